@@ -24,6 +24,7 @@ Usage:
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from scripts.core.config import *
+from scripts.buildings.influence_maps import InfluenceMaps
 
 
 @dataclass
@@ -104,6 +105,9 @@ class BuildingManager:
         # Owned buildings
         self.owned_buildings: List[Building] = []
         
+        # Rasterized spatial effects of owned buildings (see influence_maps.py)
+        self._influence_maps: Optional[InfluenceMaps] = None
+        
         # Register for events
         self.event_system.subscribe('purchase_building_requested', self._handle_purchase_request)
         
@@ -153,7 +157,7 @@ class BuildingManager:
                 print(f"Cannot place irrigation system at ({x}, {y}) - requires tilled soil")
                 return False
             # Check if tile already has irrigation
-            if hasattr(tile, 'has_irrigation') and tile.has_irrigation:
+            if tile.has_irrigation:
                 print(f"Cannot place irrigation system at ({x}, {y}) - already has irrigation")
                 return False
         else:
@@ -183,6 +187,8 @@ class BuildingManager:
             if self.grid_manager.place_building_at(x, y, building_id, building):
                 # Apply building benefits
                 self._apply_building_benefits(building)
+                if self._influence_maps is not None:  # Otherwise built from owned_buildings on first use
+                    self._influence_maps.add_building(building_id, x, y)
                 
                 # Emit purchase event
                 self.event_system.emit('building_purchased', {
@@ -232,8 +238,35 @@ class BuildingManager:
                     'building_id': building.building_type.id
                 })
         
-        # Spatial benefits are handled dynamically in get_spatial_benefits_at()
-        # This ensures real-time calculation of effects based on building proximity
+        # Spatial benefits are stamped into the influence maps when the building is placed
+        # and read back by get_spatial_benefits_at()
+    
+    @property
+    def influence_maps(self) -> InfluenceMaps:
+        """Influence rasters sized to the current grid (created on first use)"""
+        if self._influence_maps is None:
+            width = self.grid_manager.width if self.grid_manager else GRID_WIDTH
+            height = self.grid_manager.height if self.grid_manager else GRID_HEIGHT
+            self._influence_maps = InfluenceMaps(width, height)
+            for building in self.owned_buildings:
+                self._influence_maps.add_building(building.building_type.id, building.x, building.y)
+        return self._influence_maps
+    
+    def rebuild_influence_maps(self):
+        """Re-rasterize every owned building (after owned_buildings is replaced, e.g. on load)"""
+        self._influence_maps = None
+        return self.influence_maps
+    
+    def remove_building(self, building: Building) -> bool:
+        """Remove an owned building from the grid and its influence maps"""
+        if building not in self.owned_buildings:
+            return False
+        self.owned_buildings.remove(building)
+        if self.grid_manager:
+            self.grid_manager.remove_building_at(building.x, building.y)
+        if self._influence_maps is not None:  # Otherwise built from owned_buildings on first use
+            self._influence_maps.remove_building(building.building_type.id, building.x, building.y)
+        return True
     
     def get_building_info(self, building_id: str) -> Dict:
         """Get information about a building type"""
@@ -288,8 +321,8 @@ class BuildingManager:
             return (0, 0)  # Default location if no grid manager
         
         # Try to find an empty tile, starting from corners and working inward
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
+        for y in range(self.grid_manager.height):
+            for x in range(self.grid_manager.width):
                 tile = self.grid_manager.get_tile(x, y)
                 if tile and tile.can_place_building():
                     return (x, y)
@@ -327,6 +360,23 @@ class BuildingManager:
     
     def get_spatial_benefits_at(self, x: int, y: int) -> Dict:
         """Get all spatial benefits that apply at a specific grid coordinate"""
+        maps = self.influence_maps
+        if not maps.contains(x, y):
+            # Off-grid positions (rare) fall back to scanning the buildings
+            return self._scan_spatial_benefits_at(x, y)
+        
+        # Each effect is a single raster read
+        return {
+            'crop_yield_multiplier': maps.get_multiplier('crop_yield', x, y),
+            'work_efficiency_multiplier': maps.get_multiplier('work_efficiency', x, y),
+            'rest_decay_multiplier': maps.get_multiplier('rest_decay', x, y),
+            'trait_effectiveness_multiplier': maps.get_multiplier('trait_effectiveness', x, y),
+            'has_water_cooler': maps.has_effect('water_cooler', x, y),
+            'has_housing': maps.has_effect('housing', x, y)
+        }
+    
+    def _scan_spatial_benefits_at(self, x: int, y: int) -> Dict:
+        """Compute spatial benefits by checking every owned building"""
         # Dictionary to store cumulative effects at this location
         benefits = {
             'crop_yield_multiplier': 1.0,  # Multiplicative bonus to crop yield (1.0 = no bonus)
@@ -389,24 +439,25 @@ class BuildingManager:
     
     def calculate_crop_yield_at(self, x: int, y: int, base_yield: int) -> int:
         """Calculate final crop yield at a location including building bonuses"""
-        # Get spatial benefits for this location
-        benefits = self.get_spatial_benefits_at(x, y)
-        
         # Apply yield multiplier to base yield
-        final_yield = int(base_yield * benefits['crop_yield_multiplier'])
+        final_yield = int(base_yield * self._effect_multiplier_at('crop_yield', x, y))
         
         return final_yield
     
     def calculate_work_efficiency_at(self, x: int, y: int, base_efficiency: float) -> float:
         """Calculate work efficiency at a location including building bonuses"""
-        # Get spatial benefits for this location
-        benefits = self.get_spatial_benefits_at(x, y)
-        
         # Apply efficiency multiplier to base efficiency
-        final_efficiency = base_efficiency * benefits['work_efficiency_multiplier']
+        final_efficiency = base_efficiency * self._effect_multiplier_at('work_efficiency', x, y)
         
         return final_efficiency
     
+    def _effect_multiplier_at(self, effect: str, x: int, y: int) -> float:
+        """Single-effect lookup without building the full benefits dict"""
+        maps = self.influence_maps
+        if maps.contains(x, y):
+            return maps.get_multiplier(effect, x, y)
+        return self._scan_spatial_benefits_at(x, y)[f'{effect}_multiplier']
+    
     def can_restore_thirst_at(self, x: int, y: int) -> bool:
         """Check if employees can restore thirst at this location"""
         # Get spatial benefits to check for water cooler availability
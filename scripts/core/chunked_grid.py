@@ -0,0 +1,114 @@
+"""
+Chunked Grid - Lazily allocated chunk storage for large farms
+
+Splits the farm into fixed-size square chunks (CHUNK_SIZE x CHUNK_SIZE tiles), each
+backed by its own TileStore. Chunks are only allocated the first time a tile inside
+them is accessed, so a 1024x1024 farm costs nothing until it is actually used and the
+growth, save and render passes only ever visit chunks that exist.
+
+Key Features:
+- Configurable world size up to MAX_GRID_SIZE tiles per side
+- Lazy chunk allocation with a creation callback (soil randomization, scheduler registration)
+- Edge chunks clipped to the world bounds (a 16x16 farm is a single 16x16 chunk)
+- Chunk iteration APIs: all allocated chunks, or chunks overlapping a tile rectangle
+
+Design Goals:
+- Memory and per-pass cost proportional to the farmed area, not the world size
+- Whole-chunk vectorized passes (growth, save, render culling)
+- Tile views keep working unchanged (each view points at its chunk's store)
+
+Usage:
+    chunks = ChunkedGrid(1024, 1024, on_chunk_created=setup_chunk)
+    store = chunks.chunk_for(500, 730)  # Allocates the chunk if needed
+    for store in chunks.iter_chunks():  # Only allocated chunks
+        store.advance_growth(1.0)
+    for store in chunks.iter_chunks_in_rect(0, 0, 64, 40, create=True):  # Visible area
+        ...
+"""
+
+from typing import Callable, Dict, Iterator, Optional, Tuple
+from scripts.core.config import *
+from scripts.core.tile_store import TileStore
+
+
+class ChunkedGrid:
+    """Sparse map of chunk coordinates to lazily allocated TileStores"""
+    
+    def __init__(self, width: int, height: int, chunk_size: int = CHUNK_SIZE,
+                 on_chunk_created: Optional[Callable[[TileStore], None]] = None):
+        """Initialize an empty world of width x height tiles"""
+        if not (0 < width <= MAX_GRID_SIZE and 0 < height <= MAX_GRID_SIZE):
+            raise ValueError(f"Grid size {width}x{height} outside 1..{MAX_GRID_SIZE}")
+        
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.chunks_x = (width + chunk_size - 1) // chunk_size
+        self.chunks_y = (height + chunk_size - 1) // chunk_size
+        self.on_chunk_created = on_chunk_created
+        
+        # Allocated chunks keyed by (chunk_x, chunk_y)
+        self.chunks: Dict[Tuple[int, int], TileStore] = {}
+    
+    def contains(self, x: int, y: int) -> bool:
+        """Check if world tile coordinates are inside the grid"""
+        return 0 <= x < self.width and 0 <= y < self.height
+    
+    def chunk_key(self, x: int, y: int) -> Tuple[int, int]:
+        """Chunk coordinates that contain a world tile"""
+        return (x // self.chunk_size, y // self.chunk_size)
+    
+    def get_chunk(self, chunk_x: int, chunk_y: int, create: bool = True) -> Optional[TileStore]:
+        """Get the chunk at chunk coordinates, allocating it on first use"""
+        store = self.chunks.get((chunk_x, chunk_y))
+        if store is None and create:
+            if not (0 <= chunk_x < self.chunks_x and 0 <= chunk_y < self.chunks_y):
+                return None
+            origin_x = chunk_x * self.chunk_size
+            origin_y = chunk_y * self.chunk_size
+            store = TileStore(min(self.chunk_size, self.width - origin_x),
+                              min(self.chunk_size, self.height - origin_y),
+                              origin_x, origin_y)
+            self.chunks[(chunk_x, chunk_y)] = store
+            if self.on_chunk_created:
+                self.on_chunk_created(store)
+        return store
+    
+    def chunk_for(self, x: int, y: int, create: bool = True) -> Optional[TileStore]:
+        """Get the chunk holding a world tile (None if out of bounds or not allocated)"""
+        if not self.contains(x, y):
+            return None
+        return self.get_chunk(x // self.chunk_size, y // self.chunk_size, create)
+    
+    def iter_chunks(self) -> Iterator[TileStore]:
+        """Iterate over every allocated chunk"""
+        return iter(list(self.chunks.values()))
+    
+    def iter_chunks_in_rect(self, start_x: int, start_y: int, end_x: int, end_y: int,
+                            create: bool = False) -> Iterator[TileStore]:
+        """Iterate over chunks overlapping the tile rectangle [start, end)"""
+        start_x, start_y = max(0, start_x), max(0, start_y)
+        end_x, end_y = min(self.width, end_x), min(self.height, end_y)
+        if start_x >= end_x or start_y >= end_y:
+            return
+        
+        for chunk_y in range(start_y // self.chunk_size, (end_y - 1) // self.chunk_size + 1):
+            for chunk_x in range(start_x // self.chunk_size, (end_x - 1) // self.chunk_size + 1):
+                store = self.get_chunk(chunk_x, chunk_y, create)
+                if store is not None:
+                    yield store
+    
+    def clear(self) -> list:
+        """Drop every allocated chunk, returning the removed stores"""
+        removed = list(self.chunks.values())
+        self.chunks.clear()
+        return removed
+    
+    @property
+    def allocated_count(self) -> int:
+        """Number of chunks currently allocated"""
+        return len(self.chunks)
+    
+    def nbytes(self) -> int:
+        """Approximate memory used by all allocated chunk buffers"""
+        return sum(store.nbytes() for store in self.chunks.values())
@@ -7,11 +7,15 @@ All game settings and constants are defined here for easy tweaking.
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
 FPS = 60
+SIMULATION_TICK_RATE = 30  # Fixed simulation ticks per game second (independent of FPS)
+SIMULATION_MAX_CATCH_UP_STEPS = 10  # Most ticks simulated in one frame; slower frames drop the excess game time
 
 # Grid Settings
-GRID_WIDTH = 16
+GRID_WIDTH = 16   # Default farm size (GridManager accepts larger farms)
 GRID_HEIGHT = 16
 TILE_SIZE = 32  # pixels per tile
+CHUNK_SIZE = 32  # tiles per side of a lazily allocated grid chunk
+MAX_GRID_SIZE = 1024  # largest supported farm side in tiles
 
 # Game World Settings
 STARTING_CASH = 100000  # Increased for building feature testing
@@ -24,6 +28,27 @@ DAILY_UTILITIES = 20
 # Employee Settings
 BASE_EMPLOYEE_WAGE = 80  # Reduced from 100 to improve multi-employee viability
 EMPLOYEE_SPEED = 2.0  # tiles per second
+PATHFINDING_MODE = 'astar'  # 'astar', 'jps', 'hierarchical' (long trips on large farms) or 'cooperative' (crews avoid each other)
+PATH_CACHE_SIZE = 256  # Paths kept by each Pathfinder's LRU cache
+COOPERATIVE_WINDOW = 16  # Steps each employee is planned ahead in cooperative mode
+COOPERATIVE_STUCK_LIMIT = 4  # Windows without progress before an employee may pass through others
+COOPERATIVE_MAX_EXPANSIONS = 2000  # Space-time nodes one cooperative window may expand
+COOPERATIVE_PLANS_PER_STEP = 100  # Window plans per step boundary; the rest wait for the next one
+PATH_WORKERS = 2  # Worker processes for batched path requests (0 plans every batch on the main thread)
+PATH_BATCH_MIN_QUERIES = 8  # Smaller batches are answered on the main thread without the pool
+EMPLOYEE_BATCH_MIN_EMPLOYEES = 64  # Crew size from which EmployeeManager decays needs and moves employees with array kernels
+EMPLOYEE_DECISION_SCHEDULING = True  # Batched crews only run the AI of employees whose next decision is due
+ASSIGNMENT_2OPT_MAX_TILES = 150  # Largest per-employee share whose walking order is refined with 2-opt
+ASSIGNMENT_2OPT_MAX_PASSES = 4  # 2-opt sweeps over a share before keeping its order
+JOB_BOARD_CELL_SIZE = 8  # Side in tiles of the job board's spatial buckets
+JOB_PRIORITIES = {'harvest': 3, 'plant': 2, 'till': 1}  # Idle employees pull the highest-priority jobs first
+JOB_CLAIM_TILES = 8  # Jobs an idle employee pulls from the board as one task
+JOB_STEAL_MIN_TILES = 4  # Queued tiles an employee must have before idle crewmates steal half of them
+JOB_BOARD_INTERVAL = 0.5  # Game seconds between job board rounds (pulling and stealing)
+HARVEST_QUALITY_BUCKET = 0.05  # Harvest qualities are rounded to this step so a tick's harvests share inventory entries
+EMPLOYEE_HASH_BUCKET_SIZE = 4  # Tiles per side of the spatial hash buckets EmployeeManager keeps employee positions in
+EMPLOYEE_RADIUS = 8  # Employee sprite radius in pixels at zoom 1.0
+EMPLOYEE_RENDER_MARGIN = 60  # Pixels around the viewport where employees are still drawn (labels and needs bars overhang)
 MAX_HUNGER = 100
 MAX_THIRST = 100
 MAX_REST = 100
@@ -0,0 +1,166 @@
+"""
+Flow Fields - Shared routes from every tile to the nearest amenity
+
+One breadth-first search per amenity type, started from every walkable tile next
+to a building of that type, labels each tile of the farm with its distance to the
+nearest amenity and the neighbouring tile one step closer. Any number of employees
+looking for a water cooler then read their next step instead of each searching for
+a building and a path.
+
+Key Features:
+- Multi-source BFS over the passability bitmap (4-directional, like the Pathfinder)
+- Distance and next-step arrays per amenity type, plus the building each
+  interaction tile belongs to
+- Built lazily on first request and rebuilt only after buildings change: either
+  a building of that type, or any building that alters walkability
+- O(1) next_step/distance_at lookups; route_from() follows the field and keeps
+  only the turning points as waypoints
+
+Design Goals:
+- Amenity routing cost independent of crew size
+- Same interaction tiles as GridManager.get_building_interaction_tiles
+
+Usage:
+    fields = AmenityFlowFields(grid_manager)
+    field = fields.get('water_cooler')
+    if field is not None:
+        field.next_step(x, y)          # (x, y) one tile closer, or None
+        waypoints, building = field.route_from(x, y)
+"""
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+
+AMENITY_TYPES = ('water_cooler', 'employee_housing', 'storage_silo')  # Buildings employees walk to
+UNREACHABLE = -1
+
+
+class FlowField:
+    """Distances and next steps toward the nearest building of one type"""
+    
+    def __init__(self, building_type: str, width: int, height: int):
+        """Initialize an empty field (every tile unreachable)"""
+        self.building_type = building_type
+        self.width = width
+        self.height = height
+        size = width * height
+        self.distances = array('i', [UNREACHABLE]) * size
+        self.next_index = array('i', [UNREACHABLE]) * size  # Flat index one step closer (-1 at the goal)
+        self.building_for: Dict[int, Tuple[int, int]] = {}  # Interaction tile index -> building position
+    
+    def build(self, walls: bytes, buildings: List[Tuple[int, int]]):
+        """Multi-source BFS from every walkable tile around the given buildings"""
+        width = self.width
+        height = self.height
+        distances = self.distances
+        next_index = self.next_index
+        
+        # Interaction tiles: the 8 neighbours of each building that can be stood on
+        frontier = []
+        for building_x, building_y in buildings:
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    x, y = building_x + dx, building_y + dy
+                    if (dx or dy) and 0 <= x < width and 0 <= y < height:
+                        index = y * width + x
+                        if not walls[index] and index not in self.building_for:
+                            self.building_for[index] = (building_x, building_y)
+                            distances[index] = 0
+                            frontier.append(index)
+        
+        # Breadth-first waves; the list doubles as the queue
+        head = 0
+        while head < len(frontier):
+            index = frontier[head]
+            head += 1
+            y, x = divmod(index, width)
+            next_distance = distances[index] + 1
+            for neighbor, inside in ((index - width, y > 0), (index + 1, x + 1 < width),
+                                     (index + width, y + 1 < height), (index - 1, x > 0)):
+                if inside and distances[neighbor] == UNREACHABLE and not walls[neighbor]:
+                    distances[neighbor] = next_distance
+                    next_index[neighbor] = index
+                    frontier.append(neighbor)
+    
+    def distance_at(self, x: int, y: int) -> Optional[int]:
+        """Steps from (x, y) to the nearest interaction tile, or None if unreachable"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        distance = self.distances[y * self.width + x]
+        return None if distance == UNREACHABLE else distance
+    
+    def next_step(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Neighbouring tile one step closer to the amenity (None at the goal or if unreachable)"""
+        if self.distance_at(x, y) is None:
+            return None
+        index = self.next_index[y * self.width + x]
+        return None if index == UNREACHABLE else (index % self.width, index // self.width)
+    
+    def route_from(self, x: int, y: int) -> Optional[Tuple[List[Tuple[int, int]], Tuple[int, int]]]:
+        """
+        Follow the field from (x, y) to the nearest interaction tile
+        
+        Returns:
+            (waypoints from (x, y) to the interaction tile, keeping only turns,
+            position of the building to use there), or None if unreachable
+        """
+        if self.distance_at(x, y) is None:
+            return None
+        
+        width = self.width
+        next_index = self.next_index
+        index = y * width + x
+        waypoints = [index]
+        step = None
+        while next_index[index] != UNREACHABLE:
+            following = next_index[index]
+            if following - index != step and index != waypoints[-1]:
+                waypoints.append(index)  # The route turns here
+            step = following - index
+            index = following
+        if index != waypoints[-1]:
+            waypoints.append(index)
+        
+        return [(i % width, i // width) for i in waypoints], self.building_for[index]
+
+
+class AmenityFlowFields:
+    """Lazily built flow fields per amenity type for one GridManager"""
+    
+    def __init__(self, grid_manager):
+        """Initialize with no fields built"""
+        self.grid_manager = grid_manager
+        self.fields: Dict[str, FlowField] = {}
+        self._built_from: Dict[str, Tuple[int, int]] = {}  # Type -> (building version, passability version)
+        self.rebuilds = 0
+    
+    def get(self, building_type: str) -> Optional[FlowField]:
+        """Current field for a building type, or None if there are no such buildings"""
+        tile_index = self.grid_manager.tile_index
+        passability = self.grid_manager.passability
+        versions = (tile_index.building_versions.get(building_type, 0), passability.version)
+        if self._built_from.get(building_type) != versions:
+            self._rebuild(building_type, versions)
+        return self.fields.get(building_type)
+    
+    def invalidate(self, building_type: Optional[str] = None):
+        """Force a rebuild of one field (or all) on next request"""
+        if building_type is None:
+            self._built_from.clear()
+        else:
+            self._built_from.pop(building_type, None)
+    
+    def _rebuild(self, building_type: str, versions: Tuple[int, int]):
+        """Recompute one amenity's field from the building index and bitmap"""
+        self._built_from[building_type] = versions
+        buildings = self.grid_manager.find_buildings_of_type(building_type)
+        if not buildings:
+            self.fields.pop(building_type, None)
+            return
+        
+        passability = self.grid_manager.passability
+        field = FlowField(building_type, passability.width, passability.height)
+        field.build(passability.blocked.tobytes(), buildings)
+        self.fields[building_type] = field
+        self.rebuilds += 1
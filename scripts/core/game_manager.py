@@ -14,18 +14,22 @@ System Initialization Order (Critical):
 6. UIManager - Display and user interaction
 
 Update Order (Critical):
-Systems must update in dependency order to avoid frame-delay issues:
+The simulation advances in fixed game-time ticks (SIMULATION_TICK_RATE per game
+second, more ticks per frame at higher game speeds, none while paused). Each tick
+updates systems in dependency order to avoid frame-delay issues:
 1. TimeManager - Updates game time first
 2. GridManager - Updates world state  
 3. EmployeeManager - Entities act on current world state
 4. EconomyManager - Processes consequences of actions
-5. UIManager - Updates display based on current state
-6. EventSystem.process_events() - Process all events generated this frame
+5. EventSystem.process_events() - Process all events generated this tick
+Once per frame, after the ticks:
+6. UIManager / SaveManager - Real-time updates (animations, auto-save)
+7. Render - Employees drawn between their last two tick positions
 
 Key Responsibilities:
 - Coordinate system lifecycle (init, update, render)
 - Handle pygame events and forward to appropriate systems
-- Maintain target framerate (60 FPS)
+- Maintain target framerate (60 FPS) with a frame-rate-independent simulation
 - Provide clean shutdown when game exits
 
 Event Handling:
@@ -50,6 +54,7 @@ import sys
 from typing import Dict, Any
 from scripts.core.config import *
 from scripts.core.event_system import EventSystem
+from scripts.core.simulation_clock import SimulationClock
 from scripts.core.grid_manager import GridManager
 from scripts.core.time_manager import TimeManager
 from scripts.core.inventory_manager import InventoryManager
@@ -75,6 +80,9 @@ class GameManager:
         self.clock = pygame.time.Clock()
         self.running = True
         
+        # Fixed-timestep accumulator: frames bank real time, the simulation runs whole ticks
+        self.simulation_clock = SimulationClock()
+        
         # Initialize event system (must be first)
         self.event_system = EventSystem()
         
@@ -100,7 +108,7 @@ class GameManager:
         # Connect employee manager to inventory manager for synchronous harvest processing
         self.employee_manager.set_inventory_manager(self.inventory_manager)
         
-        self.ui_manager = UIManager(self.event_system, self.screen)
+        self.ui_manager = UIManager(self.event_system, self.screen, self.grid_manager)
         
         # Initialize contract system (after economy, time, and inventory systems)
         self.contract_manager = ContractManager(self.event_system, self.economy_manager, self.time_manager, self.inventory_manager)
@@ -188,24 +196,36 @@ class GameManager:
                     self.employee_manager.handle_keyboard_input(event.key)
     
     def _update(self, dt):
-        """Update all game systems"""
-        # Update systems in dependency order
-        self.time_manager.update(dt)
-        self.weather_manager.update()  # Weather affects crop growth, so update before grid
-        self.grid_manager.update(dt)
-        self.inventory_manager.update(dt)
-        self.building_manager.update(dt)
-        self.contract_manager.update(dt)
-        # Update hiring system for any time-based operations
-        self.hiring_system.update(dt)
-        self.employee_manager.update(dt)
-        self.economy_manager.update(dt)
+        """Advance the simulation by the ticks due after dt real seconds, then update real-time systems"""
+        # Game speed scales how much game time a frame banks; paused frames bank none
+        speed = 0 if self.time_manager.is_paused else self.time_manager.time_speed
+        for _ in range(self.simulation_clock.advance(dt, speed)):
+            self._simulate(self.simulation_clock.tick_dt)
+        
+        # UI animations and auto-save run on real time
         self.ui_manager.update(dt)
         self.save_manager.update(dt)
         
         # Process any pending events
         self.event_system.process_events()
     
+    def _simulate(self, tick_dt):
+        """Advance all simulation systems by one fixed tick of tick_dt game seconds"""
+        # Update systems in dependency order
+        self.time_manager.update(tick_dt)
+        self.weather_manager.update()  # Weather affects crop growth, so update before grid
+        self.grid_manager.update(tick_dt)
+        self.inventory_manager.update(tick_dt)
+        self.building_manager.update(tick_dt)
+        self.contract_manager.update(tick_dt)
+        # Update hiring system for any time-based operations
+        self.hiring_system.update(tick_dt)
+        self.employee_manager.update(tick_dt)
+        self.economy_manager.update(tick_dt)
+        
+        # Process events generated this tick before the next one
+        self.event_system.process_events()
+    
     def _render(self):
         """Render the game world and UI"""
         # Clear screen
@@ -213,7 +233,7 @@ class GameManager:
         
         # Render systems in order
         self.grid_manager.render(self.screen)
-        self.employee_manager.render(self.screen)
+        self.employee_manager.render(self.screen, self.simulation_clock.alpha)
         self.ui_manager.render(self.screen)
         
         # Update display
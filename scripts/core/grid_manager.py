@@ -1,60 +1,248 @@
 """
-Grid Manager - Handles the 16x16 tile grid system
+Grid Manager - Handles the farm tile grid system
 Manages tile states, rendering, and interactions for the farming simulation.
+The grid is stored in lazily allocated chunks (see chunked_grid.py), so farms
+from the default 16x16 up to MAX_GRID_SIZE tiles per side are supported.
 """
 
 import pygame
+import numpy as np
 from typing import List, Tuple, Optional, Dict
 from scripts.core.config import *
+from scripts.core.tile_store import (
+    TileStore, SoilNutrients, NO_ID, NUTRIENT_INDEX, MAX_GROWTH_STAGE,
+    TERRAIN_TABLE, CROP_TABLE, BUILDING_TABLE, TASK_TABLE, crop_base_yields
+)
+from scripts.core.chunked_grid import ChunkedGrid
+from scripts.core.maturation_scheduler import MaturationScheduler
+from scripts.core.tile_index import TileIndex
+from scripts.core.tile_selection import TileSelection
+from scripts.core.passability_map import PassabilityMap
+from scripts.core.flow_fields import AmenityFlowFields, FlowField
 from scripts.ui.enhanced_grid_renderer import EnhancedGridRenderer
 
 
 class Tile:
-    """Individual tile in the farming grid"""
+    """Individual tile in the farming grid
     
-    def __init__(self, x: int, y: int):
-        """Initialize a tile at grid position (x, y)"""
+    Tiles are thin views over a TileStore: all state lives in the store's column
+    buffers and is read/written through the properties below.
+    """
+    
+    __slots__ = ('x', 'y', '_store', '_index')
+    
+    def __init__(self, x: int, y: int, store: Optional[TileStore] = None, index: Optional[int] = None):
+        """Initialize a tile view at grid position (x, y)"""
         self.x = x
         self.y = y
         
-        # Tile properties
-        self.terrain_type = 'soil'  # 'soil', 'tilled', 'planted'
-        self.soil_quality = 5  # 1-10 scale
-        self.water_level = 100  # 0-100 scale
-        
-        # Soil Health System - nutrient levels for crop rotation
-        self.soil_nutrients = {
-            'nitrogen': 100,    # Nitrogen level (0-100)
-            'phosphorus': 100,  # Phosphorus level (0-100) 
-            'potassium': 100    # Potassium level (0-100)
-        }
-        
-        # Crop History for rotation bonuses
-        self.crop_history = []  # List of previous crops grown on this tile
-        self.seasons_rested = 0  # Seasons since last crop (for soil rest bonus)
-        
-        # Crop information - now supports multiple crop types
-        self.current_crop = None  # crop type string or None
-        self.growth_stage = 0  # 0-4 for all crops
-        self.days_growing = 0
-        
-        # Task assignment
-        self.task_assignment = None  # 'till', 'plant', 'harvest', or None
-        self.task_assigned_to = None  # Employee ID
-        
-        # Building information
-        self.building = None  # Building object if this tile has a building
-        self.building_type = None  # Building type ID for rendering
-        self.is_occupied = False  # True if tile has building or is unusable
-        
-        # Irrigation system
-        self.has_irrigation = False  # True if tile has irrigation infrastructure
-        
-        # Visual properties
-        self.highlight = False  # For UI selection
-        self.rect = pygame.Rect(
-            x * TILE_SIZE, 
-            y * TILE_SIZE + 70,  # Offset for UI panel
+        # Standalone tiles get a private single-tile store
+        if store is None:
+            store = TileStore(1, 1, x, y)
+        self._store = store
+        self._index = store.index_of(x, y) if index is None else index
+    
+    def __eq__(self, other):
+        """Tiles are equal when they view the same storage slot"""
+        if not isinstance(other, Tile):
+            return NotImplemented
+        return self._store is other._store and self._index == other._index
+    
+    def __hash__(self):
+        """Hash on storage slot so tiles can be used in sets and dictionaries"""
+        return hash((id(self._store), self._index))
+    
+    def __repr__(self):
+        return f"Tile({self.x}, {self.y})"
+    
+    # Tile properties
+    @property
+    def terrain_type(self) -> str:
+        """'soil', 'tilled', 'planted' or 'building'"""
+        return TERRAIN_TABLE.names[self._store.terrain[self._index]]
+    
+    @terrain_type.setter
+    def terrain_type(self, value: str):
+        self._store.terrain[self._index] = TERRAIN_TABLE.id_for(value)
+    
+    @property
+    def soil_quality(self) -> int:
+        """Soil quality on a 1-10 scale"""
+        return int(self._store.soil_quality[self._index])
+    
+    @soil_quality.setter
+    def soil_quality(self, value: int):
+        self._store.soil_quality[self._index] = value
+    
+    @property
+    def water_level(self) -> float:
+        """Water level on a 0-100 scale"""
+        return float(self._store.water_level[self._index])
+    
+    @water_level.setter
+    def water_level(self, value: float):
+        self._store.water_level[self._index] = value
+    
+    # Soil Health System - nutrient levels for crop rotation
+    @property
+    def soil_nutrients(self) -> SoilNutrients:
+        """Nitrogen/phosphorus/potassium levels (0-100) as a dict-like view"""
+        return SoilNutrients(self._store, self._index)
+    
+    @soil_nutrients.setter
+    def soil_nutrients(self, value: Dict[str, int]):
+        for nutrient, level in value.items():
+            self._store.nutrients[NUTRIENT_INDEX[nutrient], self._index] = level
+    
+    # Crop History for rotation bonuses
+    @property
+    def crop_history(self) -> List[str]:
+        """List of previous crops grown on this tile"""
+        history = self._store.crop_history.get(self._index)
+        if history is None:
+            history = self._store.crop_history[self._index] = []
+        return history
+    
+    @crop_history.setter
+    def crop_history(self, value: List[str]):
+        self._store.crop_history[self._index] = list(value)
+    
+    @property
+    def seasons_rested(self) -> int:
+        """Seasons since last crop (for soil rest bonus)"""
+        return int(self._store.seasons_rested[self._index])
+    
+    @seasons_rested.setter
+    def seasons_rested(self, value: int):
+        self._store.seasons_rested[self._index] = value
+    
+    # Crop information - supports multiple crop types
+    @property
+    def current_crop(self) -> Optional[str]:
+        """Crop type string or None"""
+        return CROP_TABLE.name_for(self._store.crop_id[self._index])
+    
+    @current_crop.setter
+    def current_crop(self, value: Optional[str]):
+        self._store.crop_id[self._index] = CROP_TABLE.id_for(value)
+        self._store.notify_changed(self._index)
+    
+    @property
+    def growth_stage(self) -> int:
+        """Growth stage, 0-4 for all crops"""
+        return int(self._store.growth_stage[self._index])
+    
+    @growth_stage.setter
+    def growth_stage(self, value: int):
+        self._store.growth_stage[self._index] = value
+        self._store.notify_changed(self._index)
+    
+    @property
+    def days_growing(self) -> float:
+        """Days the current crop has been growing"""
+        return self._store.current_days_growing(self._index)
+    
+    @days_growing.setter
+    def days_growing(self, value: float):
+        self._store.set_days_growing(self._index, value)
+    
+    @property
+    def rotation_bonuses(self) -> Optional[dict]:
+        """Rotation bonuses calculated at planting time (None if not planted)"""
+        return self._store.rotation_bonuses.get(self._index)
+    
+    @rotation_bonuses.setter
+    def rotation_bonuses(self, value: Optional[dict]):
+        if value is None:
+            self._store.rotation_bonuses.pop(self._index, None)
+        else:
+            self._store.rotation_bonuses[self._index] = value
+    
+    # Task assignment
+    @property
+    def task_assignment(self) -> Optional[str]:
+        """'till', 'plant', 'harvest', or None"""
+        return TASK_TABLE.name_for(self._store.task_id[self._index])
+    
+    @task_assignment.setter
+    def task_assignment(self, value: Optional[str]):
+        self._store.task_id[self._index] = TASK_TABLE.id_for(value)
+        self._store.notify_changed(self._index)
+    
+    @property
+    def task_assigned_to(self) -> Optional[str]:
+        """Employee ID"""
+        return self._store.task_assigned_to.get(self._index)
+    
+    @task_assigned_to.setter
+    def task_assigned_to(self, value: Optional[str]):
+        if value is None:
+            self._store.task_assigned_to.pop(self._index, None)
+        else:
+            self._store.task_assigned_to[self._index] = value
+    
+    # Building information
+    @property
+    def building(self):
+        """Building object if this tile has a building"""
+        return self._store.buildings.get(self._index)
+    
+    @building.setter
+    def building(self, value):
+        if value is None:
+            self._store.buildings.pop(self._index, None)
+        else:
+            self._store.buildings[self._index] = value
+    
+    @property
+    def building_type(self) -> Optional[str]:
+        """Building type ID for rendering"""
+        return BUILDING_TABLE.name_for(self._store.building_id[self._index])
+    
+    @building_type.setter
+    def building_type(self, value: Optional[str]):
+        self._store.building_id[self._index] = BUILDING_TABLE.id_for(value)
+        self._store.notify_changed(self._index)
+    
+    @property
+    def is_occupied(self) -> bool:
+        """True if tile has building or is unusable"""
+        return bool(self._store.occupied[self._index])
+    
+    @is_occupied.setter
+    def is_occupied(self, value: bool):
+        self._store.occupied[self._index] = value
+        self._store.notify_changed(self._index)  # Occupied tiles block movement
+    
+    # Irrigation system
+    @property
+    def has_irrigation(self) -> bool:
+        """True if tile has irrigation infrastructure"""
+        return bool(self._store.irrigation[self._index])
+    
+    @has_irrigation.setter
+    def has_irrigation(self, value: bool):
+        if bool(self._store.irrigation[self._index]) != bool(value):
+            self._store.irrigation[self._index] = value
+            self._store.reschedule_growth(self._index)  # Drought mitigation rate may change
+            self._store.notify_changed(self._index)
+    
+    # Visual properties
+    @property
+    def highlight(self) -> bool:
+        """For UI selection"""
+        return bool(self._store.highlight[self._index])
+    
+    @highlight.setter
+    def highlight(self, value: bool):
+        self._store.highlight[self._index] = value
+    
+    @property
+    def rect(self) -> pygame.Rect:
+        """Screen rectangle of this tile in the legacy (unzoomed) layout"""
+        return pygame.Rect(
+            self.x * TILE_SIZE, 
+            self.y * TILE_SIZE + 70,  # Offset for UI panel
             TILE_SIZE, 
             TILE_SIZE
         )
@@ -161,7 +349,7 @@ class Tile:
             # Apply crop rotation bonuses if available
             rotation_yield_bonus = 0.0
             rotation_quality_bonus = 0.0
-            if hasattr(self, 'rotation_bonuses') and self.rotation_bonuses:
+            if self.rotation_bonuses:
                 rotation_yield_bonus = self.rotation_bonuses.get('yield', 0.0)
                 rotation_quality_bonus = self.rotation_bonuses.get('quality', 0.0)
                 yield_amount *= (1.0 + rotation_yield_bonus)
@@ -192,7 +380,7 @@ class Tile:
                         bonus_percent = int((wheat_bonus - 1.0) * 100)
                         print(f"  Grain specialization: +{bonus_percent}% wheat yield")
                         specialization_bonus_applied = True
-                        
+                
                 elif crop_type == 'tomatoes':
                     tomato_bonus = spec_manager.get_bonus_multiplier('tomato_yield_multiplier', 1.0)
                     if tomato_bonus > 1.0:
@@ -247,13 +435,8 @@ class Tile:
     def _calculate_storage_silo_bonus(self, grid_manager) -> float:
         """Calculate yield bonus from nearby storage silos"""
         # Check for storage silos within 4 tiles (Manhattan distance)
-        storage_silos = grid_manager.find_buildings_of_type('storage_silo')
-        
-        for silo_x, silo_y in storage_silos:
-            # Calculate Manhattan distance to storage silo
-            distance = abs(self.x - silo_x) + abs(self.y - silo_y)
-            if distance <= 4:  # Within 4 tiles
-                return 0.10  # +10% yield bonus
+        if grid_manager.find_buildings_within(self.x, self.y, 'storage_silo', 4):
+            return 0.10  # +10% yield bonus
         
         return 0.0  # No bonus
     
@@ -424,19 +607,86 @@ class Tile:
             return COLORS['tile_soil']
 
 
+class GridRow:
+    """Read-only row of tile views, so grid[y][x] keeps working over chunked storage"""
+    
+    __slots__ = ('_grid_manager', '_y')
+    
+    def __init__(self, grid_manager, y: int):
+        self._grid_manager = grid_manager
+        self._y = y
+    
+    def __len__(self) -> int:
+        return self._grid_manager.width
+    
+    def __getitem__(self, x: int) -> Tile:
+        if not 0 <= x < self._grid_manager.width:
+            raise IndexError(x)
+        return self._grid_manager.get_tile(x, self._y)
+    
+    def __iter__(self):
+        for x in range(self._grid_manager.width):
+            yield self._grid_manager.get_tile(x, self._y)
+
+
+class GridRows:
+    """Read-only list-of-rows view over the chunked grid"""
+    
+    __slots__ = ('_grid_manager',)
+    
+    def __init__(self, grid_manager):
+        self._grid_manager = grid_manager
+    
+    def __len__(self) -> int:
+        return self._grid_manager.height
+    
+    def __getitem__(self, y: int) -> GridRow:
+        if not 0 <= y < self._grid_manager.height:
+            raise IndexError(y)
+        return GridRow(self._grid_manager, y)
+    
+    def __iter__(self):
+        for y in range(self._grid_manager.height):
+            yield GridRow(self._grid_manager, y)
+
+
 class GridManager:
-    """Manages the 16x16 tile grid"""
+    """Manages the chunked farm tile grid (16x16 by default)"""
     
-    def __init__(self, event_system):
-        """Initialize the grid manager"""
+    def __init__(self, event_system, width: int = GRID_WIDTH, height: int = GRID_HEIGHT):
+        """Initialize the grid manager for a width x height farm"""
         self.event_system = event_system
+        self.width = width
+        self.height = height
+        
+        # Event-scheduled crop maturation (see maturation_scheduler.py)
+        self.maturation_scheduler = MaturationScheduler()
+        
+        # Incremental planted/harvestable/task/irrigation/building sets (see tile_index.py)
+        self.tile_index = TileIndex()
+        
+        # Walkability bitmap read by the pathfinder, kept current by the tile index
+        self.passability = PassabilityMap(width, height)
+        self.tile_index.passability = self.passability
+        
+        # Shared routes to the nearest amenity of each type (see flow_fields.py)
+        self.amenity_fields = AmenityFlowFields(self)
+        
+        # Sibling systems wired in by GameManager (None when running standalone)
+        self.time_manager = None
+        self.building_manager = None
+        self.game_manager = None
+        
+        # Latest weather yield modifier, for callers of harvest_tiles
+        self.weather_yield_modifier = 1.0
+        
+        # Selection state (rectangles, see tile_selection.py)
+        self.selected_tiles = TileSelection(self)
         
-        # Create the grid
-        self.grid: List[List[Tile]] = []
+        # Create the grid (lazily allocated columnar chunks, see chunked_grid.py)
+        self.chunked_grid: ChunkedGrid = None
         self._create_grid()
         
-        # Selection state
-        self.selected_tiles: List[Tile] = []
         self.drag_start_pos: Optional[Tuple[int, int]] = None
         self.drag_current_pos: Optional[Tuple[int, int]] = None
         
@@ -454,11 +704,13 @@ class GridManager:
         # Register for events
         self.event_system.subscribe('day_passed', self._handle_day_passed)
         self.event_system.subscribe('day_passed_with_weather', self._handle_day_passed)  # Weather-enhanced day events
+        self.event_system.subscribe('weather_updated', self._handle_weather_updated)  # Re-key growth deadlines
         self.event_system.subscribe('task_assigned', self._handle_task_assignment)
         self.event_system.subscribe('building_placement_preview_start', self._handle_preview_start)
         self.event_system.subscribe('building_placement_preview_stop', self._handle_preview_stop)
         
-        print(f"Grid Manager initialized with {GRID_WIDTH}x{GRID_HEIGHT} tiles and enhanced rendering")
+        print(f"Grid Manager initialized with {self.width}x{self.height} tiles "
+              f"({self.chunked_grid.chunks_x}x{self.chunked_grid.chunks_y} chunks) and enhanced rendering")
     
     def _setup_enhanced_renderer_events(self):
         """Setup event subscriptions for enhanced renderer"""
@@ -497,22 +749,96 @@ class GridManager:
             self.enhanced_renderer.toggle_irrigation_overlay()
     
     def _create_grid(self):
-        """Create the initial tile grid"""
-        for y in range(GRID_HEIGHT):
-            row = []
-            for x in range(GRID_WIDTH):
-                tile = Tile(x, y)
-                # Randomize soil quality slightly
-                import random
-                tile.soil_quality = random.randint(3, 8)
-                row.append(tile)
-            self.grid.append(row)
+        """Create the (empty) chunked tile grid; chunks are allocated on first access"""
+        self.chunked_grid = ChunkedGrid(self.width, self.height, CHUNK_SIZE,
+                                        on_chunk_created=self._setup_chunk)
+    
+    def _setup_chunk(self, store: TileStore):
+        """Initialize a newly allocated chunk"""
+        # Randomize soil quality slightly (3-8)
+        store.soil_quality[:] = np.random.randint(3, 9, size=store.size)
+        store.tile_index = self.tile_index
+        self.maturation_scheduler.register_store(store)
+        self.selected_tiles.stamp_store(store)  # Chunk may lie inside an active selection
+    
+    def clear_chunks(self):
+        """Drop every allocated chunk (used before restoring a saved farm)"""
+        for store in self.chunked_grid.clear():
+            self.maturation_scheduler.unregister_store(store, rebuild=False)
+            self.tile_index.remove_store(store)
+            store.tile_index = None
+        self.maturation_scheduler.rebuild()
+    
+    @property
+    def tile_store(self) -> TileStore:
+        """Store of the first chunk (the whole grid on farms no larger than one chunk)"""
+        return self.chunked_grid.get_chunk(0, 0)
+    
+    @property
+    def chunk_size(self) -> int:
+        """Tiles per chunk side"""
+        return self.chunked_grid.chunk_size
+    
+    def iter_chunks(self):
+        """Iterate over every allocated chunk store"""
+        return self.chunked_grid.iter_chunks()
+    
+    def iter_chunks_in_rect(self, start_x: int, start_y: int, end_x: int, end_y: int, create: bool = False):
+        """Iterate over chunk stores overlapping the tile rectangle [start, end)"""
+        return self.chunked_grid.iter_chunks_in_rect(start_x, start_y, end_x, end_y, create)
+    
+    def iter_tiles_in_rect(self, start_x: int, start_y: int, end_x: int, end_y: int):
+        """Yield tile views in the rectangle [start, end), one chunk at a time"""
+        for store in self.iter_chunks_in_rect(start_x, start_y, end_x, end_y, create=True):
+            for y in range(max(start_y, store.origin_y), min(end_y, store.origin_y + store.height)):
+                for x in range(max(start_x, store.origin_x), min(end_x, store.origin_x + store.width)):
+                    yield Tile(x, y, store, store.index_of(x, y))
+    
+    # Index queries (only touch the matching tiles)
+    def get_planted_tiles(self) -> List[Tile]:
+        """All tiles that currently have a crop"""
+        return [self._tile_at_index(store, index) for store, index in self.tile_index.planted.items()]
+    
+    def get_harvestable_tiles(self) -> List[Tile]:
+        """All tiles with a crop ready to harvest"""
+        return [self._tile_at_index(store, index) for store, index in self.tile_index.harvestable.items()]
+    
+    def get_irrigated_tiles(self) -> List[Tile]:
+        """All tiles with irrigation installed"""
+        return [self._tile_at_index(store, index) for store, index in self.tile_index.irrigated.items()]
+    
+    def get_tasked_tiles(self, task_type: Optional[str] = None) -> List[Tile]:
+        """All tiles with a task assignment (optionally of one task type)"""
+        task_types = [task_type] if task_type else list(self.tile_index.tasks.keys())
+        return [self._tile_at_index(store, index)
+                for name in task_types
+                for store, index in self.tile_index.task_set(name).items()]
+    
+    def get_building_tiles(self, building_type_id: str) -> List[Tile]:
+        """All tiles holding a building of the given type"""
+        return [self._tile_at_index(store, index)
+                for store, index in self.tile_index.building_set(building_type_id).items()]
+    
+    def get_tile_counts(self) -> Dict[str, int]:
+        """Number of planted, harvestable, irrigated, tasked and building tiles"""
+        return self.tile_index.counts()
+    
+    @property
+    def grid(self) -> GridRows:
+        """Row-major view of all tiles (grid[y][x])"""
+        return GridRows(self)
     
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
-        """Get tile at grid position"""
-        if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
-            return self.grid[y][x]
-        return None
+        """Get tile at grid position (allocates its chunk on first access)"""
+        store = self.chunked_grid.chunk_for(x, y)
+        if store is None:
+            return None
+        return Tile(x, y, store, store.index_of(x, y))
+    
+    def _tile_at_index(self, store: TileStore, index: int) -> Tile:
+        """Get the tile view for a flat index within a chunk store"""
+        x, y = store.position_of(index)
+        return Tile(x, y, store, int(index))
     
     def get_tile_at_pixel(self, px: int, py: int) -> Optional[Tile]:
         """Get tile at pixel position with enhanced grid transformation support"""
@@ -526,7 +852,7 @@ class GridManager:
         
         if py < 0:  # Click in UI area
             return None
-            
+        
         grid_x = px // TILE_SIZE
         grid_y = py // TILE_SIZE
         
@@ -567,9 +893,7 @@ class GridManager:
                         # Emit tile deselected to close any open panels
                         self.event_system.emit('tile_deselected', {})
                     
-                    self._clear_selection()
-                    self.selected_tiles = [tile]
-                    tile.highlight = True
+                    self.selected_tiles.set_rect(tile.x, tile.y, tile.x + 1, tile.y + 1)
                 else:
                     # Clicked on empty area - deselect and close panels
                     self.event_system.emit('tile_deselected', {})
@@ -586,7 +910,7 @@ class GridManager:
         if self.building_placement_preview:
             # Skip drag selection during building placement
             return
-            
+        
         if self.drag_start_pos:
             self.drag_current_pos = pos
             self._update_drag_selection()
@@ -594,9 +918,10 @@ class GridManager:
     def handle_mouse_up(self, pos: Tuple[int, int], button: int):
         """Handle mouse button up"""
         if button == 1:  # Left click
-            if self.drag_start_pos and self.drag_current_pos:
-                # Finalize selection
-                pass
+            if self.drag_start_pos and self.selected_tiles:
+                # Finalize selection: hand the rectangle selection itself to the smart actions,
+                # which summarize it from the tile index sets
+                self.event_system.emit('tiles_selected', {'tiles': self.selected_tiles})
             
             self.drag_start_pos = None
             self.drag_current_pos = None
@@ -649,40 +974,51 @@ class GridManager:
         min_y = min(start_gy, end_gy)
         max_y = max(start_gy, end_gy)
         
-        # Clear and rebuild selection
-        self._clear_selection()
-        
-        for y in range(max(0, min_y), min(GRID_HEIGHT, max_y + 1)):
-            for x in range(max(0, min_x), min(GRID_WIDTH, max_x + 1)):
-                tile = self.grid[y][x]
-                self.selected_tiles.append(tile)
-                tile.highlight = True
+        # Replace the selection rectangle (no-op while the drag stays on the same tiles)
+        self.selected_tiles.set_rect(min_x, min_y, max_x + 1, max_y + 1)
     
     def _clear_selection(self):
         """Clear current tile selection"""
-        for tile in self.selected_tiles:
-            tile.highlight = False
         self.selected_tiles.clear()
+        self.event_system.emit('selection_cleared', {})
+    
+    def get_selected_tiles_for_task(self, task_type: str) -> List[Tile]:
+        """
+        Selected tiles that a task can be assigned to
+        
+        Candidates come from the harvestable index (harvest) or a vectorized terrain
+        check per chunk (till/plant), and only those are checked tile by tile.
+        """
+        if task_type == 'harvest':
+            candidates = self.selected_tiles.tiles_in(self.tile_index.harvestable)
+        elif task_type in ('till', 'plant'):
+            terrain_id = TERRAIN_TABLE.id_for('soil' if task_type == 'till' else 'tilled')
+            candidates = (self._tile_at_index(store, index)
+                          for store, indices in self.selected_tiles.iter_store_indices(create=True)
+                          for index in indices[(store.terrain[indices] == terrain_id) &
+                                               (store.crop_id[indices] == NO_ID)].tolist())
+        else:
+            return []
+        tiles = [tile for tile in candidates if self._can_assign_task(tile, task_type)]
+        tiles.sort(key=lambda tile: (tile.y, tile.x))  # Row-major, like the old selection list
+        return tiles
     
     def assign_task_to_selection(self, task_type: str, employee_id: str):
         """Assign a task to all selected tiles"""
-        assigned_count = 0
+        assigned_tiles = self.get_selected_tiles_for_task(task_type)
+        for tile in assigned_tiles:
+            tile.task_assignment = task_type
+            tile.task_assigned_to = employee_id
         
-        for tile in self.selected_tiles:
-            if self._can_assign_task(tile, task_type):
-                tile.task_assignment = task_type
-                tile.task_assigned_to = employee_id
-                assigned_count += 1
-        
-        if assigned_count > 0:
+        if assigned_tiles:
             self.event_system.emit('task_assigned', {
                 'task_type': task_type,
                 'employee_id': employee_id,
-                'tile_count': assigned_count,
-                'tiles': self.selected_tiles.copy()
+                'tile_count': len(assigned_tiles),
+                'tiles': assigned_tiles
             })
         
-        return assigned_count
+        return len(assigned_tiles)
     
     def _can_assign_task(self, tile: Tile, task_type: str) -> bool:
         """Check if a task can be assigned to a tile"""
@@ -696,23 +1032,167 @@ class GridManager:
         return False
     
     def update(self, dt: float):
-        """Update grid state"""
-        # Update crop growth based on game time progression
-        # Get time speed from time manager if available
-        if hasattr(self, 'time_manager') and self.time_manager:
-            time_speed = getattr(self.time_manager, 'time_speed', 1)
-            # Apply time speed to growth: faster game time = faster crop growth
-            game_time_dt = dt * time_speed
+        """Update grid state by dt game seconds (one simulation tick)"""
+        # Convert game seconds to game days (20 minutes of game time = 1 game day)
+        days_per_tick = dt / (20 * 60)
+        
+        # Only tiles whose next growth stage deadline has passed are touched
+        changes = self.maturation_scheduler.advance(days_per_tick)
+        if changes:
+            self._emit_growth_events(changes)
+    
+    def _advance_crop_growth(self, days_passed: float, growth_modifier: float = 1.0,
+                             irrigated_growth_modifier: Optional[float] = None) -> int:
+        """Run the batched growth kernel and notify only for tiles that changed stage"""
+        # Lump growth edits days_growing directly, so bank scheduled growth first
+        # and recompute every deadline afterwards
+        self.maturation_scheduler.sync_all()
+        changes = []
+        for store in self.tile_index.planted.stores():  # Skip chunks without crops
+            changed = store.advance_growth(days_passed, growth_modifier, irrigated_growth_modifier)
+            if changed.size:
+                changes.append((store, changed))
+        self.maturation_scheduler.rebuild()
+        if changes:
+            self._emit_growth_events(changes)
+        return sum(int(changed.size) for _, changed in changes)
+    
+    def _emit_growth_events(self, changes: List[Tuple[TileStore, np.ndarray]]):
+        """Emit one coalesced ready-for-harvest event per crop type across all chunks"""
+        positions_by_crop: Dict[int, List[Tuple[int, int]]] = {}
+        for store, changed_indices in changes:
+            harvestable = changed_indices[store.growth_stage[changed_indices] == MAX_GROWTH_STAGE]
+            self.tile_index.refresh_many(store, harvestable)  # Growth writes the columns directly
+            for index, crop_id in zip(harvestable.tolist(), store.crop_id[harvestable].tolist()):
+                positions_by_crop.setdefault(crop_id, []).append(store.position_of(index))
+        
+        for crop_id, positions in positions_by_crop.items():
+            self.event_system.emit('crop_growth_stage_changed', {
+                'crop_type': CROP_TABLE.name_for(crop_id),
+                'stage': MAX_GROWTH_STAGE,
+                'tile_count': len(positions),
+                'positions': positions
+            })
+    
+    def harvest_tiles(self, tiles=None, weather_yield_modifier: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Harvest many tiles in one vectorized pass per chunk
+        
+        Applies the same yield rules as Tile.harvest (soil quality and water, rotation,
+        soil health, specialization and building bonuses) from column arrays and
+        per-crop factor tables instead of per-tile method calls, then resets the tiles.
+        
+        Args:
+            tiles: Tiles to harvest (unripe tiles are skipped), or None for every
+                harvestable tile on the farm
+            weather_yield_modifier: Extra yield multiplier (defaults to the current
+                weather's, tracked from weather_updated events)
+        
+        Returns:
+            Per-crop totals: {crop_type: {'quantity', 'tiles', 'quality'}} where quality
+            is the quantity-weighted average harvest quality
+        """
+        if tiles is None:
+            groups = {store: np.fromiter(indices, dtype=np.intp, count=len(indices))
+                      for store, indices in self.tile_index.harvestable.members.items()}
         else:
-            game_time_dt = dt
+            grouped: Dict[TileStore, List[int]] = {}
+            for tile in tiles:
+                grouped.setdefault(tile._store, []).append(tile._index)
+            groups = {store: np.unique(np.array(indices, dtype=np.intp)) for store, indices in grouped.items()}
+        
+        if weather_yield_modifier is None:
+            weather_yield_modifier = self.weather_yield_modifier
+        factors = self._harvest_factor_tables()
+        totals: Dict[str, Dict] = {}
+        for store, indices in groups.items():
+            indices = indices[(store.crop_id[indices] != NO_ID) &
+                              (store.growth_stage[indices] >= MAX_GROWTH_STAGE)]
+            if indices.size == 0:
+                continue
+            crop_ids = store.crop_id[indices].copy()
+            yields, qualities = self._harvest_yields(store, indices, factors, weather_yield_modifier)
+            self._reset_harvested(store, indices)
             
-        # Convert real seconds to game time (20 minutes real = 1 game day)
-        days_per_frame = game_time_dt / (20 * 60)
-        
-        for row in self.grid:
-            for tile in row:
-                if tile.current_crop:
-                    tile.update_growth(days_per_frame)
+            for crop_id in np.unique(crop_ids).tolist():
+                mask = crop_ids == crop_id
+                total = totals.setdefault(CROP_TABLE.name_for(crop_id), {'quantity': 0, 'tiles': 0, 'quality': 0.0})
+                total['quantity'] += int(yields[mask].sum())
+                total['tiles'] += int(mask.sum())
+                total['quality'] += float((qualities[mask] * yields[mask]).sum())  # Normalized below
+        
+        for total in totals.values():
+            total['quality'] = total['quality'] / total['quantity'] if total['quantity'] else 0.0
+        return totals
+    
+    def _harvest_factor_tables(self) -> Dict:
+        """Per-crop and farm-wide yield factors shared by every tile of a batch harvest"""
+        crop_count = len(CROP_TABLE.names)
+        crop_bonus = np.ones(crop_count, dtype=np.float64)
+        overall_bonus = 1.0
+        rotation_multiplier = 1.0
+        
+        spec_manager = getattr(self.game_manager, 'specialization_manager', None)
+        if spec_manager is not None:
+            # Crop-specific bonuses only ever increase yield (same rules as Tile.harvest)
+            for crop_type, bonus_type in (('wheat', 'wheat_yield_multiplier'), ('tomatoes', 'tomato_yield_multiplier')):
+                bonus = spec_manager.get_bonus_multiplier(bonus_type, 1.0)
+                crop_id = CROP_TABLE.lookup(crop_type)
+                if bonus > 1.0 and crop_id != NO_ID:
+                    crop_bonus[crop_id] = bonus
+            overall_bonus = max(1.0, spec_manager.get_bonus_multiplier('overall_crop_quality', 1.0))
+            rotation_multiplier = max(1.0, spec_manager.get_bonus_multiplier('rotation_bonus_multiplier', 1.0))
+        
+        return {
+            'base_yield': crop_base_yields(),
+            'crop_bonus': crop_bonus,
+            'overall_bonus': overall_bonus,
+            'rotation_multiplier': rotation_multiplier
+        }
+    
+    def _harvest_yields(self, store: TileStore, indices: np.ndarray, factors: Dict,
+                        weather_yield_modifier: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Final yields and harvest qualities for ripe tiles of one store"""
+        crop_ids = store.crop_id[indices]
+        soil_modifier = store.soil_quality[indices] / 10.0
+        water_modifier = store.water_level[indices].astype(np.float64) / 100.0
+        yields = factors['base_yield'][crop_ids] * soil_modifier * water_modifier
+        
+        # Rotation bonuses are sparse (only tiles planted with a bonus have one)
+        rotation = np.fromiter((store.rotation_bonuses.get(index, {}).get('yield', 0.0)
+                                for index in indices.tolist()), dtype=np.float64, count=len(indices))
+        yields *= 1.0 + rotation
+        yields *= store.soil_health_multipliers(indices)
+        
+        # Specialization bonuses
+        yields *= factors['crop_bonus'][crop_ids]
+        yields *= factors['overall_bonus']
+        if factors['rotation_multiplier'] > 1.0:
+            yields *= 1.0 + (factors['rotation_multiplier'] - 1.0) * rotation
+        
+        # Building bonuses from the influence rasters (whole units, like calculate_crop_yield_at)
+        xs = indices % store.width + store.origin_x
+        ys = indices // store.width + store.origin_y
+        if self.building_manager:
+            yields = np.floor(np.floor(yields) * self.building_manager.influence_maps.get_multipliers('crop_yield', xs, ys))
+        elif len(self.tile_index.building_locations_of('storage_silo')):
+            # Legacy silo bonus when running without a building manager
+            yields *= [1.10 if self.find_buildings_within(x, y, 'storage_silo', 4) else 1.0
+                       for x, y in zip(xs.tolist(), ys.tolist())]
+        
+        yields = np.maximum(1, (yields * weather_yield_modifier).astype(np.int64))
+        qualities = soil_modifier * water_modifier
+        return yields, qualities
+    
+    def _reset_harvested(self, store: TileStore, indices: np.ndarray):
+        """Clear harvested tiles back to tilled soil (same end state as Tile.harvest)"""
+        store.crop_id[indices] = NO_ID
+        store.terrain[indices] = TERRAIN_TABLE.id_for('tilled')
+        store.growth_stage[indices] = 0
+        store.days_growing[indices] = 0.0
+        store.growth_synced[indices] = np.nan
+        store.growth_generation[indices] += 1  # Drop pending maturation deadlines
+        self.tile_index.refresh_many(store, indices)
     
     def render(self, screen: pygame.Surface):
         """Render the grid using enhanced rendering system"""
@@ -785,25 +1265,29 @@ class GridManager:
         
         print(f"Grid Manager: Day passed, updating crop growth by {days_passed} days (weather: {weather_event}, modifier: {weather_growth_modifier:.2f}x)")
         
-        crops_updated = 0
-        for row in self.grid:
-            for tile in row:
-                # Calculate tile-specific growth modifier considering irrigation
-                tile_growth_modifier = weather_growth_modifier
-                
-                # Apply irrigation bonus during drought if tile has irrigation
-                if (weather_event == 'drought' and tile.has_irrigation and 
-                    weather_growth_modifier < 1.0):
-                    # Irrigation provides 30% boost during drought (from config)
-                    irrigation_boost = IRRIGATION_DROUGHT_MITIGATION
-                    tile_growth_modifier = min(1.0, weather_growth_modifier + irrigation_boost)
-                    
-                if tile.update_growth(days_passed, tile_growth_modifier):
-                    crops_updated += 1
+        weather_growth_modifier, irrigated_growth_modifier = self._weather_growth_modifiers(
+            weather_growth_modifier, weather_event)
+        
+        crops_updated = self._advance_crop_growth(days_passed, weather_growth_modifier, irrigated_growth_modifier)
         
         if crops_updated > 0:
             print(f"Updated growth for {crops_updated} crops with weather effects")
     
+    def _handle_weather_updated(self, event_data):
+        """Re-key growth deadlines when the weather changes the growth rate"""
+        self.weather_yield_modifier = event_data.get('yield_modifier', 1.0)
+        growth_modifier, irrigated_growth_modifier = self._weather_growth_modifiers(
+            event_data.get('growth_modifier', 1.0), event_data.get('weather_event', 'clear'))
+        self.maturation_scheduler.set_growth_modifiers(growth_modifier, irrigated_growth_modifier)
+    
+    def _weather_growth_modifiers(self, weather_growth_modifier: float, weather_event: str) -> Tuple[float, Optional[float]]:
+        """Growth modifier for all tiles and the irrigated-tile override (drought only)"""
+        # Irrigation provides a boost during drought (from config)
+        irrigated_growth_modifier = None
+        if weather_event == 'drought' and weather_growth_modifier < 1.0:
+            irrigated_growth_modifier = min(1.0, weather_growth_modifier + IRRIGATION_DROUGHT_MITIGATION)
+        return weather_growth_modifier, irrigated_growth_modifier
+    
     def _handle_task_assignment(self, event_data):
         """Handle task assignment events"""
         # Tasks are assigned by this manager, so just log for now
@@ -852,30 +1336,28 @@ class GridManager:
     
     def find_buildings_of_type(self, building_type_id: str) -> List[Tuple[int, int]]:
         """Find all buildings of a specific type and return their coordinates"""
-        buildings = []
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                tile = self.grid[y][x]
-                if tile.building_type == building_type_id:
-                    buildings.append((x, y))
-        return buildings
+        return self.tile_index.building_set(building_type_id).positions()
     
     def find_nearest_building(self, from_x: int, from_y: int, building_type_id: str) -> Optional[Tuple[int, int]]:
-        """Find the nearest building of a specific type"""
-        buildings = self.find_buildings_of_type(building_type_id)
-        if not buildings:
+        """Find the nearest building of a specific type (Manhattan distance)"""
+        locations = self.tile_index.building_locations.get(building_type_id)
+        if not locations:
             return None
         
-        min_distance = float('inf')
-        nearest = None
-        
-        for bx, by in buildings:
-            distance = abs(from_x - bx) + abs(from_y - by)  # Manhattan distance
-            if distance < min_distance:
-                min_distance = distance
-                nearest = (bx, by)
-        
-        return nearest
+        # Bucketed search only visits buckets that could hold a closer building
+        nearest = locations.nearest(from_x, from_y)
+        return nearest[0] if nearest else None
+    
+    def find_buildings_within(self, x: float, y: float, building_type_id: str, radius: float) -> List[Tuple[int, int]]:
+        """Find buildings of a type within a Manhattan radius of a position"""
+        locations = self.tile_index.building_locations.get(building_type_id)
+        if not locations:
+            return []
+        return locations.query_radius(x, y, radius)
+    
+    def get_amenity_field(self, building_type_id: str) -> Optional[FlowField]:
+        """Flow field toward the nearest building of a type (None if there are none)"""
+        return self.amenity_fields.get(building_type_id)
     
     def get_building_interaction_tiles(self, building_x: int, building_y: int) -> List[Tuple[int, int]]:
         """Get adjacent tiles where employees can interact with a building"""
@@ -887,7 +1369,7 @@ class GridManager:
                     continue
                 
                 x, y = building_x + dx, building_y + dy
-                if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
+                if 0 <= x < self.width and 0 <= y < self.height:
                     tile = self.get_tile(x, y)
                     # Employee can interact if tile is not occupied
                     if tile and not tile.is_occupied:
@@ -1003,7 +1485,7 @@ class GridManager:
                 tile_y = center_y + dy
                 
                 # Skip tiles outside the grid boundaries
-                if tile_x < 0 or tile_x >= GRID_WIDTH or tile_y < 0 or tile_y >= GRID_HEIGHT:
+                if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
                     continue
                 
                 # Calculate screen pixel coordinates for this tile
@@ -21,16 +21,17 @@ Design Goals:
 Usage:
     inventory = InventoryManager(event_system)
     inventory.add_crop('corn', 15)  # Add 15 corn from harvest
+    inventory.add_crops_batch({('corn', 0.8, 3): 40})  # A tick of employee harvests
     inventory.sell_crop('corn', 10, current_price)  # Sell 10 corn
     total_corn = inventory.get_crop_count('corn')
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from scripts.core.config import *
 
 
-@dataclass
+@dataclass(slots=True)
 class CropEntry:
     """Individual crop storage entry with metadata"""
     crop_type: str
@@ -124,6 +125,69 @@ class InventoryManager:
         print(f"Added {quantity} {crop_type} to inventory (quality: {quality:.2f})")
         return True
     
+    def add_crops_batch(self, batch: Dict[Tuple[str, float, int], int]) -> Dict[str, int]:
+        """
+        Add a tick's worth of harvests in one go
+        
+        Quantities sharing a (crop type, quality, harvest day) key merge into one
+        CropEntry, topping up a same-day entry already in storage when there is one,
+        and the whole batch emits a single inventory_updated event.
+        
+        Args:
+            batch: (crop_type, quality, harvest_day) -> units harvested
+            
+        Returns:
+            Units stored per crop type (less than harvested once storage fills up)
+        """
+        stored: Dict[str, int] = {}
+        overflow: Dict[str, int] = {}
+        for (crop_type, quality, harvest_day), quantity in batch.items():
+            if quantity <= 0:
+                continue
+            
+            # Partial storage once capacity runs out
+            space = max(self.storage_capacity - self.current_storage, 0)
+            if quantity > space:
+                overflow[crop_type] = overflow.get(crop_type, 0) + quantity - space
+                quantity = space
+            if quantity <= 0:
+                continue
+            
+            entries = self.crops.setdefault(crop_type, [])
+            for entry in reversed(entries):
+                if entry.harvest_day != harvest_day:
+                    # Entries are in harvest order, so older days can't match
+                    entries.append(CropEntry(crop_type, quantity, quality, harvest_day))
+                    break
+                if entry.quality == quality:
+                    entry.quantity += quantity
+                    break
+            else:
+                entries.append(CropEntry(crop_type, quantity, quality, harvest_day))
+            self.current_storage += quantity
+            stored[crop_type] = stored.get(crop_type, 0) + quantity
+        
+        if overflow:
+            event = 'storage_nearly_full' if stored else 'storage_full'
+            self.event_system.emit(event, {
+                'stored_quantity': sum(stored.values()),
+                'overflow_quantity': sum(overflow.values()),
+                'overflow_by_crop': overflow,
+                'available_space': self.storage_capacity - self.current_storage
+            })
+        
+        if stored:
+            self.event_system.emit('inventory_updated', {
+                'crops_added': stored,
+                'quantity_added': sum(stored.values()),
+                'total_quantities': {crop_type: self.get_crop_count(crop_type) for crop_type in stored},
+                'storage_used': self.current_storage,
+                'storage_capacity': self.storage_capacity
+            })
+            print(f"Added {', '.join(f'{quantity} {crop_type}' for crop_type, quantity in stored.items())} to inventory")
+        
+        return stored
+    
     def sell_crop(self, crop_type: str, quantity: int, price_per_unit: float) -> float:
         """
         Sell crops from inventory
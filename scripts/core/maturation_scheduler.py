@@ -0,0 +1,199 @@
+"""
+Maturation Scheduler - Event-driven crop growth for the tile store
+
+Instead of touching every planted tile every frame, the scheduler computes the game
+time at which each planted tile will cross its next GROWTH_STAGES boundary and keeps
+those deadlines in a min-heap. Each frame only advances a shared growth clock and pops
+the tiles whose deadline has passed.
+
+Key Features:
+- Shared growth clock (game days) referenced by every registered TileStore
+- Per-tile growth rate (weather modifier, with drought mitigation on irrigated tiles)
+- days_growing is materialized lazily: exact value = synced value + elapsed clock * rate
+- Lazy heap deletion via a per-tile generation counter (replant, harvest, re-key)
+- Whole-farm re-key when a weather change alters the growth modifier
+
+Design Goals:
+- Per-frame growth cost proportional to the number of stage changes, not planted tiles
+- Identical stage results to the batched growth kernel
+- Works with any number of stores so chunked grids can register each chunk
+
+Usage:
+    scheduler = MaturationScheduler()
+    scheduler.register_store(grid_manager.tile_store)
+    changed = scheduler.advance(days_per_frame)  # [(store, indices), ...]
+    scheduler.set_growth_modifiers(0.6, irrigated_growth_modifier=0.9)  # Weather change
+"""
+
+import heapq
+import itertools
+import numpy as np
+from typing import List, Optional, Tuple
+from scripts.core.tile_store import TileStore, NO_ID, MAX_GROWTH_STAGE, crop_days_per_stage
+
+
+class GrowthClock:
+    """Shared game-day clock that stores use to materialize days_growing"""
+    
+    __slots__ = ('now',)
+    
+    def __init__(self):
+        self.now = 0.0
+
+
+class MaturationScheduler:
+    """Heap of per-tile growth stage deadlines keyed by growth clock time"""
+    
+    def __init__(self):
+        """Initialize an empty scheduler at clock time zero"""
+        self.clock = GrowthClock()
+        self.stores: List[TileStore] = []
+        
+        # Current weather growth rates (applied to tiles as they are scheduled)
+        self.growth_modifier = 1.0
+        self.irrigated_growth_modifier: Optional[float] = None
+        
+        # Heap entries: (deadline, sequence, store, index, generation, target_stage)
+        self._heap: list = []
+        self._sequence = itertools.count()  # Tie breaker so stores are never compared
+    
+    def register_store(self, store: TileStore):
+        """Attach a store to the shared clock and schedule its planted tiles"""
+        store.growth_clock = self.clock
+        self.stores.append(store)
+        self._schedule(store, store.planted_indices(), heapify=True)
+    
+    def unregister_store(self, store: TileStore, rebuild: bool = True):
+        """Detach a store (its pending heap entries are dropped on rebuild)"""
+        if store in self.stores:
+            store.sync_growth()
+            store.growth_clock = None
+            self.stores.remove(store)
+            if rebuild:
+                self.rebuild()
+    
+    def advance(self, days_passed: float) -> List[Tuple[TileStore, np.ndarray]]:
+        """
+        Advance the growth clock and process every tile whose deadline has passed
+        
+        Returns:
+            List of (store, flat indices) for tiles whose growth stage changed
+        """
+        self.clock.now += days_passed
+        self._drain_pending()
+        
+        now = self.clock.now
+        heap = self._heap
+        changed = {}
+        days_per_stage_table = crop_days_per_stage()
+        
+        while heap and heap[0][0] <= now:
+            _, _, store, index, generation, target_stage = heapq.heappop(heap)
+            
+            # Stale entry (tile replanted, harvested or re-keyed since it was pushed)
+            if store.growth_generation[index] != generation or store.crop_id[index] == NO_ID:
+                continue
+            
+            days_per_stage = days_per_stage_table[store.crop_id[index]]
+            days_growing = store.current_days_growing(index)
+            store.days_growing[index] = days_growing
+            store.growth_synced[index] = now
+            
+            # Trust the deadline for the target stage so rounding can never stall a tile
+            current_stage = int(store.growth_stage[index])
+            new_stage = max(target_stage, current_stage, min(MAX_GROWTH_STAGE, int(days_growing / days_per_stage)))
+            if new_stage > current_stage:
+                store.growth_stage[index] = new_stage
+                changed.setdefault(store, []).append(index)
+            
+            if new_stage < MAX_GROWTH_STAGE:
+                rate = store.growth_rate[index]
+                if rate > 0:
+                    deadline = now + ((new_stage + 1) * days_per_stage - days_growing) / rate
+                    heapq.heappush(heap, (deadline, next(self._sequence), store, index, generation, new_stage + 1))
+        
+        return [(store, np.array(indices, dtype=np.intp)) for store, indices in changed.items()]
+    
+    def set_growth_modifiers(self, growth_modifier: float, irrigated_growth_modifier: Optional[float] = None) -> bool:
+        """Change the weather growth rate, re-keying every planted tile if it differs
+        
+        Returns:
+            True if the rates changed and the heap was rebuilt
+        """
+        if (growth_modifier == self.growth_modifier and
+                irrigated_growth_modifier == self.irrigated_growth_modifier):
+            return False
+        
+        # Bank growth at the old rates before switching
+        self.sync_all()
+        self.growth_modifier = growth_modifier
+        self.irrigated_growth_modifier = irrigated_growth_modifier
+        self.rebuild()
+        return True
+    
+    def sync_all(self):
+        """Materialize days_growing on every store so it can be edited directly"""
+        for store in self.stores:
+            store.sync_growth()
+    
+    def rebuild(self):
+        """Recompute every deadline from the current store state"""
+        self._heap = []
+        for store in self.stores:
+            store.pending_growth.clear()
+            self._schedule(store, store.planted_indices(), heapify=False)
+        heapq.heapify(self._heap)
+    
+    def pending_count(self) -> int:
+        """Number of heap entries (including stale ones awaiting lazy deletion)"""
+        return len(self._heap)
+    
+    def _drain_pending(self):
+        """Schedule tiles that were planted or edited since the last advance"""
+        for store in self.stores:
+            if store.pending_growth:
+                indices = np.unique(np.array(store.pending_growth, dtype=np.intp))
+                store.pending_growth.clear()
+                self._schedule(store, indices[store.crop_id[indices] != NO_ID], heapify=False)
+    
+    def _schedule(self, store: TileStore, indices: np.ndarray, heapify: bool):
+        """Sync, apply current rates and push next-stage deadlines for the given tiles"""
+        if indices.size == 0:
+            return
+        
+        now = self.clock.now
+        store.sync_growth(indices)
+        
+        # Per-tile rate (drought mitigation only applies to irrigated tiles)
+        if self.irrigated_growth_modifier is None:
+            rates = np.full(indices.size, self.growth_modifier, dtype=np.float64)
+        else:
+            rates = np.where(store.irrigation[indices], self.irrigated_growth_modifier, self.growth_modifier)
+        store.growth_rate[indices] = rates
+        store.growth_synced[indices] = now
+        store.growth_generation[indices] += 1
+        
+        days_per_stage = crop_days_per_stage()[store.crop_id[indices]]
+        stages = store.growth_stage[indices].astype(np.int64)
+        days_growing = store.days_growing[indices]
+        
+        # Only growable, not-yet-harvestable tiles with a positive rate get deadlines
+        schedulable = np.isfinite(days_per_stage) & (stages < MAX_GROWTH_STAGE) & (rates > 0)
+        if not schedulable.any():
+            return
+        indices = indices[schedulable]
+        target_stages = stages[schedulable] + 1
+        deadlines = now + (target_stages * days_per_stage[schedulable] - days_growing[schedulable]) / rates[schedulable]
+        generations = store.growth_generation[indices]
+        
+        entries = [
+            (deadline, next(self._sequence), store, index, generation, target_stage)
+            for deadline, index, generation, target_stage in zip(
+                deadlines.tolist(), indices.tolist(), generations.tolist(), target_stages.tolist())
+        ]
+        if heapify:
+            self._heap.extend(entries)
+            heapq.heapify(self._heap)
+        else:
+            for entry in entries:
+                heapq.heappush(self._heap, entry)
@@ -24,9 +24,12 @@ Usage:
 
 import json
 import os
+import numpy as np
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from scripts.core.config import *
+from scripts.core.tile_store import TERRAIN_TABLE, CROP_TABLE, BUILDING_TABLE, TASK_TABLE
 
 
 class SaveManager:
@@ -40,7 +43,8 @@ class SaveManager:
         # Save directory and file management
         self.save_directory = "saves"
         self.auto_save_file = "autosave.json"
-        self.save_version = "1.0"  # Version for compatibility tracking
+        self.save_version = "1.1"  # Version for compatibility tracking (1.1 = chunked grid)
+        self.compatible_versions = ("1.0", "1.1")  # 1.0 saves use the dense per-tile grid format
         
         # Auto-save configuration
         self.auto_save_enabled = True
@@ -93,7 +97,7 @@ class SaveManager:
             })
             
             return True
-            
+        
         except Exception as e:
             print(f"Error saving game: {e}")
             self.event_system.emit('save_failed', {
@@ -149,7 +153,7 @@ class SaveManager:
                 })
             
             return success
-            
+        
         except Exception as e:
             print(f"Error loading game: {e}")
             self.event_system.emit('load_failed', {
@@ -261,32 +265,36 @@ class SaveManager:
         """Get grid manager state for saving"""
         grid_manager = self.game_manager.grid_manager
         
-        # Serialize all tiles
-        tiles_data = []
-        for row in grid_manager.grid:
-            row_data = []
-            for tile in row:
-                tile_data = {
-                    'x': tile.x,
-                    'y': tile.y,
-                    'terrain_type': tile.terrain_type,
-                    'soil_quality': tile.soil_quality,
-                    'water_level': tile.water_level,
-                    'current_crop': tile.current_crop,
-                    'growth_stage': tile.growth_stage,
-                    'days_growing': tile.days_growing,
-                    'task_assignment': tile.task_assignment,
-                    'task_assigned_to': tile.task_assigned_to,
-                    'building_type': tile.building_type,
-                    'is_occupied': tile.is_occupied
-                }
-                row_data.append(tile_data)
-            tiles_data.append(row_data)
+        # Bank scheduled crop growth so days_growing columns are exact
+        grid_manager.maturation_scheduler.sync_all()
+        
+        # Serialize allocated chunks only (untouched chunks are regenerated on demand)
+        chunks_data = [self._serialize_chunk(store) for store in grid_manager.iter_chunks()]
         
         return {
-            'grid_width': GRID_WIDTH,
-            'grid_height': GRID_HEIGHT,
-            'tiles': tiles_data
+            'grid_width': grid_manager.width,
+            'grid_height': grid_manager.height,
+            'chunk_size': grid_manager.chunk_size,
+            'chunks': chunks_data
+        }
+    
+    def _serialize_chunk(self, store) -> Dict[str, Any]:
+        """Serialize one chunk's tile columns (row-major within the chunk)"""
+        return {
+            'origin_x': store.origin_x,
+            'origin_y': store.origin_y,
+            'width': store.width,
+            'height': store.height,
+            'terrain_type': [TERRAIN_TABLE.name_for(i) for i in store.terrain.tolist()],
+            'soil_quality': store.soil_quality.tolist(),
+            'water_level': store.water_level.tolist(),
+            'current_crop': [CROP_TABLE.name_for(i) for i in store.crop_id.tolist()],
+            'growth_stage': store.growth_stage.tolist(),
+            'days_growing': store.days_growing.tolist(),
+            'task_assignment': [TASK_TABLE.name_for(i) for i in store.task_id.tolist()],
+            'task_assigned_to': {str(index): employee_id for index, employee_id in store.task_assigned_to.items()},
+            'building_type': [BUILDING_TABLE.name_for(i) for i in store.building_id.tolist()],
+            'is_occupied': store.occupied.tolist()
         }
     
     def _get_employee_manager_state(self) -> Dict[str, Any]:
@@ -319,8 +327,13 @@ class SaveManager:
             }
             employees_data.append(employee_data)
         
+        # Unclaimed jobs waiting on the job board
+        job_board_data = [{'x': tile.x, 'y': tile.y, 'type': task_type, **params}
+                          for tile, task_type, params in employee_manager.job_board.export()]
+        
         return {
             'employees': employees_data,
+            'job_board': job_board_data,
             'next_employee_id': getattr(employee_manager, '_next_employee_id', 2)
         }
     
@@ -328,7 +341,7 @@ class SaveManager:
         """Serialize employee tasks, converting Tile objects to coordinates"""
         serialized_tasks = []
         for task in tasks:
-            serialized_task = task.copy()
+            serialized_task = task.to_dict()
             # Convert tile objects to coordinates
             if 'tiles' in serialized_task:
                 tile_coords = []
@@ -344,12 +357,12 @@ class SaveManager:
             serialized_tasks.append(serialized_task)
         return serialized_tasks
     
-    def _serialize_employee_task(self, task: dict) -> dict:
+    def _serialize_employee_task(self, task) -> dict:
         """Serialize a single employee task, converting Tile objects to coordinates"""
         if not task:
             return None
         
-        serialized_task = task.copy()
+        serialized_task = task.to_dict()
         # Convert tile objects to coordinates
         if 'tiles' in serialized_task:
             tile_coords = []
@@ -394,9 +407,8 @@ class SaveManager:
     
     def _is_compatible_version(self, save_version: str) -> bool:
         """Check if save file version is compatible with current game"""
-        # For now, only exact version match
-        # Future versions could implement backward compatibility
-        return save_version == self.save_version
+        # Older versions listed here are migrated on load
+        return save_version in self.compatible_versions
     
     def _apply_game_state(self, game_state: Dict[str, Any]) -> bool:
         """Apply loaded game state to all managers"""
@@ -411,7 +423,7 @@ class SaveManager:
             self._apply_ui_manager_state(game_state.get('ui_state', {}))
             
             return True
-            
+        
         except Exception as e:
             print(f"Error applying game state: {e}")
             return False
@@ -508,6 +520,16 @@ class SaveManager:
     def _apply_grid_manager_state(self, grid_state: Dict[str, Any]):
         """Apply grid manager state from save file"""
         grid_manager = self.game_manager.grid_manager
+        
+        if 'chunks' in grid_state:
+            # Chunked format: replace the whole grid with the saved chunks
+            grid_manager.clear_chunks()
+            for chunk_data in grid_state['chunks']:
+                self._apply_chunk_state(grid_manager, chunk_data)
+            grid_manager.maturation_scheduler.rebuild()
+            return
+        
+        # Legacy dense format (save version 1.0)
         tiles_data = grid_state.get('tiles', [])
         
         # Restore tile states
@@ -527,19 +549,47 @@ class SaveManager:
                     tile.is_occupied = tile_data.get('is_occupied', False)
                     # Note: building object will be restored by building manager
     
+    def _apply_chunk_state(self, grid_manager, chunk_data: Dict[str, Any]):
+        """Restore one saved chunk's tile columns"""
+        store = grid_manager.chunked_grid.chunk_for(chunk_data['origin_x'], chunk_data['origin_y'])
+        if store is None or store.width != chunk_data['width'] or store.height != chunk_data['height']:
+            print(f"Skipping saved chunk at ({chunk_data['origin_x']}, {chunk_data['origin_y']}): does not fit this farm")
+            return
+        
+        store.terrain[:] = [TERRAIN_TABLE.id_for(name) for name in chunk_data['terrain_type']]
+        store.soil_quality[:] = chunk_data['soil_quality']
+        store.water_level[:] = chunk_data['water_level']
+        store.crop_id[:] = [CROP_TABLE.id_for(name) for name in chunk_data['current_crop']]
+        store.growth_stage[:] = chunk_data['growth_stage']
+        store.days_growing[:] = chunk_data['days_growing']
+        store.growth_synced[:] = np.nan  # Rescheduled once all chunks are restored
+        store.task_id[:] = [TASK_TABLE.id_for(name) for name in chunk_data['task_assignment']]
+        store.task_assigned_to = {int(index): employee_id
+                                  for index, employee_id in chunk_data.get('task_assigned_to', {}).items()}
+        store.building_id[:] = [BUILDING_TABLE.id_for(name) for name in chunk_data['building_type']]
+        store.occupied[:] = chunk_data['is_occupied']
+        grid_manager.tile_index.refresh_store(store)
+        # Note: building objects will be restored by building manager
+    
     def _apply_employee_manager_state(self, employee_state: Dict[str, Any]):
         """Apply employee manager state from save file"""
         employee_manager = self.game_manager.employee_manager
         
-        # Clear existing employees
+        # Clear existing employees (and free their store slots and queued tiles)
+        for employee in employee_manager.employees.values():
+            employee_manager.employee_store.detach(employee)
         employee_manager.employees.clear()
+        employee_manager.task_index.clear()
         
         # Recreate employees from save data
         from scripts.employee.employee import Employee, EmployeeState
         employees_data = employee_state.get('employees', [])
         
         for emp_data in employees_data:
-            employee = Employee(emp_data['id'], emp_data['name'], emp_data['x'], emp_data['y'])
+            employee = Employee(emp_data['id'], emp_data['name'], emp_data['x'], emp_data['y'],
+                                store=employee_manager.employee_store)
+            employee.pathfinder = employee_manager.pathfinder
+            employee.task_index = employee_manager.task_index
             
             # Restore employee state
             employee.target_x = emp_data.get('target_x', employee.x)
@@ -555,22 +605,42 @@ class SaveManager:
             employee.traits = emp_data.get('traits', [])
             employee.work_efficiency = emp_data.get('work_efficiency', 1.0)
             employee.daily_wage = emp_data.get('daily_wage', BASE_EMPLOYEE_WAGE)
-            employee.assigned_tasks = self._deserialize_employee_tasks(emp_data.get('assigned_tasks', []))
-            employee.current_task = self._deserialize_employee_task(emp_data.get('current_task', None))
+            employee.assigned_tasks = deque(self._deserialize_employee_tasks(emp_data.get('assigned_tasks', []), employee))
+            # The current task is the queued task in progress, not a separate copy
+            employee.current_task = None
+            if emp_data.get('current_task'):
+                employee.current_task = next((task for task in employee.assigned_tasks
+                                              if task.status == 'in_progress'), None)
             
             # Re-apply traits
             for trait in employee.traits:
                 employee._apply_trait_effects(trait)
             
+            # Waypoints are not saved; re-plan the route of employees that were walking
+            if employee.state == EmployeeState.MOVING:
+                employee._set_destination(employee.target_x, employee.target_y)
+            
             # Add to dictionary using ID as key
             employee_manager.employees[employee.id] = employee
         
+        # Re-index the restored crew's positions
+        employee_manager.refresh_employee_positions()
+        
+        # Restore unclaimed jobs on the job board
+        employee_manager.job_board.clear()
+        for job_data in employee_state.get('job_board', []):
+            job = job_data.copy()
+            tile = self.game_manager.grid_manager.get_tile(job.pop('x'), job.pop('y'))
+            if tile:
+                employee_manager.job_board.post([tile], job.pop('type'), **job)
+        
         # Restore next ID counter
         if hasattr(employee_manager, '_next_employee_id'):
             employee_manager._next_employee_id = employee_state.get('next_employee_id', len(employees_data) + 1)
     
-    def _deserialize_employee_tasks(self, tasks_data: list) -> list:
+    def _deserialize_employee_tasks(self, tasks_data: list, employee) -> list:
         """Deserialize employee tasks, converting coordinates back to Tile objects"""
+        from scripts.employee.task_queue import Task
         deserialized_tasks = []
         grid_manager = self.game_manager.grid_manager
         
@@ -592,35 +662,9 @@ class SaveManager:
                     if tile:
                         completed_tiles.append(tile)
                 task['completed_tiles'] = completed_tiles
-            deserialized_tasks.append(task)
+            deserialized_tasks.append(Task.from_dict(task, employee, employee.task_index))
         return deserialized_tasks
     
-    def _deserialize_employee_task(self, task_data: dict) -> dict:
-        """Deserialize a single employee task, converting coordinates back to Tile objects"""
-        if not task_data:
-            return None
-        
-        task = task_data.copy()
-        grid_manager = self.game_manager.grid_manager
-        
-        # Convert tile coordinates back to Tile objects
-        if 'tiles' in task:
-            tiles = []
-            for coord in task['tiles']:
-                tile = grid_manager.get_tile(coord['x'], coord['y'])
-                if tile:
-                    tiles.append(tile)
-            task['tiles'] = tiles
-        # Handle completed_tiles if present
-        if 'completed_tiles' in task:
-            completed_tiles = []
-            for coord in task['completed_tiles']:
-                tile = grid_manager.get_tile(coord['x'], coord['y'])
-                if tile:
-                    completed_tiles.append(tile)
-            task['completed_tiles'] = completed_tiles
-        return task
-    
     def _apply_building_manager_state(self, building_state: Dict[str, Any]):
         """Apply building manager state from save file"""
         building_manager = self.game_manager.building_manager
@@ -655,6 +699,9 @@ class SaveManager:
                 
                 # Re-apply building benefits
                 building_manager._apply_building_benefits(building)
+        
+        # Re-rasterize spatial effects for the restored buildings
+        building_manager.rebuild_influence_maps()
     
     def _apply_ui_manager_state(self, ui_state: Dict[str, Any]):
         """Apply UI manager state from save file"""
@@ -686,7 +733,7 @@ class SaveManager:
                             'employees': len(data.get('employee_state', {}).get('employees', []))
                         }
                         saves.append(save_info)
-                        
+                    
                     except Exception as e:
                         print(f"Error reading save file {filename}: {e}")
         
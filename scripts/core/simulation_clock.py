@@ -0,0 +1,62 @@
+"""
+Simulation Clock - Fixed-timestep accumulator between frames and game ticks
+
+GameManager renders as often as the display allows but advances the farm in
+fixed game-time ticks. Every frame banks its real duration (times the game
+speed) and the clock pays it out as whole ticks of 1 / SIMULATION_TICK_RATE
+game seconds, carrying the remainder over to the next frame.
+
+Key Features:
+- Same tick length at every frame rate and game speed, so a run plays out the
+  same however it is rendered (faster speeds just run more ticks per frame)
+- At most SIMULATION_MAX_CATCH_UP_STEPS ticks per frame; time beyond that is
+  dropped so a stalled frame can't snowball into ever longer catch-up frames
+- alpha: fraction of a tick left in the accumulator, for drawing moving things
+  between their last two tick positions
+
+Usage:
+    clock = SimulationClock()
+    for _ in range(clock.advance(frame_dt, time_manager.time_speed)):
+        simulate(clock.tick_dt)
+    render(clock.alpha)
+"""
+
+from scripts.core.config import SIMULATION_TICK_RATE, SIMULATION_MAX_CATCH_UP_STEPS
+
+
+class SimulationClock:
+    """Accumulator turning variable frame times into fixed simulation ticks"""
+    
+    def __init__(self, tick_rate: float = SIMULATION_TICK_RATE, max_steps: int = SIMULATION_MAX_CATCH_UP_STEPS):
+        """Initialize a clock with no banked time"""
+        self.tick_dt = 1.0 / tick_rate  # Game seconds per tick
+        self.max_steps = max_steps
+        self.accumulator = 0.0  # Game seconds banked but not simulated yet
+        self.alpha = 0.0
+        
+        # Statistics
+        self.ticks = 0
+        self.dropped_time = 0.0  # Game seconds discarded by the catch-up limit
+    
+    def advance(self, frame_dt: float, speed: float = 1.0) -> int:
+        """
+        Bank a frame's worth of game time
+        
+        Args:
+            frame_dt: Real seconds since the last frame
+            speed: Game speed multiplier (0 while paused)
+        
+        Returns:
+            Number of ticks of tick_dt game seconds to simulate this frame
+        """
+        self.accumulator += frame_dt * speed
+        steps = int(self.accumulator / self.tick_dt + 1e-9)  # Tolerate float drift just below a tick boundary
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.tick_dt
+            steps = self.max_steps
+            self.accumulator = self.max_steps * self.tick_dt + self.accumulator % self.tick_dt
+        self.accumulator = max(self.accumulator - steps * self.tick_dt, 0.0)
+        
+        self.alpha = min(self.accumulator / self.tick_dt, 1.0)
+        self.ticks += steps
+        return steps
@@ -0,0 +1,188 @@
+"""
+Spatial Index - Bucketed grid for fast nearest and radius queries
+
+Stores items (buildings, employees, ...) at 2D positions in square buckets so that
+"nearest item" and "items within radius" queries only look at the buckets around the
+query point instead of every item on the farm.
+
+Key Features:
+- Insert, move and remove in O(1)
+- Nearest-item search that expands bucket rings outward and stops as soon as no
+  closer item can exist
+- Radius and rectangle queries that only visit overlapping buckets
+- Manhattan (tile) or Euclidean distance
+
+Design Goals:
+- Amenity lookups independent of total building count
+- Works with integer tile positions and float employee positions alike
+
+Usage:
+    index = BucketGrid(bucket_size=8)
+    index.insert((12, 4), 12, 4)
+    item, distance = index.nearest(10, 10)
+    nearby = index.query_radius(10, 10, 3)
+"""
+
+import math
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+
+class BucketGrid:
+    """Uniform bucket grid mapping items to 2D positions"""
+    
+    def __init__(self, bucket_size: int = 8, metric: str = 'manhattan'):
+        """Initialize an empty index with square buckets of bucket_size tiles"""
+        self.bucket_size = bucket_size
+        self.metric = metric
+        self.positions: Dict[Hashable, Tuple[float, float]] = {}
+        self.buckets: Dict[Tuple[int, int], Set[Hashable]] = {}
+        
+        # Bounding box of all buckets ever used (limits ring expansion)
+        self._min_bucket: Optional[Tuple[int, int]] = None
+        self._max_bucket: Optional[Tuple[int, int]] = None
+    
+    def __len__(self) -> int:
+        return len(self.positions)
+    
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.positions
+    
+    def _bucket_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Bucket coordinates holding a position"""
+        return (int(math.floor(x / self.bucket_size)), int(math.floor(y / self.bucket_size)))
+    
+    def _distance(self, ax: float, ay: float, bx: float, by: float) -> float:
+        """Distance between two points using the index metric"""
+        if self.metric == 'manhattan':
+            return abs(ax - bx) + abs(ay - by)
+        return math.hypot(ax - bx, ay - by)
+    
+    def insert(self, item: Hashable, x: float, y: float):
+        """Add an item (or move it if already present)"""
+        if item in self.positions:
+            self.move(item, x, y)
+            return
+        
+        self.positions[item] = (x, y)
+        bucket = self._bucket_of(x, y)
+        self.buckets.setdefault(bucket, set()).add(item)
+        
+        if self._min_bucket is None:
+            self._min_bucket = self._max_bucket = bucket
+        else:
+            self._min_bucket = (min(self._min_bucket[0], bucket[0]), min(self._min_bucket[1], bucket[1]))
+            self._max_bucket = (max(self._max_bucket[0], bucket[0]), max(self._max_bucket[1], bucket[1]))
+    
+    def remove(self, item: Hashable):
+        """Remove an item if present"""
+        position = self.positions.pop(item, None)
+        if position is None:
+            return
+        bucket = self._bucket_of(*position)
+        members = self.buckets.get(bucket)
+        if members is not None:
+            members.discard(item)
+            if not members:
+                del self.buckets[bucket]
+        if not self.positions:
+            self._min_bucket = self._max_bucket = None
+    
+    def move(self, item: Hashable, x: float, y: float):
+        """Update an item's position, re-bucketing only when it crosses a bucket edge"""
+        old_position = self.positions.get(item)
+        if old_position is None:
+            self.insert(item, x, y)
+            return
+        if self._bucket_of(*old_position) == self._bucket_of(x, y):
+            self.positions[item] = (x, y)
+            return
+        self.remove(item)
+        self.insert(item, x, y)
+    
+    def clear(self):
+        """Remove every item"""
+        self.positions.clear()
+        self.buckets.clear()
+        self._min_bucket = self._max_bucket = None
+    
+    def nearest(self, x: float, y: float, max_distance: Optional[float] = None,
+                predicate: Optional[Callable[[Hashable], bool]] = None) -> Optional[Tuple[Hashable, float]]:
+        """
+        Find the closest item to (x, y)
+        
+        Args:
+            max_distance: Ignore items farther than this
+            predicate: Optional filter; items for which it returns False are skipped
+        
+        Returns:
+            (item, distance) or None if nothing qualifies. Ties go to the lowest (y, x).
+        """
+        if not self.positions:
+            return None
+        
+        center_x, center_y = self._bucket_of(x, y)
+        max_ring = max(
+            abs(center_x - self._min_bucket[0]), abs(center_x - self._max_bucket[0]),
+            abs(center_y - self._min_bucket[1]), abs(center_y - self._max_bucket[1])
+        )
+        
+        best = None
+        best_key = None
+        for ring in range(max_ring + 1):
+            # Anything in this ring or beyond is at least this far away
+            ring_min_distance = max(0, (ring - 1) * self.bucket_size)
+            if best is not None and ring_min_distance > best_key[0]:
+                break
+            if max_distance is not None and ring_min_distance > max_distance:
+                break
+            
+            for bucket in self._ring_buckets(center_x, center_y, ring):
+                for item in self.buckets.get(bucket, ()):
+                    if predicate is not None and not predicate(item):
+                        continue
+                    item_x, item_y = self.positions[item]
+                    distance = self._distance(x, y, item_x, item_y)
+                    if max_distance is not None and distance > max_distance:
+                        continue
+                    key = (distance, item_y, item_x)
+                    if best_key is None or key < best_key:
+                        best, best_key = item, key
+        
+        return None if best is None else (best, best_key[0])
+    
+    def query_radius(self, x: float, y: float, radius: float) -> List[Hashable]:
+        """All items within radius of (x, y)"""
+        return [item for item in self.query_rect(x - radius, y - radius, x + radius, y + radius)
+                if self._distance(x, y, *self.positions[item]) <= radius]
+    
+    def query_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Hashable]:
+        """All items with min <= position <= max on both axes"""
+        if not self.positions:
+            return []
+        min_bucket_x, min_bucket_y = self._bucket_of(min_x, min_y)
+        max_bucket_x, max_bucket_y = self._bucket_of(max_x, max_y)
+        
+        # Clamp to occupied area so huge query rectangles stay cheap
+        min_bucket_x, min_bucket_y = max(min_bucket_x, self._min_bucket[0]), max(min_bucket_y, self._min_bucket[1])
+        max_bucket_x, max_bucket_y = min(max_bucket_x, self._max_bucket[0]), min(max_bucket_y, self._max_bucket[1])
+        
+        results = []
+        for bucket_y in range(min_bucket_y, max_bucket_y + 1):
+            for bucket_x in range(min_bucket_x, max_bucket_x + 1):
+                for item in self.buckets.get((bucket_x, bucket_y), ()):
+                    item_x, item_y = self.positions[item]
+                    if min_x <= item_x <= max_x and min_y <= item_y <= max_y:
+                        results.append(item)
+        return results
+    
+    def _ring_buckets(self, center_x: int, center_y: int, ring: int):
+        """Bucket coordinates at Chebyshev distance ring from the center bucket"""
+        if ring == 0:
+            yield (center_x, center_y)
+            return
+        for bucket_x in range(center_x - ring, center_x + ring + 1):
+            yield (bucket_x, center_y - ring)
+            yield (bucket_x, center_y + ring)
+        for bucket_y in range(center_y - ring + 1, center_y + ring):
+            yield (center_x - ring, bucket_y)
+            yield (center_x + ring, bucket_y)
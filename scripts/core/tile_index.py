@@ -0,0 +1,217 @@
+"""
+Tile Index - Incremental index sets over the chunked tile grid
+
+Keeps sets of "interesting" tiles (planted, harvestable, tasked, irrigated, and
+tiles holding each building type) up to date as tiles change, so systems that only
+care about a sparse subset of the farm never scan the whole grid.
+
+Key Features:
+- Membership stored per chunk store as sets of flat indices (chunk filtering is free)
+- Single-tile refresh from the store columns, called by Tile setters
+- Vectorized rebuild of a whole chunk (used after loading a save)
+- Position and count queries used by GridManager's query APIs
+- Per-type building location index (bucketed grid) for nearest/radius queries,
+  with a change counter per type
+- Optional passability bitmap kept in sync with buildings and occupancy
+
+Design Goals:
+- O(1) maintenance per tile change
+- Queries proportional to the number of matching tiles, not the farm size
+
+Usage:
+    index = TileIndex()
+    store.tile_index = index  # Tile setters now keep the index in sync
+    index.refresh_store(store)
+    for x, y in index.planted.positions():
+        ...
+"""
+
+import numpy as np
+from typing import Dict, Iterator, List, Set, Tuple
+from scripts.core.tile_store import (
+    TileStore, NO_ID, MAX_GROWTH_STAGE, TASK_TABLE, BUILDING_TABLE
+)
+from scripts.core.spatial_index import BucketGrid
+
+
+BUILDING_BUCKET_SIZE = 8  # Tiles per side of a building location bucket
+
+
+class TileSet:
+    """Set of tiles grouped by the chunk store that holds them"""
+    
+    def __init__(self):
+        """Initialize an empty tile set"""
+        self.members: Dict[TileStore, Set[int]] = {}
+    
+    def update(self, store: TileStore, index: int, present: bool):
+        """Add or remove one tile"""
+        if present:
+            self.members.setdefault(store, set()).add(index)
+        else:
+            indices = self.members.get(store)
+            if indices:
+                indices.discard(index)
+                if not indices:
+                    del self.members[store]
+    
+    def replace_store(self, store: TileStore, indices: np.ndarray):
+        """Replace every member of one store with the given flat indices"""
+        if indices.size:
+            self.members[store] = set(indices.tolist())
+        else:
+            self.members.pop(store, None)
+    
+    def remove_store(self, store: TileStore):
+        """Drop every member of one store"""
+        self.members.pop(store, None)
+    
+    def contains(self, store: TileStore, index: int) -> bool:
+        """Check if a tile is in the set"""
+        return index in self.members.get(store, ())
+    
+    def stores(self) -> List[TileStore]:
+        """Stores with at least one member"""
+        return list(self.members.keys())
+    
+    def items(self) -> Iterator[Tuple[TileStore, int]]:
+        """Iterate over (store, flat index) pairs"""
+        for store, indices in list(self.members.items()):
+            for index in list(indices):
+                yield store, index
+    
+    def positions(self) -> List[Tuple[int, int]]:
+        """World (x, y) positions of every member"""
+        return [store.position_of(index) for store, index in self.items()]
+    
+    def __len__(self) -> int:
+        return sum(len(indices) for indices in self.members.values())
+
+
+class TileIndex:
+    """Incrementally maintained index sets for the whole farm"""
+    
+    def __init__(self):
+        """Initialize empty index sets"""
+        self.planted = TileSet()
+        self.harvestable = TileSet()
+        self.irrigated = TileSet()
+        self.tasks: Dict[str, TileSet] = {name: TileSet() for name in TASK_TABLE.names}
+        self.buildings: Dict[str, TileSet] = {}
+        
+        # Building locations per type for nearest/radius queries, keyed by (x, y)
+        self.building_locations: Dict[str, BucketGrid] = {}
+        self._building_at: Dict[Tuple[int, int], str] = {}
+        self.building_versions: Dict[str, int] = {}  # Type -> change counter (for amenity flow fields)
+        
+        # Walkability bitmap for pathfinding (see passability_map.py), attached by GridManager
+        self.passability = None
+    
+    def refresh(self, store: TileStore, index: int):
+        """Recompute one tile's membership from its store columns"""
+        crop_id = store.crop_id[index]
+        self.planted.update(store, index, crop_id != NO_ID)
+        self.harvestable.update(store, index, crop_id != NO_ID and store.growth_stage[index] >= MAX_GROWTH_STAGE)
+        self.irrigated.update(store, index, bool(store.irrigation[index]))
+        
+        task_type = TASK_TABLE.name_for(store.task_id[index])
+        for name, tile_set in self.tasks.items():
+            tile_set.update(store, index, name == task_type)
+        
+        building_type = BUILDING_TABLE.name_for(store.building_id[index])
+        if building_type is not None and building_type not in self.buildings:
+            self.buildings[building_type] = TileSet()
+        for name, tile_set in self.buildings.items():
+            tile_set.update(store, index, name == building_type)
+        self._update_building_location(store.position_of(index), building_type)
+        if self.passability is not None:
+            self.passability.refresh_tile(store, index)
+    
+    def refresh_many(self, store: TileStore, indices: np.ndarray):
+        """Recompute membership for several tiles of one store"""
+        for index in indices.tolist():
+            self.refresh(store, index)
+    
+    def refresh_store(self, store: TileStore):
+        """Rebuild every set for one store with vectorized column scans"""
+        planted = store.crop_id != NO_ID
+        self.planted.replace_store(store, np.flatnonzero(planted))
+        self.harvestable.replace_store(store, np.flatnonzero(planted & (store.growth_stage >= MAX_GROWTH_STAGE)))
+        self.irrigated.replace_store(store, np.flatnonzero(store.irrigation))
+        
+        for name in TASK_TABLE.names:
+            self.tasks.setdefault(name, TileSet()).replace_store(
+                store, np.flatnonzero(store.task_id == TASK_TABLE.lookup(name)))
+        for name in BUILDING_TABLE.names:
+            self.buildings.setdefault(name, TileSet()).replace_store(
+                store, np.flatnonzero(store.building_id == BUILDING_TABLE.lookup(name)))
+        
+        self._clear_building_locations(store)
+        for index in np.flatnonzero(store.building_id != NO_ID).tolist():
+            self._update_building_location(store.position_of(index),
+                                           BUILDING_TABLE.name_for(store.building_id[index]))
+        if self.passability is not None:
+            self.passability.refresh_store(store)
+    
+    def remove_store(self, store: TileStore):
+        """Forget every tile of a store (chunk dropped)"""
+        for tile_set in self._all_sets():
+            tile_set.remove_store(store)
+        self._clear_building_locations(store)
+        if self.passability is not None:
+            self.passability.clear_store(store)
+    
+    def building_locations_of(self, building_type: str) -> BucketGrid:
+        """Spatial index of one building type's (x, y) positions"""
+        locations = self.building_locations.get(building_type)
+        if locations is None:
+            locations = self.building_locations[building_type] = BucketGrid(BUILDING_BUCKET_SIZE)
+        return locations
+    
+    def _update_building_location(self, position: Tuple[int, int], building_type):
+        """Move a tile between building location indexes when its building changes"""
+        old_type = self._building_at.get(position)
+        if old_type == building_type:
+            return
+        if old_type is not None:
+            self.building_locations[old_type].remove(position)
+            del self._building_at[position]
+            self.building_versions[old_type] = self.building_versions.get(old_type, 0) + 1
+        if building_type is not None:
+            self.building_locations_of(building_type).insert(position, *position)
+            self._building_at[position] = building_type
+            self.building_versions[building_type] = self.building_versions.get(building_type, 0) + 1
+    
+    def _clear_building_locations(self, store: TileStore):
+        """Drop building locations that fall inside one store"""
+        for position in [p for p in self._building_at if store.contains(*p)]:
+            self._update_building_location(position, None)
+    
+    def task_set(self, task_type: str) -> TileSet:
+        """Tiles with the given task assignment"""
+        tile_set = self.tasks.get(task_type)
+        return tile_set if tile_set is not None else TileSet()
+    
+    def building_set(self, building_type: str) -> TileSet:
+        """Tiles holding a building of the given type"""
+        tile_set = self.buildings.get(building_type)
+        return tile_set if tile_set is not None else TileSet()
+    
+    def counts(self) -> Dict[str, int]:
+        """Size of every index set"""
+        counts = {
+            'planted': len(self.planted),
+            'harvestable': len(self.harvestable),
+            'irrigated': len(self.irrigated),
+            'tasks': sum(len(tile_set) for tile_set in self.tasks.values())
+        }
+        for name, tile_set in self.tasks.items():
+            counts[f'task_{name}'] = len(tile_set)
+        for name, tile_set in self.buildings.items():
+            counts[f'building_{name}'] = len(tile_set)
+        return counts
+    
+    def _all_sets(self) -> List[TileSet]:
+        """Every tile set held by the index"""
+        return [self.planted, self.harvestable, self.irrigated,
+                *self.tasks.values(), *self.buildings.values()]
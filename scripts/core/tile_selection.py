@@ -0,0 +1,258 @@
+"""
+Tile Selection - Rectangle-based tile selections over the chunked grid
+
+A selection is stored as a list of disjoint rectangles rather than a list of tile
+objects. Dragging a box over the farm only replaces one rectangle, the selected tile
+count is kept up to date arithmetically, and questions like "how many selected tiles
+are harvestable?" are answered from GridManager's index sets and column slices
+instead of visiting every selected tile.
+
+Key Features:
+- Union of disjoint half-open rectangles [x0, x1) x [y0, y1), clipped to the grid
+- O(1) len() and truthiness; tiles produced lazily when iterated
+- Highlight column stamped with vectorized slice writes per chunk
+- Aggregates from index sets (planted, harvestable, irrigated, tasked) and terrain
+  column slices, skipping chunks that were never allocated
+- Drop-in for the old selected_tiles list (len, iteration, "in", copy)
+
+Design Goals:
+- Drag selection cost independent of the selected area
+- No per-tile Python work for counts and summaries
+
+Usage:
+    selection = TileSelection(grid_manager)
+    selection.set_rect(10, 10, 200, 120)  # Tiles 10..199 x 10..119
+    len(selection)                          # 20900
+    selection.count_in(grid_manager.tile_index.harvestable)
+    for tile in selection.tiles_in(grid_manager.tile_index.task_set('harvest')):
+        ...
+"""
+
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple
+from scripts.core.tile_store import TileStore, NO_ID, TERRAIN_TABLE
+
+
+Rect = Tuple[int, int, int, int]  # (x0, y0, x1, y1), half-open
+
+
+def _subtract_rect(rect: Rect, cut: Rect) -> List[Rect]:
+    """Pieces of rect not covered by cut (at most four)"""
+    x0, y0, x1, y1 = rect
+    cx0, cy0, cx1, cy1 = cut
+    if cx0 >= x1 or cx1 <= x0 or cy0 >= y1 or cy1 <= y0:
+        return [rect]  # No overlap
+    
+    pieces = []
+    if cy0 > y0:
+        pieces.append((x0, y0, x1, cy0))  # Band above the cut
+    if cy1 < y1:
+        pieces.append((x0, cy1, x1, y1))  # Band below the cut
+    band_y0, band_y1 = max(y0, cy0), min(y1, cy1)
+    if cx0 > x0:
+        pieces.append((x0, band_y0, cx0, band_y1))  # Left of the cut
+    if cx1 < x1:
+        pieces.append((cx1, band_y0, x1, band_y1))  # Right of the cut
+    return pieces
+
+
+class TileSelection:
+    """Selected tiles as a union of disjoint rectangles"""
+    
+    def __init__(self, grid_manager):
+        """Initialize an empty selection over a GridManager's grid"""
+        self.grid_manager = grid_manager
+        self.rects: List[Rect] = []
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __bool__(self) -> bool:
+        return self._count > 0
+    
+    def __iter__(self) -> Iterator:
+        """Lazily yield every selected tile, chunk by chunk"""
+        for rect in list(self.rects):
+            yield from self.grid_manager.iter_tiles_in_rect(*rect)
+    
+    def __contains__(self, tile) -> bool:
+        return self.contains(tile.x, tile.y)
+    
+    def contains(self, x: int, y: int) -> bool:
+        """Check if a grid position is selected"""
+        return any(x0 <= x < x1 and y0 <= y < y1 for x0, y0, x1, y1 in self.rects)
+    
+    def copy(self) -> list:
+        """Materialize the selected tiles as a list (compatibility with list selections)"""
+        return list(self)
+    
+    def bounds(self) -> Optional[Rect]:
+        """Bounding rectangle of the selection, or None if empty"""
+        if not self.rects:
+            return None
+        return (min(r[0] for r in self.rects), min(r[1] for r in self.rects),
+                max(r[2] for r in self.rects), max(r[3] for r in self.rects))
+    
+    # Editing
+    def set_rect(self, x0: int, y0: int, x1: int, y1: int) -> bool:
+        """
+        Replace the selection with a single rectangle
+        
+        Returns:
+            False if the selection already was exactly this rectangle (nothing to do)
+        """
+        rect = self._clip((x0, y0, x1, y1))
+        if rect is not None and self.rects == [rect]:
+            return False
+        self.clear()
+        if rect is not None:
+            self._add_disjoint([rect])
+        return True
+    
+    def add_rect(self, x0: int, y0: int, x1: int, y1: int):
+        """Add a rectangle to the selection (overlaps with existing rectangles are merged away)"""
+        rect = self._clip((x0, y0, x1, y1))
+        if rect is None:
+            return
+        pieces = [rect]
+        for existing in self.rects:
+            pieces = [piece for part in pieces for piece in _subtract_rect(part, existing)]
+            if not pieces:
+                return
+        self._add_disjoint(pieces)
+    
+    def add_tile(self, x: int, y: int):
+        """Add a single tile to the selection"""
+        self.add_rect(x, y, x + 1, y + 1)
+    
+    def clear(self):
+        """Deselect everything"""
+        for rect in self.rects:
+            self._stamp_highlight(rect, False)
+        self.rects = []
+        self._count = 0
+    
+    def _add_disjoint(self, pieces: List[Rect]):
+        """Append rectangles known not to overlap the selection"""
+        for rect in pieces:
+            self.rects.append(rect)
+            self._count += (rect[2] - rect[0]) * (rect[3] - rect[1])
+            self._stamp_highlight(rect, True)
+    
+    def _clip(self, rect: Rect) -> Optional[Rect]:
+        """Clip a rectangle to the grid (None if nothing is left)"""
+        x0, y0 = max(0, rect[0]), max(0, rect[1])
+        x1, y1 = min(self.grid_manager.width, rect[2]), min(self.grid_manager.height, rect[3])
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return (x0, y0, x1, y1)
+    
+    # Chunk-level access
+    def iter_store_slices(self, create: bool = False) -> Iterator[Tuple[TileStore, Tuple[slice, slice]]]:
+        """Yield (store, (row slice, column slice)) for each chunk/rectangle overlap"""
+        for x0, y0, x1, y1 in list(self.rects):
+            for store in self.grid_manager.iter_chunks_in_rect(x0, y0, x1, y1, create):
+                rows = slice(max(y0, store.origin_y) - store.origin_y, min(y1, store.origin_y + store.height) - store.origin_y)
+                cols = slice(max(x0, store.origin_x) - store.origin_x, min(x1, store.origin_x + store.width) - store.origin_x)
+                yield store, (rows, cols)
+    
+    def iter_store_indices(self, create: bool = False) -> Iterator[Tuple[TileStore, np.ndarray]]:
+        """Yield (store, flat indices) of the selected tiles in each chunk"""
+        for store, (rows, cols) in self.iter_store_slices(create):
+            yield store, np.arange(store.size).reshape(store.height, store.width)[rows, cols].ravel()
+    
+    def iter_in_rect(self, x0: int, y0: int, x1: int, y1: int) -> Iterator:
+        """Yield selected tiles that also fall inside [x0, x1) x [y0, y1) (e.g. the viewport)"""
+        for rx0, ry0, rx1, ry1 in list(self.rects):
+            ix0, iy0, ix1, iy1 = max(x0, rx0), max(y0, ry0), min(x1, rx1), min(y1, ry1)
+            if ix0 < ix1 and iy0 < iy1:
+                yield from self.grid_manager.iter_tiles_in_rect(ix0, iy0, ix1, iy1)
+    
+    def stamp_store(self, store: TileStore):
+        """Highlight the selected part of a newly allocated chunk"""
+        for x0, y0, x1, y1 in self.rects:
+            self._stamp_store(store, (x0, y0, x1, y1), True)
+    
+    def _stamp_highlight(self, rect: Rect, value: bool):
+        """Set the highlight column over a rectangle in every allocated chunk"""
+        for store in self.grid_manager.iter_chunks_in_rect(*rect, create=False):
+            self._stamp_store(store, rect, value)
+    
+    def _stamp_store(self, store: TileStore, rect: Rect, value: bool):
+        """Set the highlight column over the part of a rectangle inside one chunk"""
+        x0, y0, x1, y1 = rect
+        lx0, ly0 = max(x0, store.origin_x) - store.origin_x, max(y0, store.origin_y) - store.origin_y
+        lx1, ly1 = min(x1, store.origin_x + store.width) - store.origin_x, min(y1, store.origin_y + store.height) - store.origin_y
+        if lx0 < lx1 and ly0 < ly1:
+            store.highlight.reshape(store.height, store.width)[ly0:ly1, lx0:lx1] = value
+    
+    # Index-backed aggregates
+    def _in_selection(self, store: TileStore, indices: np.ndarray) -> np.ndarray:
+        """Mask of which flat indices of a store fall inside the selection"""
+        xs = indices % store.width + store.origin_x
+        ys = indices // store.width + store.origin_y
+        mask = np.zeros(len(indices), dtype=bool)
+        for x0, y0, x1, y1 in self.rects:
+            mask |= (xs >= x0) & (xs < x1) & (ys >= y0) & (ys < y1)
+        return mask
+    
+    def _selected_members(self, tile_set) -> Iterator[Tuple[TileStore, np.ndarray]]:
+        """(store, flat indices) of a TileSet's members that are selected"""
+        if not self.rects:
+            return
+        bounds = self.bounds()
+        for store, members in list(tile_set.members.items()):
+            # Skip chunks entirely outside the selection's bounding box
+            if (store.origin_x >= bounds[2] or store.origin_x + store.width <= bounds[0] or
+                    store.origin_y >= bounds[3] or store.origin_y + store.height <= bounds[1]):
+                continue
+            indices = np.fromiter(members, dtype=np.intp, count=len(members))
+            selected = indices[self._in_selection(store, indices)]
+            if selected.size:
+                yield store, selected
+    
+    def count_in(self, tile_set) -> int:
+        """Number of selected tiles that are members of a TileIndex set"""
+        return sum(int(indices.size) for _, indices in self._selected_members(tile_set))
+    
+    def tiles_in(self, tile_set) -> Iterator:
+        """Yield selected tiles that are members of a TileIndex set"""
+        for store, indices in self._selected_members(tile_set):
+            for index in indices.tolist():
+                yield self.grid_manager._tile_at_index(store, index)
+    
+    def summary(self) -> Dict[str, int]:
+        """
+        Counts describing the selected tiles
+        
+        Returns:
+            total, soil (untilled), tilled_empty, buildings, planted,
+            harvestable, irrigated and tasked tile counts
+        """
+        tile_index = self.grid_manager.tile_index
+        soil_id = TERRAIN_TABLE.id_for('soil')
+        tilled_id = TERRAIN_TABLE.id_for('tilled')
+        building_id = TERRAIN_TABLE.id_for('building')
+        
+        # Terrain is not indexed; count it from column slices of allocated chunks
+        allocated = soil = tilled_empty = buildings = 0
+        for store, (rows, cols) in self.iter_store_slices():
+            terrain = store.terrain.reshape(store.height, store.width)[rows, cols]
+            crops = store.crop_id.reshape(store.height, store.width)[rows, cols]
+            allocated += terrain.size
+            soil += int(np.count_nonzero(terrain == soil_id))
+            tilled_empty += int(np.count_nonzero((terrain == tilled_id) & (crops == NO_ID)))
+            buildings += int(np.count_nonzero(terrain == building_id))
+        soil += self._count - allocated  # Unallocated chunks are untouched soil
+        
+        return {
+            'total': self._count,
+            'soil': soil,
+            'tilled_empty': tilled_empty,
+            'buildings': buildings,
+            'planted': self.count_in(tile_index.planted),
+            'harvestable': self.count_in(tile_index.harvestable),
+            'irrigated': self.count_in(tile_index.irrigated),
+            'tasked': sum(self.count_in(tile_set) for tile_set in tile_index.tasks.values())
+        }
@@ -0,0 +1,317 @@
+"""
+Tile Store - Columnar (structure-of-arrays) storage for farm tiles
+
+This module keeps all per-tile simulation state in compact NumPy arrays instead of
+one Python object per tile. GridManager owns a TileStore and hands out lightweight
+Tile view objects that read and write straight through to these arrays, so existing
+callers keep using tile.current_crop, tile.soil_nutrients, etc. unchanged.
+
+Key Features:
+- One contiguous buffer per field (terrain, crop id, growth stage, days growing,
+  water, soil quality, N/P/K nutrients, irrigation, building id, ...)
+- String fields (terrain, crop, building, task) stored as small integer ids
+- Rarely-populated object fields (crop history, building objects, task owners)
+  kept in sparse dictionaries keyed by flat tile index
+- Whole-grid passes can be expressed as vectorized array operations
+
+Design Goals:
+- Megabytes of per-tile object overhead reduced to a few compact buffers
+- Tile views stay API compatible with the original Tile class
+- Foundation for vectorized growth, harvest and index passes
+
+Usage:
+    store = TileStore(GRID_WIDTH, GRID_HEIGHT)
+    index = store.index_of(3, 4)
+    store.crop_id[index] = CROP_TABLE.id_for('corn')
+    planted = store.planted_indices()  # Flat indices of all tiles with crops
+"""
+
+import numpy as np
+from collections.abc import MutableMapping
+from typing import Dict, List, Optional, Iterable
+from scripts.core.config import *
+
+
+NO_ID = -1  # Id used for "no crop" / "no building" / "no task"
+
+
+class NameTable:
+    """Bidirectional mapping between string names and compact integer ids"""
+    
+    def __init__(self, names: Iterable[str] = ()):
+        """Initialize table with an optional list of known names"""
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for name in names:
+            self.id_for(name)
+    
+    def id_for(self, name: Optional[str]) -> int:
+        """Get the id for a name, registering it if it has not been seen before"""
+        if name is None:
+            return NO_ID
+        
+        name_id = self.ids.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.names.append(name)
+            self.ids[name] = name_id
+        return name_id
+    
+    def lookup(self, name: Optional[str]) -> int:
+        """Get the id for a name without registering it (NO_ID if unknown)"""
+        if name is None:
+            return NO_ID
+        return self.ids.get(name, NO_ID)
+    
+    def name_for(self, name_id: int) -> Optional[str]:
+        """Get the name for an id (None for NO_ID)"""
+        if name_id < 0:
+            return None
+        return self.names[name_id]
+
+
+# Shared name tables so every store (and every chunk) agrees on ids
+TERRAIN_TABLE = NameTable(('soil', 'tilled', 'planted', 'building'))
+CROP_TABLE = NameTable(CROP_TYPES.keys())
+BUILDING_TABLE = NameTable()
+TASK_TABLE = NameTable(('till', 'plant', 'harvest'))
+
+# Highest growth stage index (harvestable)
+MAX_GROWTH_STAGE = len(GROWTH_STAGES) - 1
+
+# Row order of the nutrient matrix
+NUTRIENT_NAMES = ('nitrogen', 'phosphorus', 'potassium')
+NUTRIENT_INDEX = {name: i for i, name in enumerate(NUTRIENT_NAMES)}
+
+
+_days_per_stage_cache = {'count': -1, 'table': None}
+
+
+def crop_days_per_stage() -> np.ndarray:
+    """Lookup table of days per growth stage indexed by CROP_TABLE id
+    
+    Crops that are not defined in CROP_TYPES get inf so they never advance.
+    """
+    if _days_per_stage_cache['count'] != len(CROP_TABLE.names):
+        _days_per_stage_cache['table'] = np.array([
+            CROP_TYPES[name]['growth_time'] / len(GROWTH_STAGES) if name in CROP_TYPES else np.inf
+            for name in CROP_TABLE.names
+        ], dtype=np.float64)
+        _days_per_stage_cache['count'] = len(CROP_TABLE.names)
+    return _days_per_stage_cache['table']
+
+
+_base_yield_cache = {'count': -1, 'table': None}
+
+
+def crop_base_yields() -> np.ndarray:
+    """Lookup table of base harvest yield indexed by CROP_TABLE id (0 for unknown crops)"""
+    if _base_yield_cache['count'] != len(CROP_TABLE.names):
+        _base_yield_cache['table'] = np.array([
+            CROP_TYPES[name]['base_yield'] if name in CROP_TYPES else 0
+            for name in CROP_TABLE.names
+        ], dtype=np.float64)
+        _base_yield_cache['count'] = len(CROP_TABLE.names)
+    return _base_yield_cache['table']
+
+
+# Soil health levels as (min average nutrient, yield multiplier), lowest first
+_SOIL_HEALTH_STEPS = sorted((data['min'], data['bonus_multiplier']) for data in SOIL_HEALTH_LEVELS.values())
+
+
+class TileStore:
+    """Structure-of-arrays storage for a rectangular block of tiles"""
+    
+    def __init__(self, width: int, height: int, origin_x: int = 0, origin_y: int = 0):
+        """Allocate column buffers for width x height tiles starting at (origin_x, origin_y)"""
+        self.width = width
+        self.height = height
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.size = width * height
+        
+        # Dense per-tile columns
+        self.terrain = np.zeros(self.size, dtype=np.uint8)  # TERRAIN_TABLE id ('soil' = 0)
+        self.soil_quality = np.full(self.size, 5, dtype=np.int8)  # 1-10 scale
+        self.water_level = np.full(self.size, 100.0, dtype=np.float32)  # 0-100 scale
+        self.nutrients = np.full((len(NUTRIENT_NAMES), self.size), 100, dtype=np.int16)  # N/P/K rows (0-100)
+        self.seasons_rested = np.zeros(self.size, dtype=np.int16)
+        self.crop_id = np.full(self.size, NO_ID, dtype=np.int8)  # CROP_TABLE id or NO_ID
+        self.growth_stage = np.zeros(self.size, dtype=np.int8)  # 0-4 for all crops
+        self.days_growing = np.zeros(self.size, dtype=np.float64)
+        self.task_id = np.full(self.size, NO_ID, dtype=np.int8)  # TASK_TABLE id or NO_ID
+        self.building_id = np.full(self.size, NO_ID, dtype=np.int16)  # BUILDING_TABLE id or NO_ID
+        self.occupied = np.zeros(self.size, dtype=bool)
+        self.irrigation = np.zeros(self.size, dtype=bool)
+        self.highlight = np.zeros(self.size, dtype=bool)
+        
+        # Event-scheduled growth (see maturation_scheduler.py)
+        self.growth_rate = np.ones(self.size, dtype=np.float64)  # Days of growth per clock day
+        self.growth_synced = np.full(self.size, np.nan, dtype=np.float64)  # Clock time days_growing is exact at (NaN = unscheduled)
+        self.growth_generation = np.zeros(self.size, dtype=np.uint32)  # Invalidates stale heap entries
+        self.growth_clock = None  # Shared GrowthClock once registered with a scheduler
+        self.pending_growth: List[int] = []  # Tiles to (re)schedule on the next advance
+        
+        # Incremental index sets notified on tile changes (see tile_index.py)
+        self.tile_index = None
+        
+        # Sparse per-tile objects (only tiles that actually have a value are stored)
+        self.crop_history: Dict[int, List[str]] = {}
+        self.rotation_bonuses: Dict[int, dict] = {}
+        self.buildings: Dict[int, object] = {}
+        self.task_assigned_to: Dict[int, str] = {}
+    
+    def index_of(self, x: int, y: int) -> int:
+        """Convert world grid coordinates to a flat index in this store"""
+        return (y - self.origin_y) * self.width + (x - self.origin_x)
+    
+    def position_of(self, index: int) -> tuple:
+        """Convert a flat index back to world grid coordinates"""
+        local_y, local_x = divmod(int(index), self.width)
+        return (local_x + self.origin_x, local_y + self.origin_y)
+    
+    def contains(self, x: int, y: int) -> bool:
+        """Check if world grid coordinates fall inside this store"""
+        return (self.origin_x <= x < self.origin_x + self.width and
+                self.origin_y <= y < self.origin_y + self.height)
+    
+    def planted_indices(self) -> np.ndarray:
+        """Flat indices of every tile that currently has a crop"""
+        return np.flatnonzero(self.crop_id != NO_ID)
+    
+    def advance_growth(self, days_passed: float, growth_modifier: float = 1.0,
+                       irrigated_growth_modifier: Optional[float] = None) -> np.ndarray:
+        """
+        Advance every planted tile's growth in one batched array operation
+        
+        Args:
+            days_passed: Game days elapsed since the last growth pass
+            growth_modifier: Weather growth rate multiplier for all tiles
+            irrigated_growth_modifier: Multiplier used instead on irrigated tiles
+                (e.g. drought mitigation), or None to treat them like any other tile
+        
+        Returns:
+            Flat indices of the tiles whose growth stage changed
+        """
+        planted = self.planted_indices()
+        if planted.size == 0:
+            return planted
+        
+        days_per_stage = crop_days_per_stage()[self.crop_id[planted]]
+        growable = np.isfinite(days_per_stage)
+        if not growable.all():
+            planted = planted[growable]
+            days_per_stage = days_per_stage[growable]
+        
+        # Per-tile growth rate (weather, with irrigation mitigation where it applies)
+        if irrigated_growth_modifier is None:
+            effective_days = days_passed * growth_modifier
+        else:
+            effective_days = np.where(self.irrigation[planted],
+                                      days_passed * irrigated_growth_modifier,
+                                      days_passed * growth_modifier)
+        
+        days_growing = self.days_growing[planted] + effective_days
+        self.days_growing[planted] = days_growing
+        
+        # Stage is fully determined by days growing
+        new_stages = np.minimum(MAX_GROWTH_STAGE, (days_growing / days_per_stage).astype(np.int8))
+        changed = new_stages > self.growth_stage[planted]
+        changed_indices = planted[changed]
+        self.growth_stage[changed_indices] = new_stages[changed]
+        
+        return changed_indices
+    
+    def notify_changed(self, index: int):
+        """Tell the attached tile index that one tile's indexed fields changed"""
+        if self.tile_index is not None:
+            self.tile_index.refresh(self, index)
+    
+    def current_days_growing(self, index: int) -> float:
+        """Exact days growing for a tile, including growth since its last sync"""
+        days_growing = float(self.days_growing[index])
+        synced = self.growth_synced[index]
+        if self.growth_clock is not None and synced == synced:  # NaN check
+            days_growing += (self.growth_clock.now - synced) * self.growth_rate[index]
+        return days_growing
+    
+    def set_days_growing(self, index: int, value: float):
+        """Overwrite days growing and queue the tile to be rescheduled"""
+        self.days_growing[index] = value
+        self.growth_generation[index] += 1  # Drop any deadline computed from the old value
+        if self.growth_clock is not None and self.crop_id[index] != NO_ID:
+            self.growth_synced[index] = self.growth_clock.now
+            self.pending_growth.append(index)
+        else:
+            self.growth_synced[index] = np.nan
+    
+    def reschedule_growth(self, index: int):
+        """Queue a planted tile to be rescheduled (e.g. after its irrigation changed)"""
+        if self.growth_clock is not None and self.crop_id[index] != NO_ID:
+            self.pending_growth.append(index)
+    
+    def sync_growth(self, indices: Optional[np.ndarray] = None):
+        """Fold scheduled growth into days_growing so the column is exact"""
+        if self.growth_clock is None:
+            return
+        if indices is None:
+            indices = np.flatnonzero(~np.isnan(self.growth_synced))
+        else:
+            indices = indices[~np.isnan(self.growth_synced[indices])]
+        if indices.size == 0:
+            return
+        now = self.growth_clock.now
+        self.days_growing[indices] += (now - self.growth_synced[indices]) * self.growth_rate[indices]
+        self.growth_synced[indices] = now
+    
+    def soil_health_multipliers(self, indices: np.ndarray) -> np.ndarray:
+        """Soil health yield multiplier for several tiles (matches Tile.get_soil_health_level)"""
+        average = self.nutrients[:, indices].sum(axis=0) / len(NUTRIENT_NAMES)
+        multipliers = np.empty(len(indices), dtype=np.float64)
+        for minimum, multiplier in _SOIL_HEALTH_STEPS:
+            multipliers[average >= minimum] = multiplier  # Higher levels overwrite lower ones
+        return multipliers
+    
+    def building_indices(self, building_type: str) -> np.ndarray:
+        """Flat indices of every tile holding a building of the given type"""
+        building_id = BUILDING_TABLE.lookup(building_type)
+        if building_id == NO_ID:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(self.building_id == building_id)
+    
+    def nbytes(self) -> int:
+        """Approximate memory used by the dense column buffers"""
+        return sum(column.nbytes for column in (
+            self.terrain, self.soil_quality, self.water_level, self.nutrients,
+            self.seasons_rested, self.crop_id, self.growth_stage, self.days_growing,
+            self.task_id, self.building_id, self.occupied, self.irrigation, self.highlight,
+            self.growth_rate, self.growth_synced, self.growth_generation
+        ))
+
+
+class SoilNutrients(MutableMapping):
+    """Dict-like view of one tile's N/P/K nutrient levels"""
+    
+    __slots__ = ('_store', '_index')
+    
+    def __init__(self, store: TileStore, index: int):
+        self._store = store
+        self._index = index
+    
+    def __getitem__(self, nutrient: str) -> int:
+        return int(self._store.nutrients[NUTRIENT_INDEX[nutrient], self._index])
+    
+    def __setitem__(self, nutrient: str, value):
+        self._store.nutrients[NUTRIENT_INDEX[nutrient], self._index] = value
+    
+    def __delitem__(self, nutrient: str):
+        raise TypeError("Soil nutrients cannot be removed")
+    
+    def __iter__(self):
+        return iter(NUTRIENT_NAMES)
+    
+    def __len__(self) -> int:
+        return len(NUTRIENT_NAMES)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
@@ -40,13 +40,11 @@ class TimeManager:
         print(f"Real time per game day: {self.real_time_per_game_day} seconds")
     
     def update(self, dt: float):
-        """Update game time based on real time"""
+        """Advance game time by dt game seconds (GameManager already applied the speed multiplier)"""
         if self.is_paused or self.time_speed == 0:
             return
         
-        # Apply speed multiplier
-        effective_dt = dt * self.time_speed
-        self.game_time_elapsed += effective_dt
+        self.game_time_elapsed += dt
         
         # Calculate game time from elapsed time
         old_hour = self.current_hour
@@ -11,12 +11,14 @@ from scripts.core.config import *
 class Transaction:
     """Individual financial transaction record"""
     
+    __slots__ = ('amount', 'description', 'type', 'day')
+    
     def __init__(self, amount: float, description: str, transaction_type: str, day: int = 1):
         self.amount = amount  # Positive for income, negative for expenses
         self.description = description
         self.type = transaction_type  # 'income', 'expense', 'loan', 'subsidy'
         self.day = day
-        
+    
     def __str__(self):
         sign = "+" if self.amount >= 0 else ""
         return f"Day {self.day}: {self.description} ({sign}${self.amount:.2f})"
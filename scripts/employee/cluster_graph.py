@@ -0,0 +1,339 @@
+"""
+Cluster Graph - HPA*-style abstraction of the farm for long-distance pathfinding
+
+The farm is split into clusters that match the grid chunks. Wherever two
+neighbouring clusters share a run of walkable border tiles, the run becomes an
+entrance: one transition in the middle of short runs, one at each end of long
+runs. Searching the much smaller graph of entrances and then stitching together
+precomputed routes inside each cluster finds cross-map paths without expanding
+every tile in between.
+
+Key Features:
+- Entrances per chunk border, derived from the passability bitmap
+- Per-entrance breadth-first distance fields inside its cluster, built lazily
+  the first time a search passes through the cluster
+- Start/goal attached to the graph by reading the distance fields (no local search)
+- Refresh driven by PassabilityMap chunk versions: only chunks whose buildings
+  changed (and neighbours whose shared border changed) are rebuilt
+
+Design Goals:
+- Cross-map queries on large farms in well under a millisecond once warmed up
+- Near-optimal paths (entrances are sampled, so routes may be a few tiles longer
+  than the true shortest path)
+
+Usage:
+    graph = ClusterGraph(grid_manager.passability)
+    graph.refresh(walls)                    # After the bitmap changes
+    path = graph.find_path((3, 3), (500, 505))
+"""
+
+import heapq
+import numpy as np
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+
+ENTRANCE_SPLIT = 6  # Border runs at least this long get two transitions instead of one
+UNREACHED = 0xFFFF  # Distance field value for tiles an entrance cannot reach
+HEURISTIC_WEIGHT = 1.1  # Slightly greedy: a few tiles of detour at most for far fewer expansions
+
+
+class ClusterGraph:
+    """Entrance graph over chunk-sized clusters of the passability bitmap"""
+    
+    def __init__(self, passability):
+        """Initialize the graph and compute every cluster border"""
+        self.passability = passability
+        self.width = passability.width
+        self.height = passability.height
+        self.cluster_size = passability.chunk_size
+        self.clusters_x = passability.chunks_x
+        self.clusters_y = passability.chunks_y
+        
+        self._walls = b''  # Byte snapshot of the bitmap shared with the Pathfinder
+        self._seen_versions: Optional[np.ndarray] = None  # Chunk versions the graph was built from
+        
+        # (cluster, right or lower neighbour) -> [(tile in cluster, tile across the border)]
+        self.borders: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        self.entrances: Dict[int, List[int]] = {}  # Cluster -> entrance tiles inside it
+        self.partners: Dict[int, List[int]] = {}  # Entrance tile -> tiles across its borders
+        
+        # Lazily built per cluster: entrance -> (distances, next tile toward the entrance)
+        self.fields: Dict[int, Dict[int, Tuple[array, array]]] = {}
+        self.edges: Dict[int, List[Tuple[int, int, int, int]]] = {}  # Entrance -> [(entrance, cost, x, y)]
+        self.segments: Dict[int, Dict[Tuple[int, int], List[int]]] = {}  # Cluster -> refined entrance-to-entrance tiles
+    
+    # Maintenance
+    def refresh(self, walls: bytes):
+        """Rebuild the clusters whose chunk version changed since the last refresh"""
+        self._walls = walls
+        versions = self.passability.chunk_versions.ravel()
+        if self._seen_versions is None:
+            changed = range(self.clusters_x * self.clusters_y)
+        else:
+            changed = np.flatnonzero(versions != self._seen_versions).tolist()
+        self._seen_versions = versions.copy()
+        if not changed:
+            return
+        
+        # Recompute all four borders of each changed cluster
+        dirty = set(changed)
+        for cluster in changed:
+            for border, vertical in self._cluster_borders(cluster):
+                pairs = self._compute_border(*border, vertical)
+                if self.borders.get(border) != pairs:
+                    self.borders[border] = pairs
+                    dirty.update(border)  # The neighbour's entrances moved too
+        
+        # Rebuild entrance lists and drop distance fields of every affected cluster
+        for cluster in dirty:
+            for entrance in self.entrances.get(cluster, ()):
+                self.partners.pop(entrance, None)
+                self.edges.pop(entrance, None)
+            self.fields.pop(cluster, None)
+            self.segments.pop(cluster, None)
+        for cluster in dirty:
+            entrances = []
+            for border, _ in self._cluster_borders(cluster):
+                for a, b in self.borders.get(border, ()):
+                    inside, outside = (a, b) if border[0] == cluster else (b, a)
+                    if inside not in self.partners:
+                        entrances.append(inside)
+                        self.partners[inside] = []
+                    self.partners[inside].append(outside)
+            self.entrances[cluster] = entrances
+    
+    def _cluster_borders(self, cluster: int) -> List[Tuple[Tuple[int, int], bool]]:
+        """
+        Borders around a cluster as (key, vertical) pairs
+        
+        Keys are (left/upper cluster, right/lower cluster). The orientation is
+        returned explicitly because the keys alone can't tell it: with a single
+        column of clusters the cluster below is also cluster + 1.
+        """
+        cy, cx = divmod(cluster, self.clusters_x)
+        borders = []
+        if cx > 0:
+            borders.append(((cluster - 1, cluster), True))
+        if cx + 1 < self.clusters_x:
+            borders.append(((cluster, cluster + 1), True))
+        if cy > 0:
+            borders.append(((cluster - self.clusters_x, cluster), False))
+        if cy + 1 < self.clusters_y:
+            borders.append(((cluster, cluster + self.clusters_x), False))
+        return borders
+    
+    def _compute_border(self, first: int, second: int, vertical: bool) -> List[Tuple[int, int]]:
+        """Transitions across the (vertical or horizontal) border between two adjacent clusters"""
+        walls = self._walls
+        width = self.width
+        size = self.cluster_size
+        cy, cx = divmod(first, self.clusters_x)
+        
+        if vertical:
+            # Vertical border: first's last column against second's first column
+            x = (cx + 1) * size - 1
+            cells = [(y * width + x, y * width + x + 1) for y in range(cy * size, min(self.height, (cy + 1) * size))]
+        else:
+            # Horizontal border: first's last row against second's first row
+            y = (cy + 1) * size - 1
+            cells = [(y * width + x, (y + 1) * width + x) for x in range(cx * size, min(self.width, (cx + 1) * size))]
+        
+        # Split the border into runs walkable on both sides
+        pairs = []
+        run = []
+        for a, b in cells + [(None, None)]:
+            if a is not None and not walls[a] and not walls[b]:
+                run.append((a, b))
+                continue
+            if run:
+                if len(run) < ENTRANCE_SPLIT:
+                    pairs.append(run[len(run) // 2])
+                else:
+                    pairs.extend((run[0], run[-1]))
+                run = []
+        return pairs
+    
+    def _bounds(self, cluster: int) -> Tuple[int, int, int, int]:
+        """Tile rectangle [x0, x1) x [y0, y1) of a cluster"""
+        cy, cx = divmod(cluster, self.clusters_x)
+        x0, y0 = cx * self.cluster_size, cy * self.cluster_size
+        return x0, y0, min(self.width, x0 + self.cluster_size), min(self.height, y0 + self.cluster_size)
+    
+    def _cluster_fields(self, cluster: int) -> Dict[int, Tuple[array, array]]:
+        """Distance fields of a cluster's entrances, building them on first use"""
+        fields = self.fields.get(cluster)
+        if fields is None:
+            fields = self.fields[cluster] = {entrance: self._build_field(cluster, entrance)
+                                             for entrance in self.entrances.get(cluster, ())}
+            x0, y0, x1, _ = self._bounds(cluster)
+            local_width = x1 - x0
+            for entrance, (distances, _) in fields.items():
+                edges = [(partner, 1, partner % self.width, partner // self.width) for partner in self.partners[entrance]]
+                for other in fields:
+                    if other != entrance:
+                        oy, ox = divmod(other, self.width)
+                        cost = distances[(oy - y0) * local_width + ox - x0]
+                        if cost != UNREACHED:
+                            edges.append((other, cost, ox, oy))
+                self.edges[entrance] = edges
+        return fields
+    
+    def _build_field(self, cluster: int, entrance: int) -> Tuple[array, array]:
+        """Breadth-first distances (and next steps) from every cluster tile to an entrance"""
+        walls = self._walls
+        width = self.width
+        x0, y0, x1, y1 = self._bounds(cluster)
+        local_width = x1 - x0
+        size = local_width * (y1 - y0)
+        distances = array('H', [UNREACHED]) * size
+        toward = array('i', [-1]) * size  # Neighbouring tile one step closer to the entrance
+        
+        ey, ex = divmod(entrance, width)
+        distances[(ey - y0) * local_width + ex - x0] = 0
+        queue = deque([(entrance, ex, ey)])
+        while queue:
+            index, x, y = queue.popleft()
+            next_distance = distances[(y - y0) * local_width + x - x0] + 1
+            for neighbor, nx, ny in ((index - width, x, y - 1), (index + 1, x + 1, y),
+                                     (index + width, x, y + 1), (index - 1, x - 1, y)):
+                if nx < x0 or nx >= x1 or ny < y0 or ny >= y1 or walls[neighbor]:
+                    continue
+                local = (ny - y0) * local_width + nx - x0
+                if distances[local] == UNREACHED:
+                    distances[local] = next_distance
+                    toward[local] = index
+                    queue.append((neighbor, nx, ny))
+        return distances, toward
+    
+    # Queries
+    def cluster_of(self, x: int, y: int) -> int:
+        """Cluster number containing a tile"""
+        return (y // self.cluster_size) * self.clusters_x + x // self.cluster_size
+    
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find a tile path between two walkable tiles in different clusters
+        
+        Returns:
+            Start, goal and every tile where the route turns (consecutive points
+            share a row or column), or None if the entrance graph has no route
+        """
+        width = self.width
+        start_cluster = self.cluster_of(*start)
+        goal_cluster = self.cluster_of(*goal)
+        start_index = start[1] * width + start[0]
+        goal_x, goal_y = goal
+        
+        # Attach start and goal to their clusters' entrances via the distance fields
+        start_edges = self._attach(start_cluster, start)
+        goal_costs = {entrance: cost for entrance, cost, _, _ in self._attach(goal_cluster, goal)}
+        if not start_edges or not goal_costs:
+            return None
+        
+        # Weighted A* over entrances; -1 is the start node, -2 the goal node.
+        # Heap entries carry their g-cost so superseded entries are recognised when popped.
+        g_costs = {-1: 0}
+        parents = {-1: None}
+        open_heap = [(0, 0, -1)]
+        edges_of = self.edges
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        while open_heap:
+            _, node_g, node = heappop(open_heap)
+            if node_g > g_costs[node]:
+                continue
+            if node == -2:
+                return self._refine(self._abstract_path(parents), start_index, start_cluster, goal_cluster, goal)
+            
+            if node == -1:
+                edges = start_edges
+            else:
+                edges = edges_of.get(node)
+                if edges is None:
+                    self._cluster_fields(self.cluster_of(node % width, node // width))
+                    edges = edges_of[node]
+                goal_cost = goal_costs.get(node)
+                if goal_cost is not None:
+                    edges = edges + [(-2, goal_cost, goal_x, goal_y)]
+            
+            for neighbor, cost, nx, ny in edges:
+                neighbor_g = node_g + cost
+                known = g_costs.get(neighbor)
+                if known is not None and known <= neighbor_g:
+                    continue
+                g_costs[neighbor] = neighbor_g
+                parents[neighbor] = node
+                heappush(open_heap, (neighbor_g + HEURISTIC_WEIGHT * (abs(nx - goal_x) + abs(ny - goal_y)), neighbor_g, neighbor))
+        
+        return None
+    
+    def _attach(self, cluster: int, position: Tuple[int, int]) -> List[Tuple[int, int, int, int]]:
+        """(entrance, distance, x, y) for every entrance of a cluster reachable from a tile"""
+        fields = self._cluster_fields(cluster)
+        x0, y0, x1, _ = self._bounds(cluster)
+        local = (position[1] - y0) * (x1 - x0) + position[0] - x0
+        attached = []
+        for entrance, (distances, _) in fields.items():
+            if distances[local] != UNREACHED:
+                attached.append((entrance, distances[local], entrance % self.width, entrance // self.width))
+        return attached
+    
+    def _abstract_path(self, parents: Dict[int, Optional[int]]) -> List[int]:
+        """Entrance tiles visited between start (-1) and goal (-2)"""
+        nodes = []
+        node = parents[-2]
+        while node != -1:
+            nodes.append(node)
+            node = parents[node]
+        nodes.reverse()
+        return nodes
+    
+    def _refine(self, entrances: List[int], start_index: int, start_cluster: int,
+                goal_cluster: int, goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Expand the entrance sequence into tiles using the distance fields, keeping the turns"""
+        width = self.width
+        cells = self._walk(start_cluster, entrances[0], start_index)
+        for previous, entrance in zip(entrances, entrances[1:]):
+            if entrance in self.partners.get(previous, ()):
+                cells.append(entrance)  # Step across a border
+            else:
+                cells.extend(self._segment(previous, entrance))
+        
+        # The goal field leads toward the last entrance; walk it backwards
+        tail = self._walk(goal_cluster, entrances[-1], goal[1] * width + goal[0])
+        tail.reverse()
+        cells.extend(tail[1:])
+        
+        # Keep tiles where the flat index step changes (a turn), plus both ends
+        turns = [cells[0]]
+        step = cells[1] - cells[0]
+        for current, following in zip(cells[1:], cells[2:]):
+            if following - current != step:
+                turns.append(current)
+                step = following - current
+        turns.append(cells[-1])
+        return [(index % width, index // width) for index in turns]
+    
+    def _segment(self, entrance: int, other: int) -> List[int]:
+        """Tiles after entrance up to another entrance of the same cluster (cached)"""
+        cluster = self.cluster_of(entrance % self.width, entrance // self.width)
+        segments = self.segments.setdefault(cluster, {})
+        cells = segments.get((entrance, other))
+        if cells is None:
+            cells = segments[(entrance, other)] = self._walk(cluster, other, entrance)[1:]
+        return cells
+    
+    def _walk(self, cluster: int, entrance: int, index: int) -> List[int]:
+        """Tiles from index to an entrance of the same cluster, following its field"""
+        _, toward = self._cluster_fields(cluster)[entrance]
+        x0, y0, x1, _ = self._bounds(cluster)
+        local_width = x1 - x0
+        width = self.width
+        cells = [index]
+        while index != entrance:
+            index = toward[(index // width - y0) * local_width + index % width - x0]
+            cells.append(index)
+        return cells
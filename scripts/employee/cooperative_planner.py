@@ -0,0 +1,604 @@
+"""
+Cooperative Planner - Collision-free movement for whole crews of employees
+
+Windowed cooperative A* (WHCA*): the moving employees are planned one after
+another through space and time. Each plan is written into a shared reservation
+table (tile, step) -> employee that every later plan must respect, so two
+employees never stand on the same tile at the same step or swap tiles head-on.
+Plans only look a fixed window of steps ahead and are renewed once half of
+the window has been walked, which spreads replanning over time instead of
+replanning everyone whenever anyone moves.
+
+Key Features:
+- Global step clock: every planned employee moves one tile (or waits) per step,
+  interpolated smoothly between steps
+- Batch replanning at step boundaries only: new movers, changed targets and
+  half-walked windows are planned together, longest-stuck employees first,
+  at most COOPERATIVE_PLANS_PER_STEP per boundary
+- Static guide route per employee (the Pathfinder's own route) provides the
+  subgoal each window heads for, so windows never wander away from the goal
+- Standing employees (working, resting, arrived) hold their tile indefinitely;
+  every plan also holds its last tile until it is replaced
+- Deadlock breaker: an employee that has not advanced along its guide for
+  COOPERATIVE_STUCK_LIMIT windows plans one window ignoring the others
+
+Design Goals:
+- Realistic congestion for crews of hundreds of employees
+- Bounded per-step work: a space-time search is capped at the window length
+  and COOPERATIVE_MAX_EXPANSIONS nodes
+
+Usage:
+    pathfinder.set_mode('cooperative')          # Creates pathfinder.cooperative_planner
+    pathfinder.cooperative_planner.update(dt, employees)  # Once per frame
+"""
+
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
+from scripts.core.config import (EMPLOYEE_SPEED, COOPERATIVE_WINDOW, COOPERATIVE_STUCK_LIMIT,
+                                 COOPERATIVE_MAX_EXPANSIONS, COOPERATIVE_PLANS_PER_STEP)
+from scripts.employee.employee import EmployeeState
+
+
+OBSTACLE_AGENT = ''  # Reservation owner for Pathfinder.add_temporary_obstacle tiles
+MAX_REPLANS_PER_STEP = 2  # Plans per employee and step boundary before conflicts are accepted
+
+
+class ReservationTable:
+    """Space-time tile reservations shared by every cooperatively planned employee"""
+    
+    def __init__(self):
+        """Initialize an empty table"""
+        self.cells: Dict[int, Dict[int, str]] = {}  # Tile index -> {step: employee id}
+        self.parked: Dict[int, Tuple[str, int]] = {}  # Tile index -> (employee id, first step) held indefinitely
+    
+    def reserve(self, agent: str, index: int, step: int):
+        """Claim a tile for one step"""
+        self.cells.setdefault(index, {})[step] = agent
+    
+    def release(self, agent: str, entries: List[Tuple[int, int]]):
+        """Drop the given (tile, step) reservations if the agent still holds them"""
+        cells = self.cells
+        for index, step in entries:
+            cell = cells.get(index)
+            if cell is not None and cell.get(step) == agent:
+                del cell[step]
+                if not cell:
+                    del cells[index]
+    
+    def park(self, agent: str, index: int, step: int) -> bool:
+        """Hold a tile from step onward (False if another agent already holds it)"""
+        holder = self.parked.get(index)
+        if holder is not None and holder[0] != agent:
+            return False
+        self.parked[index] = (agent, step)
+        return True
+    
+    def unpark(self, agent: str, index: Optional[int]):
+        """Give up a held tile"""
+        holder = self.parked.get(index)
+        if holder is not None and holder[0] == agent:
+            del self.parked[index]
+    
+    def is_free(self, agent: str, index: int, step: int) -> bool:
+        """True if no other agent is on the tile at this step"""
+        holder = self.parked.get(index)
+        if holder is not None and holder[0] != agent and holder[1] <= step:
+            return False
+        cell = self.cells.get(index)
+        if cell is not None:
+            owner = cell.get(step)
+            if owner is not None and owner != agent:
+                return False
+        return True
+    
+    def is_free_after(self, agent: str, index: int, step: int) -> bool:
+        """True if no other agent will be on the tile at or after this step"""
+        holder = self.parked.get(index)
+        if holder is not None and holder[0] != agent:
+            return False
+        cell = self.cells.get(index)
+        if cell is not None:
+            for reserved_step, owner in cell.items():
+                if reserved_step >= step and owner != agent:
+                    return False
+        return True
+    
+    def is_swap(self, agent: str, from_index: int, to_index: int, step: int) -> bool:
+        """True if another agent moves from to_index to from_index between step and step + 1"""
+        cell = self.cells.get(to_index)
+        if cell is None:
+            return False
+        owner = cell.get(step)
+        if owner is None or owner == agent:
+            return False
+        back = self.cells.get(from_index)
+        return back is not None and back.get(step + 1) == owner
+    
+    def holders_after(self, agent: str, index: int, step: int) -> Set[str]:
+        """Other agents with a reservation on the tile at or after this step"""
+        cell = self.cells.get(index)
+        if cell is None:
+            return set()
+        return {owner for reserved_step, owner in cell.items() if reserved_step >= step and owner != agent}
+
+
+class WalkingDistance:
+    """
+    Resumable reverse A* (RRA*) from a subgoal toward an agent's tile
+    
+    Gives the walking distance around buildings (ignoring other agents) from any
+    tile to the subgoal, settling only as many tiles as the queries need. Tiles
+    it cannot settle within its expansion budget fall back to the Manhattan distance.
+    """
+    
+    def __init__(self, walls: bytes, width: int, height: int, subgoal: int, start: int, budget: int):
+        """Start the reverse search at the subgoal, heading for start"""
+        self.walls = walls
+        self.width = width
+        self.height = height
+        self.subgoal_y, self.subgoal_x = divmod(subgoal, width)
+        self.start_y, self.start_x = divmod(start, width)
+        self.budget = budget
+        self.g_costs = {subgoal: 0}
+        self.settled: Dict[int, int] = {}  # Tile -> exact distance
+        h = abs(self.start_x - self.subgoal_x) + abs(self.start_y - self.subgoal_y)
+        self.open_heap = [(h * (width + height) + h, subgoal)]
+    
+    def get(self, index: int) -> int:
+        """Walking distance from a tile to the subgoal (resuming the search if needed)"""
+        distance = self.settled.get(index)
+        if distance is not None:
+            return distance
+        if self.budget > 0 and not self.walls[index]:
+            distance = self._resume(index)
+            if distance is not None:
+                return distance
+        y, x = divmod(index, self.width)
+        return abs(x - self.subgoal_x) + abs(y - self.subgoal_y)
+    
+    def _resume(self, target: int) -> Optional[int]:
+        """Expand tiles in f order until target is settled or the budget runs out"""
+        width = self.width
+        height = self.height
+        walls = self.walls
+        g_costs = self.g_costs
+        settled = self.settled
+        open_heap = self.open_heap
+        start_x, start_y = self.start_x, self.start_y
+        tie_scale = width + height
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        while open_heap and self.budget > 0:
+            _, index = heappop(open_heap)
+            if index in settled:
+                continue
+            distance = settled[index] = g_costs[index]
+            self.budget -= 1
+            y, x = divmod(index, width)
+            next_distance = distance + 1
+            for neighbor, nx, ny, inside in ((index - width, x, y - 1, y > 0), (index + 1, x + 1, y, x + 1 < width),
+                                             (index + width, x, y + 1, y + 1 < height), (index - 1, x - 1, y, x > 0)):
+                if inside and not walls[neighbor] and neighbor not in settled:
+                    known = g_costs.get(neighbor)
+                    if known is None or next_distance < known:
+                        g_costs[neighbor] = next_distance
+                        h = abs(nx - start_x) + abs(ny - start_y)
+                        heappush(open_heap, ((next_distance + h) * tie_scale + h, neighbor))
+            if index == target:
+                return distance
+        return None
+
+
+class AgentPlan:
+    """Cooperative planning state of one employee"""
+    
+    def __init__(self, employee):
+        """Initialize a standing (not yet planned) agent"""
+        self.employee = employee
+        self.moving = False  # Steered along cells; False while standing on parked_at
+        self.goal: Optional[int] = None  # Tile index the guide leads to
+        self.guide: List[int] = []  # Static route to the goal, one tile index per step
+        self.guide_pos = 0  # Guide positions before this one are behind the agent
+        self.guide_version = -1  # Passability version the guide was routed on
+        self.cells: List[int] = []  # Tile at each step from start_step
+        self.start_step = 0
+        self.reserved: List[Tuple[int, int]] = []  # (tile, step) held in the table
+        self.parked_at: Optional[int] = None
+        self.unreachable: Optional[int] = None  # Goal without a route; the employee walks there unplanned
+        self.best_remaining: Optional[int] = None  # Fewest guide steps left after any window
+        self.stuck = 0  # Consecutive windows without getting closer
+        self.replans = 0  # Plans made at the current step boundary
+        self.deferred = 0  # Step boundaries the agent waited for a plan because of the budget
+    
+    def cell_at(self, step: int) -> int:
+        """Tile the agent occupies at a step (its last planned tile once the plan runs out)"""
+        offset = step - self.start_step
+        return self.cells[min(max(offset, 0), len(self.cells) - 1)]
+
+
+class CooperativePlanner:
+    """Plans and moves all MOVING employees of one Pathfinder through a reservation table"""
+    
+    def __init__(self, pathfinder, window: int = COOPERATIVE_WINDOW):
+        """Initialize with an empty table at step 0"""
+        self.pathfinder = pathfinder
+        self.window = window
+        self.table = ReservationTable()
+        self.agents: Dict[str, AgentPlan] = {}
+        self.step = 0  # Global step clock
+        self.progress = 0.0  # Fraction of the current step already walked
+        self.steps_per_second = EMPLOYEE_SPEED  # One tile per step at walking speed
+        
+        # Counters for benchmarks and tests
+        self.replans = 0
+        self.expansions = 0
+        self.conflicts = 0  # Moving agents found sharing a tile at a step boundary
+        self.ghost_plans = 0  # Windows planned through other agents to break a deadlock
+    
+    # Per-frame driver
+    def update(self, dt: float, employees: List):
+        """Register movers, advance the step clock, replan at boundaries and move employees"""
+        self._sync(employees)
+        self.progress += dt * self.steps_per_second
+        while self.progress >= 1.0:
+            self.progress -= 1.0
+            self.step += 1
+            self._on_step()
+        self._place_agents()
+    
+    def _sync(self, employees: List):
+        """Track new, departed and newly moving employees (their plans start at the next boundary)"""
+        present = set()
+        for employee in employees:
+            present.add(employee.id)
+            plan = self.agents.get(employee.id)
+            if plan is None:
+                plan = self.agents[employee.id] = AgentPlan(employee)
+            if (employee.state == EmployeeState.MOVING and not plan.moving
+                    and plan.unreachable != self._target_index(employee)):
+                employee.steered = True  # Stands still until planned at the next boundary
+        
+        for agent in [agent for agent in self.agents if agent not in present]:
+            self._drop(agent)
+    
+    def _drop(self, agent: str):
+        """Forget an employee and everything it holds"""
+        plan = self.agents.pop(agent)
+        self._release(plan)
+        plan.employee.steered = False
+    
+    def _release(self, plan: AgentPlan):
+        """Give up every reservation and the held tile of an agent"""
+        agent = plan.employee.id
+        self.table.release(agent, plan.reserved)
+        self.table.unpark(agent, plan.parked_at)
+        plan.reserved = []
+        plan.parked_at = None
+        plan.cells = []
+    
+    def release_all(self):
+        """Hand every employee back to free movement (when leaving cooperative mode)"""
+        for agent in list(self.agents):
+            plan = self.agents[agent]
+            self._drop(agent)
+            employee = plan.employee
+            if employee.state == EmployeeState.MOVING:
+                employee._set_destination(employee.target_x, employee.target_y)
+    
+    def _place_agents(self):
+        """Interpolate every moving agent between its tiles at this and the next step"""
+        width = self.pathfinder.grid_width
+        progress = self.progress
+        step = self.step
+        for plan in self.agents.values():
+            if plan.moving:
+                cells = plan.cells
+                offset = step - plan.start_step  # Never negative: plans start at a past boundary
+                if offset + 1 < len(cells):
+                    current, following = cells[offset], cells[offset + 1]
+                else:
+                    current = following = cells[-1]
+                cy, cx = divmod(current, width)
+                fy, fx = divmod(following, width)
+                plan.employee.x = cx + (fx - cx) * progress
+                plan.employee.y = cy + (fy - cy) * progress
+    
+    # Step boundaries
+    def _on_step(self):
+        """Settle arrivals and stops, then replan every agent whose window needs renewing"""
+        step = self.step
+        batch = []
+        displaced: Set[str] = set()
+        
+        for agent, plan in self.agents.items():
+            plan.replans = 0
+            employee = plan.employee
+            if plan.moving:
+                cell = plan.cell_at(step)
+                arrived = cell == plan.goal and step - plan.start_step >= len(plan.cells) - 1
+                if employee.state != EmployeeState.MOVING or arrived:
+                    # Stop on this tile: cut the plan here and keep holding the tile
+                    plan.moving = False
+                    employee.steered = False
+                    employee.x, employee.y = self._position(cell)
+                    displaced |= self._hold(plan, [cell], step)
+                    if arrived and employee.state == EmployeeState.MOVING:
+                        employee._arrive()
+                elif plan.goal != self._target_index(employee) or (
+                        plan.cells[-1] != plan.goal
+                        and step - plan.start_step >= len(plan.cells) - 1 - self.window // 2):
+                    batch.append(plan)  # New target, or half of the window walked
+            elif employee.state != EmployeeState.MOVING or employee.steered:
+                # Standing employees (and movers waiting for a plan) hold the tile they stand on
+                cell = self._index(int(round(employee.x)), int(round(employee.y)))
+                if plan.parked_at != cell or plan.cells != [cell]:
+                    displaced |= self._hold(plan, [cell], step)
+                if employee.steered:
+                    batch.append(plan)
+            elif plan.reserved:
+                self._release(plan)  # Walking unplanned toward an unreachable target
+        
+        # Displaced agents must replan now, before they walk into the held tile
+        # Longest-deferred and longest-stuck agents claim tiles first; the per-step budget
+        # spreads mass starts over several steps (deferred agents keep walking or wait)
+        batch.sort(key=lambda plan: (-plan.deferred, -plan.stuck, plan.employee.id))
+        for plan in batch[COOPERATIVE_PLANS_PER_STEP:]:
+            plan.deferred += 1
+        for plan in batch[:COOPERATIVE_PLANS_PER_STEP]:
+            plan.deferred = 0
+        queue = batch[:COOPERATIVE_PLANS_PER_STEP]
+        queue += [self.agents[agent] for agent in sorted(displaced) if agent in self.agents]
+        planned = 0
+        while planned < len(queue):
+            plan = queue[planned]
+            planned += 1
+            if plan.employee.state != EmployeeState.MOVING or plan.replans >= MAX_REPLANS_PER_STEP:
+                continue
+            for agent in sorted(self._replan(plan)):
+                other = self.agents.get(agent)
+                if other is not None and other.moving:
+                    queue.append(other)
+        
+        self._count_conflicts()
+    
+    def _hold(self, plan: AgentPlan, cells: List[int], step: int) -> Set[str]:
+        """
+        Replace an agent's reservations with cells from step on, holding the last one
+        
+        Returns:
+            Other agents whose reservations overlap the held tile (they must replan)
+        """
+        agent = plan.employee.id
+        table = self.table
+        self._release(plan)
+        plan.cells = cells
+        plan.start_step = step
+        plan.reserved = [(index, step + offset) for offset, index in enumerate(cells)]
+        for index, reserved_step in plan.reserved:
+            table.reserve(agent, index, reserved_step)
+        
+        end_step = step + len(cells) - 1
+        plan.parked_at = cells[-1] if table.park(agent, cells[-1], end_step) else None
+        return table.holders_after(agent, cells[-1], end_step + 1)
+    
+    def _replan(self, plan: AgentPlan) -> Set[str]:
+        """Plan the next window of an agent from its tile at the current step"""
+        employee = plan.employee
+        agent = employee.id
+        step = self.step
+        start = plan.cell_at(step) if plan.cells else self._index(int(round(employee.x)), int(round(employee.y)))
+        plan.replans += 1
+        self.replans += 1
+        
+        # Static guide toward the target, rerouted when the target or the buildings change
+        pathfinder = self.pathfinder
+        pathfinder._sync_walls()
+        goal = self._target_index(employee)
+        if goal != plan.goal or plan.guide_version != pathfinder._walls_version:
+            if not self._route_guide(plan, start, goal):
+                # Unreachable: hand the employee back to free movement (walks straight)
+                plan.unreachable = goal
+                plan.moving = False
+                employee.steered = False
+                return self._hold(plan, [start], step)
+        plan.unreachable = None
+        
+        # Head for the furthest guide tile within a window's reach (agents often
+        # walk equally short routes beside the guide rather than on it)
+        guide = plan.guide
+        width = pathfinder.grid_width
+        start_y, start_x = divmod(start, width)
+        subgoal_pos = plan.guide_pos
+        for position in range(plan.guide_pos, min(len(guide), plan.guide_pos + 2 * self.window + 1)):
+            y, x = divmod(guide[position], width)
+            if abs(x - start_x) + abs(y - start_y) <= self.window:
+                subgoal_pos = position
+        plan.guide_pos = max(plan.guide_pos, subgoal_pos - self.window)
+        subgoal = guide[subgoal_pos]
+        distance = WalkingDistance(pathfinder._walls, width, pathfinder.grid_height, subgoal, start,
+                                   COOPERATIVE_MAX_EXPANSIONS)
+        ghost = plan.stuck >= COOPERATIVE_STUCK_LIMIT
+        if ghost:
+            self.ghost_plans += 1
+        cells = self._search(agent, start, subgoal, distance, subgoal == goal, ghost)
+        
+        # Progress along the guide decides whether the agent counts as stuck
+        remaining = distance.get(cells[-1]) + len(guide) - 1 - subgoal_pos
+        if plan.best_remaining is None or remaining < plan.best_remaining:
+            plan.best_remaining = remaining
+            plan.stuck = 0
+        else:
+            plan.stuck += 1
+        
+        plan.moving = True
+        employee.steered = True
+        return self._hold(plan, cells, step)
+    
+    def _route_guide(self, plan: AgentPlan, start: int, goal: int) -> bool:
+        """Expand the Pathfinder's route from start to goal into one tile per step"""
+        pathfinder = self.pathfinder
+        route = pathfinder.find_path(self._position(start), self._position(goal))
+        plan.goal = goal
+        plan.guide_version = pathfinder._walls_version
+        plan.guide_pos = 0
+        plan.best_remaining = None
+        plan.stuck = 0
+        if route is None:
+            plan.guide = []
+            return False
+        
+        # Waypoints share a row or column (or a clear diagonal, walked as a staircase)
+        width = pathfinder.grid_width
+        x, y = route[0]
+        guide = [y * width + x]
+        for end_x, end_y in route[1:]:
+            while (x, y) != (end_x, end_y):
+                if x != end_x:
+                    x += 1 if end_x > x else -1
+                    guide.append(y * width + x)
+                if y != end_y:
+                    y += 1 if end_y > y else -1
+                    guide.append(y * width + x)
+        plan.guide = guide
+        return True
+    
+    def _search(self, agent: str, start: int, subgoal: int, distance: WalkingDistance,
+                final: bool, ghost: bool) -> List[int]:
+        """
+        Space-time A* from start toward subgoal over at most one window of steps
+        
+        Nodes are (tile, step offset); each step moves to a neighbour or waits, and
+        must not enter a tile another agent holds at that step or swap with one.
+        The heuristic is the walking distance around buildings (WalkingDistance).
+        The search ends at the final goal, at the subgoal or at the end of the
+        window (the last two must stay free afterwards, as the agent holds its
+        last tile) or, failing those, at the reachable node nearest the subgoal.
+        
+        Returns:
+            Tile per step starting with start
+        """
+        pathfinder = self.pathfinder
+        width = pathfinder.grid_width
+        height = pathfinder.grid_height
+        size = width * height
+        walls = pathfinder._walls
+        table = self.table
+        is_free = table.is_free
+        is_swap = table.is_swap
+        is_free_after = table.is_free_after
+        window = self.window
+        base = self.step
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        distance_to = distance.get
+        h = distance_to(start)
+        tie_scale = size  # Beyond any walking distance
+        open_heap = [(h * tie_scale + h, start)]  # Keys are t * size + tile
+        parents = {start: -1}  # Every step costs 1, so the first parent found is as good as any
+        best, best_rank = start, None
+        expansions = 0
+        
+        while open_heap and expansions < COOPERATIVE_MAX_EXPANSIONS:
+            _, key = heappop(open_heap)
+            expansions += 1
+            t, index = divmod(key, size)
+            y, x = divmod(index, width)
+            h = distance_to(index)
+            
+            if index == subgoal and final:
+                best = key  # Arrive; anyone planned through the goal later gets displaced
+                break
+            # Stop here for good only if nobody needs the tile later
+            if ghost or is_free_after(agent, index, base + t + 1):
+                if index == subgoal or t == window:
+                    best = key  # Popped in f order, so the best node at the window's end
+                    break
+                rank = (h, t)
+                if best_rank is None or rank < best_rank:
+                    best, best_rank = key, rank
+            if t == window:
+                continue
+            
+            step = base + t + 1
+            child_base = (t + 1) * size
+            for neighbor, inside in ((index, True), (index - width, y > 0), (index + 1, x + 1 < width),
+                                     (index + width, y + 1 < height), (index - 1, x > 0)):
+                if not inside or walls[neighbor]:
+                    continue
+                child = child_base + neighbor
+                if child in parents:
+                    continue
+                if not ghost and (not is_free(agent, neighbor, step)
+                                  or (neighbor != index and is_swap(agent, index, neighbor, step - 1))):
+                    continue
+                parents[child] = key
+                child_h = distance_to(neighbor)
+                heappush(open_heap, ((t + 1 + child_h) * tie_scale + child_h, child))
+        self.expansions += expansions
+        
+        # Walk parents back to the start; arriving at the final goal ends the plan there
+        cells = []
+        key = best
+        while key != -1:
+            cells.append(key % size)
+            key = parents[key]
+        cells.reverse()
+        if not final:
+            while len(cells) > 1 and cells[-1] == cells[-2] and cells[-1] != subgoal:
+                cells.pop()  # Trailing waits: holding the tile does the same
+        return cells
+    
+    def _count_conflicts(self):
+        """Count moving agents that share a tile with any other agent at this step"""
+        occupied: Dict[int, int] = {}
+        step = self.step
+        for plan in self.agents.values():
+            if plan.moving:
+                cell = plan.cell_at(step)
+            elif plan.parked_at is not None:
+                cell = plan.parked_at
+            else:
+                continue
+            occupied[cell] = occupied.get(cell, 0) + 1
+        for plan in self.agents.values():
+            if plan.moving and occupied[plan.cell_at(step)] > 1:
+                self.conflicts += 1
+    
+    # Temporary obstacles (Pathfinder.add_temporary_obstacle)
+    def block_tile(self, x: int, y: int):
+        """Hold a tile for no agent so planned routes avoid it"""
+        index = self._index(x, y)
+        if self.table.park(OBSTACLE_AGENT, index, self.step):
+            for agent in self.table.holders_after(OBSTACLE_AGENT, index, self.step + 1):
+                plan = self.agents.get(agent)
+                if plan is not None and plan.moving:
+                    plan.goal = None  # Replans at the next boundary
+    
+    def unblock_tile(self, x: int, y: int):
+        """Release a tile held by block_tile"""
+        self.table.unpark(OBSTACLE_AGENT, self._index(x, y))
+    
+    # Helpers
+    def _index(self, x: int, y: int) -> int:
+        return y * self.pathfinder.grid_width + x
+    
+    def _position(self, index: int) -> Tuple[int, int]:
+        y, x = divmod(index, self.pathfinder.grid_width)
+        return x, y
+    
+    def _target_index(self, employee) -> int:
+        return self._index(int(employee.target_x), int(employee.target_y))
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Planning counters"""
+        return {
+            'agents': len(self.agents),
+            'moving': sum(1 for plan in self.agents.values() if plan.moving),
+            'step': self.step,
+            'replans': self.replans,
+            'expansions': self.expansions,
+            'conflicts': self.conflicts,
+            'ghost_plans': self.ghost_plans
+        }
@@ -1,14 +1,20 @@
 """
 Employee - Individual worker with AI, needs, and task execution
 Represents a single farm worker with pathfinding, needs system, and work capabilities.
+
+Position, target, speed, needs, state, timers and efficiency live in a slot of an
+EmployeeStore (a private one-slot store until EmployeeManager adopts the employee),
+so large crews can be simulated with the store's vectorized kernels.
 """
 
 import pygame
 import math
-from typing import List, Tuple, Optional, Dict
+from collections import deque
+from typing import Deque, List, Tuple, Optional, Dict
 from enum import Enum
 from scripts.core.config import *
-# Pathfinding removed - using direct movement for performance
+from scripts.employee.employee_store import EmployeeStore, STATE_NAMES
+from scripts.employee.task_queue import Task, TaskIndex
 
 
 class EmployeeState(Enum):
@@ -20,21 +26,50 @@ class EmployeeState(Enum):
     SEEKING_AMENITY = "seeking_amenity"
 
 
+# EmployeeState for each EmployeeStore state code, and the reverse mapping
+_STATES = tuple(EmployeeState(name) for name in STATE_NAMES)
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+
+
 class Employee:
     """Individual farm employee with AI and needs"""
     
-    def __init__(self, employee_id: str, name: str, x: float, y: float):
-        """Initialize employee at grid position"""
+    # Fixed attribute layout: no per-instance __dict__, and every optional field is
+    # declared (and initialized) here instead of being probed for with hasattr.
+    # Simulation columns (position, target, speed, needs, state, timers, efficiency)
+    # are properties over the employee's EmployeeStore slot.
+    __slots__ = (
+        'id', 'name', '_store', '_slot', 'path', 'pending_path', 'pathfinder', 'steered',
+        'skill_level', 'walking_speed', 'max_stamina', 'traits',
+        'assigned_tasks', 'current_task', 'task_index', 'daily_wage',
+        'housing_recently_used', '_pending_harvest',
+        'color', 'radius'
+    )
+    
+    def __init__(self, employee_id: str, name: str, x: float, y: float, store: Optional[EmployeeStore] = None):
+        """Initialize employee at grid position (in a private store unless one is given)"""
         self.id = employee_id
         self.name = name
         
+        # Standalone employees get a private single-slot store
+        if store is None:
+            store = EmployeeStore(1)
+        self._store = store
+        self._slot = store.allocate(self)
+        
         # Position (in grid coordinates)
         self.x = x
         self.y = y
         self.target_x = x
         self.target_y = y
         
-        # Direct movement system
+        # Waypoints still to visit on the way to the target (from the shared pathfinder)
+        self.path: List[Tuple[int, int]] = []
+        self.pending_path = None  # Future from a batched request, claimed once a worker finishes
+        self.pathfinder = None  # Set by EmployeeManager; None walks in straight lines
+        self.steered = False  # True while a CooperativePlanner moves this employee step by step
+        
+        # Movement speed
         self.speed = EMPLOYEE_SPEED  # tiles per second
         
         # AI State
@@ -55,8 +90,9 @@ class Employee:
         self.traits: List[str] = []
         
         # Work assignment
-        self.assigned_tasks: List[Dict] = []  # List of task dictionaries
-        self.current_task = None
+        self.assigned_tasks: Deque[Task] = deque()  # Queued tasks, oldest first
+        self.current_task: Optional[Task] = None
+        self.task_index = TaskIndex()  # Replaced by EmployeeManager's crew-wide index
         self.work_efficiency = 1.0
         
         # Employment details
@@ -66,12 +102,125 @@ class Employee:
         self.housing_recently_used = False  # +25% trait effectiveness if used housing recently
         self.housing_usage_timer = 0.0  # Timer since last housing use
         
+        # Ripe tile waiting to be harvested by EmployeeManager (None if nothing pending)
+        self._pending_harvest = None
+        
         # Visual
         self.color = COLORS['employee']
-        self.radius = 8
+        self.radius = EMPLOYEE_RADIUS
         
         print(f"Employee {self.name} ({self.id}) created at ({x}, {y})")
     
+    # Store-backed properties
+    @property
+    def x(self) -> float:
+        """Grid column (fractional while walking)"""
+        return float(self._store.x[self._slot])
+    
+    @x.setter
+    def x(self, value: float):
+        self._store.x[self._slot] = value
+    
+    @property
+    def y(self) -> float:
+        """Grid row (fractional while walking)"""
+        return float(self._store.y[self._slot])
+    
+    @y.setter
+    def y(self, value: float):
+        self._store.y[self._slot] = value
+    
+    @property
+    def target_x(self) -> float:
+        """Column of the movement target"""
+        return float(self._store.target_x[self._slot])
+    
+    @target_x.setter
+    def target_x(self, value: float):
+        self._store.target_x[self._slot] = value
+    
+    @property
+    def target_y(self) -> float:
+        """Row of the movement target"""
+        return float(self._store.target_y[self._slot])
+    
+    @target_y.setter
+    def target_y(self, value: float):
+        self._store.target_y[self._slot] = value
+    
+    @property
+    def speed(self) -> float:
+        """Walking speed in tiles per second"""
+        return float(self._store.speed[self._slot])
+    
+    @speed.setter
+    def speed(self, value: float):
+        self._store.speed[self._slot] = value
+    
+    @property
+    def state(self) -> 'EmployeeState':
+        """Current AI state"""
+        return _STATES[self._store.state[self._slot]]
+    
+    @state.setter
+    def state(self, value: 'EmployeeState'):
+        self._store.state[self._slot] = _STATE_CODES[value]
+        self._store.wake_at[self._slot] = 0.0  # Decide again on the next tick
+    
+    @property
+    def state_timer(self) -> float:
+        """Game seconds spent in the current state (or action)"""
+        return float(self._store.state_timer[self._slot])
+    
+    @state_timer.setter
+    def state_timer(self, value: float):
+        self._store.state_timer[self._slot] = value
+    
+    @property
+    def housing_usage_timer(self) -> float:
+        """Game seconds since housing was last used"""
+        return float(self._store.housing_timer[self._slot])
+    
+    @housing_usage_timer.setter
+    def housing_usage_timer(self, value: float):
+        self._store.housing_timer[self._slot] = value
+    
+    @property
+    def hunger(self) -> float:
+        """Hunger need (0-100, 100 = fed)"""
+        return float(self._store.hunger[self._slot])
+    
+    @hunger.setter
+    def hunger(self, value: float):
+        self._store.hunger[self._slot] = value
+    
+    @property
+    def thirst(self) -> float:
+        """Thirst need (0-100, 100 = quenched)"""
+        return float(self._store.thirst[self._slot])
+    
+    @thirst.setter
+    def thirst(self, value: float):
+        self._store.thirst[self._slot] = value
+    
+    @property
+    def rest(self) -> float:
+        """Rest need (0-100, 100 = rested)"""
+        return float(self._store.rest[self._slot])
+    
+    @rest.setter
+    def rest(self, value: float):
+        self._store.rest[self._slot] = value
+    
+    @property
+    def work_efficiency(self) -> float:
+        """Work speed multiplier from traits"""
+        return float(self._store.work_efficiency[self._slot])
+    
+    @work_efficiency.setter
+    def work_efficiency(self, value: float):
+        self._store.work_efficiency[self._slot] = value
+    
     def add_trait(self, trait_name: str):
         """Add a trait to the employee"""
         if trait_name not in self.traits:
@@ -88,14 +237,8 @@ class Employee:
             self.speed = self.walking_speed
     
     def assign_task(self, task_type: str, target_tiles: List, **kwargs):
-        """Assign a new task to the employee with optional parameters"""
-        task = {
-            'type': task_type,
-            'tiles': target_tiles,
-            'completed_tiles': [],
-            'status': 'pending',
-            **kwargs  # Allow additional task parameters like crop_type
-        }
+        """Assign a new task to the employee with optional parameters (like crop_type)"""
+        task = Task(task_type, target_tiles, self, self.task_index, **kwargs)
         self.assigned_tasks.append(task)
         
         # Start working on this task if idle
@@ -104,6 +247,7 @@ class Employee:
     
     def _start_next_task(self):
         """Start working on the next available task"""
+        self._cleanup_completed_tasks()
         if not self.assigned_tasks:
             self.current_task = None
             self.state = EmployeeState.IDLE
@@ -111,40 +255,62 @@ class Employee:
         
         # Find first incomplete task
         for task in self.assigned_tasks:
-            if task['status'] == 'pending':
-                remaining_tiles = [t for t in task['tiles'] 
-                                 if t not in task['completed_tiles']]
-                if remaining_tiles:
+            if task.status == 'pending':
+                target_tile = task.next_tile()
+                if target_tile is not None:
                     self.current_task = task
-                    task['status'] = 'in_progress'
+                    task.status = 'in_progress'
                     
                     # Move to first tile that needs work
-                    target_tile = remaining_tiles[0]
                     self._move_to_tile(target_tile.x, target_tile.y)
                     return
                 else:
-                    task['status'] = 'completed'
+                    task.status = 'completed'
         
         # No tasks available
         self.current_task = None
         self.state = EmployeeState.IDLE
     
     def _move_to_tile(self, grid_x: int, grid_y: int):
-        """Start moving to a specific grid tile using efficient direct movement"""
+        """Start moving to a specific grid tile along an obstacle-free path"""
         if abs(self.x - grid_x) < 0.1 and abs(self.y - grid_y) < 0.1:
             # Already at target (within tolerance)
             self.state = EmployeeState.WORKING
             self.state_timer = 0.0
             return
         
-        # Simple, efficient direct movement
-        self.target_x = grid_x
-        self.target_y = grid_y
+        self._set_destination(grid_x, grid_y)
         self.state = EmployeeState.MOVING
         self.state_timer = 0.0
         
         print(f"Employee {self.name}: Moving to ({grid_x}, {grid_y})")
     
+    def _set_destination(self, grid_x: int, grid_y: int):
+        """Set the movement target and plan waypoints around obstacles"""
+        self.target_x = grid_x
+        self.target_y = grid_y
+        self.path = []
+        self.pending_path = None
+        
+        if self.pathfinder is None:
+            return
+        
+        start = (int(round(self.x)), int(round(self.y)))
+        if self.pathfinder.batching:
+            # Planned with the rest of the batch; picked up by _update_movement when ready
+            self.pending_path = self.pathfinder.request_path(start, (int(grid_x), int(grid_y)))
+            return
+        self._follow_path(self.pathfinder.find_path(start, (int(grid_x), int(grid_y))))
+    
+    def _follow_path(self, path: Optional[List[Tuple[int, int]]]):
+        """Walk the planned waypoints toward the current target"""
+        grid_x, grid_y = self.target_x, self.target_y
+        if path is None:
+            # Unreachable (e.g. target walled in); walk straight rather than stall
+            print(f"Employee {self.name}: No path to ({grid_x}, {grid_y}), moving directly")
+            return
+        self.path = path[1:]  # First point is the tile we are standing on
+    
     def update(self, dt: float, grid_manager):
         """Update employee AI and needs"""
         # Clean up completed tasks first
@@ -161,6 +327,26 @@ class Employee:
         # Update AI state
         self.update_ai(dt, grid_manager)
     
+    def update_batched(self, dt: float, grid_manager, moved: bool):
+        """
+        Per-object part of an update whose needs were decayed by EmployeeStore kernels
+        
+        Args:
+            moved: True if the movement kernel already walked this employee this tick
+        """
+        self._cleanup_completed_tasks()
+        self._update_housing_timer(dt)
+        
+        if moved:
+            self.state_timer += dt  # Still MOVING toward the same waypoint
+            return
+        
+        if self._has_critical_needs():
+            self._handle_critical_needs()
+            return
+        
+        self.update_ai(dt, grid_manager)
+    
     def update_needs(self, dt: float, grid_manager=None):
         """Update employee needs over time"""
         hours_passed = dt / 3600.0  # Convert seconds to hours
@@ -176,7 +362,7 @@ class Employee:
             # Hard worker trait effect
             if "hard_worker" in self.traits:
                 rest_decay *= 0.95  # 5% less drain
-                
+            
             # Apply building-based rest decay bonuses if building manager available
             if grid_manager and hasattr(grid_manager, 'building_manager') and grid_manager.building_manager:
                 # Get current tile position for spatial benefits calculation
@@ -195,7 +381,7 @@ class Employee:
                 # Fallback to legacy water cooler check for compatibility
                 if grid_manager and self._has_nearby_water_cooler(grid_manager):
                     rest_decay *= 0.80  # 20% less rest drain (work 20% longer)
-                
+        
         elif self.state == EmployeeState.RESTING:
             rest_decay = -REST_DECAY_RATE * 2 * hours_passed  # Restore rest
         else:
@@ -206,7 +392,10 @@ class Employee:
         self.thirst = max(0, self.thirst - thirst_decay)
         self.rest = max(0, min(MAX_REST, self.rest - rest_decay))
         
-        # Update housing usage timer
+        self._update_housing_timer(dt)
+    
+    def _update_housing_timer(self, dt: float):
+        """Expire the housing bonus an hour after housing was used"""
         if self.housing_recently_used:
             self.housing_usage_timer += dt
             if self.housing_usage_timer >= 3600.0:  # 1 hour has passed
@@ -257,32 +446,52 @@ class Employee:
             self._update_seeking_amenity(dt, grid_manager)
     
     def _update_movement(self, dt: float):
-        """Update movement toward target using efficient direct movement"""
-        # Calculate direction to target
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
-        distance = math.sqrt(dx*dx + dy*dy)
-        
-        if distance < 0.1:  # Close enough
-            self.x = self.target_x
-            self.y = self.target_y
-            self.state = EmployeeState.WORKING
-            self.state_timer = 0.0
-            print(f"Employee {self.name}: Reached destination ({self.target_x}, {self.target_y})")
-            return
+        """Update movement toward the next waypoint (or the target if no path is planned)"""
+        if self.steered:
+            return  # Moved in step with the crew by the cooperative planner
+        
+        if self.pending_path is not None:
+            if not self.pathfinder.route_ready(self.pending_path):
+                return  # Wait in place until the route is handed out at a tick boundary
+            future, self.pending_path = self.pending_path, None
+            start = (int(round(self.x)), int(round(self.y)))
+            self._follow_path(self.pathfinder.claim_path(future, start, (int(self.target_x), int(self.target_y))))
         
-        # Move toward target
         move_distance = self.speed * dt
-        if move_distance >= distance:
-            # Arrive at target this frame
-            self.x = self.target_x
-            self.y = self.target_y
-            self.state = EmployeeState.WORKING
-            self.state_timer = 0.0
-        else:
+        
+        # Walk through as many waypoints as this frame's movement covers
+        while True:
+            waypoint_x, waypoint_y = self.path[0] if self.path else (self.target_x, self.target_y)
+            dx = waypoint_x - self.x
+            dy = waypoint_y - self.y
+            distance = math.sqrt(dx*dx + dy*dy)
+            
+            if distance < 0.1 or move_distance >= distance:
+                # Arrive at this waypoint
+                self.x = waypoint_x
+                self.y = waypoint_y
+                move_distance -= distance
+                if self.path:
+                    self.path.pop(0)
+                    if self.path or (self.x, self.y) != (self.target_x, self.target_y):
+                        continue
+                
+                self._arrive()
+                if distance < 0.1:
+                    print(f"Employee {self.name}: Reached destination ({self.target_x}, {self.target_y})")
+                return
+            
             # Move closer
             self.x += (dx / distance) * move_distance
             self.y += (dy / distance) * move_distance
+            return
+    
+    def _arrive(self):
+        """Stop at the target and start working there"""
+        self.path = []
+        self.pending_path = None
+        self.state = EmployeeState.WORKING
+        self.state_timer = 0.0
     
     def _update_work(self, dt: float, grid_manager):
         """Update work progress on current task"""
@@ -297,13 +506,7 @@ class Employee:
             self._complete_current_tile()
             return
         
-        # Calculate work efficiency including building bonuses
-        effective_efficiency = self._calculate_work_efficiency(grid_manager)
-        
-        # Work takes time based on efficiency
-        work_time_needed = 3.0 / effective_efficiency  # Base 3 seconds per task
-        
-        if self.state_timer >= work_time_needed:
+        if self.state_timer >= self._work_time_needed(grid_manager):
             # Complete the work on this tile
             if self._perform_work_on_tile(tile, grid_manager):
                 self._complete_current_tile()
@@ -311,38 +514,74 @@ class Employee:
                 # Work failed, skip tile
                 self._complete_current_tile()
     
+    def _work_time_needed(self, grid_manager) -> float:
+        """Seconds the work on the current tile takes, including building bonuses"""
+        # Work takes time based on efficiency
+        effective_efficiency = self._calculate_work_efficiency(grid_manager)
+        return 3.0 / effective_efficiency  # Base 3 seconds per task
+    
+    def next_decision_delay(self, grid_manager) -> float:
+        """
+        Game seconds until this employee next has a decision to make
+        
+        Work completion, the end of a rest break, needs crossing a threshold and the
+        housing bonus expiring are computed from the timers and decay rates. Walkers
+        and amenity seekers decide every tick. Any state change in between wakes
+        the employee early (the state setter clears its scheduled time).
+        """
+        if self.state == EmployeeState.WORKING:
+            if not self.current_task:
+                return 0.0
+            delay = self._work_time_needed(grid_manager) - self.state_timer
+        elif self.state == EmployeeState.RESTING:
+            # Leaves once state_timer > 30 and rest > 50 (rest restores at twice its decay rate)
+            delay = max(30.0 - self.state_timer, (50 - self.rest) * 3600.0 / (REST_DECAY_RATE * 2))
+        elif self.state == EmployeeState.IDLE:
+            if self.current_task or any(task.status == 'pending' for task in self.assigned_tasks):
+                return 0.0
+            delay = math.inf
+        else:
+            return 0.0
+        
+        delay = min(delay, self._time_to_needs_threshold())
+        if self.housing_recently_used:
+            delay = min(delay, 3600.0 - self.housing_usage_timer)
+        return max(0.0, delay)
+    
+    def _time_to_needs_threshold(self) -> float:
+        """Game seconds until a need falls below a threshold of _has_critical_needs or needs_building_interaction"""
+        if self.state == EmployeeState.RESTING:
+            rest_rate = 0.0  # Rest is restored, not drained
+        elif self.state == EmployeeState.WORKING:
+            rest_rate = REST_DECAY_RATE  # Upper bound: traits and buildings only slow the drain
+        else:
+            rest_rate = REST_DECAY_RATE * 0.5
+        
+        delay = math.inf
+        for value, threshold, rate in ((self.hunger, 20, HUNGER_DECAY_RATE),
+                                       (self.thirst, 30, THIRST_DECAY_RATE), (self.thirst, 15, THIRST_DECAY_RATE),
+                                       (self.rest, 25, rest_rate), (self.rest, 10, rest_rate)):
+            if value >= threshold and rate > 0:
+                delay = min(delay, (value - threshold) * 3600.0 / rate)
+        return delay
+    
     def _perform_work_on_tile(self, tile, grid_manager) -> bool:
         """Perform the assigned work on a tile"""
         if not self.current_task:
             return False
         
-        task_type = self.current_task['type']
+        task_type = self.current_task.type
         
         if task_type == 'till' and tile.can_till():
             return tile.till()
         elif task_type == 'plant' and tile.can_plant():
             # Get crop type from current task, default to corn for backward compatibility
-            crop_type = self.current_task.get('crop_type', DEFAULT_CROP_TYPE)
+            crop_type = self.current_task.params.get('crop_type', DEFAULT_CROP_TYPE)
             return tile.plant(crop_type)
         elif task_type == 'harvest' and tile.can_harvest():
-            crop_type, yield_amount = tile.harvest(grid_manager)  # Pass grid_manager for building bonuses
-            if yield_amount > 0:
-                # Direct synchronous harvest processing to avoid race conditions
-                quality = (tile.soil_quality / 10.0) * (tile.water_level / 100.0)
-                harvest_result = {
-                    'crop_type': crop_type,  # Now uses actual crop type from harvest
-                    'quantity': yield_amount,
-                    'quality': quality,
-                    'tile_position': (tile.x, tile.y),
-                    'employee_id': self.id
-                }
-                crop_name = CROP_TYPES[crop_type]['name']
-                print(f"Employee {self.name}: Harvested {yield_amount} {crop_name.lower()} (quality: {quality:.2f})")
-                
-                # Return harvest data for immediate processing
-                self._pending_harvest = harvest_result
-                return True
-            return False
+            # EmployeeManager harvests every tile finished this tick in one GridManager.harvest_tiles call
+            self._pending_harvest = tile
+            return True
         
         return False
     
@@ -351,55 +590,49 @@ class Employee:
         if not self.current_task:
             return
         
-        # Mark current tile as completed
-        current_tile = None
-        for tile in self.current_task['tiles']:
-            if (int(tile.x) == int(self.x) and 
-                int(tile.y) == int(self.y)):
-                current_tile = tile
-                break
-        
-        if current_tile and current_tile not in self.current_task['completed_tiles']:
-            self.current_task['completed_tiles'].append(current_tile)
+        # Mark current tile as completed (the task's next tile, unless it was
+        # cancelled or handed to someone else while we walked there)
+        current_tile = self.current_task.next_tile()
+        if (current_tile is not None and int(current_tile.x) == int(self.x) and
+                int(current_tile.y) == int(self.y)):
+            self.current_task.complete(current_tile)
             # Clear task assignment from tile
             current_tile.task_assignment = None
             current_tile.task_assigned_to = None
         
         # Find next tile to work on
-        remaining_tiles = [t for t in self.current_task['tiles'] 
-                          if t not in self.current_task['completed_tiles']]
+        next_tile = self.current_task.next_tile()
         
-        if remaining_tiles:
+        if next_tile is not None:
             # Move to next tile
-            next_tile = remaining_tiles[0]
             self._move_to_tile(next_tile.x, next_tile.y)
         else:
             # Task completed
-            self.current_task['status'] = 'completed'
+            self.current_task.status = 'completed'
             self.current_task = None
             self._start_next_task()
     
     def _cleanup_completed_tasks(self):
-        """Remove completed tasks from the assigned_tasks list to prevent queue buildup"""
-        initial_count = len(self.assigned_tasks)
+        """Remove completed tasks from the front of the queue to prevent queue buildup"""
+        removed_count = 0
+        while self.assigned_tasks and self.assigned_tasks[0].status == 'completed':
+            self.assigned_tasks.popleft()
+            removed_count += 1
         
-        # Remove tasks marked as completed
-        self.assigned_tasks = [task for task in self.assigned_tasks 
-                              if task['status'] != 'completed']
-        
-        removed_count = initial_count - len(self.assigned_tasks)
         if removed_count > 0:
             print(f"Employee {self.name}: Cleaned up {removed_count} completed tasks ({len(self.assigned_tasks)} remaining)")
     
     def get_pixel_position(self, zoom_factor: float = 1.0, pan_offset_x: float = 0.0, 
-                          pan_offset_y: float = 0.0, hud_height: int = 70) -> Tuple[int, int]:
-        """Get employee position in screen pixels with grid transformations"""
+                          pan_offset_y: float = 0.0, hud_height: int = 70,
+                          position: Optional[Tuple[float, float]] = None) -> Tuple[int, int]:
+        """Get employee position (or an interpolated position) in screen pixels with grid transformations"""
         # Apply the same transformations as the enhanced grid renderer
         scaled_tile_size = TILE_SIZE * zoom_factor
+        x, y = position if position is not None else (self.x, self.y)
         
         # Calculate position with grid center offset and transformations
-        world_x = self.x * scaled_tile_size + scaled_tile_size // 2
-        world_y = self.y * scaled_tile_size + scaled_tile_size // 2
+        world_x = x * scaled_tile_size + scaled_tile_size // 2
+        world_y = y * scaled_tile_size + scaled_tile_size // 2
         
         # Apply pan offset and HUD offset
         pixel_x = int(world_x + pan_offset_x)
@@ -408,9 +641,9 @@ class Employee:
         return (pixel_x, pixel_y)
     
     def render(self, screen: pygame.Surface, zoom_factor: float = 1.0, pan_offset_x: float = 0.0, 
-               pan_offset_y: float = 0.0, hud_height: int = 70):
+               pan_offset_y: float = 0.0, hud_height: int = 70, position: Optional[Tuple[float, float]] = None):
         """Render the employee with enhanced visual indicators and grid transformations"""
-        pixel_x, pixel_y = self.get_pixel_position(zoom_factor, pan_offset_x, pan_offset_y, hud_height)
+        pixel_x, pixel_y = self.get_pixel_position(zoom_factor, pan_offset_x, pan_offset_y, hud_height, position)
         
         # Scale employee size based on zoom factor
         scaled_radius = max(3, int(self.radius * zoom_factor))
@@ -522,7 +755,7 @@ class Employee:
             'thirst': self.thirst,
             'rest': self.rest,
             'position': (self.x, self.y),
-            'current_task': self.current_task['type'] if self.current_task else None,
+            'current_task': self.current_task.type if self.current_task else None,
             'traits': self.traits
         }
     
@@ -539,7 +772,7 @@ class Employee:
         # Check hunger (can be satisfied through other means later)
         if self.hunger < 20:
             return 'employee_housing'  # For now, housing also satisfies hunger
-            
+        
         return None
     
     def _update_seeking_amenity(self, dt: float, grid_manager):
@@ -553,6 +786,26 @@ class Employee:
             self.state_timer = 0.0
             return
         
+        # Shared flow field: one lookup walk instead of a building search and a path search
+        if hasattr(grid_manager, 'get_amenity_field'):
+            field = grid_manager.get_amenity_field(needed_building)
+            route = field.route_from(int(round(self.x)), int(round(self.y))) if field is not None else None
+            if route is not None:
+                waypoints, (building_x, building_y) = route
+                target_x, target_y = waypoints[-1]
+                if abs(self.x - target_x) + abs(self.y - target_y) > 0.5:
+                    self.target_x = target_x
+                    self.target_y = target_y
+                    self.path = waypoints[1:]
+                    self.pending_path = None
+                    self.state = EmployeeState.MOVING
+                    print(f"Employee {self.name}: Moving to {needed_building} at ({building_x}, {building_y})")
+                else:
+                    self._interact_with_building(needed_building, building_x, building_y)
+                    self.state = EmployeeState.IDLE
+                    self.state_timer = 0.0
+                return
+        
         # Find nearest building of the needed type
         nearest_building = grid_manager.find_nearest_building(
             int(self.x), int(self.y), needed_building
@@ -585,8 +838,7 @@ class Employee:
         
         if distance > 0.5:
             # Still moving to building
-            self.target_x = target_x
-            self.target_y = target_y
+            self._set_destination(target_x, target_y)
             self.state = EmployeeState.MOVING
             print(f"Employee {self.name}: Moving to {needed_building} at ({building_x}, {building_y})")
         else:
@@ -604,7 +856,7 @@ class Employee:
             old_thirst = self.thirst
             self.thirst = min(100, self.thirst + 50)
             print(f"  Thirst restored: {old_thirst:.1f} → {self.thirst:.1f}")
-            
+        
         elif building_type == 'employee_housing':
             # Restore rest and hunger
             old_rest = self.rest
@@ -619,7 +871,7 @@ class Employee:
             print(f"  Rest restored: {old_rest:.1f} → {self.rest:.1f}")
             print(f"  Hunger restored: {old_hunger:.1f} → {self.hunger:.1f}")
             print(f"  Housing bonus activated: +25% trait effectiveness for 1 hour")
-            
+        
         elif building_type == 'storage_silo':
             # For future: deposit/retrieve crops
             print(f"  Accessed storage silo")
@@ -637,12 +889,9 @@ class Employee:
             return benefits['rest_decay_multiplier'] < 1.0
         else:
             # Fallback to legacy system
-            if hasattr(grid_manager, 'find_buildings_of_type'):
-                water_coolers = grid_manager.find_buildings_of_type('water_cooler')
-                for cooler_x, cooler_y in water_coolers:
-                    distance = abs(self.x - cooler_x) + abs(self.y - cooler_y)
-                    if distance <= 3.0:  # Within 3 tiles
-                        return True
+            if hasattr(grid_manager, 'find_buildings_within'):
+                # Within 3 tiles (Manhattan distance)
+                return bool(grid_manager.find_buildings_within(self.x, self.y, 'water_cooler', 3.0))
             return False
     
     def check_and_seek_building(self):
@@ -700,15 +949,12 @@ class Employee:
             if self.housing_recently_used and "hard_worker" in self.traits:
                 trait_enhancement = 0.025  # Additional 2.5% on top of base 10%
                 efficiency *= (1.0 + trait_enhancement)
-                
+            
             # Legacy tool shed check - fallback for compatibility
-            if hasattr(grid_manager, 'find_buildings_of_type'):
-                tool_sheds = grid_manager.find_buildings_of_type('tool_shed')
-                for shed_x, shed_y in tool_sheds:
-                    distance = abs(self.x - shed_x) + abs(self.y - shed_y)  # Manhattan distance
-                    if distance <= 3.0:  # Within 3 tiles
-                        efficiency *= 1.15  # +15% efficiency bonus
-                        print(f"Employee {self.name}: +15% efficiency bonus from tool shed (legacy)")
-                        break  # Only one tool shed bonus applies
+            if hasattr(grid_manager, 'find_buildings_within'):
+                # Within 3 tiles (Manhattan distance); only one tool shed bonus applies
+                if grid_manager.find_buildings_within(self.x, self.y, 'tool_shed', 3.0):
+                    efficiency *= 1.15  # +15% efficiency bonus
+                    print(f"Employee {self.name}: +15% efficiency bonus from tool shed (legacy)")
             
             return efficiency
\ No newline at end of file
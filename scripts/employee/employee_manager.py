@@ -4,12 +4,22 @@ Manages hiring, firing, task assignment, and employee coordination.
 """
 
 import pygame
-from typing import List, Dict, Optional
-from scripts.employee.employee import Employee
-# Pathfinding removed - using direct movement for performance
+import numpy as np
+from collections import deque
+from typing import List, Dict, Optional, Tuple
+from scripts.employee.employee import Employee, EmployeeState
+from scripts.employee.employee_store import EmployeeStore, STATE_MOVING, STATE_WORKING
+from scripts.employee.pathfinding import Pathfinder
+from scripts.employee.task_assignment import TaskAssignmentEngine
+from scripts.employee.job_board import JobBoard
+from scripts.employee.task_queue import TaskIndex
+from scripts.core.spatial_index import BucketGrid
 from scripts.core.config import *
 
 
+WAKE_MARGIN = 1e-6  # Scheduled decisions wake this many seconds early so float drift never makes them late
+
+
 class EmployeeManager:
     """Manages all farm employees"""
     
@@ -24,7 +34,37 @@ class EmployeeManager:
         self.employees: Dict[str, Employee] = {}
         self.next_employee_id = 1
         
-        # Direct movement system (pathfinding removed for performance)
+        # Columnar needs/movement state of every employee (Employee objects view their slot)
+        self.employee_store = EmployeeStore()
+        self.batch_min_employees = EMPLOYEE_BATCH_MIN_EMPLOYEES  # Crew size that switches to the array kernels
+        self.decision_scheduling = EMPLOYEE_DECISION_SCHEDULING  # Batched crews only wake employees with a decision due
+        self.sim_time = 0.0  # Game seconds simulated, the clock of scheduled decisions
+        
+        # Which employee's task holds each queued tile (for O(1) cancellation)
+        self.task_index = TaskIndex()
+        
+        # Shared pathfinder reading GridManager's passability bitmap
+        self.pathfinder = Pathfinder(grid_manager)
+        
+        # Splits multi-employee selections into compact, travel-ordered shares
+        self.assignment_engine = TaskAssignmentEngine()
+        
+        # Unclaimed tile jobs that idle employees pull (and overloaded queues are stolen into)
+        self.job_board = JobBoard()
+        self.job_board_timer = 0.0
+        
+        # Uniform-grid hash of employee positions (by employee ID) for picking and proximity queries
+        self.employee_positions = BucketGrid(bucket_size=EMPLOYEE_HASH_BUCKET_SIZE, metric='euclidean')
+        self._hashed_ids: List[str] = []  # Employees and positions as of the last refresh
+        self._hashed_x = np.zeros(0)
+        self._hashed_y = np.zeros(0)
+        self._hashed_index: Dict[str, int] = {}  # Employee ID -> position in the arrays above
+        self._previous_x = np.zeros(0)  # Positions one tick earlier, for render interpolation
+        self._previous_y = np.zeros(0)
+        
+        # Tiles harvested this tick and who harvested them (employee ID -> tile count)
+        self.harvest_batch: List = []
+        self.harvest_batch_employees: Dict[str, int] = {}
         
         # UI status update timer
         self.ui_status_timer = 0.0
@@ -46,7 +86,7 @@ class EmployeeManager:
         else:
             print("Employee Manager initialized - No employees (hiring required)")
         
-        print("Employee Manager: Direct movement system active")
+        print("Employee Manager: Pathfinding around buildings active")
     
     def set_inventory_manager(self, inventory_manager):
         """Set inventory manager for synchronous harvest processing"""
@@ -63,13 +103,15 @@ class EmployeeManager:
             employee_id=employee_id,
             name="Sam",
             x=8.0,  # Center of 16x16 grid
-            y=8.0
+            y=8.0,
+            store=self.employee_store
         )
         
         # Add some basic traits
         employee.add_trait("hard_worker")
         
-        # Direct movement (no pathfinding setup needed)
+        employee.pathfinder = self.pathfinder
+        employee.task_index = self.task_index
         
         self.employees[employee_id] = employee
         print(f"Created starting employee: {employee.name} ({employee_id}) with pathfinding enabled")
@@ -84,7 +126,8 @@ class EmployeeManager:
             employee_id=employee_id,
             name=name,
             x=8.0,
-            y=8.0
+            y=8.0,
+            store=self.employee_store
         )
         
         # Apply traits if provided
@@ -92,9 +135,11 @@ class EmployeeManager:
             for trait in traits:
                 employee.add_trait(trait)
         
-        # Direct movement (no pathfinding setup needed)
+        employee.pathfinder = self.pathfinder
+        employee.task_index = self.task_index
         
         self.employees[employee_id] = employee
+        self.employee_positions.insert(employee_id, employee.x, employee.y)
         
         # Emit hiring event
         self.event_system.emit('employee_hired', {
@@ -114,8 +159,10 @@ class EmployeeManager:
             # Clear any assigned tasks
             self._clear_employee_tasks(employee_id)
             
-            # Remove employee
+            # Remove employee (the object keeps its state in a private store)
             del self.employees[employee_id]
+            self.employee_store.detach(employee)
+            self.employee_positions.remove(employee_id)
             
             # Emit firing event
             self.event_system.emit('employee_fired', {
@@ -156,29 +203,18 @@ class EmployeeManager:
         if not tiles or not employees:
             return False
         
-        # Sort tiles by position for logical distribution (top-left to bottom-right)
-        tiles.sort(key=lambda t: (t.y, t.x))
+        # One compact cluster per employee, matched by travel cost and in walking order
+        shares = self.assignment_engine.plan(tiles, [self._planning_start(employee) for employee in employees])
         
-        # Calculate tiles per employee
-        tiles_per_employee = len(tiles) // len(employees)
-        remainder = len(tiles) % len(employees)
+        # Routes requested while the task_assigned events are handled are planned as one
+        # batch (on the pathfinder's worker processes) at the start of the next update
+        self.pathfinder.begin_batch()
         
         total_assigned = 0
         employee_assignments = []
         
         # Distribute tiles
-        start_idx = 0
-        for i, employee in enumerate(employees):
-            # Give some employees one extra tile if there's a remainder
-            tiles_for_this_employee = tiles_per_employee + (1 if i < remainder else 0)
-            
-            if tiles_for_this_employee == 0:
-                break  # No more tiles to assign
-            
-            # Get tiles for this employee
-            employee_tiles = tiles[start_idx:start_idx + tiles_for_this_employee]
-            start_idx += tiles_for_this_employee
-            
+        for employee, employee_tiles in zip(employees, shares):
             if employee_tiles:
                 # Assign tiles to employee through grid manager
                 assigned_count = 0
@@ -218,6 +254,14 @@ class EmployeeManager:
         
         return False
     
+    def _planning_start(self, employee: Employee) -> Tuple[float, float]:
+        """Where an employee sets off for new work: the last tile already queued, or where they stand"""
+        for task in reversed(employee.assigned_tasks):
+            last_tile = task.last_tile()
+            if task.status != 'completed' and last_tile is not None:
+                return (last_tile.x, last_tile.y)
+        return (employee.x, employee.y)
+    
     def cancel_tasks_on_selection(self) -> bool:
         """Cancel tasks on selected tiles and remove from employee task queues"""
         if not self.grid_manager.selected_tiles:
@@ -232,8 +276,16 @@ class EmployeeManager:
         cancelled_tasks = {}
         cancelled_count = 0
         
-        for tile in self.grid_manager.selected_tiles:
-            if tile.task_assignment and tile.task_assigned_to:
+        # Only tasked tiles can be cancelled, so walk the task index instead of the selection
+        tasked_tiles = [tile for tile_set in self.grid_manager.tile_index.tasks.values()
+                        for tile in self.grid_manager.selected_tiles.tiles_in(tile_set)]
+        for tile in tasked_tiles:
+            if tile in self.job_board:
+                # Unclaimed job: no employee queue to update
+                self.job_board.withdraw([tile])
+                tile.task_assignment = None
+                cancelled_count += 1
+            elif tile.task_assignment and tile.task_assigned_to:
                 # Track which employee and task type
                 employee_id = tile.task_assigned_to
                 task_type = tile.task_assignment
@@ -264,7 +316,7 @@ class EmployeeManager:
                 removed_count = self._remove_tiles_from_employee_tasks(employee, [tile for tile, _ in cancelled_tiles])
                 if removed_count > 0:
                     affected_employees.append(employee.name)
-                    print(f"Cancelled {len(cancelled_tiles)} tasks for employee {employee.name}")
+                    print(f"Cancelled {removed_count} tasks for employee {employee.name}")
         
         # Emit success feedback
         employee_list = ', '.join(affected_employees) if affected_employees else 'employees'
@@ -279,44 +331,30 @@ class EmployeeManager:
         return True
     
     def _remove_tiles_from_employee_tasks(self, employee: Employee, tiles_to_remove: List) -> int:
-        """Remove specific tiles from an employee's task queue"""
+        """Remove specific tiles from an employee's task queue (looked up in the task index)"""
         removed_count = 0
-        tiles_to_remove_set = set(tiles_to_remove)
+        emptied = False
         
-        # Check current task
-        if employee.current_task:
-            original_tiles = employee.current_task['tiles']
-            remaining_tiles = [t for t in original_tiles if t not in tiles_to_remove_set]
+        for tile in tiles_to_remove:
+            holder = self.task_index.lookup(tile)
+            if holder is None or holder[0] is not employee:
+                continue
+            task = holder[1]
+            task.discard(tile)
+            removed_count += 1
             
-            if len(remaining_tiles) != len(original_tiles):
-                removed_count += len(original_tiles) - len(remaining_tiles)
-                
-                if remaining_tiles:
-                    # Update current task with remaining tiles
-                    employee.current_task['tiles'] = remaining_tiles
-                else:
-                    # No tiles left, cancel current task and move to next
-                    employee.current_task['status'] = 'completed'
-                    employee.current_task = None
-                    employee._start_next_task()
-        
-        # Check assigned tasks queue
-        for task in employee.assigned_tasks:
-            if 'tiles' in task:
-                original_tiles = task['tiles']
-                remaining_tiles = [t for t in original_tiles if t not in tiles_to_remove_set]
-                
-                if len(remaining_tiles) != len(original_tiles):
-                    removed_count += len(original_tiles) - len(remaining_tiles)
-                    
-                    if remaining_tiles:
-                        task['tiles'] = remaining_tiles
-                    else:
-                        # Mark task as completed if no tiles left
-                        task['status'] = 'completed'
+            if task.remaining == 0 and task.status != 'completed':
+                # Mark task as completed if no tiles left
+                task.status = 'completed'
+                emptied = True
         
-        # Clean up any completed tasks
-        employee._cleanup_completed_tasks()
+        if emptied:
+            # Emptied tasks can sit anywhere in the queue
+            employee.assigned_tasks = deque(task for task in employee.assigned_tasks if task.status != 'completed')
+            if employee.current_task is not None and employee.current_task.status == 'completed':
+                # No tiles left, cancel current task and move to next
+                employee.current_task = None
+                employee._start_next_task()
         
         return removed_count
     
@@ -329,110 +367,380 @@ class EmployeeManager:
         return False
     
     def _clear_employee_tasks(self, employee_id: str):
-        """Clear all tasks for an employee"""
+        """Clear all tasks for an employee, returning unfinished tiles to the job board"""
         employee = self.get_employee(employee_id)
         if employee:
-            # Clear task assignments from tiles
+            # Unfinished tiles stay tasked and wait on the board for the rest of the crew
             for task in employee.assigned_tasks:
-                for tile in task.get('tiles', []):
-                    if tile.task_assigned_to == employee_id:
-                        tile.task_assignment = None
-                        tile.task_assigned_to = None
+                unfinished = [tile for tile in task.cancel() if tile.task_assigned_to == employee_id]
+                for tile in unfinished:
+                    tile.task_assigned_to = None
+                self.job_board.post(unfinished, task.type, **task.params)
             
             # Clear employee tasks
             employee.assigned_tasks.clear()
             employee.current_task = None
     
     def update(self, dt: float):
-        """Update all employees"""
-        # Apply time speed multiplier to employee updates
-        if self.time_manager and hasattr(self.time_manager, 'time_speed'):
-            effective_dt = dt * self.time_manager.time_speed
-        else:
-            effective_dt = dt
-            
-        for employee in self.employees.values():
-            employee.update(effective_dt, self.grid_manager)
+        """Update all employees by dt game seconds (one simulation tick)"""
+        # Hand out the routes workers planned since last tick (waiting for stragglers), then
+        # send the ones queued by last frame's task assignments; employees claim them next tick
+        self.pathfinder.settle_batch()
+        self.pathfinder.submit_batch()
+        
+        # Large crews decay needs and walk in array kernels; objects make the decisions,
+        # and with decision scheduling only employees with a decision due wake up
+        self.sim_time += dt
+        employees = list(self.employees.values())
+        moved = None
+        scheduled = False
+        awake = range(len(employees))
+        if len(employees) >= self.batch_min_employees:
+            slots = self.employee_store.sync(employees)
+            moved = self._run_batch_kernels(dt, employees, slots)
+            if self.decision_scheduling:
+                scheduled = True
+                awake = self._wake_due_employees(dt, slots, moved)
+        
+        for index in awake:
+            employee = employees[index]
+            if moved is None:
+                employee.update(dt, self.grid_manager)
+            else:
+                employee.update_batched(dt, self.grid_manager, bool(moved[index]))
             
             # Check if employee should seek buildings for their needs
             employee.check_and_seek_building()
             
-            # Process harvest events synchronously to avoid race conditions
-            if hasattr(employee, '_pending_harvest') and employee._pending_harvest:
-                harvest_data = employee._pending_harvest
-                
-                # Process harvest directly through inventory manager
-                if self.inventory_manager:
-                    success = self.inventory_manager.add_crop(
-                        harvest_data['crop_type'],
-                        harvest_data['quantity'],
-                        harvest_data['quality'],
-                        1  # TODO: Get actual day from time manager
-                    )
-                    
-                    if success:
-                        # Emit harvest completion event for UI updates
-                        self.event_system.emit('harvest_completed', {
-                            'crop_type': harvest_data['crop_type'],
-                            'quantity': harvest_data['quantity'],
-                            'quality': harvest_data['quality'],
-                            'employee_id': employee.id,
-                            'stored_successfully': True
-                        })
-                    else:
-                        # Storage full - emit warning
-                        self.event_system.emit('harvest_storage_failed', {
-                            'crop_type': harvest_data['crop_type'],
-                            'quantity': harvest_data['quantity'],
-                            'employee_id': employee.id,
-                            'reason': 'storage_full'
-                        })
-                else:
-                    # Fallback: emit old-style event if no inventory manager
-                    self.event_system.emit('crop_harvested', {
-                        'crop_type': harvest_data['crop_type'],
-                        'quantity': harvest_data['quantity'],
-                        'quality': harvest_data['quality'],
-                        'employee_id': employee.id,
-                        'day': 1
-                    })
-                
-                # Clear the harvest data
+            if scheduled:
+                # Sleep until the next decision (work done, break over, a need running low)
+                delay = employee.next_decision_delay(self.grid_manager)
+                self.employee_store.wake_at[employee._slot] = self.sim_time + delay - WAKE_MARGIN
+            
+            # Collect harvests into this tick's batch; they are harvested and stored together below
+            if employee._pending_harvest is not None:
+                self._collect_harvest(employee, employee._pending_harvest)
                 employee._pending_harvest = None
         
+        # One bulk inventory call and one event for every harvest of the tick
+        if self.harvest_batch:
+            self._commit_harvests()
+        
+        # Idle employees pull jobs from the board, stealing from overloaded queues when it runs dry
+        self.job_board_timer += dt
+        if self.job_board_timer >= JOB_BOARD_INTERVAL:
+            self._run_job_board()
+            self.job_board_timer = 0.0
+        
+        # Cooperative pathfinding: move every MOVING employee in step through reserved tiles
+        if self.pathfinder.cooperative_planner is not None:
+            self.pathfinder.cooperative_planner.update(dt, list(self.employees.values()))
+        
+        # Re-bucket everyone who moved this tick
+        self.refresh_employee_positions()
+        
         # Update UI status periodically
-        self.ui_status_timer += effective_dt
+        self.ui_status_timer += dt
         if self.ui_status_timer >= self.ui_status_update_interval:
             self._emit_status_update()
             self.ui_status_timer = 0.0
     
-    def render(self, screen: pygame.Surface):
-        """Render all employees with grid transformations"""
-        # Get grid transformation parameters from enhanced grid renderer
-        if hasattr(self.grid_manager, 'enhanced_renderer'):
-            renderer = self.grid_manager.enhanced_renderer
-            zoom_factor = renderer.zoom_factor
-            pan_offset_x = renderer.pan_offset_x
-            pan_offset_y = renderer.pan_offset_y
-            hud_height = renderer.hud_height
+    def _collect_harvest(self, employee: Employee, tile):
+        """Add one ripe tile to the current tick's batch"""
+        self.harvest_batch.append(tile)
+        self.harvest_batch_employees[employee.id] = self.harvest_batch_employees.get(employee.id, 0) + 1
+    
+    def _commit_harvests(self):
+        """Harvest the tick's tiles in one pass, store them and announce them with one coalesced event"""
+        totals = self.grid_manager.harvest_tiles(self.harvest_batch)
+        day = self.time_manager.current_day if self.time_manager else 1
+        batch: Dict[Tuple[str, float, int], int] = {}
+        harvested: Dict[str, int] = {}
+        for crop_type, total in totals.items():
+            quality = round(round(total['quality'] / HARVEST_QUALITY_BUCKET) * HARVEST_QUALITY_BUCKET, 4)
+            batch[(crop_type, quality, day)] = total['quantity']
+            harvested[crop_type] = total['quantity']
+            crop_name = CROP_TYPES[crop_type]['name']
+            print(f"Employee Manager: Harvested {total['quantity']} {crop_name.lower()} from {total['tiles']} tiles (quality: {total['quality']:.2f})")
+        harvested_tiles = sum(total['tiles'] for total in totals.values())
+        
+        if self.inventory_manager:
+            stored = self.inventory_manager.add_crops_batch(batch)
+            overflow = {crop_type: quantity - stored.get(crop_type, 0)
+                        for crop_type, quantity in harvested.items() if quantity > stored.get(crop_type, 0)}
+            
+            if stored:
+                # Harvest completion event for UI updates
+                self.event_system.emit('harvest_completed', {
+                    'crops': stored,
+                    'quantity': sum(stored.values()),
+                    'tiles': harvested_tiles,
+                    'employee_ids': list(self.harvest_batch_employees),
+                    'stored_successfully': not overflow
+                })
+            if overflow:
+                # Storage full - emit warning
+                self.event_system.emit('harvest_storage_failed', {
+                    'crops': overflow,
+                    'quantity': sum(overflow.values()),
+                    'employee_ids': list(self.harvest_batch_employees),
+                    'reason': 'storage_full'
+                })
         else:
-            # Fallback to default values if enhanced renderer not available
-            zoom_factor = 1.0
-            pan_offset_x = 0.0
-            pan_offset_y = 0.0
-            hud_height = 70
+            # Fallback: emit old-style events if no inventory manager, one per batch key
+            for (crop_type, quality, day), quantity in batch.items():
+                self.event_system.emit('crop_harvested', {
+                    'crop_type': crop_type,
+                    'quantity': quantity,
+                    'quality': quality,
+                    'employee_ids': list(self.harvest_batch_employees),
+                    'day': day
+                })
+        
+        self.harvest_batch = []
+        self.harvest_batch_employees = {}
+    
+    def _run_job_board(self) -> int:
+        """
+        Hand board jobs to idle employees, refilling the board from overloaded queues
+        
+        Returns:
+            Number of employees that were given work
+        """
+        idle = [employee for employee in self.employees.values()
+                if employee.state == EmployeeState.IDLE and employee.current_task is None
+                and not employee._has_critical_needs()]
+        if not idle:
+            return 0
+        
+        # Routes to the claimed jobs are planned as one batch at the start of the next update
+        self.pathfinder.begin_batch()
         
-        # Render all employees with transformation parameters
+        supplied = 0
+        for employee in idle:
+            if not self.job_board and not self._steal_work():
+                break  # Nothing left to share out
+            task_type, tiles, params = self.job_board.claim(employee.x, employee.y, JOB_CLAIM_TILES)
+            for tile in tiles:
+                tile.task_assigned_to = employee.id
+            employee.assign_task(task_type, tiles, **params)
+            supplied += 1
+        return supplied
+    
+    def _steal_work(self) -> int:
+        """
+        Move the back half of the longest queue onto the job board
+        
+        The stolen tiles are the last ones the owner would have reached on their
+        planned walk; the tile they are heading for or working on is never taken.
+        
+        Returns:
+            Number of tiles stolen (0 if no queue reaches JOB_STEAL_MIN_TILES)
+        """
+        victim, queued = None, 0
         for employee in self.employees.values():
-            employee.render(screen, zoom_factor, pan_offset_x, pan_offset_y, hud_height)
+            count = self._queued_tile_count(employee)
+            if count > queued:
+                victim, queued = employee, count
+        if queued < JOB_STEAL_MIN_TILES:
+            return 0
+        
+        wanted = queued // 2
+        stolen = []
+        emptied = False
+        for task in reversed(victim.assigned_tasks):
+            if len(stolen) >= wanted:
+                break
+            if task.status == 'completed':
+                continue
+            keep = 1 if task is victim.current_task else 0
+            tail = task.pop_tail(min(wanted - len(stolen), task.remaining - keep))
+            stolen.extend(tail)
+            for tile in tail:
+                tile.task_assigned_to = None
+            self.job_board.post(tail, task.type, **task.params)
+            if task.remaining == 0:
+                task.status = 'completed'
+                emptied = True
+        
+        if emptied:
+            victim.assigned_tasks = deque(task for task in victim.assigned_tasks if task.status != 'completed')
+        print(f"Job board: Took {len(stolen)} queued tiles from {victim.name} for idle employees")
+        return len(stolen)
+    
+    def _queued_tile_count(self, employee: Employee) -> int:
+        """Tiles an employee has queued beyond the one they are heading for or working on"""
+        count = sum(task.remaining for task in employee.assigned_tasks if task.status != 'completed')
+        if employee.current_task is not None:
+            count -= 1
+        return count
+    
+    def _run_batch_kernels(self, dt: float, employees: List[Employee], slots: np.ndarray) -> np.ndarray:
+        """
+        Decay every employee's needs and walk plain movers with EmployeeStore kernels
+        
+        Returns:
+            Mask (in employees order) of employees the movement kernel walked this tick
+        """
+        store = self.employee_store
+        store.decay_needs(slots, dt, self._rest_multipliers(employees, slots))
+        
+        # Movers needing only a straight step toward their current waypoint; critical
+        # needs, arrivals, steered and still-planning employees are left to the objects
+        moved = np.zeros(len(employees), dtype=bool)
+        candidates = np.flatnonzero((store.state[slots] == STATE_MOVING) & ~store.critical_needs(slots))
+        movers = [index for index in candidates.tolist()
+                  if not employees[index].steered and employees[index].pending_path is None]
+        if movers:
+            waypoints = np.array([employees[index].path[0] if employees[index].path
+                                  else (employees[index].target_x, employees[index].target_y)
+                                  for index in movers], dtype=np.float64)
+            movers = np.array(movers, dtype=np.intp)
+            moved[movers] = store.advance(slots[movers], waypoints[:, 0], waypoints[:, 1], dt)
+        return moved
+    
+    def _wake_due_employees(self, dt: float, slots: np.ndarray, moved: np.ndarray) -> List[int]:
+        """
+        Indices of employees whose next decision is due this tick
+        
+        The others sleep: the kernels already advanced their needs and (for walkers
+        between waypoints) their position, and only their timers still need to run.
+        """
+        store = self.employee_store
+        awake = ~moved & store.due(slots, self.sim_time)
+        store.run_timers(slots[~awake], dt)
+        return np.flatnonzero(awake).tolist()
+    
+    def _rest_multipliers(self, employees: List[Employee], slots: np.ndarray) -> np.ndarray:
+        """Working rest drain factor of each employee (hard worker trait and nearby buildings)"""
+        store = self.employee_store
+        multipliers = np.ones(len(slots))
+        working = np.flatnonzero(store.state[slots] == STATE_WORKING)
+        if not len(working):
+            return multipliers
+        
+        multipliers[working] = [0.95 if "hard_worker" in employees[index].traits else 1.0
+                                for index in working.tolist()]
+        building_manager = getattr(self.grid_manager, 'building_manager', None)
+        if building_manager:
+            maps = building_manager.influence_maps
+            xs = np.clip(np.rint(store.x[slots[working]]).astype(np.intp), 0, maps.width - 1)
+            ys = np.clip(np.rint(store.y[slots[working]]).astype(np.intp), 0, maps.height - 1)
+            multipliers[working] *= maps.get_multipliers('rest_decay', xs, ys)
+        else:
+            # Legacy water cooler check, as in Employee.update_needs
+            multipliers[working] *= [0.80 if employees[index]._has_nearby_water_cooler(self.grid_manager) else 1.0
+                                     for index in working.tolist()]
+        return multipliers
+    
+    def refresh_employee_positions(self):
+        """Re-bucket employees whose position changed since the last refresh (rebuilding after hires and fires)"""
+        employees = list(self.employees.values())
+        ids = [employee.id for employee in employees]
+        slots = self.employee_store.sync(employees)
+        xs, ys = self.employee_store.x[slots], self.employee_store.y[slots]
+        if ids != self._hashed_ids:
+            self.employee_positions.clear()
+            for employee_id, x, y in zip(ids, xs.tolist(), ys.tolist()):
+                self.employee_positions.insert(employee_id, x, y)
+            self._hashed_index = {employee_id: index for index, employee_id in enumerate(ids)}
+            self._previous_x, self._previous_y = xs, ys  # No interpolation across roster changes
+        else:
+            for index in np.flatnonzero((xs != self._hashed_x) | (ys != self._hashed_y)).tolist():
+                self.employee_positions.move(ids[index], float(xs[index]), float(ys[index]))
+            self._previous_x, self._previous_y = self._hashed_x, self._hashed_y
+        self._hashed_ids, self._hashed_x, self._hashed_y = ids, xs, ys
+    
+    def employees_in_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Employee]:
+        """Employees standing within a rectangle of tile coordinates (bounds inclusive)"""
+        return [self.employees[employee_id]
+                for employee_id in self.employee_positions.query_rect(min_x, min_y, max_x, max_y)]
+    
+    def employees_near(self, x: float, y: float, radius: float) -> List[Employee]:
+        """Employees within radius tiles of (x, y)"""
+        return [self.employees[employee_id] for employee_id in self.employee_positions.query_radius(x, y, radius)]
+    
+    def nearest_employee(self, x: float, y: float, max_distance: Optional[float] = None,
+                         predicate=None) -> Optional[Employee]:
+        """
+        Employee closest to (x, y) in tiles
+        
+        Args:
+            max_distance: Ignore employees farther than this
+            predicate: Optional filter taking an Employee
+        """
+        item_filter = None
+        if predicate is not None:
+            item_filter = lambda employee_id: predicate(self.employees[employee_id])
+        found = self.employee_positions.nearest(x, y, max_distance, item_filter)
+        return None if found is None else self.employees[found[0]]
+    
+    def employee_at_pixel(self, pos: tuple) -> Optional[Employee]:
+        """Employee drawn under a screen position, accounting for the renderer's zoom and pan"""
+        zoom_factor, pan_offset_x, pan_offset_y, hud_height = self._view_transform()
+        scaled_tile_size = TILE_SIZE * zoom_factor
+        
+        # Invert Employee.get_pixel_position: sprites are centred on their tile
+        x = (pos[0] - pan_offset_x - scaled_tile_size // 2) / scaled_tile_size
+        y = (pos[1] - pan_offset_y - hud_height - scaled_tile_size // 2) / scaled_tile_size
+        
+        # Outlined sprite radius, as drawn by Employee.render
+        pick_radius = (max(3, int(EMPLOYEE_RADIUS * zoom_factor)) + 2) / scaled_tile_size
+        return self.nearest_employee(x, y, pick_radius)
+    
+    def _view_transform(self) -> Tuple[float, float, float, int]:
+        """Zoom, pan and HUD offset of the enhanced grid renderer"""
+        if hasattr(self.grid_manager, 'enhanced_renderer'):
+            renderer = self.grid_manager.enhanced_renderer
+            return renderer.zoom_factor, renderer.pan_offset_x, renderer.pan_offset_y, renderer.hud_height
+        
+        # Fallback to default values if enhanced renderer not available
+        return 1.0, 0.0, 0.0, 70
+    
+    def _interpolated_position(self, employee: Employee, alpha: float) -> Optional[Tuple[float, float]]:
+        """Position alpha of the way from the previous tick to the current one (None to draw as is)"""
+        index = self._hashed_index.get(employee.id)
+        if index is None or alpha >= 1.0:
+            return None
+        previous_x, previous_y = self._previous_x[index], self._previous_y[index]
+        return (previous_x + (employee.x - previous_x) * alpha, previous_y + (employee.y - previous_y) * alpha)
+    
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
+        """
+        Render the employees inside the viewport with grid transformations
+        
+        Args:
+            alpha: Fraction of a simulation tick elapsed since the last one; employees
+                are drawn that far between their previous and current tick positions
+        """
+        zoom_factor, pan_offset_x, pan_offset_y, hud_height = self._view_transform()
+        scaled_tile_size = TILE_SIZE * zoom_factor
+        
+        # Visible tile rectangle, widened by the name label and needs bars drawn around a sprite
+        margin = (EMPLOYEE_RENDER_MARGIN * max(zoom_factor, 1.0)) / scaled_tile_size + 1
+        min_x = -pan_offset_x / scaled_tile_size - margin
+        min_y = -pan_offset_y / scaled_tile_size - margin
+        max_x = (screen.get_width() - pan_offset_x) / scaled_tile_size + margin
+        max_y = (screen.get_height() - hud_height - pan_offset_y) / scaled_tile_size + margin
+        
+        # Render visible employees in hiring order so overlapping sprites stack consistently
+        for employee in sorted(self.employees_in_rect(min_x, min_y, max_x, max_y), key=lambda employee: employee.id):
+            employee.render(screen, zoom_factor, pan_offset_x, pan_offset_y, hud_height,
+                            self._interpolated_position(employee, alpha))
     
     def handle_mouse_click(self, pos: tuple, button: int):
-        """Handle mouse clicks for employee interaction"""
-        # For now, just handle grid interaction through grid manager
+        """Handle mouse clicks: select the employee under the cursor, otherwise interact with the grid"""
+        if button == 1 and not self.grid_manager.building_placement_preview:
+            employee = self.employee_at_pixel(pos)
+            if employee is not None:
+                self.event_system.emit('employee_selected', {
+                    'employee': employee,
+                    'employee_id': employee.id
+                })
+                return
+        
         if button == 1:  # Left click
             self.grid_manager.handle_mouse_down(pos, button)
-        
-        # Add employee-specific click handling later
     
     def handle_mouse_motion(self, pos: tuple):
         """Handle mouse motion for building placement preview"""
@@ -460,7 +768,7 @@ class EmployeeManager:
         
         # Get all available employees
         available_employees = self.get_available_employees()
-        if not available_employees:
+        if not self.employees:
             print("No available employees for task assignment")
             
             # Emit feedback about no available employees
@@ -473,10 +781,8 @@ class EmployeeManager:
             return False
         
         # Filter tiles that can actually perform this task
-        valid_tiles = []
-        for tile in self.grid_manager.selected_tiles:
-            if self.grid_manager._can_assign_task(tile, task_type) and not tile.task_assigned_to:
-                valid_tiles.append(tile)
+        valid_tiles = [tile for tile in self.grid_manager.get_selected_tiles_for_task(task_type)
+                       if not tile.task_assigned_to and tile not in self.job_board]
         
         if not valid_tiles:
             self.event_system.emit('task_assignment_failed', {
@@ -487,9 +793,29 @@ class EmployeeManager:
             })
             return False
         
+        # Whole crew busy: the jobs wait on the board for whoever frees up first
+        if not available_employees:
+            return self._post_to_job_board(valid_tiles, task_type)
+        
         # Distribute tiles among available employees
         return self._distribute_tiles_among_employees(valid_tiles, task_type, available_employees)
     
+    def _post_to_job_board(self, tiles: List, task_type: str, **params) -> bool:
+        """Mark tiles as tasked and leave them on the job board for idle employees"""
+        for tile in tiles:
+            tile.task_assignment = task_type
+        posted = self.job_board.post(tiles, task_type, **params)
+        
+        self.event_system.emit('task_assigned_feedback', {
+            'task_type': task_type,
+            'assigned_count': posted,
+            'employee_name': 'Job board (crew busy)',
+            'employee_count': 0
+        })
+        
+        print(f"Posted {posted} {task_type} jobs to the job board ({len(self.job_board)} waiting)")
+        return posted > 0
+    
     def get_employee_status_summary(self) -> List[Dict]:
         """Get status summary for all employees"""
         return [emp.get_status_info() for emp in self.employees.values()]
@@ -571,7 +897,7 @@ class EmployeeManager:
         
         for i, (emp_id, employee) in enumerate(self.employees.items(), 1):
             trait_display = ', '.join([trait.replace('_', ' ').title() for trait in employee.traits])
-            current_task = employee.current_task['type'] if employee.current_task else 'Idle'
+            current_task = employee.current_task.type if employee.current_task else 'Idle'
             
             print(f"{i}. {employee.name} ({emp_id})")
             print(f"   Status: {employee.state.value.title()}")
@@ -626,7 +952,7 @@ class EmployeeManager:
                 'name': emp.name,
                 'id': emp.id,
                 'state': emp.state.value,
-                'current_task': emp.current_task['type'] if emp.current_task else None,
+                'current_task': emp.current_task.type if emp.current_task else None,
                 'position': (emp.x, emp.y)
             }
             employee_status.append(status)
@@ -656,7 +982,7 @@ class EmployeeManager:
             return False
         
         available_employees = self.get_available_employees()
-        if not available_employees:
+        if not self.employees:
             self.event_system.emit('task_assignment_failed', {
                 'reason': 'no_available_employees',
                 'message': 'No available employees for planting task',
@@ -665,10 +991,8 @@ class EmployeeManager:
             return False
         
         # Filter tiles that can be planted
-        valid_tiles = []
-        for tile in self.grid_manager.selected_tiles:
-            if tile.can_plant(crop_type) and not tile.task_assigned_to:
-                valid_tiles.append(tile)
+        valid_tiles = [tile for tile in self.grid_manager.get_selected_tiles_for_task('plant')
+                       if tile.can_plant(crop_type) and not tile.task_assigned_to and tile not in self.job_board]
         
         if not valid_tiles:
             crop_name = CROP_TYPES[crop_type]['name']
@@ -679,22 +1003,21 @@ class EmployeeManager:
             })
             return False
         
-        # Distribute planting tasks among employees
+        # Whole crew busy: the jobs wait on the board for whoever frees up first
+        if not available_employees:
+            return self._post_to_job_board(valid_tiles, 'plant', crop_type=crop_type)
+        
+        # Distribute planting tasks among employees (compact shares queued in walking order)
+        shares = self.assignment_engine.plan(valid_tiles, [self._planning_start(employee)
+                                                           for employee in available_employees])
         assigned_count = 0
-        for i, tile in enumerate(valid_tiles):
-            employee = available_employees[i % len(available_employees)]
-            
-            # Create task with crop type information
-            task_data = {
-                'type': 'plant',
-                'crop_type': crop_type,
-                'target_tile': (tile.x, tile.y)
-            }
-            
-            employee.assign_task(task_data['type'], [tile], crop_type=crop_type)
-            tile.task_assignment = 'plant'
-            tile.task_assigned_to = employee.id
-            assigned_count += 1
+        for employee, share in zip(available_employees, shares):
+            for tile in share:
+                # Create task with crop type information
+                employee.assign_task('plant', [tile], crop_type=crop_type)
+                tile.task_assignment = 'plant'
+                tile.task_assigned_to = employee.id
+                assigned_count += 1
         
         crop_name = CROP_TYPES[crop_type]['name']
         print(f"Assigned {assigned_count} {crop_name} planting tasks among {len(available_employees)} employees")
@@ -0,0 +1,185 @@
+"""
+Employee Store - Columnar (structure-of-arrays) needs and movement state
+
+Employees keep their position, target, speed, needs, AI state and efficiency in
+one slot of an EmployeeStore instead of in per-object attributes. Employee objects
+read and write straight through to their slot, so AI decisions, rendering and
+saving work unchanged, while EmployeeManager can decay the needs of and move a
+whole crew with a few array operations per tick.
+
+Key Features:
+- One float64 column per field (x, y, target_x, target_y, speed, hunger, thirst,
+  rest, work_efficiency, state_timer, housing_timer) and an int8 column of AI
+  state codes
+- A wake_at column holding the game time of each employee's next decision; any
+  state change clears it so the employee decides again on the next tick
+- Slots handed out from a free list; columns double in size when full
+- adopt() moves a standalone employee into a shared store, detach() moves it back
+  out to a private one-slot store (fired employees keep working as objects)
+- Vectorized kernels for needs decay, straight-line movement toward waypoints
+  and the timers of employees sleeping until their next decision
+
+Design Goals:
+- Thousands of workers per headless balance run without a per-object update loop
+- Kernels reproduce Employee.update_needs and Employee._update_movement exactly,
+  leaving waypoint arrivals and every AI decision to the Employee objects
+
+Usage:
+    store = EmployeeStore()
+    employee = Employee("emp_001", "Sam", 4.0, 4.0, store=store)
+    slots = np.array([employee._slot])
+    store.decay_needs(slots, dt, rest_multipliers=np.ones(1))
+"""
+
+import numpy as np
+from typing import List, Optional
+from scripts.core.config import *
+
+
+# AI state codes, in the order of EmployeeState's values
+STATE_NAMES = ('idle', 'moving', 'working', 'resting', 'seeking_amenity')
+STATE_IDLE, STATE_MOVING, STATE_WORKING, STATE_RESTING, STATE_SEEKING_AMENITY = range(len(STATE_NAMES))
+
+# Columns copied when an employee changes store
+FLOAT_FIELDS = ('x', 'y', 'target_x', 'target_y', 'speed', 'hunger', 'thirst', 'rest', 'work_efficiency',
+                'state_timer', 'housing_timer', 'wake_at')
+FIELDS = FLOAT_FIELDS + ('state',)
+
+ARRIVAL_DISTANCE = 0.1  # Employees this close to a waypoint snap onto it (as in Employee._update_movement)
+
+
+class EmployeeStore:
+    """Structure-of-arrays storage for employee needs and movement"""
+    
+    def __init__(self, capacity: int = 16):
+        """Allocate columns for capacity employees"""
+        self.capacity = capacity
+        for field in FLOAT_FIELDS:
+            setattr(self, field, np.zeros(capacity, dtype=np.float64))
+        self.state = np.zeros(capacity, dtype=np.int8)  # STATE_* code
+        self.owners: List[Optional[object]] = [None] * capacity  # Employee viewing each slot
+        self._free = list(range(capacity - 1, -1, -1))  # Lowest slots handed out first
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def allocate(self, owner) -> int:
+        """Claim a slot for owner, growing the columns if none is free"""
+        if not self._free:
+            self._grow(self.capacity * 2)
+        slot = self._free.pop()
+        self.owners[slot] = owner
+        self.count += 1
+        return slot
+    
+    def release(self, slot: int):
+        """Return a slot to the free list"""
+        self.owners[slot] = None
+        self._free.append(slot)
+        self.count -= 1
+    
+    def adopt(self, employee):
+        """Move an employee's state from its current store into a new slot of this one"""
+        old_store, old_slot = employee._store, employee._slot
+        if old_store is self:
+            return
+        slot = self.allocate(employee)
+        for field in FIELDS:
+            getattr(self, field)[slot] = getattr(old_store, field)[old_slot]
+        old_store.release(old_slot)
+        employee._store = self
+        employee._slot = slot
+    
+    def detach(self, employee):
+        """Move an employee out into a private one-slot store"""
+        if employee._store is self:
+            EmployeeStore(1).adopt(employee)
+    
+    def sync(self, employees: List) -> np.ndarray:
+        """
+        Adopt newcomers and drop slots of employees no longer listed
+        
+        Returns:
+            Slot of each listed employee, in list order
+        """
+        for employee in employees:
+            if employee._store is not self:
+                self.adopt(employee)
+        if self.count != len(employees):
+            listed = {id(employee) for employee in employees}
+            for slot, owner in enumerate(self.owners):
+                if owner is not None and id(owner) not in listed:
+                    self.detach(owner)
+        return np.fromiter((employee._slot for employee in employees), dtype=np.intp, count=len(employees))
+    
+    def _grow(self, capacity: int):
+        """Enlarge every column to capacity slots"""
+        for field in FIELDS:
+            column = getattr(self, field)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.capacity] = column
+            setattr(self, field, grown)
+        self.owners.extend([None] * (capacity - self.capacity))
+        self._free = list(range(capacity - 1, self.capacity - 1, -1)) + self._free
+        self.capacity = capacity
+    
+    # Kernels
+    def decay_needs(self, slots: np.ndarray, dt: float, rest_multipliers: np.ndarray):
+        """
+        Decay hunger, thirst and rest of the given slots over dt game seconds
+        
+        Args:
+            slots: Slots to update
+            dt: Elapsed game seconds
+            rest_multipliers: Per-slot factor on the working rest drain (traits and
+                nearby buildings); ignored for employees that are not working
+        """
+        hours_passed = dt / 3600.0
+        state = self.state[slots]
+        
+        # Working drains rest, resting restores it, everything else drains it slowly
+        rest_decay = np.full(len(slots), REST_DECAY_RATE * 0.5 * hours_passed)
+        working = state == STATE_WORKING
+        rest_decay[working] = REST_DECAY_RATE * hours_passed * rest_multipliers[working]
+        rest_decay[state == STATE_RESTING] = -REST_DECAY_RATE * 2 * hours_passed
+        
+        self.hunger[slots] = np.maximum(0, self.hunger[slots] - HUNGER_DECAY_RATE * hours_passed)
+        self.thirst[slots] = np.maximum(0, self.thirst[slots] - THIRST_DECAY_RATE * hours_passed)
+        self.rest[slots] = np.clip(self.rest[slots] - rest_decay, 0, MAX_REST)
+    
+    def critical_needs(self, slots: np.ndarray) -> np.ndarray:
+        """Mask of slots whose needs demand attention (as in Employee._has_critical_needs)"""
+        return (self.hunger[slots] < 20) | (self.thirst[slots] < 15) | (self.rest[slots] < 10)
+    
+    def advance(self, slots: np.ndarray, waypoint_x: np.ndarray, waypoint_y: np.ndarray, dt: float) -> np.ndarray:
+        """
+        Walk each slot toward its waypoint for dt seconds unless it would reach it
+        
+        Employees that would arrive this tick are left untouched, so the Employee
+        can snap onto the waypoint and carry the remaining distance to the next one.
+        
+        Returns:
+            Mask of slots that were moved
+        """
+        x = self.x[slots]
+        y = self.y[slots]
+        dx = waypoint_x - x
+        dy = waypoint_y - y
+        distance = np.sqrt(dx * dx + dy * dy)
+        move_distance = self.speed[slots] * dt
+        moved = (distance >= ARRIVAL_DISTANCE) & (move_distance < distance)
+        
+        distance = distance[moved]
+        self.x[slots[moved]] = x[moved] + (dx[moved] / distance) * move_distance[moved]
+        self.y[slots[moved]] = y[moved] + (dy[moved] / distance) * move_distance[moved]
+        return moved
+    
+    def due(self, slots: np.ndarray, now: float) -> np.ndarray:
+        """Mask of slots whose next decision is due at game time now (walkers always are)"""
+        return (self.wake_at[slots] <= now) | (self.state[slots] == STATE_MOVING)
+    
+    def run_timers(self, slots: np.ndarray, dt: float):
+        """Advance the state and housing timers of slots skipping their object update"""
+        self.state_timer[slots] += dt
+        self.housing_timer[slots] += dt
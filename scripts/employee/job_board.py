@@ -0,0 +1,168 @@
+"""
+Job Board - Shared, spatially indexed queue of unclaimed tile jobs
+
+Tile jobs that no employee holds yet wait here instead of in someone's task
+queue: selections made while the whole crew is busy, work left behind by fired
+employees, and the tail of an overloaded employee's queue that EmployeeManager
+steals for an idle crewmate. Idle employees pull the nearest job of the highest
+priority on the board, plus a short walking chain of similar jobs around it, as
+one ordinary task.
+
+Key Features:
+- Jobs bucketed per kind (task type plus task parameters such as crop_type) into
+  square cells of JOB_BOARD_CELL_SIZE tiles
+- Nearest-job search visits cells in order of their distance bound and stops as
+  soon as no closer job can exist
+- Priority by task type (JOB_PRIORITIES); distance only ranks jobs within the
+  highest priority that has any
+- Claims of up to JOB_CLAIM_TILES jobs, each the nearest remaining job of the
+  same kind to the one before it
+
+Design Goals:
+- No employee stands idle while a crewmate has a long queue, so fields finish in
+  time proportional to the crew size instead of the worst-loaded worker
+- Claim cost grows with occupied cells, not with the number of pending jobs
+
+Usage:
+    board = JobBoard()
+    board.post(tiles, 'plant', crop_type='corn')
+    claim = board.claim(employee.x, employee.y, JOB_CLAIM_TILES)
+    if claim:
+        task_type, tiles, params = claim
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from scripts.core.config import JOB_BOARD_CELL_SIZE, JOB_PRIORITIES
+
+
+class JobBoard:
+    """Priority queue of unclaimed tile jobs with per-kind spatial buckets"""
+    
+    def __init__(self, cell_size: int = JOB_BOARD_CELL_SIZE):
+        """Initialize an empty board"""
+        self.cell_size = cell_size
+        self.jobs: Dict[object, Tuple] = {}  # Tile -> kind (task type, sorted task parameters)
+        self._cells: Dict[Tuple, Dict[Tuple[int, int], Set]] = {}  # Kind -> cell -> tiles (kinds with jobs only)
+        
+        # Statistics
+        self.posted = 0
+        self.claimed = 0
+    
+    def __len__(self) -> int:
+        return len(self.jobs)
+    
+    def __contains__(self, tile) -> bool:
+        return tile in self.jobs
+    
+    def post(self, tiles: Iterable, task_type: str, **params) -> int:
+        """
+        Put tile jobs on the board (tiles already posted keep their job)
+        
+        Args:
+            tiles: Tiles needing the work
+            task_type: 'till', 'plant' or 'harvest'
+            **params: Task parameters handed to the claiming employee (e.g. crop_type)
+        
+        Returns:
+            Number of jobs added
+        """
+        kind = (task_type, tuple(sorted(params.items())))
+        posted = 0
+        for tile in tiles:
+            if tile in self.jobs:
+                continue
+            self.jobs[tile] = kind
+            cells = self._cells.setdefault(kind, {})
+            cells.setdefault(self._cell_of(tile.x, tile.y), set()).add(tile)
+            posted += 1
+        self.posted += posted
+        return posted
+    
+    def withdraw(self, tiles: Iterable) -> int:
+        """Remove the jobs on tiles (e.g. cancelled work); returns the number removed"""
+        withdrawn = 0
+        for tile in tiles:
+            if tile in self.jobs:
+                self._remove(tile)
+                withdrawn += 1
+        return withdrawn
+    
+    def claim(self, x: float, y: float, limit: int) -> Optional[Tuple[str, List, Dict]]:
+        """
+        Take the nearest highest-priority job and up to limit - 1 similar jobs after it
+        
+        Returns:
+            (task_type, tiles in walking order, task parameters), or None if the
+            board is empty
+        """
+        if not self.jobs:
+            return None
+        
+        top = max(JOB_PRIORITIES.get(kind[0], 0) for kind in self._cells)
+        best = None
+        for kind in self._cells:
+            if JOB_PRIORITIES.get(kind[0], 0) == top:
+                found = self._nearest(kind, x, y)
+                if best is None or found[0] < best[0]:
+                    best = found + (kind,)
+        
+        _, tile, kind = best
+        tiles = [tile]
+        self._remove(tile)
+        while len(tiles) < limit and kind in self._cells:
+            _, tile = self._nearest(kind, tile.x, tile.y)
+            tiles.append(tile)
+            self._remove(tile)
+        
+        self.claimed += len(tiles)
+        return kind[0], tiles, dict(kind[1])
+    
+    def export(self) -> List[Tuple[object, str, Dict]]:
+        """Every pending job as (tile, task type, task parameters)"""
+        return [(tile, kind[0], dict(kind[1])) for tile, kind in self.jobs.items()]
+    
+    def clear(self):
+        """Drop every pending job"""
+        self.jobs.clear()
+        self._cells.clear()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Pending, posted and claimed job counts"""
+        return {'pending': len(self.jobs), 'posted': self.posted, 'claimed': self.claimed}
+    
+    def _cell_of(self, x: int, y: int) -> Tuple[int, int]:
+        """Bucket holding tile (x, y)"""
+        return (int(x) // self.cell_size, int(y) // self.cell_size)
+    
+    def _remove(self, tile):
+        """Drop one pending job, forgetting cells and kinds left empty"""
+        kind = self.jobs.pop(tile)
+        cells = self._cells[kind]
+        cell = self._cell_of(tile.x, tile.y)
+        cells[cell].discard(tile)
+        if not cells[cell]:
+            del cells[cell]
+            if not cells:
+                del self._cells[kind]
+    
+    def _nearest(self, kind: Tuple, x: float, y: float) -> Tuple[float, object]:
+        """Closest job of a kind to (x, y) by walking distance, ties broken by row then column"""
+        size = self.cell_size
+        bounds = []
+        for cell in self._cells[kind]:
+            # Walking distance from (x, y) to the nearest point of the cell
+            left, top = cell[0] * size, cell[1] * size
+            bound = (max(left - x, 0, x - (left + size - 1)) +
+                     max(top - y, 0, y - (top + size - 1)))
+            bounds.append((bound, cell))
+        bounds.sort()
+        
+        best = None
+        for bound, cell in bounds:
+            if best is not None and bound > best[0][0]:
+                break
+            for tile in self._cells[kind][cell]:
+                key = (abs(tile.x - x) + abs(tile.y - y), tile.y, tile.x)
+                if best is None or key < best[0]:
+                    best = (key, tile)
+        return best[0][0], best[1]
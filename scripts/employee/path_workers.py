@@ -0,0 +1,173 @@
+"""
+Path Workers - Process pool answering batches of path requests
+
+Path searches are pure Python and hold the GIL, so planning the routes of a whole
+crew on the main thread stalls the frame. PathWorkerPool hands independent
+(start, goal) queries to worker processes instead. Each worker keeps its own
+Pathfinder over a private PassabilityMap that it refreshes from one shared-memory
+copy of the farm's walkability bitmap, so buildings are published once per change
+rather than pickled with every request.
+
+Key Features:
+- multiprocessing.shared_memory block holding a sequence counter and one byte per
+  tile (nonzero = blocked); the main process republishes it only when the
+  passability version changes
+- Seqlock publishing: the counter is odd while the bitmap is being written and
+  workers retry their copy until they read the same even counter before and after
+- Workers apply only the tiles that changed, so their chunk versions, path caches
+  and cluster graphs refresh incrementally like the main Pathfinder's
+- Queries are split into a few chunks per worker; each chunk is one pool task whose
+  future fans out into one future per query
+- Pool and shared block are released by close() or when the pool is collected
+
+Design Goals:
+- No game state crosses the process boundary except (start, goal) tuples and the
+  resulting waypoint lists
+- Results may be a few ticks old; callers revalidate them against the current
+  bitmap before use (see Pathfinder.claim_path)
+
+Usage:
+    pool = PathWorkerPool(passability, workers=2)
+    pool.publish(walls_bytes, passability.version)
+    futures = pool.submit('jps', [((0, 0), (40, 12)), ((5, 5), (9, 30))])
+    path = futures[0].result()
+"""
+
+import struct
+import time
+import weakref
+from functools import partial
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+HEADER = struct.Struct('<Q')  # Seqlock counter in front of the bitmap
+CHUNKS_PER_WORKER = 2  # Pool tasks per worker for one batch (evens out long and short routes)
+
+# Per-process state of a worker (set by _init_worker)
+_worker = None
+
+
+def _init_worker(shm_name: str, width: int, height: int, chunk_size: int):
+    """Attach to the shared bitmap and build this worker's private Pathfinder"""
+    global _worker
+    from scripts.core.passability_map import PassabilityMap
+    from scripts.employee.pathfinding import Pathfinder
+    
+    block = shared_memory.SharedMemory(name=shm_name)
+    passability = PassabilityMap(width, height, chunk_size)
+    grid = SimpleNamespace(width=width, height=height, passability=passability)
+    _worker = SimpleNamespace(block=block, passability=passability, sequence=0,
+                              pathfinder=Pathfinder(grid, mode='astar', workers=0))
+
+
+def _read_bitmap(block, size: int, known: int) -> Tuple[int, Optional[bytes]]:
+    """(sequence, bitmap copy) from the shared block, or (known, None) if unchanged"""
+    buffer = block.buf
+    while True:
+        sequence = HEADER.unpack_from(buffer, 0)[0]
+        if sequence == known:
+            return known, None
+        if sequence & 1:
+            time.sleep(0)  # Main process is mid-write
+            continue
+        bitmap = bytes(buffer[HEADER.size:HEADER.size + size])
+        if HEADER.unpack_from(buffer, 0)[0] == sequence:
+            return sequence, bitmap
+
+
+def _sync_worker():
+    """Apply bitmap changes published since this worker last looked"""
+    passability = _worker.passability
+    size = passability.width * passability.height
+    sequence, bitmap = _read_bitmap(_worker.block, size, _worker.sequence)
+    if bitmap is None:
+        return
+    
+    _worker.sequence = sequence
+    blocked = np.frombuffer(bitmap, dtype=bool).reshape(passability.height, passability.width)
+    for index in np.flatnonzero(blocked != passability.blocked):
+        y, x = divmod(int(index), passability.width)
+        passability.set_blocked(x, y, bool(blocked[y, x]))  # Bumps that tile's chunk version
+
+
+def _plan_paths(mode: str, queries: List[Tuple[Tuple[int, int], Tuple[int, int]]]) -> List[Optional[List[Tuple[int, int]]]]:
+    """Worker task: answer a chunk of queries against the latest published bitmap"""
+    _sync_worker()
+    pathfinder = _worker.pathfinder
+    pathfinder.set_mode('jps' if mode == 'cooperative' else mode)  # Reservations stay on the main process
+    return [pathfinder.find_path(start, goal) for start, goal in queries]
+
+
+def _fan_out(futures: List[Future], task: Future):
+    """Resolve each query's future from its chunk's result (runs on the pool's thread)"""
+    if task.cancelled():
+        for future in futures:
+            future.cancel()
+        return
+    error = task.exception()
+    if error is not None:
+        for future in futures:
+            future.set_exception(error)  # e.g. BrokenProcessPool; claim_path replans locally
+        return
+    for future, path in zip(futures, task.result()):
+        future.set_result(path)
+
+
+def _release(executor: ProcessPoolExecutor, block: shared_memory.SharedMemory):
+    """Stop the workers and free the shared block"""
+    executor.shutdown(wait=True, cancel_futures=True)
+    block.close()
+    block.unlink()
+
+
+class PathWorkerPool:
+    """Worker processes planning paths over a shared copy of the passability bitmap"""
+    
+    def __init__(self, passability, workers: int):
+        """Start workers for a farm of the passability map's size"""
+        self.width = passability.width
+        self.height = passability.height
+        self.workers = workers
+        self.block = shared_memory.SharedMemory(create=True, size=HEADER.size + self.width * self.height)
+        HEADER.pack_into(self.block.buf, 0, 0)
+        self.sequence = 0
+        self.published_version = None  # Passability version currently in the shared block
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                            initargs=(self.block.name, self.width, self.height,
+                                                      passability.chunk_size))
+        self.batches = 0
+        self.queries = 0
+        self._finalizer = weakref.finalize(self, _release, self.executor, self.block)
+    
+    def publish(self, walls: bytes, version: int):
+        """Copy the bitmap into shared memory if it changed since the last publish"""
+        if version == self.published_version:
+            return
+        buffer = self.block.buf
+        HEADER.pack_into(buffer, 0, self.sequence + 1)  # Odd: readers wait
+        buffer[HEADER.size:HEADER.size + len(walls)] = walls
+        self.sequence += 2
+        HEADER.pack_into(buffer, 0, self.sequence)
+        self.published_version = version
+    
+    def submit(self, mode: str, queries: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+               futures: Optional[List[Future]] = None) -> List[Future]:
+        """One future per query (given or new), resolved when the worker holding its chunk finishes"""
+        futures = futures if futures is not None else [Future() for _ in queries]
+        chunk_size = max(1, -(-len(queries) // (self.workers * CHUNKS_PER_WORKER)))
+        for first in range(0, len(queries), chunk_size):
+            chunk = futures[first:first + chunk_size]
+            task = self.executor.submit(_plan_paths, mode, queries[first:first + chunk_size])
+            task.add_done_callback(partial(_fan_out, chunk))
+        self.batches += 1
+        self.queries += len(queries)
+        return futures
+    
+    def close(self):
+        """Stop the workers and free the shared bitmap"""
+        self._finalizer()
@@ -5,87 +5,242 @@ This module provides A* pathfinding algorithm for employee navigation around obs
 Designed to be efficient for real-time game usage with caching and optimization.
 
 Key Features:
-- Classic A* algorithm with Manhattan distance heuristic
+- A* over flat integer cell indices (y * width + x) with Manhattan distance heuristic
+- Preallocated g-cost/parent arrays reused across searches via a generation counter
+- Binary heap of (f, index) tuples (ties on f broken toward the goal); no per-node objects
+- Selectable search modes:
+  - 'astar': plain A* (best for small farms and short trips)
+  - 'jps': Jump Point Search for 4-connected grids, skipping straight runs of open tiles
+  - 'hierarchical': HPA*-style entrance graph over chunks (see cluster_graph.py)
+    for long trips on large farms
+  - 'cooperative': JPS routes as guides for a CooperativePlanner that moves all
+    MOVING employees in step through a space-time reservation table, so they
+    queue and give way instead of walking through each other
 - Obstacle detection and avoidance
 - Path smoothing and optimization
-- Caching for repeated path requests
+- LRU cache for repeated path requests with hit/miss counters; each entry records
+  the chunk versions it crosses and is dropped only when one of those chunks changes
 - Integration with existing employee movement system
+- Batch requests (find_paths_batch) answered by a pool of worker processes over a
+  shared-memory copy of the bitmap; settle_batch hands the routes out at the next
+  tick boundary, so employees pick them up on a fixed tick however fast the
+  workers were
 
 Usage:
     pathfinder = Pathfinder(grid_manager)
+    pathfinder.set_mode('hierarchical')  # Optional, defaults to PATHFINDING_MODE
     path = pathfinder.find_path(start_pos, end_pos)
     if path:
         employee.set_path(path)
+    
+    futures = pathfinder.find_paths_batch([(start_a, goal_a), (start_b, goal_b)])
+    path = pathfinder.claim_path(futures[0], start_a, goal_a)  # Once futures[0].done()
+    
+    pathfinder.settle_batch()  # Once per tick: worker routes become route_ready
 
 Performance Considerations:
 - Grid size: 16x16 is small enough for real-time pathfinding
-- Obstacle detection: Checks for impassable tiles and future workstations
-- Path caching: Avoids recalculating identical paths
+- Search state: Allocated once per grid; a search only writes the cells it touches
+- Obstacle detection: Byte snapshot of GridManager's passability bitmap (buildings, occupied tiles)
+- Path caching: Avoids recalculating identical paths; buildings elsewhere on the farm
+  do not invalidate routes that never pass through their chunk
 - Early termination: Returns quickly if direct path is clear
+- Long paths: JPS and hierarchical results are reduced to their turning points
+  instead of line-of-sight smoothing, which costs O(length) per waypoint
 
 Future Enhancements:
-- Hierarchical pathfinding for larger grids
-- Dynamic obstacle avoidance (other employees)
 - Path sharing between employees with similar routes
 """
 
 import heapq
-import math
-from typing import List, Tuple, Optional, Set
-from scripts.core.config import GRID_WIDTH, GRID_HEIGHT
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, wait
+from typing import Dict, List, Set, Tuple, Optional
+from scripts.core.config import (GRID_WIDTH, GRID_HEIGHT, PATHFINDING_MODE, PATH_CACHE_SIZE,
+                                 PATH_WORKERS, PATH_BATCH_MIN_QUERIES)
+from scripts.employee.cluster_graph import ClusterGraph
+from scripts.employee.cooperative_planner import CooperativePlanner
+from scripts.employee.path_workers import PathWorkerPool
+
+
+PATHFINDING_MODES = ('astar', 'jps', 'hierarchical', 'cooperative')
+MAX_GENERATION = 0xFFFFFFFF  # Largest value of the 'I' generation stamps
 
 
-class PathNode:
-    """A node in the pathfinding graph"""
-    
-    def __init__(self, x: int, y: int, g_cost: float = 0, h_cost: float = 0, parent=None):
-        self.x = x
-        self.y = y
-        self.g_cost = g_cost  # Distance from start
-        self.h_cost = h_cost  # Heuristic distance to goal
-        self.f_cost = g_cost + h_cost  # Total cost
-        self.parent = parent
-    
-    def __lt__(self, other):
-        """For priority queue comparison"""
-        return self.f_cost < other.f_cost
-    
-    def __eq__(self, other):
-        """For node comparison"""
-        return self.x == other.x and self.y == other.y
-    
-    def __hash__(self):
-        """For use in sets and dictionaries"""
-        return hash((self.x, self.y))
-    
-    def get_position(self) -> Tuple[int, int]:
-        """Get node position as tuple"""
-        return (self.x, self.y)
+class PathCache:
+    """
+    Least-recently-used cache of paths keyed by (start, goal)
+    
+    Every entry stores the version of each passability chunk its route crosses.
+    A lookup whose chunks have all kept their versions is still walkable; if any
+    of them changed the entry is dropped and counted as a miss.
+    """
+    
+    def __init__(self, capacity: int = PATH_CACHE_SIZE, passability=None):
+        """Initialize an empty cache holding at most capacity paths"""
+        self.capacity = capacity
+        self.passability = passability
+        self.entries: OrderedDict = OrderedDict()  # (start, goal) -> (path, ((chunk, version), ...))
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0  # Misses caused by a changed chunk on the cached route
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def get(self, key: Tuple) -> Optional[List[Tuple[int, int]]]:
+        """Copy of the cached path for key, or None if absent or no longer valid"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        path, stamps = entry
+        if stamps:
+            versions = self.passability.chunk_versions.ravel()
+            for chunk, version in stamps:
+                if versions[chunk] != version:
+                    del self.entries[key]
+                    self.invalidations += 1
+                    self.misses += 1
+                    return None
+        
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return path.copy()
+    
+    def put(self, key: Tuple, path: List[Tuple[int, int]]):
+        """Store a path, evicting the least recently used entries beyond capacity"""
+        if self.capacity <= 0:
+            return
+        self.entries[key] = (path.copy(), self._chunk_stamps(path))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop every cached path (counters are kept)"""
+        self.entries.clear()
+    
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and fill level"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.entries),
+            'capacity': self.capacity
+        }
+    
+    def _chunk_stamps(self, path: List[Tuple[int, int]]) -> Tuple[Tuple[int, int], ...]:
+        """(chunk, current version) for every chunk the path's segments may cross"""
+        passability = self.passability
+        if passability is None:
+            return ()
+        
+        chunk_size = passability.chunk_size
+        chunks_x = passability.chunks_x
+        chunks = set()
+        # Each segment's bounding box covers every tile it touches (diagonals included)
+        for (ax, ay), (bx, by) in zip(path, path[1:] or path):
+            for chunk_y in range(min(ay, by) // chunk_size, max(ay, by) // chunk_size + 1):
+                for chunk_x in range(min(ax, bx) // chunk_size, max(ax, bx) // chunk_size + 1):
+                    chunks.add(chunk_y * chunks_x + chunk_x)
+        
+        versions = passability.chunk_versions.ravel()
+        return tuple((chunk, int(versions[chunk])) for chunk in sorted(chunks))
 
 
 class Pathfinder:
     """A* pathfinding implementation for employee movement"""
     
-    def __init__(self, grid_manager):
-        """Initialize pathfinder with grid reference"""
+    def __init__(self, grid_manager, mode: str = PATHFINDING_MODE, cache_capacity: int = PATH_CACHE_SIZE,
+                 workers: int = PATH_WORKERS):
+        """Initialize pathfinder with grid reference, search mode, path cache size and batch workers"""
         self.grid_manager = grid_manager
-        self.path_cache = {}  # Cache for recently calculated paths
-        self.max_cache_size = 50
-        
-        # Movement directions (4-directional movement)
-        self.directions = [
-            (0, -1),  # North
-            (1, 0),   # East  
-            (0, 1),   # South
-            (-1, 0)   # West
-        ]
-        
-        # Optional: 8-directional movement
-        # self.directions = [
-        #     (0, -1), (1, -1), (1, 0), (1, 1),
-        #     (0, 1), (-1, 1), (-1, 0), (-1, -1)
-        # ]
-        
+        self.grid_width = getattr(grid_manager, 'width', GRID_WIDTH)  # Farms can be larger than the default
+        self.grid_height = getattr(grid_manager, 'height', GRID_HEIGHT)
+        
+        # Walkability bitmap maintained by GridManager (True = blocked)
+        self.passability = getattr(grid_manager, 'passability', None)
+        self.blocked = self.passability.blocked if self.passability is not None else None
+        self._walls_version = self.passability.version if self.passability is not None else 0
+        
+        # Recently calculated paths, validated per chunk on lookup
+        self.path_cache = PathCache(cache_capacity, self.passability)
+        self._walls = b''  # Flat byte copy of the bitmap (nonzero = blocked), cheap to index
+        self._refresh_walls()
+        
+        # Flat A* state indexed by y * width + x, allocated once and reused by every search.
+        # A cell's g-cost/parent are only valid when its stamp equals the current generation,
+        # so starting a search is O(1) instead of clearing the arrays.
+        size = self.grid_width * self.grid_height
+        self._g_costs = array('i', bytes(4 * size))
+        self._parents = array('i', bytes(4 * size))
+        self._seen = array('I', bytes(4 * size))  # Generation that wrote g-cost/parent
+        self._closed = array('I', bytes(4 * size))  # Generation that expanded the cell
+        self._generation = 0
+        
+        # Entrance graph for hierarchical mode, built on first use
+        self.cluster_graph: Optional[ClusterGraph] = None
+        # Reservation-table planner for cooperative mode, and tiles it must keep clear
+        self.cooperative_planner: Optional[CooperativePlanner] = None
+        self.temporary_obstacles = set()
+        
+        # Worker processes for large batches, started on the first one (0 = main thread only)
+        self.workers = workers
+        self.worker_pool: Optional[PathWorkerPool] = None
+        self._batch: Optional[List[Tuple[Tuple, Future]]] = None  # Requests collected by begin_batch
+        self._in_flight: Set[Future] = set()  # Worker futures not yet handed out by settle_batch
+        self.mode = 'astar'
+        self.set_mode(mode)
+    
+    def set_mode(self, mode: str):
+        """Select the search used for new paths ('astar', 'jps', 'hierarchical' or 'cooperative')"""
+        if mode not in PATHFINDING_MODES:
+            raise ValueError(f"Unknown pathfinding mode '{mode}' (expected one of {PATHFINDING_MODES})")
+        if mode != self.mode:
+            self.mode = mode
+            self.clear_cache()  # Modes may pick different (equally valid) routes
+        if mode == 'hierarchical' and self.cluster_graph is None and self.passability is not None:
+            self.cluster_graph = ClusterGraph(self.passability)
+            self.cluster_graph.refresh(self._walls)
+        if mode == 'cooperative' and self.cooperative_planner is None:
+            self.cooperative_planner = CooperativePlanner(self)
+            for x, y in self.temporary_obstacles:
+                self.cooperative_planner.block_tile(x, y)
+        elif mode != 'cooperative' and self.cooperative_planner is not None:
+            self.cooperative_planner.release_all()  # Employees walk their own paths again
+            self.cooperative_planner = None
+    
+    def _refresh_walls(self):
+        """Take a byte snapshot of the passability bitmap"""
+        if self.blocked is None:
+            self._walls = bytes(self.grid_width * self.grid_height)  # Everything walkable
+        else:
+            self._walls = self.blocked.tobytes()
+        if getattr(self, 'cluster_graph', None) is not None:
+            self.cluster_graph.refresh(self._walls)  # Rebuilds only chunks that changed
+    
+    def _sync_walls(self):
+        """Retake the bitmap snapshot if buildings changed since the last one"""
+        if self.passability is not None and self.passability.version != self._walls_version:
+            self._refresh_walls()
+            self._walls_version = self.passability.version
+    
+    def _next_generation(self) -> int:
+        """Start a new search generation, clearing the stamps only on wrap-around"""
+        self._generation += 1
+        if self._generation > MAX_GENERATION:
+            size = len(self._seen)
+            self._seen = array('I', bytes(4 * size))
+            self._closed = array('I', bytes(4 * size))
+            self._generation = 1
+        return self._generation
+    
     def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
         """
         Find optimal path from start to goal using A* algorithm
@@ -93,89 +248,410 @@ class Pathfinder:
         Args:
             start: Starting position (x, y)
             goal: Target position (x, y)
-            
+        
         Returns:
             List of positions representing the path, or None if no path exists
         """
-        # Check cache first
+        # Searches read a snapshot of the bitmap; retake it after buildings change
+        self._sync_walls()
+        
+        answered, path = self._answer_without_search(start, goal)
+        if answered:
+            return path
+        return self._search(start, goal)
+    
+    def _answer_without_search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[bool, Optional[List[Tuple[int, int]]]]:
+        """(True, path) for cached, invalid, trivial and straight-line requests, else (False, None)"""
+        # Check cache first (entries crossing a changed chunk are dropped here)
         cache_key = (start, goal)
-        if cache_key in self.path_cache:
-            return self.path_cache[cache_key].copy()
+        cached = self.path_cache.get(cache_key)
+        if cached is not None:
+            return True, cached
         
         # Quick validation
+        if not self._is_valid_position(start[0], start[1]):
+            return True, None
         if not self._is_valid_position(goal[0], goal[1]) or self._is_obstacle(goal[0], goal[1]):
-            return None
+            return True, None
         
         if start == goal:
-            return [start]
+            return True, [start]
         
         # Check if direct path is clear (optimization for open areas)
         direct_path = self._get_direct_path(start, goal)
         if direct_path:
             self._cache_path(cache_key, direct_path)
-            return direct_path
+            return True, direct_path
         
-        # A* algorithm implementation
-        path = self._astar_search(start, goal)
+        return False, None
+    
+    def _search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """Run the current mode's search and cache the resulting waypoints"""
+        cache_key = (start, goal)
+        if self.mode in ('jps', 'cooperative'):
+            path = self._jps_search(start, goal)  # Cooperative guides need row/column routes
+        elif self.mode == 'hierarchical' and self._use_cluster_graph(start, goal):
+            path = self.cluster_graph.find_path(start, goal)  # Already reduced to turns
+        else:
+            # A* algorithm implementation
+            path = self._astar_search(start, goal)
+            if path:
+                # Smooth the path to reduce unnecessary waypoints
+                smoothed_path = self._smooth_path(path)
+                self._cache_path(cache_key, smoothed_path)
+                return smoothed_path
+            return None
         
         if path:
-            # Smooth the path to reduce unnecessary waypoints
-            smoothed_path = self._smooth_path(path)
-            self._cache_path(cache_key, smoothed_path)
-            return smoothed_path
+            path = self._compress_path(path)
+            self._cache_path(cache_key, path)
+            return path
         
         return None
     
-    def _astar_search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
-        """Core A* algorithm implementation"""
-        start_node = PathNode(start[0], start[1], 0, self._heuristic(start, goal))
-        goal_node = PathNode(goal[0], goal[1])
+    # Batched requests
+    @property
+    def batching(self) -> bool:
+        """True between begin_batch and submit_batch"""
+        return self._batch is not None
+    
+    def begin_batch(self):
+        """Collect request_path calls until submit_batch plans them together"""
+        if self._batch is None:
+            self._batch = []
+    
+    def request_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Future:
+        """Future route from start to goal (planned at submit_batch while a batch is open)"""
+        future = Future()
+        if self._batch is None:
+            self.find_paths_batch([(start, goal)], [future])
+        else:
+            self._batch.append(((start, goal), future))
+        return future
+    
+    def submit_batch(self):
+        """Plan every request collected since begin_batch"""
+        batch, self._batch = self._batch, None
+        if batch:
+            self.find_paths_batch([query for query, _ in batch], [future for _, future in batch])
+    
+    def find_paths_batch(self, queries: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+                         futures: Optional[List[Future]] = None) -> List[Future]:
+        """
+        Plan many independent routes, on worker processes when the batch is large enough
+        
+        Cached, invalid and straight-line requests are answered immediately. The rest
+        go to the worker pool as one batch, or are searched here if there are fewer
+        than PATH_BATCH_MIN_QUERIES of them or no workers are available.
+        
+        Args:
+            queries: (start, goal) positions
+            futures: Futures to resolve (one per query); new ones are created if omitted
         
-        open_list = [start_node]  # Priority queue of nodes to explore
-        closed_set = set()  # Positions we've already explored
+        Returns:
+            One future per query resolving to its waypoints (or None); pass it to
+            claim_path once done, since worker routes may predate new buildings
+        """
+        self._sync_walls()
+        if futures is None:
+            futures = [Future() for _ in queries]
+        
+        searches = []
+        for (start, goal), future in zip(queries, futures):
+            answered, path = self._answer_without_search(start, goal)
+            if answered:
+                future.set_result(path)
+            else:
+                searches.append(((start, goal), future))
+        
+        pool = self._pool_for(len(searches))
+        if pool is None:
+            for (start, goal), future in searches:
+                future.set_result(self._search(start, goal))
+        elif searches:
+            pool.publish(self._walls, self._walls_version)
+            pool.submit(self.mode, [query for query, _ in searches], [future for _, future in searches])
+            self._in_flight.update(future for _, future in searches)
+        return futures
+    
+    def settle_batch(self):
+        """
+        Wait for every route sent to the workers so far and mark them ready
         
-        # Track best g_cost for each position
-        g_costs = {start: 0}
+        EmployeeManager calls this once per tick, before sending the next batch, so a
+        worker route is picked up on the tick after it was requested whatever the
+        worker latency, and a run plays out the same at any frame rate.
+        """
+        if self._in_flight:
+            wait(self._in_flight)
+            self._in_flight.clear()
+    
+    def route_ready(self, future: Future) -> bool:
+        """True once a request_path future can be claimed (worker routes wait for settle_batch)"""
+        return future not in self._in_flight and future.done()
+    
+    def claim_path(self, future: Future, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Waypoints from a finished find_paths_batch future, checked against the current bitmap
         
-        while open_list:
-            # Get node with lowest f_cost
-            current_node = heapq.heappop(open_list)
-            current_pos = current_node.get_position()
+        A route that no longer starts at start or crosses a tile blocked since it was
+        planned, a missing route, or a failed worker is planned again on this thread.
+        """
+        self._sync_walls()
+        if future.cancelled() or future.exception() is not None:
+            return self.find_path(start, goal)
+        
+        path = future.result()
+        if path is None or path[0] != start or path[-1] != goal or not self._is_path_open(path):
+            return self.find_path(start, goal)
+        self._cache_path((start, goal), path)
+        return path
+    
+    def _is_path_open(self, path: List[Tuple[int, int]]) -> bool:
+        """True if every waypoint after the start and every segment between them is walkable"""
+        if any(self._is_obstacle(x, y) for x, y in path[1:]):
+            return False
+        return all(self._has_line_of_sight(a, b) for a, b in zip(path, path[1:]))
+    
+    def _pool_for(self, searches: int) -> Optional[PathWorkerPool]:
+        """Worker pool for a batch of this many searches, or None to search on this thread"""
+        if self.workers <= 0 or self.passability is None or searches < PATH_BATCH_MIN_QUERIES:
+            return None
+        if self.worker_pool is None:
+            try:
+                self.worker_pool = PathWorkerPool(self.passability, self.workers)
+            except (OSError, NotImplementedError) as error:
+                # No shared memory or process support here; keep planning on the main thread
+                print(f"Pathfinder: Worker pool unavailable ({error}), planning batches inline")
+                self.workers = 0
+                return None
+        return self.worker_pool
+    
+    def close(self):
+        """Stop the worker processes (a later large batch starts them again)"""
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+            self.worker_pool = None
+    
+    def _use_cluster_graph(self, start: Tuple[int, int], goal: Tuple[int, int]) -> bool:
+        """Hierarchical search pays off once start and goal are in different clusters"""
+        graph = self.cluster_graph
+        return graph is not None and graph.cluster_of(*start) != graph.cluster_of(*goal)
+    
+    def _astar_search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Core A* search over flat cell indices
+        
+        Uses the preallocated g-cost/parent arrays; the only per-search allocations
+        are the (f, index) heap entries. Stale heap entries are skipped when popped.
+        """
+        width = self.grid_width
+        height = self.grid_height
+        walls = self._walls
+        g_costs = self._g_costs
+        parents = self._parents
+        seen = self._seen
+        closed = self._closed
+        generation = self._next_generation()
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        goal_x, goal_y = goal
+        start_index = start[1] * width + start[0]
+        goal_index = goal_y * width + goal_x
+        
+        g_costs[start_index] = 0
+        parents[start_index] = -1
+        seen[start_index] = generation
+        # Heap keys are f scaled past any h plus h, so among equal f the cell nearest
+        # the goal pops first (on open grids this avoids expanding every tied cell)
+        tie_scale = width + height
+        open_heap = [(0, start_index)]
+        
+        while open_heap:
+            _, index = heappop(open_heap)
+            if closed[index] == generation:
+                continue  # Already expanded through a cheaper entry
             
-            # Check if we reached the goal
-            if current_pos == goal:
-                return self._reconstruct_path(current_node)
+            if index == goal_index:
+                return self._reconstruct_path(index)
             
-            closed_set.add(current_pos)
+            closed[index] = generation
+            y, x = divmod(index, width)
+            neighbor_g = g_costs[index] + 1  # Uniform cost, 4-directional movement
             
-            # Explore neighbors
-            for neighbor_pos in self._get_neighbors(current_pos):
-                if neighbor_pos in closed_set:
+            # North, east, south, west
+            for neighbor, nx, ny, inside in ((index - width, x, y - 1, y > 0),
+                                             (index + 1, x + 1, y, x + 1 < width),
+                                             (index + width, x, y + 1, y + 1 < height),
+                                             (index - 1, x - 1, y, x > 0)):
+                if not inside or walls[neighbor] or closed[neighbor] == generation:
                     continue
                 
-                if self._is_obstacle(neighbor_pos[0], neighbor_pos[1]):
+                # Keep the cheaper of the known and the new route
+                if seen[neighbor] == generation and g_costs[neighbor] <= neighbor_g:
                     continue
-                
-                # Calculate costs
-                movement_cost = self._get_movement_cost(current_pos, neighbor_pos)
-                tentative_g_cost = current_node.g_cost + movement_cost
-                
-                # Check if this path to neighbor is better
-                if neighbor_pos not in g_costs or tentative_g_cost < g_costs[neighbor_pos]:
-                    g_costs[neighbor_pos] = tentative_g_cost
-                    
-                    neighbor_node = PathNode(
-                        neighbor_pos[0], neighbor_pos[1],
-                        tentative_g_cost,
-                        self._heuristic(neighbor_pos, goal),
-                        current_node
-                    )
-                    
-                    heapq.heappush(open_list, neighbor_node)
+                seen[neighbor] = generation
+                g_costs[neighbor] = neighbor_g
+                parents[neighbor] = index
+                h = abs(nx - goal_x) + abs(ny - goal_y)
+                heappush(open_heap, ((neighbor_g + h) * tie_scale + h, neighbor))
         
         # No path found
         return None
     
+    def _jps_search(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Jump Point Search over flat cell indices (4-directional movement)
+        
+        Canonical routes move vertically first, so vertical jumps scan sideways at
+        every row while horizontal jumps only stop at the goal or where a vertical
+        turn is forced by a wall ending beside them. Only jump points enter the heap.
+        
+        Returns:
+            Jump points from start to goal (consecutive points share a row or column)
+        """
+        width = self.grid_width
+        walls = self._walls
+        g_costs = self._g_costs
+        parents = self._parents
+        seen = self._seen
+        closed = self._closed
+        generation = self._next_generation()
+        jump_vertical = self._jump_vertical
+        jump_horizontal = self._jump_horizontal
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        goal_x, goal_y = goal
+        start_index = start[1] * width + start[0]
+        goal_index = goal_y * width + goal_x
+        tie_scale = width + self.grid_height
+        
+        g_costs[start_index] = 0
+        parents[start_index] = -1
+        seen[start_index] = generation
+        open_heap = [(0, start_index)]
+        
+        while open_heap:
+            _, index = heappop(open_heap)
+            if closed[index] == generation:
+                continue
+            
+            if index == goal_index:
+                return self._reconstruct_path(index)
+            
+            closed[index] = generation
+            y, x = divmod(index, width)
+            parent = parents[index]
+            
+            # Directions worth exploring given how we arrived (pruned neighbours)
+            if parent == -1:
+                directions = ((0, -1), (1, 0), (0, 1), (-1, 0))
+            else:
+                parent_y, parent_x = divmod(parent, width)
+                if parent_x == x:
+                    dy = 1 if y > parent_y else -1
+                    directions = ((0, dy), (1, 0), (-1, 0))
+                else:
+                    dx = 1 if x > parent_x else -1
+                    directions = [(dx, 0)]
+                    # Turning vertical is forced where the tile behind us on that side is a wall
+                    for side in (-1, 1):
+                        side_row = (y + side) * width
+                        if 0 <= y + side < self.grid_height and not walls[side_row + x] and walls[side_row + x - dx]:
+                            directions.append((0, side))
+            
+            for dx, dy in directions:
+                if dx:
+                    jump_x = jump_horizontal(x, y, dx, goal_x, goal_y)
+                    if jump_x < 0:
+                        continue
+                    neighbor = y * width + jump_x
+                    distance = abs(jump_x - x)
+                else:
+                    jump_y = jump_vertical(x, y, dy, goal_x, goal_y)
+                    if jump_y < 0:
+                        continue
+                    neighbor = jump_y * width + x
+                    distance = abs(jump_y - y)
+                
+                if closed[neighbor] == generation:
+                    continue
+                neighbor_g = g_costs[index] + distance
+                if seen[neighbor] == generation and g_costs[neighbor] <= neighbor_g:
+                    continue
+                seen[neighbor] = generation
+                g_costs[neighbor] = neighbor_g
+                parents[neighbor] = index
+                ny, nx = divmod(neighbor, width)
+                h = abs(nx - goal_x) + abs(ny - goal_y)
+                heappush(open_heap, ((neighbor_g + h) * tie_scale + h, neighbor))
+        
+        return None
+    
+    def _jump_horizontal(self, x: int, y: int, dx: int, goal_x: int, goal_y: int) -> int:
+        """
+        Scan a row from (x, y) in direction dx for the next jump point
+        
+        Walls, goal and forced turns are located with bytes.find on the row and the
+        rows above and below, so open stretches are skipped at C speed.
+        
+        Returns:
+            Column of the jump point, or -1 if the scan hits a wall or the farm edge
+        """
+        walls = self._walls
+        width = self.grid_width
+        row = y * width
+        candidates = []
+        
+        if dx > 0:
+            wall = walls.find(1, row + x + 1, row + width)
+            limit = wall - row if wall >= 0 else width  # First column the scan cannot enter
+            if y == goal_y and x < goal_x < limit:
+                candidates.append(goal_x)
+            # Forced turn at column c: side tile c open, side tile c - 1 a wall
+            for side_row in (row - width, row + width):
+                if 0 <= side_row < len(walls):
+                    found = walls.find(b'\x01\x00', side_row + x, side_row + limit)
+                    if found >= 0:
+                        candidates.append(found - side_row + 1)
+            return min(candidates) if candidates else -1
+        
+        wall = walls.rfind(1, row, row + x)
+        limit = wall - row if wall >= 0 else -1  # Last column the scan cannot enter
+        if y == goal_y and limit < goal_x < x:
+            candidates.append(goal_x)
+        # Forced turn at column c: side tile c open, side tile c + 1 a wall
+        for side_row in (row - width, row + width):
+            if 0 <= side_row < len(walls):
+                found = walls.rfind(b'\x00\x01', side_row + limit + 1, side_row + x + 1)
+                if found >= 0:
+                    candidates.append(found - side_row)
+        return max(candidates) if candidates else -1
+    
+    def _jump_vertical(self, x: int, y: int, dy: int, goal_x: int, goal_y: int) -> int:
+        """
+        Step along a column from (x, y) in direction dy until a jump point
+        
+        A tile is a jump point if it is the goal or a sideways scan from it finds one.
+        
+        Returns:
+            Row of the jump point, or -1 if the column hits a wall or the farm edge
+        """
+        walls = self._walls
+        width = self.grid_width
+        height = self.grid_height
+        jump_horizontal = self._jump_horizontal
+        
+        while True:
+            y += dy
+            if y < 0 or y >= height or walls[y * width + x]:
+                return -1
+            if (x == goal_x and y == goal_y) or jump_horizontal(x, y, 1, goal_x, goal_y) >= 0 \
+                    or jump_horizontal(x, y, -1, goal_x, goal_y) >= 0:
+                return y
+    
     def _get_direct_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
         """Check if a direct straight-line path is possible"""
         dx = goal[0] - start[0]
@@ -190,89 +666,65 @@ class Pathfinder:
         if steps == 0:
             return [start]
         
+        # Diagonal lines must not squeeze between two blocked corners
+        if not self._has_line_of_sight(start, goal):
+            return None
+        
         path = [start]
         for i in range(1, steps + 1):
-            x = start[0] + (dx * i // steps)
-            y = start[1] + (dy * i // steps)
-            
-            if self._is_obstacle(x, y):
-                return None
-            
-            path.append((x, y))
+            path.append((start[0] + (dx * i // steps), start[1] + (dy * i // steps)))
         
         return path
     
-    def _get_neighbors(self, pos: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Get valid neighboring positions"""
-        neighbors = []
-        x, y = pos
-        
-        for dx, dy in self.directions:
-            new_x, new_y = x + dx, y + dy
-            
-            if self._is_valid_position(new_x, new_y):
-                neighbors.append((new_x, new_y))
-        
-        return neighbors
-    
     def _is_valid_position(self, x: int, y: int) -> bool:
         """Check if position is within grid bounds"""
-        return 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT
+        return 0 <= x < self.grid_width and 0 <= y < self.grid_height
     
     def _is_obstacle(self, x: int, y: int) -> bool:
         """
         Check if position is blocked by an obstacle
         
-        Future workstations will be considered obstacles here
+        Buildings and occupied tiles are read from the passability bitmap
         """
         if not self._is_valid_position(x, y):
             return True
         
-        # For now, no obstacles in the basic grid
-        # Future implementation will check:
-        # - Workstation positions
-        # - Impassable terrain
-        # - Other employees (dynamic obstacles)
-        
-        # Example future obstacle checking:
-        # tile = self.grid_manager.get_tile(x, y)
-        # if tile.has_workstation():
-        #     return True
-        # if tile.terrain_type == 'water':
-        #     return True
-        
-        return False
+        return bool(self._walls[y * self.grid_width + x])
     
     def _heuristic(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
         """Manhattan distance heuristic (good for 4-directional movement)"""
         return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
     
-    def _get_movement_cost(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> float:
-        """Get cost of moving between adjacent positions"""
-        # Basic cost is 1.0 for adjacent tiles
-        # Could be modified based on terrain difficulty in future
-        dx = abs(to_pos[0] - from_pos[0])
-        dy = abs(to_pos[1] - from_pos[1])
-        
-        if dx + dy == 1:  # Orthogonal movement
-            return 1.0
-        elif dx == 1 and dy == 1:  # Diagonal movement
-            return math.sqrt(2)  # ~1.414
-        else:
-            return float('inf')  # Invalid movement
-    
-    def _reconstruct_path(self, goal_node: PathNode) -> List[Tuple[int, int]]:
-        """Reconstruct path from goal node back to start"""
+    def _reconstruct_path(self, goal_index: int) -> List[Tuple[int, int]]:
+        """Reconstruct path by following parent indices from the goal back to start"""
+        width = self.grid_width
+        parents = self._parents
         path = []
-        current = goal_node
+        index = goal_index
         
-        while current:
-            path.append(current.get_position())
-            current = current.parent
+        while index != -1:
+            y, x = divmod(index, width)
+            path.append((x, y))
+            index = parents[index]
         
         path.reverse()
         return path
     
+    def _compress_path(self, path: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Keep only the start, goal and tiles where the path changes direction"""
+        if len(path) <= 2:
+            return path
+        
+        def heading(a, b):
+            return ((b[0] > a[0]) - (b[0] < a[0]), (b[1] > a[1]) - (b[1] < a[1]))
+        
+        compressed = [path[0]]
+        for previous, current, following in zip(path, path[1:], path[2:]):
+            if heading(previous, current) != heading(current, following):
+                compressed.append(current)
+        compressed.append(path[-1])
+        return compressed
+    
     def _smooth_path(self, path: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
         """
         Remove unnecessary waypoints from path using line-of-sight
@@ -301,8 +753,13 @@ class Pathfinder:
         return smoothed
     
     def _has_line_of_sight(self, start: Tuple[int, int], end: Tuple[int, int]) -> bool:
-        """Check if there's a clear line of sight between two points"""
-        # Simple line-of-sight check using Bresenham's line algorithm concept
+        """
+        Check if there's a clear line of sight between two points
+        
+        Employees walk the straight segment between waypoints, so every tile the
+        segment touches is checked (supercover line), not just one tile per step.
+        Passing exactly through a tile corner needs both side tiles to be open.
+        """
         dx = abs(end[0] - start[0])
         dy = abs(end[1] - start[1])
         
@@ -312,39 +769,56 @@ class Pathfinder:
         step_x = 1 if end[0] > start[0] else -1
         step_y = 1 if end[1] > start[1] else -1
         
-        # Check all points along the line
-        steps = max(dx, dy)
-        for i in range(1, steps):
-            check_x = start[0] + (step_x * dx * i) // steps
-            check_y = start[1] + (step_y * dy * i) // steps
+        x, y = start
+        moved_x = moved_y = 0
+        while moved_x < dx or moved_y < dy:
+            # Compare where the line crosses the next vertical vs horizontal tile edge
+            decision = (1 + 2 * moved_x) * dy - (1 + 2 * moved_y) * dx
+            if decision == 0:
+                # Through a corner: both tiles beside it must be walkable
+                if self._is_obstacle(x + step_x, y) or self._is_obstacle(x, y + step_y):
+                    return False
+                x += step_x
+                y += step_y
+                moved_x += 1
+                moved_y += 1
+            elif decision < 0:
+                x += step_x
+                moved_x += 1
+            else:
+                y += step_y
+                moved_y += 1
             
-            if self._is_obstacle(check_x, check_y):
+            if (x, y) != end and self._is_obstacle(x, y):
                 return False
         
         return True
     
     def _cache_path(self, cache_key: Tuple, path: List[Tuple[int, int]]):
         """Cache a calculated path"""
-        if len(self.path_cache) >= self.max_cache_size:
-            # Remove oldest entry (simple FIFO)
-            oldest_key = next(iter(self.path_cache))
-            del self.path_cache[oldest_key]
-        
-        self.path_cache[cache_key] = path.copy()
+        self.path_cache.put(cache_key, path)
     
     def clear_cache(self):
-        """Clear the path cache (useful when obstacles change)"""
+        """Clear the path cache (obstacle changes are handled per chunk without this)"""
         self.path_cache.clear()
     
+    def get_cache_stats(self) -> Dict[str, float]:
+        """Path cache hits, misses, invalidations, hit rate and fill level"""
+        return self.path_cache.stats()
+    
     def add_temporary_obstacle(self, x: int, y: int):
         """
-        Add temporary obstacle (e.g., another employee)
-        This will clear the cache to force recalculation
+        Add temporary obstacle (e.g., a parked cart)
+        
+        Cooperative planning routes employees around it; other employees are
+        already avoided through the reservation table. Static searches ignore it.
         """
-        # Future implementation for dynamic obstacles
-        self.clear_cache()
+        self.temporary_obstacles.add((x, y))
+        if self.cooperative_planner is not None:
+            self.cooperative_planner.block_tile(x, y)
     
     def remove_temporary_obstacle(self, x: int, y: int):
         """Remove temporary obstacle"""
-        # Future implementation for dynamic obstacles
-        self.clear_cache()
\ No newline at end of file
+        self.temporary_obstacles.discard((x, y))
+        if self.cooperative_planner is not None:
+            self.cooperative_planner.unblock_tile(x, y)
\ No newline at end of file
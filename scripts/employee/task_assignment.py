@@ -0,0 +1,220 @@
+"""
+Task Assignment - Travel-minimizing split of a tile selection across a crew
+
+Instead of handing out row-major slices of the selection, the selected tiles are
+cut into one spatially compact cluster per employee, each cluster goes to the
+employee who can reach it most cheaply, and every employee's tiles are put in a
+short walking order. Employees still visit their task's tiles in list order, so
+the order produced here is the route they walk.
+
+Key Features:
+- Grid sweeps (recursive coordinate bisection): the tiles are split along the
+  longer side of their bounding box, in proportion to the employees on each side,
+  until every employee has one cluster; cluster sizes differ by at most one tile
+  per split, like the even split they replace
+- Hungarian assignment of clusters to employees on the walking distance from the
+  employee (or the end of their queued work) to the nearest tile of the cluster
+- Nearest-neighbour tour from the employee through their cluster, improved by
+  2-opt segment reversals on clusters up to ASSIGNMENT_2OPT_MAX_TILES tiles
+
+Design Goals:
+- Less walking per tile worked, so crews finish fields sooner
+- Manhattan distance as travel cost (4-directional movement; buildings inside a
+  field are rare enough that the straight estimate ranks routes correctly)
+- NumPy over tile coordinates; no per-pair Python loops in the cost matrices
+
+Usage:
+    engine = TaskAssignmentEngine()
+    shares = engine.plan(tiles, [(employee.x, employee.y) for employee in employees])
+    for employee, share in zip(employees, shares):
+        ...  # share: that employee's tiles in walking order (may be empty)
+"""
+
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+from scripts.core.config import ASSIGNMENT_2OPT_MAX_TILES, ASSIGNMENT_2OPT_MAX_PASSES
+
+
+class TaskAssignmentEngine:
+    """Clusters, matches and orders selected tiles for a crew"""
+    
+    def __init__(self):
+        """Initialize travel statistics"""
+        self.plans = 0
+        self.last_travel = 0  # Tiles walked by the whole crew in the last plan
+    
+    def plan(self, tiles: List, starts: Sequence[Tuple[float, float]]) -> List[List]:
+        """
+        Split tiles into one walking-ordered share per employee
+        
+        Args:
+            tiles: Tiles with x and y attributes
+            starts: Position each employee sets off from, one per employee
+        
+        Returns:
+            One list of tiles per start, in visiting order (empty when there are
+            fewer tiles than employees)
+        """
+        shares = [[] for _ in starts]
+        if not tiles or not starts:
+            return shares
+        
+        coords = np.array([(tile.x, tile.y) for tile in tiles], dtype=np.int64)
+        origins = np.rint(np.asarray(starts, dtype=np.float64)).astype(np.int64)
+        clusters = sweep_clusters(coords, min(len(starts), len(tiles)))
+        
+        # Entry cost: distance from each employee to the nearest tile of each cluster
+        cost = np.empty((len(clusters), len(origins)), dtype=np.int64)
+        for row, members in enumerate(clusters):
+            cost[row] = manhattan(coords[members][:, None, :], origins[None, :, :]).min(axis=0)
+        owners = hungarian(cost)
+        
+        travel = 0
+        for members, owner in zip(clusters, owners):
+            order, length = order_tour(origins[owner], coords[members])
+            shares[owner] = [tiles[index] for index in members[order]]
+            travel += length
+        
+        self.plans += 1
+        self.last_travel = travel
+        return shares
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Number of plans and the crew's walking distance in the last one"""
+        return {'plans': self.plans, 'last_travel': self.last_travel}
+
+
+def manhattan(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Grid walking distance between broadcastable (..., 2) coordinate arrays"""
+    return np.abs(a - b).sum(axis=-1)
+
+
+def sweep_clusters(coords: np.ndarray, count: int) -> List[np.ndarray]:
+    """
+    Split points into count compact clusters of near-equal size
+    
+    Each split sorts the points along the longer side of their bounding box and
+    cuts where the share of points matches the share of clusters on each side.
+    
+    Returns:
+        Index arrays into coords, one per cluster
+    """
+    clusters = []
+    pending = [(np.arange(len(coords)), count)]
+    while pending:
+        members, parts = pending.pop()
+        if parts == 1:
+            clusters.append(members)
+            continue
+        
+        points = coords[members]
+        spans = points.max(axis=0) - points.min(axis=0)
+        axis = 0 if spans[0] >= spans[1] else 1
+        members = members[np.lexsort((points[:, 1 - axis], points[:, axis]))]
+        left_parts = parts // 2
+        cut = (len(members) * left_parts + parts // 2) // parts  # Rounded proportional cut
+        pending.append((members[cut:], parts - left_parts))
+        pending.append((members[:cut], left_parts))
+    return clusters
+
+
+def hungarian(cost: np.ndarray) -> List[int]:
+    """
+    Minimum-cost assignment of every row to a distinct column (rows <= columns)
+    
+    Shortest augmenting path version of the Hungarian algorithm with row and column
+    potentials, O(rows^2 * columns), with the inner column scans vectorized.
+    
+    Returns:
+        Column chosen for each row
+    """
+    rows, columns = cost.shape
+    cost = cost.astype(np.float64)
+    row_potential = np.zeros(rows + 1)
+    column_potential = np.zeros(columns + 1)
+    column_row = np.zeros(columns + 1, dtype=np.intp)  # 1-based row matched to each column (0 = free)
+    previous = np.zeros(columns + 1, dtype=np.intp)  # Column before each one on the augmenting path
+    
+    for row in range(1, rows + 1):
+        column_row[0] = row
+        column = 0
+        slack = np.full(columns + 1, np.inf)
+        used = np.zeros(columns + 1, dtype=bool)
+        while True:
+            used[column] = True
+            current_row = column_row[column]
+            reduced = cost[current_row - 1] - row_potential[current_row] - column_potential[1:]
+            free = ~used[1:]
+            better = free & (reduced < slack[1:])
+            slack[1:][better] = reduced[better]
+            previous[1:][better] = column
+            
+            candidates = np.where(free, slack[1:], np.inf)
+            next_column = int(np.argmin(candidates)) + 1
+            delta = candidates[next_column - 1]
+            row_potential[column_row[used]] += delta
+            column_potential[used] -= delta
+            slack[~used] -= delta
+            column = next_column
+            if column_row[column] == 0:
+                break
+        
+        # Flip the augmenting path
+        while column:
+            prior = previous[column]
+            column_row[column] = column_row[prior]
+            column = prior
+    
+    assignment = [0] * rows
+    for column in range(1, columns + 1):
+        if column_row[column]:
+            assignment[column_row[column] - 1] = column - 1
+    return assignment
+
+
+def order_tour(origin: np.ndarray, points: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Short open walk from origin through every point
+    
+    Returns:
+        (visiting order as indices into points, walking distance)
+    """
+    remaining = np.ones(len(points), dtype=bool)
+    order = np.empty(len(points), dtype=np.intp)
+    position = origin
+    for step in range(len(points)):
+        distances = np.where(remaining, manhattan(points, position), np.iinfo(np.int64).max)
+        nearest = int(np.argmin(distances))
+        order[step] = nearest
+        remaining[nearest] = False
+        position = points[nearest]
+    
+    if len(points) <= ASSIGNMENT_2OPT_MAX_TILES:
+        order = _two_opt(origin, points, order)
+    
+    walk = np.vstack((origin[None, :], points[order]))
+    return order, int(manhattan(walk[1:], walk[:-1]).sum())
+
+
+def _two_opt(origin: np.ndarray, points: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Reverse segments of an open walk (start fixed, end free) while that shortens it"""
+    for _ in range(ASSIGNMENT_2OPT_MAX_PASSES):
+        improved = False
+        walk = np.vstack((origin[None, :], points[order]))
+        count = len(walk)
+        for i in range(1, count - 1):
+            # Reversing walk[i..j] swaps edges (i-1, i) and (j, j+1) for (i-1, j) and (i, j+1)
+            ends = walk[i + 1:]
+            after = np.vstack((walk[i + 2:], walk[-1:]))  # Stand-in for j + 1 past the end
+            gain = (manhattan(walk[i - 1], walk[i]) + manhattan(ends, after)
+                    - manhattan(walk[i - 1], ends) - manhattan(walk[i], after))
+            gain[-1] = manhattan(walk[i - 1], walk[i]) - manhattan(walk[i - 1], walk[-1])  # j is the last tile
+            best = int(np.argmax(gain))
+            if gain[best] > 0:
+                j = i + 1 + best
+                walk[i:j + 1] = walk[i:j + 1][::-1].copy()
+                order[i - 1:j] = order[i - 1:j][::-1].copy()
+                improved = True
+        if not improved:
+            break
+    return order
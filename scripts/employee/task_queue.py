@@ -0,0 +1,162 @@
+"""
+Task Queue - Employee tasks with constant-time tile bookkeeping
+
+A Task keeps the tiles still to be worked in an ordered set (an insertion-ordered
+dict), so taking the next tile, completing it, cancelling any tile and handing
+the last tiles of the walk to someone else each cost O(1) no matter how many
+tiles the task holds. A TaskIndex shared by the whole crew maps every queued
+tile to the task holding it (and the task to its employee), so cancelling a
+selection touches only the cancelled tiles instead of every employee's queue.
+
+Key Features:
+- Task.next_tile() / complete() / discard() / pop_tail() in O(1) per tile
+- Tasks register their pending tiles with a TaskIndex and unregister them as
+  they are completed, discarded or handed back
+- to_dict() / from_dict() keep the task dictionary layout used by save files
+  ('type', 'tiles', 'completed_tiles', 'status' plus parameters like crop_type)
+
+Usage:
+    index = TaskIndex()
+    task = Task('plant', tiles, employee, index, crop_type='corn')
+    tile = task.next_tile()
+    task.complete(tile)
+    employee, task = index.lookup(other_tile)
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class Task:
+    """One queued job: a task type worked over tiles in order"""
+    
+    __slots__ = ('type', 'params', 'pending', 'completed_tiles', 'status', 'employee', 'index')
+    
+    def __init__(self, task_type: str, tiles: Iterable, employee=None, index: Optional['TaskIndex'] = None, **params):
+        """
+        Create a pending task and register its tiles
+        
+        Args:
+            task_type: 'till', 'plant' or 'harvest'
+            tiles: Tiles in working order (duplicates are worked once)
+            employee: Employee holding the task
+            index: Crew-wide reverse index to register the tiles with
+            **params: Task parameters such as crop_type
+        """
+        self.type = task_type
+        self.params = params
+        self.pending: Dict = dict.fromkeys(tiles)  # Ordered set of tiles still to work
+        self.completed_tiles: List = []
+        self.status = 'pending'  # 'pending', 'in_progress' or 'completed'
+        self.employee = employee
+        self.index = index
+        if index is not None:
+            index.register(self, self.pending)
+    
+    @property
+    def tiles(self) -> List:
+        """Every tile still on the task: completed ones first, then those left in working order"""
+        return self.completed_tiles + list(self.pending)
+    
+    @property
+    def remaining(self) -> int:
+        """Number of tiles still to work"""
+        return len(self.pending)
+    
+    def next_tile(self):
+        """Tile to work next, or None when none are left"""
+        return next(iter(self.pending), None)
+    
+    def last_tile(self):
+        """Tile at the end of the walk, or None when none are left"""
+        return next(reversed(self.pending), None)
+    
+    def complete(self, tile) -> bool:
+        """Mark a pending tile as worked; False if the tile is not pending on this task"""
+        if tile not in self.pending:
+            return False
+        del self.pending[tile]
+        self.completed_tiles.append(tile)
+        if self.index is not None:
+            self.index.unregister(self, tile)
+        return True
+    
+    def discard(self, tile) -> bool:
+        """Drop a pending tile without working it; False if the tile is not pending on this task"""
+        if tile not in self.pending:
+            return False
+        del self.pending[tile]
+        if self.index is not None:
+            self.index.unregister(self, tile)
+        return True
+    
+    def pop_tail(self, count: int) -> List:
+        """Remove and return up to count tiles from the end of the walk, in working order"""
+        tail = []
+        while self.pending and len(tail) < count:
+            tile, _ = self.pending.popitem()
+            if self.index is not None:
+                self.index.unregister(self, tile)
+            tail.append(tile)
+        tail.reverse()
+        return tail
+    
+    def cancel(self) -> List:
+        """Drop every pending tile and return them in working order"""
+        return self.pop_tail(len(self.pending))
+    
+    def to_dict(self) -> Dict:
+        """Task in the dictionary layout of save files (tiles as Tile objects)"""
+        return {
+            'type': self.type,
+            'tiles': self.tiles,
+            'completed_tiles': list(self.completed_tiles),
+            'status': self.status,
+            **self.params
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict, employee=None, index: Optional['TaskIndex'] = None) -> 'Task':
+        """Rebuild a task from its dictionary layout (tiles as Tile objects)"""
+        params = {key: value for key, value in data.items()
+                  if key not in ('type', 'tiles', 'completed_tiles', 'status')}
+        completed = set(data.get('completed_tiles', []))
+        task = cls(data['type'], [tile for tile in data.get('tiles', []) if tile not in completed],
+                   employee, index, **params)
+        task.completed_tiles = list(data.get('completed_tiles', []))
+        task.status = data.get('status', 'pending')
+        return task
+
+
+class TaskIndex:
+    """Reverse index from every queued tile to the task holding it"""
+    
+    def __init__(self):
+        """Initialize an empty index"""
+        self.tasks: Dict[object, Task] = {}  # Tile -> task (the latest one if a tile was queued twice)
+    
+    def __len__(self) -> int:
+        return len(self.tasks)
+    
+    def __contains__(self, tile) -> bool:
+        return tile in self.tasks
+    
+    def register(self, task: Task, tiles: Iterable):
+        """Point tiles at the task now holding them"""
+        for tile in tiles:
+            self.tasks[tile] = task
+    
+    def unregister(self, task: Task, tile):
+        """Forget a tile unless another task has queued it since"""
+        if self.tasks.get(tile) is task:
+            del self.tasks[tile]
+    
+    def lookup(self, tile) -> Optional[Tuple[object, Task]]:
+        """(employee, task) holding a queued tile, or None"""
+        task = self.tasks.get(tile)
+        if task is None:
+            return None
+        return task.employee, task
+    
+    def clear(self):
+        """Forget every queued tile"""
+        self.tasks.clear()
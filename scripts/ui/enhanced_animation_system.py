@@ -387,6 +387,12 @@ class PropertyAnimation:
 class Particle:
     """Individual particle for visual effects"""
     
+    __slots__ = (
+        'x', 'y', 'velocity_x', 'velocity_y', 'acceleration_x', 'acceleration_y',
+        'color', 'size', 'initial_size', 'life_span', 'age', 'is_alive',
+        'fade_rate', 'size_change_rate', 'gravity'
+    )
+    
     def __init__(self, x: float, y: float, velocity_x: float = 0.0, velocity_y: float = 0.0,
                  life_span: float = 1.0, color: Tuple[int, int, int, int] = (255, 255, 255, 255),
                  size: float = 2.0):
@@ -168,8 +168,8 @@ class EnhancedGridRenderer:
         """Clamp pan offset to prevent panning too far off the grid"""
         # Calculate grid bounds in screen coordinates
         scaled_tile_size = TILE_SIZE * self.zoom_factor
-        grid_width = GRID_WIDTH * scaled_tile_size
-        grid_height = GRID_HEIGHT * scaled_tile_size
+        grid_width = self.grid_manager.width * scaled_tile_size
+        grid_height = self.grid_manager.height * scaled_tile_size
         
         # Allow some off-screen panning but not too much
         margin = 100  # Allow 100 pixels off-screen
@@ -214,8 +214,8 @@ class EnhancedGridRenderer:
         grid_y = int(world_y // TILE_SIZE)
         
         # Check bounds
-        if 0 <= grid_x < GRID_WIDTH and 0 <= grid_y < GRID_HEIGHT:
-            return self.grid_manager.grid[grid_y][grid_x]
+        if 0 <= grid_x < self.grid_manager.width and 0 <= grid_y < self.grid_manager.height:
+            return self.grid_manager.get_tile(grid_x, grid_y)
         
         return None
     
@@ -251,7 +251,11 @@ class EnhancedGridRenderer:
         self._render_viewport_info(screen)
     
     def _calculate_visible_tiles(self) -> Dict[str, int]:
-        """Calculate which tiles are visible in the current viewport"""
+        """Calculate which tiles are visible in the current viewport
+        
+        Only this window is rendered, so the per-frame cost depends on the
+        viewport and zoom rather than the farm size.
+        """
         scaled_tile_size = TILE_SIZE * self.zoom_factor
         
         # Calculate start and end tile indices
@@ -261,8 +265,8 @@ class EnhancedGridRenderer:
         tiles_per_screen_x = int(self.available_width / scaled_tile_size) + 2
         tiles_per_screen_y = int(self.available_height / scaled_tile_size) + 2
         
-        end_x = min(GRID_WIDTH, start_x + tiles_per_screen_x)
-        end_y = min(GRID_HEIGHT, start_y + tiles_per_screen_y)
+        end_x = min(self.grid_manager.width, start_x + tiles_per_screen_x)
+        end_y = min(self.grid_manager.height, start_y + tiles_per_screen_y)
         
         return {
             'start_x': start_x,
@@ -275,29 +279,33 @@ class EnhancedGridRenderer:
         """Render the base grid with enhanced tile visualization"""
         scaled_tile_size = int(TILE_SIZE * self.zoom_factor)
         
-        for y in range(visible_tiles['start_y'], visible_tiles['end_y']):
-            for x in range(visible_tiles['start_x'], visible_tiles['end_x']):
-                tile = self.grid_manager.grid[y][x]
-                
-                # Calculate screen position
-                screen_x = int(x * scaled_tile_size + self.pan_offset_x)
-                screen_y = int(y * scaled_tile_size + self.pan_offset_y + self.hud_height)
-                
-                # Create tile rectangle
-                tile_rect = pygame.Rect(screen_x, screen_y, scaled_tile_size, scaled_tile_size)
-                
-                # Get enhanced tile color
-                color = self._get_enhanced_tile_color(tile)
-                
-                # Draw tile
-                pygame.draw.rect(screen, color, tile_rect)
-                
-                # Draw grid lines with transparency
-                grid_color = (*COLORS['grid_line'], self.grid_line_alpha)
-                pygame.draw.rect(screen, COLORS['grid_line'], tile_rect, max(1, int(self.zoom_factor)))
-                
-                # Render tile-specific indicators
-                self._render_tile_indicators(screen, tile, tile_rect)
+        for tile in self._iter_visible_tiles(visible_tiles):
+            x, y = tile.x, tile.y
+            
+            # Calculate screen position
+            screen_x = int(x * scaled_tile_size + self.pan_offset_x)
+            screen_y = int(y * scaled_tile_size + self.pan_offset_y + self.hud_height)
+            
+            # Create tile rectangle
+            tile_rect = pygame.Rect(screen_x, screen_y, scaled_tile_size, scaled_tile_size)
+            
+            # Get enhanced tile color
+            color = self._get_enhanced_tile_color(tile)
+            
+            # Draw tile
+            pygame.draw.rect(screen, color, tile_rect)
+            
+            # Draw grid lines with transparency
+            grid_color = (*COLORS['grid_line'], self.grid_line_alpha)
+            pygame.draw.rect(screen, COLORS['grid_line'], tile_rect, max(1, int(self.zoom_factor)))
+            
+            # Render tile-specific indicators
+            self._render_tile_indicators(screen, tile, tile_rect)
+    
+    def _iter_visible_tiles(self, visible_tiles: Dict[str, int]):
+        """Iterate over visible tiles chunk by chunk"""
+        return self.grid_manager.iter_tiles_in_rect(visible_tiles['start_x'], visible_tiles['start_y'],
+                                                    visible_tiles['end_x'], visible_tiles['end_y'])
     
     def _get_enhanced_tile_color(self, tile) -> Tuple[int, int, int]:
         """Get enhanced color for tile based on state and zoom level"""
@@ -305,8 +313,8 @@ class EnhancedGridRenderer:
         base_color = tile.get_color()
         
         # Enhance color based on soil health if zoomed in enough
-        if self.zoom_factor > 1.5 and hasattr(tile, 'soil_quality'):
-            soil_health = getattr(tile, 'soil_quality', 5)
+        if self.zoom_factor > 1.5:
+            soil_health = tile.soil_quality
             health_color = self.soil_health_colors.get(soil_health, base_color)
             
             # Blend base color with health color
@@ -373,7 +381,7 @@ class EnhancedGridRenderer:
             return
         
         # Show growth stage as small bars
-        stage = getattr(tile, 'growth_stage', 0)
+        stage = tile.growth_stage
         max_stages = 5
         
         bar_width = max(1, int(2 * self.zoom_factor))
@@ -396,19 +404,14 @@ class EnhancedGridRenderer:
         
         scaled_tile_size = int(TILE_SIZE * self.zoom_factor)
         
-        for y in range(visible_tiles['start_y'], visible_tiles['end_y']):
-            for x in range(visible_tiles['start_x'], visible_tiles['end_x']):
-                tile = self.grid_manager.grid[y][x]
-                
-                if hasattr(tile, 'soil_quality'):
-                    soil_health = getattr(tile, 'soil_quality', 5)
-                    color = (*self.soil_health_colors[soil_health], 100)  # Semi-transparent
-                    
-                    screen_x = int(x * scaled_tile_size + self.pan_offset_x)
-                    screen_y = int(y * scaled_tile_size + self.pan_offset_y)
-                    
-                    tile_rect = pygame.Rect(screen_x, screen_y, scaled_tile_size, scaled_tile_size)
-                    pygame.draw.rect(overlay, color, tile_rect)
+        for tile in self._iter_visible_tiles(visible_tiles):
+            color = (*self.soil_health_colors[tile.soil_quality], 100)  # Semi-transparent
+            
+            screen_x = int(tile.x * scaled_tile_size + self.pan_offset_x)
+            screen_y = int(tile.y * scaled_tile_size + self.pan_offset_y)
+            
+            tile_rect = pygame.Rect(screen_x, screen_y, scaled_tile_size, scaled_tile_size)
+            pygame.draw.rect(overlay, color, tile_rect)
         
         screen.blit(overlay, (0, self.hud_height))
     
@@ -435,10 +438,10 @@ class EnhancedGridRenderer:
         if not hasattr(self.grid_manager, 'selected_tiles'):
             return
         
-        # Render selection highlights
-        for tile in self.grid_manager.selected_tiles:
-            if hasattr(tile, 'highlight') and tile.highlight:
-                self._render_tile_selection_highlight(screen, tile)
+        # Render selection highlights (only the selected tiles inside the viewport)
+        for tile in self.grid_manager.selected_tiles.iter_in_rect(visible_tiles['start_x'], visible_tiles['start_y'],
+                                                                  visible_tiles['end_x'], visible_tiles['end_y']):
+            self._render_tile_selection_highlight(screen, tile)
         
         # Render drag selection rectangle if active
         if hasattr(self.grid_manager, 'drag_start_pos') and self.grid_manager.drag_start_pos and \
@@ -492,7 +492,7 @@ class DynamicRightPanel:
         
         # Current task information
         current_task = getattr(employee, 'current_task', None)
-        task_text = "Current Task: " + (current_task if current_task else "Idle")
+        task_text = "Current Task: " + (current_task.type.title() if current_task else "Idle")
         task_label = pygame_gui.elements.UILabel(
             relative_rect=pygame.Rect(10, y_pos, panel_rect.width - 20, element_height),
             text=task_text,
@@ -13,6 +13,7 @@ import pygame
 import pygame_gui
 from typing import Dict, Any, List, Optional, Tuple
 from scripts.core.config import *
+from scripts.core.tile_selection import TileSelection
 
 
 class SmartActionButton:
@@ -186,6 +187,9 @@ class SmartActionSystem:
     
     def _analyze_selected_tiles(self) -> Dict[str, int]:
         """Analyze selected tiles to determine their states"""
+        if isinstance(self.selected_tiles, TileSelection):
+            return self._analyze_tile_selection(self.selected_tiles)
+        
         analysis = {
             'total_count': len(self.selected_tiles),
             'untilled_count': 0,
@@ -224,6 +228,21 @@ class SmartActionSystem:
         
         return analysis
     
+    def _analyze_tile_selection(self, selection: TileSelection) -> Dict[str, int]:
+        """Analyze a rectangle selection from its index-backed summary (no per-tile walk)"""
+        summary = selection.summary()
+        untilled = summary['soil'] + summary['buildings']
+        return {
+            'total_count': summary['total'],
+            'untilled_count': untilled,
+            'tilled_empty_count': summary['tilled_empty'],
+            'planted_count': summary['planted'],
+            'harvestable_count': summary['harvestable'],
+            'can_irrigate_count': summary['total'] - summary['irrigated'],
+            'can_fertilize_count': summary['tilled_empty'],
+            'can_clear_count': untilled + summary['tilled_empty']
+        }
+    
     def _rebuild_action_buttons(self):
         """Rebuild the action button UI elements"""
         # Clear existing buttons
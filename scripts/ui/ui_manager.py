@@ -18,10 +18,11 @@ from scripts.ui.notification_system import NotificationManager, NotificationFact
 class UIManager:
     """Main UI controller"""
     
-    def __init__(self, event_system, screen):
+    def __init__(self, event_system, screen, grid_manager=None):
         """Initialize the UI manager"""
         self.event_system = event_system
         self.screen = screen
+        self.grid_manager = grid_manager  # Farm dimensions for the debug overlay
         self.screen_rect = screen.get_rect()
         
         # Initialize pygame-gui manager with custom theme for better contrast
@@ -1470,10 +1471,16 @@ class UIManager:
         """Render debug information overlay"""
         font = pygame.font.Font(None, 24)
         
+        # Chunked farms can be far larger than the configured default grid
+        if self.grid_manager:
+            grid_width, grid_height = self.grid_manager.width, self.grid_manager.height
+        else:
+            grid_width, grid_height = GRID_WIDTH, GRID_HEIGHT
+        
         debug_lines = [
             f"FPS: {int(pygame.time.Clock().get_fps())}",
             f"Events queued: {self.event_system.get_queue_size()}",
-            f"Grid size: {GRID_WIDTH}x{GRID_HEIGHT}",
+            f"Grid size: {grid_width}x{grid_height}",
             "Movement: Direct movement (performance optimized)",
             "Green lines = movement direction",
             "Yellow circles = movement targets",
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test script for chunked large-map grid storage
+
+Verifies that a 1024x1024 farm allocates chunks lazily, that growth, building
+lookups and saving only visit allocated chunks, and that a saved farm restores.
+"""
+
+import sys
+import os
+import random
+from types import SimpleNamespace
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.core.save_manager import SaveManager
+
+
+def test_chunked_grid():
+    """Test lazy chunk allocation and chunk-level passes on a large farm"""
+    print("=== Testing Chunked Large-Map Grid ===\n")
+    
+    event_system = EventSystem()
+    grid_manager = GridManager(event_system, width=MAX_GRID_SIZE, height=MAX_GRID_SIZE)
+    chunked_grid = grid_manager.chunked_grid
+    
+    # Test 1: Nothing is allocated until a tile is touched
+    assert chunked_grid.allocated_count == 0
+    assert chunked_grid.chunks_x == MAX_GRID_SIZE // CHUNK_SIZE
+    far_tile = grid_manager.get_tile(1000, 1020)
+    assert far_tile is not None and chunked_grid.allocated_count == 1
+    assert grid_manager.get_tile(MAX_GRID_SIZE, 0) is None
+    print(f"[OK] Test 1: {MAX_GRID_SIZE}x{MAX_GRID_SIZE} farm starts with {chunked_grid.allocated_count} chunk after one access")
+    
+    # Test 2: Growth runs per chunk
+    near_tile = grid_manager.get_tile(5, 5)
+    for tile in (near_tile, far_tile):
+        tile.till()
+        tile.plant('wheat')
+    grid_manager._handle_day_passed({'days': 1})
+    assert near_tile.can_harvest() and far_tile.can_harvest()
+    print("[OK] Test 2: Crops in separate chunks both matured")
+    
+    # Test 3: Building lookups span chunks
+    grid_manager.place_building_at(40, 40, 'storage_silo')
+    grid_manager.place_building_at(900, 10, 'storage_silo')
+    assert sorted(grid_manager.find_buildings_of_type('storage_silo')) == [(40, 40), (900, 10)]
+    assert grid_manager.find_nearest_building(890, 12, 'storage_silo') == (900, 10)
+    print(f"[OK] Test 3: Found silos across {chunked_grid.allocated_count} allocated chunks")
+    
+    # Test 4: Visible-area iteration only allocates viewport chunks
+    visible = list(grid_manager.iter_tiles_in_rect(100, 100, 140, 120))
+    assert len(visible) == 40 * 20
+    assert len({(tile.x, tile.y) for tile in visible}) == len(visible)
+    print(f"[OK] Test 4: Viewport iteration touched {len(visible)} tiles")
+    
+    # Test 5: Save only writes allocated chunks and restores them
+    save_manager = SaveManager.__new__(SaveManager)
+    save_manager.game_manager = SimpleNamespace(grid_manager=grid_manager)
+    grid_state = save_manager._get_grid_manager_state()
+    assert len(grid_state['chunks']) == chunked_grid.allocated_count
+    
+    restored = GridManager(EventSystem(), width=MAX_GRID_SIZE, height=MAX_GRID_SIZE)
+    save_manager.game_manager = SimpleNamespace(grid_manager=restored)
+    save_manager._apply_grid_manager_state(grid_state)
+    restored_tile = restored.get_tile(1000, 1020)
+    assert restored_tile.current_crop == 'wheat' and restored_tile.can_harvest()
+    assert restored.get_tile(900, 10).building_type == 'storage_silo'
+    assert restored.chunked_grid.allocated_count == chunked_grid.allocated_count
+    print(f"[OK] Test 5: Saved and restored {len(grid_state['chunks'])} chunks")
+    
+    # Test 6: Bucketed nearest-building search matches a brute-force scan
+    rng = random.Random(7)
+    for _ in range(60):
+        restored.place_building_at(rng.randrange(0, 300), rng.randrange(0, 300), 'water_cooler', object())
+    coolers = restored.find_buildings_of_type('water_cooler')
+    for _ in range(50):
+        qx, qy = rng.randrange(0, 320), rng.randrange(0, 320)
+        nearest = restored.find_nearest_building(qx, qy, 'water_cooler')
+        best = min(abs(qx - bx) + abs(qy - by) for bx, by in coolers)
+        assert abs(qx - nearest[0]) + abs(qy - nearest[1]) == best
+        within = restored.find_buildings_within(qx, qy, 'water_cooler', 20)
+        assert sorted(within) == sorted(b for b in coolers if abs(qx - b[0]) + abs(qy - b[1]) <= 20)
+    restored.remove_building_at(*coolers[0])
+    assert coolers[0] not in restored.find_buildings_within(coolers[0][0], coolers[0][1], 'water_cooler', 0)
+    print(f"[OK] Test 6: Nearest-building index agrees with brute force over {len(coolers)} coolers")
+    
+    # Test 7: Rectangle selections count, summarize and assign without walking every tile
+    selection = restored.selected_tiles
+    chunks_before = restored.chunked_grid.allocated_count
+    selection.set_rect(0, 0, 800, 800)
+    assert len(selection) == 800 * 800 and restored.chunked_grid.allocated_count == chunks_before
+    assert not selection.set_rect(0, 0, 800, 800)  # Same drag rectangle is a no-op
+    selection.add_rect(700, 700, 1001, 1100)  # Overlap counted once, clipped to the grid
+    assert len(selection) == 800 * 800 + 301 * 324 - 100 * 100
+    summary = selection.summary()
+    assert summary['total'] == len(selection) and summary['harvestable'] == summary['planted'] == 2
+    assert summary['buildings'] == len(restored.find_buildings_of_type('water_cooler')) + 1  # Plus the silo at (40, 40)
+    
+    ripe = restored.get_tile(1000, 1020)
+    assert ripe in selection and ripe.highlight and restored.get_tile(1000, 0) not in selection
+    assert selection.count_in(restored.tile_index.harvestable) == 2
+    assert restored.assign_task_to_selection('harvest', 'emp_1') == 2
+    assert sorted((tile.x, tile.y) for tile in restored.get_tasked_tiles('harvest')) == [(5, 5), (1000, 1020)]
+    
+    selection.set_rect(5, 5, 8, 7)
+    assert [(tile.x, tile.y) for tile in selection] == [(x, y) for y in range(5, 7) for x in range(5, 8)]
+    tillable = sum(1 for tile in selection if tile.can_till())
+    assert tillable == 5 and restored.assign_task_to_selection('till', 'emp_1') == tillable  # (5, 5) is planted
+    assert not ripe.highlight and restored.get_tile(6, 6).highlight
+    announced = []
+    restored.event_system.subscribe('tiles_selected', announced.append)
+    restored.event_system.subscribe('selection_cleared', announced.append)
+    restored.drag_start_pos = (0, 0)
+    restored.handle_mouse_up((0, 0), 1)  # Ending the drag hands the selection itself to the smart actions
+    restored._clear_selection()
+    restored.event_system.process_events()
+    assert len(announced) == 2 and announced[0]['tiles'] is selection and restored.drag_start_pos is None
+    assert len(selection) == 0 and not restored.get_tile(6, 6).highlight
+    print(f"[OK] Test 7: Selections counted {summary['total']} tiles across the farm without materializing them")
+    
+    print("\n[SUCCESS] All chunked grid tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_chunked_grid()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for scheduled employee decisions in batched crews
+
+Verifies that employees compute when their next decision is due (work done, rest
+break over, a need crossing a threshold), that a scheduled crew plays out exactly
+like one whose every employee runs its AI every tick, that most of a busy crew
+sleeps between decisions, and that the sleeping crew is cheaper per frame.
+"""
+
+import sys
+import os
+import io
+import time
+import random
+import contextlib
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.employee.employee import EmployeeState
+from scripts.employee.employee_manager import EmployeeManager
+
+
+def build_crew(scheduling, count, seed=7):
+    """Batched crew tilling rows of a big farm, with a few resters and needy workers"""
+    grid_manager = GridManager(EventSystem(), width=128, height=128)
+    grid_manager.place_building_at(60, 60, 'water_cooler', object())
+    manager = EmployeeManager(grid_manager.event_system, grid_manager, create_starting_employee=False)
+    manager.batch_min_employees = 0
+    manager.decision_scheduling = scheduling
+    rng = random.Random(seed)
+    for number in range(count):
+        employee = manager.employees[manager.hire_employee(f"Worker {number}", ['hard_worker'] if number % 5 == 0 else [])]
+        x, y = number % 120, (number // 120) * 4
+        employee.x, employee.y = float(x), float(y)
+        if number % 10 == 9:
+            employee.rest = 9.0  # Takes a rest break
+            continue
+        employee.thirst = rng.uniform(30.0, 30.2)  # Some go looking for the cooler mid-run
+        row = [grid_manager.get_tile(x, y + offset) for offset in range(4)]
+        for tile in row:
+            tile.task_assignment, tile.task_assigned_to = 'till', employee.id
+        manager.assign_task_to_employee(employee.id, 'till', row)
+    return grid_manager, manager
+
+
+def run(manager, ticks, dt=0.05):
+    """Advance the crew, timing the frames with console output discarded"""
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(ticks):
+            manager.update(dt)
+            manager.event_system.process_events()
+    return (time.perf_counter() - started) * 1000 / ticks
+
+
+def test_decision_scheduling():
+    """Test decision delays, exactness against per-tick AI, sleeping share and cost"""
+    print("=== Testing Scheduled Employee Decisions ===\n")
+    
+    # Test 1: Delays follow work time, rest breaks and need decay rates
+    grid_manager, manager = build_crew(True, 10)
+    crew = list(manager.employees.values())
+    worker, rester = crew[0], crew[9]  # The tenth employee has no task
+    worker._move_to_tile(worker.current_task.next_tile().x, worker.current_task.next_tile().y)
+    worker.state = EmployeeState.WORKING
+    worker.state_timer = 1.0
+    assert abs(worker.next_decision_delay(grid_manager) - (worker._work_time_needed(grid_manager) - 1.0)) < 1e-9
+    rester.state = EmployeeState.RESTING
+    rester.state_timer = 10.0
+    assert rester.next_decision_delay(grid_manager) == (50 - 9.0) * 3600.0 / (REST_DECAY_RATE * 2)
+    rester.rest = 60.0
+    assert rester.next_decision_delay(grid_manager) == 20.0
+    rester.state = EmployeeState.IDLE
+    rester.thirst, rester.hunger = 40.0, 100.0
+    assert rester.next_decision_delay(grid_manager) == (40.0 - 30) * 3600.0 / THIRST_DECAY_RATE
+    print(f"[OK] Test 1: Work, rest break and thirst delays computed ({rester.next_decision_delay(grid_manager):.0f}s until thirsty)")
+    
+    # Test 2: A scheduled crew plays out exactly like per-tick AI
+    _, every_tick = build_crew(False, 300)
+    _, scheduled = build_crew(True, 300)
+    run(every_tick, 500)
+    run(scheduled, 500)
+    pairs = list(zip(every_tick.employees.values(), scheduled.employees.values()))
+    for a, b in pairs:
+        assert a.state == b.state and (a.x, a.y) == (b.x, b.y) and a.state_timer == b.state_timer
+        assert (a.hunger, a.thirst, a.rest) == (b.hunger, b.thirst, b.rest)
+        assert ([[(tile.x, tile.y) for tile in task.tiles] for task in a.assigned_tasks] ==
+                [[(tile.x, tile.y) for tile in task.tiles] for task in b.assigned_tasks])
+    states = {state.value: sum(1 for _, b in pairs if b.state == state) for state in EmployeeState}
+    print(f"[OK] Test 2: {len(pairs)} employees matched per-tick AI after 500 ticks ({states})")
+    
+    # Test 3: Most of a working crew sleeps between decisions
+    store = scheduled.employee_store
+    slots = store.sync(list(scheduled.employees.values()))
+    asleep = int((store.wake_at[slots] > scheduled.sim_time).sum())
+    assert asleep > len(slots) * 0.5
+    print(f"[OK] Test 3: {asleep} of {len(slots)} employees asleep until their next decision")
+    
+    # Test 4: Scheduled frames cost less than running every employee's AI
+    _, every_tick = build_crew(False, 2000)
+    _, scheduled = build_crew(True, 2000)
+    run(every_tick, 40)
+    run(scheduled, 40)  # Warm up: crews arrive and start working
+    slow = run(every_tick, 100)
+    fast = run(scheduled, 100)
+    assert fast < slow
+    print(f"[OK] Test 4: 2000 employees at {fast:.1f} ms/frame instead of {slow:.1f} ms/frame")
+    
+    print("\n[SUCCESS] All decision scheduling tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_decision_scheduling()
+    if not success:
+        sys.exit(1)
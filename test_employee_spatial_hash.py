@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the employee spatial hash
+
+Verifies that rectangle, radius and nearest-employee queries agree with a linear
+scan, that the hash follows employees as they walk and as the crew is hired and
+fired, that picking at a pixel honours the renderer's zoom and pan (and clicks
+select the employee), and that rendering only draws employees in the viewport.
+"""
+
+import sys
+import os
+import io
+import math
+import random
+import contextlib
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+import pygame
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.employee.employee import Employee
+from scripts.employee.employee_manager import EmployeeManager
+
+
+def build_crew(count, seed=5):
+    """Crew scattered over a 128x128 farm"""
+    grid_manager = GridManager(EventSystem(), width=128, height=128)
+    manager = EmployeeManager(grid_manager.event_system, grid_manager, create_starting_employee=False)
+    rng = random.Random(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for number in range(count):
+            employee = manager.employees[manager.hire_employee(f"Worker {number}")]
+            employee.x, employee.y = rng.uniform(0, 127), rng.uniform(0, 127)
+    manager.refresh_employee_positions()
+    return grid_manager, manager, rng
+
+
+def test_employee_spatial_hash():
+    """Test hash queries, movement tracking, pixel picking and viewport culling"""
+    print("=== Testing Employee Spatial Hash ===\n")
+    pygame.init()
+    
+    # Test 1: Queries agree with a linear scan over the crew
+    grid_manager, manager, rng = build_crew(500)
+    crew = list(manager.employees.values())
+    for _ in range(100):
+        x, y = rng.uniform(0, 127), rng.uniform(0, 127)
+        expected = min(crew, key=lambda employee: (math.hypot(employee.x - x, employee.y - y), employee.y, employee.x))
+        assert manager.nearest_employee(x, y) is expected
+        inside = {employee.id for employee in crew if x <= employee.x <= x + 20 and y <= employee.y <= y + 10}
+        assert {employee.id for employee in manager.employees_in_rect(x, y, x + 20, y + 10)} == inside
+        near = {employee.id for employee in crew if math.hypot(employee.x - x, employee.y - y) <= 6}
+        assert {employee.id for employee in manager.employees_near(x, y, 6)} == near
+    assert manager.nearest_employee(0, 0, predicate=lambda employee: employee.name == "Worker 7") is manager.employees['emp_008']
+    print(f"[OK] Test 1: 100 nearest, rectangle and radius queries matched a scan of {len(crew)} employees")
+    
+    # Test 2: The hash follows walking employees, hires and fires
+    walkers = crew[:50]
+    for employee in walkers:
+        employee._move_to_tile(rng.randrange(128), rng.randrange(128))
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(100):
+            manager.update(0.1)
+        manager.fire_employee(crew[60].id)
+        manager.hire_employee("Late Hire")
+        manager.update(0.1)
+    assert len(manager.employee_positions) == len(manager.employees) == 500
+    for employee in manager.employees.values():
+        assert manager.employee_positions.positions[employee.id] == (employee.x, employee.y)
+        bucket = manager.employee_positions._bucket_of(employee.x, employee.y)
+        assert employee.id in manager.employee_positions.buckets[bucket]
+    print(f"[OK] Test 2: Hash in step with {len(manager.employees)} employees after walking, firing and hiring")
+    
+    # Test 3: Picking at a pixel honours zoom and pan, and a click selects the employee
+    renderer = grid_manager.enhanced_renderer
+    for zoom_factor, pan_x, pan_y in ((0.5, 0.0, 0.0), (2.0, -900.0, -600.0)):
+        renderer.zoom_factor, renderer.pan_offset_x, renderer.pan_offset_y = zoom_factor, pan_x, pan_y
+        target = min(manager.employees.values(), key=lambda employee: math.hypot(employee.x - 30, employee.y - 20))
+        pixel_x, pixel_y = target.get_pixel_position(zoom_factor, pan_x, pan_y, renderer.hud_height)
+        hit = manager.employee_at_pixel((pixel_x + 2, pixel_y - 2))
+        assert hit is not None and math.hypot(hit.x - target.x, hit.y - target.y) * TILE_SIZE * zoom_factor < 12
+    assert manager.employee_at_pixel((pixel_x + 2, pixel_y - 2)) is hit
+    selected = []
+    grid_manager.event_system.subscribe('employee_selected', selected.append)
+    manager.handle_mouse_click((pixel_x, pixel_y), 1)
+    grid_manager.event_system.process_events()
+    assert selected and selected[0]['employee'] is hit and grid_manager.drag_start_pos is None
+    print(f"[OK] Test 3: Picked {hit.name} at pixel ({pixel_x}, {pixel_y}) with zoom 2.0 and pan (-900, -600)")
+    
+    # Test 4: Rendering only draws employees inside the viewport
+    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    drawn = []
+    original_render = Employee.render
+    Employee.render = lambda employee, *args: drawn.append(employee)
+    try:
+        manager.render(screen)
+    finally:
+        Employee.render = original_render
+    scaled_tile_size = TILE_SIZE * renderer.zoom_factor
+    on_screen = []
+    for employee in manager.employees.values():
+        x, y = employee.get_pixel_position(renderer.zoom_factor, renderer.pan_offset_x,
+                                           renderer.pan_offset_y, renderer.hud_height)
+        if 0 <= x < WINDOW_WIDTH and 0 <= y < WINDOW_HEIGHT:
+            on_screen.append(employee)
+    assert set(on_screen) <= set(drawn) and len(drawn) < len(manager.employees) / 2
+    assert [employee.id for employee in drawn] == sorted(employee.id for employee in drawn)
+    print(f"[OK] Test 4: Drew {len(drawn)} of {len(manager.employees)} employees ({len(on_screen)} on screen, {scaled_tile_size:.0f}px tiles)")
+    
+    print("\n[SUCCESS] All employee spatial hash tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_employee_spatial_hash()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for the columnar employee store behind EmployeeManager
+
+Verifies that Employee objects read and write through to their EmployeeStore slot,
+that slots move between stores on hire, fire and load, and that the vectorized
+needs and movement kernels reproduce the per-object update loop.
+"""
+
+import sys
+import os
+import random
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.employee.employee import Employee, EmployeeState
+from scripts.employee.employee_manager import EmployeeManager
+from scripts.employee.employee_store import EmployeeStore, STATE_WORKING
+
+
+def build_crew(batch_min_employees, count=120, seed=5):
+    """Employee manager with a mixed crew (walkers, workers, resters, needy) on a walled farm"""
+    grid_manager = GridManager(EventSystem(), width=64, height=64)
+    for y in range(40):
+        grid_manager.place_building_at(30, y, 'storage_silo', object())
+    grid_manager.place_building_at(10, 10, 'water_cooler', object())  # Slows the rest drain nearby
+    manager = EmployeeManager(grid_manager.event_system, grid_manager, create_starting_employee=False)
+    manager.batch_min_employees = batch_min_employees
+    rng = random.Random(seed)
+    for number in range(count):
+        employee_id = manager.hire_employee(f"Worker {number}", ['hard_worker'] if number % 3 == 0 else [])
+        employee = manager.employees[employee_id]
+        employee.x, employee.y = float(rng.randrange(25)), float(rng.randrange(64))
+        employee.hunger = rng.uniform(20.0, 20.2)  # Some turn critical during the run
+        role = number % 4
+        if role == 0:
+            employee._move_to_tile(rng.randrange(35, 64), rng.randrange(64))  # Around the wall
+        elif role == 1:
+            employee._move_to_tile(rng.randrange(25), rng.randrange(64))
+        elif role == 2:
+            employee.state = EmployeeState.WORKING
+        else:
+            employee.state = EmployeeState.RESTING
+    return manager
+
+
+def test_employee_store():
+    """Test employee views and the batched needs/movement kernels"""
+    print("=== Testing Columnar Employee Store ===\n")
+    
+    # Test 1: Employee fields write through to the store slot
+    store = EmployeeStore(2)
+    employee = Employee("emp_1", "Viewer", 3.0, 4.0, store=store)
+    employee.state = EmployeeState.WORKING
+    employee.rest -= 12.5
+    employee.add_trait("runner")
+    assert (store.x[employee._slot], store.y[employee._slot]) == (3.0, 4.0)
+    assert store.state[employee._slot] == STATE_WORKING and store.rest[employee._slot] == MAX_REST - 12.5
+    assert store.speed[employee._slot] == employee.speed > EMPLOYEE_SPEED
+    assert isinstance(employee.x, float) and employee.state is EmployeeState.WORKING
+    print(f"[OK] Test 1: Employee views slot {employee._slot} of a {store.capacity}-slot store")
+    
+    # Test 2: Slots grow, and employees keep their state when moving between stores
+    crew = [Employee(f"emp_{n}", "Crew", float(n), 0.0, store=store) for n in range(2, 7)]
+    assert store.capacity >= 6 and len(store) == 6
+    loner = Employee("emp_9", "Loner", 9.0, 9.0)
+    loner.hunger = 42.0
+    store.adopt(loner)
+    assert loner._store is store and (loner.x, loner.hunger) == (9.0, 42.0)
+    store.detach(employee)
+    assert employee._store is not store and employee.rest == MAX_REST - 12.5 and len(store) == 6
+    slots = store.sync(crew)  # The loner is no longer listed
+    assert list(slots) == [member._slot for member in crew] and loner._store is not store and loner.hunger == 42.0
+    print(f"[OK] Test 2: Adopt, detach and sync kept state across {store.capacity} slots")
+    
+    # Test 3: Kernels match the per-object loop on a mixed crew
+    scalar = build_crew(batch_min_employees=10 ** 9)
+    batched = build_crew(batch_min_employees=0)
+    for _ in range(600):
+        scalar.update(0.05)
+        batched.update(0.05)
+    pairs = list(zip(scalar.employees.values(), batched.employees.values()))
+    for a, b in pairs:
+        assert a.state == b.state and abs(a.x - b.x) < 1e-9 and abs(a.y - b.y) < 1e-9
+        assert abs(a.hunger - b.hunger) < 1e-9 and abs(a.thirst - b.thirst) < 1e-9 and abs(a.rest - b.rest) < 1e-9
+    assert not any(batched.grid_manager.passability.is_blocked(int(round(b.x)), int(round(b.y))) for _, b in pairs)
+    
+    for number, (a, b) in enumerate(pairs):  # One long tick of working and resting
+        a.state = b.state = (EmployeeState.WORKING, EmployeeState.RESTING)[number % 2]
+    scalar.update(600.0)
+    batched.update(600.0)
+    assert all(abs(a.rest - b.rest) < 1e-9 for a, b in pairs)
+    assert len({round(b.rest, 6) for b in batched.employees.values()}) > 3  # Traits and cooler differ
+    critical = sum(1 for _, b in pairs if b.state == EmployeeState.SEEKING_AMENITY)
+    arrived = sum(1 for _, b in pairs if b.state == EmployeeState.WORKING)
+    print(f"[OK] Test 3: Batched kernels matched {len(pairs)} employees ({arrived} working, {critical} seeking amenities)")
+    
+    # Test 4: Firing frees the slot and the fired object keeps working standalone
+    fired = next(iter(batched.employees.values()))
+    x, hunger = fired.x, fired.hunger
+    batched.fire_employee(fired.id)
+    assert fired._store is not batched.employee_store and (fired.x, fired.hunger) == (x, hunger)
+    batched.update(0.05)
+    assert len(batched.employee_store) == len(batched.employees)
+    print(f"[OK] Test 4: Fired employee detached, {len(batched.employee_store)} slots in use")
+    
+    print("\n[SUCCESS] All employee store tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_employee_store()
+    if not success:
+        sys.exit(1)
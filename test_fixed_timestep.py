@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test script for the fixed-timestep simulation loop
+
+Verifies that the simulation clock pays out whole ticks of game time whatever
+the frame pacing, that game speed and pause scale the ticks instead of the
+tick length, that stalled frames are capped at the catch-up limit, that a farm
+plays out identically at 60 FPS and at a stuttering frame rate, that employees
+are drawn between their last two tick positions, and that routes planned on
+worker processes are claimed on a fixed tick whatever the worker latency.
+"""
+
+import sys
+import os
+import io
+import random
+import contextlib
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+import pygame
+from scripts.core.config import *
+from scripts.core.simulation_clock import SimulationClock
+
+
+def build_game():
+    """Game with its starting employee queued to till a patch of the farm"""
+    from scripts.core.game_manager import GameManager
+    random.seed(3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = GameManager()
+        employee = next(iter(game.employee_manager.employees.values()))
+        tiles = [game.grid_manager.get_tile(x, y) for y in range(2, 5) for x in range(3, 7)]
+        for tile in tiles:
+            tile.task_assignment, tile.task_assigned_to = 'till', employee.id
+        game.employee_manager.assign_task_to_employee(employee.id, 'till', tiles)
+    game.time_manager.time_speed = 2
+    return game, employee, tiles
+
+
+def build_walled_crew():
+    """Game with a crew queued to till the far side of a silo wall, so routes go to the path workers"""
+    game, employee, _ = build_game()
+    manager = game.employee_manager
+    with contextlib.redirect_stdout(io.StringIO()):
+        for y in range(GRID_HEIGHT - 2):
+            game.grid_manager.place_building_at(8, y, 'storage_silo', object())
+        crew = [employee] + [manager.employees[manager.hire_employee(f"Walker {number}")] for number in range(11)]
+        for number, worker in enumerate(crew):
+            worker.x, worker.y = 1.0 + number % 4, 1.0 + number
+        tiles = [game.grid_manager.get_tile(x, y) for y in range(1, 13) for x in range(11, 15)]
+        assert manager._distribute_tiles_among_employees(tiles, 'till', crew)
+        game.event_system.process_events()  # Employees queue their routes in the open batch
+    return game, crew, tiles
+
+
+def play(game, frame_times):
+    """Run frames of the given real durations, with console output discarded"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame_dt in frame_times:
+            game._update(frame_dt)
+
+
+def test_fixed_timestep():
+    """Test the simulation clock and GameManager's fixed-step loop"""
+    print("=== Testing Fixed-Timestep Simulation ===\n")
+    pygame.init()
+    rng = random.Random(9)
+    
+    # Test 1: Jittered frames pay out whole ticks, carrying the remainder as alpha
+    clock = SimulationClock(tick_rate=30, max_steps=10)
+    frames = [rng.uniform(0.005, 0.05) for _ in range(1000)]
+    steps = [clock.advance(frame_dt) for frame_dt in frames]
+    assert abs(clock.ticks * clock.tick_dt + clock.accumulator - sum(frames)) < 1e-6
+    assert clock.ticks == sum(steps) and 0.0 <= clock.alpha < 1.0
+    assert abs(clock.alpha - clock.accumulator / clock.tick_dt) < 1e-9
+    print(f"[OK] Test 1: {len(frames)} frames of 5-50 ms paid out {clock.ticks} ticks (alpha {clock.alpha:.2f})")
+    
+    # Test 2: Speed multiplies the ticks, pause stops them, stalls are capped
+    clock = SimulationClock(tick_rate=30, max_steps=10)
+    assert [clock.advance(1 / 30, speed) for speed in (1, 2, 4, 0)] == [1, 2, 4, 0]
+    assert clock.advance(5.0) == 10 and abs(clock.dropped_time - (5.0 - 10 / 30)) < 1e-6
+    print(f"[OK] Test 2: 1x/2x/4x/paused frames ran 1/2/4/0 ticks; a 5 s stall dropped {clock.dropped_time:.2f} s")
+    
+    # Test 3: The farm plays out the same at 60 FPS and at a stuttering frame rate
+    steady, steady_worker, steady_tiles = build_game()
+    play(steady, [1 / 60] * 1200)  # 20 s at 60 FPS, 2x speed
+    stutter, stutter_worker, stutter_tiles = build_game()
+    frames = []
+    while sum(frames) < 20.0 - 1e-9:
+        frames.append(min(rng.choice([1, 2, 3, 5]) / 60, 20.0 - sum(frames)))
+        if rng.random() < 0.1:
+            frames.append(0.0)
+    stutter.time_manager.is_paused = True
+    play(stutter, [0.5] * 4)  # Paused frames bank no game time
+    stutter.time_manager.is_paused = False
+    play(stutter, frames)
+    assert steady.simulation_clock.ticks == stutter.simulation_clock.ticks == 1200
+    assert steady.time_manager.game_time_elapsed == stutter.time_manager.game_time_elapsed
+    assert steady.employee_manager.sim_time == stutter.employee_manager.sim_time
+    assert (steady_worker.x, steady_worker.y, steady_worker.state) == (stutter_worker.x, stutter_worker.y, stutter_worker.state)
+    assert [tile.terrain_type for tile in steady_tiles] == [tile.terrain_type for tile in stutter_tiles]
+    tilled = sum(tile.terrain_type == 'tilled' for tile in steady_tiles)
+    print(f"[OK] Test 3: 60 FPS and {len(frames)} stuttering frames both ran 1200 ticks ({tilled} tiles tilled)")
+    
+    # Test 4: Employees are drawn between their last two tick positions
+    game, worker, _ = build_game()
+    play(game, [1 / 60] * 20 + [1 / 240])  # Ends a quarter of a tick past the last one
+    manager = game.employee_manager
+    index = manager._hashed_index[worker.id]
+    previous = (manager._previous_x[index], manager._previous_y[index])
+    assert previous != (worker.x, worker.y) and abs(game.simulation_clock.alpha - 0.25) < 1e-6
+    x, y = manager._interpolated_position(worker, game.simulation_clock.alpha)
+    assert abs(x - (previous[0] + (worker.x - previous[0]) * 0.25)) < 1e-9
+    assert abs(y - (previous[1] + (worker.y - previous[1]) * 0.25)) < 1e-9
+    with contextlib.redirect_stdout(io.StringIO()):
+        game._render()
+    print(f"[OK] Test 4: {worker.name} drawn at ({x:.3f}, {y:.3f}), a quarter tick past ({previous[0]:.3f}, {previous[1]:.3f})")
+    
+    # Test 5: Routes planned on worker processes are picked up on the same tick at any frame rate
+    steady, steady_crew, steady_tiles = build_walled_crew()
+    play(steady, [1 / 60])  # One tick: the batch goes to the workers, walkers wait in place
+    waiting = [worker for worker in steady_crew if worker.pending_path is not None]
+    pool = steady.employee_manager.pathfinder.worker_pool
+    assert pool is not None and len(waiting) == pool.queries > 0
+    play(steady, [1 / 60])  # Next tick: every worker route is claimed, however long the workers took
+    assert all(worker.pending_path is None and worker.path for worker in waiting)
+    play(steady, [1 / 60] * 598)  # 10 s at 60 FPS, 2x speed in all
+    stutter, stutter_crew, stutter_tiles = build_walled_crew()
+    frames = []
+    while sum(frames) < 10.0 - 1e-9:
+        frames.append(min(rng.choice([1, 2, 4]) / 60, 10.0 - sum(frames)))
+    play(stutter, frames)
+    assert steady.simulation_clock.ticks == stutter.simulation_clock.ticks == 600
+    assert [(worker.x, worker.y, worker.state) for worker in steady_crew] == [(worker.x, worker.y, worker.state) for worker in stutter_crew]
+    assert [tile.terrain_type for tile in steady_tiles] == [tile.terrain_type for tile in stutter_tiles]
+    searches = pool.queries
+    for game in (steady, stutter):
+        game.employee_manager.pathfinder.close()
+    tilled = sum(tile.terrain_type == 'tilled' for tile in steady_tiles)
+    print(f"[OK] Test 5: {len(steady_crew)} walkers routed by {searches} worker searches matched at 60 FPS and stuttering ({tilled} tiles tilled)")
+    
+    print("\n[SUCCESS] All fixed-timestep tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_fixed_timestep()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script for batched harvest ingestion
+
+Verifies that a tick's harvests are bucketed by (crop, quality, day) and stored
+with one bulk inventory call, that same-day entries are topped up instead of
+fragmented, that overflow is reported once per batch, that a crew harvesting
+a big field emits one inventory update per tick instead of one per tile, and that
+employees finishing on the same tick share a single inventory commit.
+"""
+
+import sys
+import os
+import io
+import contextlib
+import numpy as np
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.core.inventory_manager import InventoryManager
+from scripts.employee.employee_manager import EmployeeManager
+
+
+def record(event_system, *event_types):
+    """Collect the payloads of the given events as they are processed"""
+    seen = {event_type: [] for event_type in event_types}
+    for event_type in event_types:
+        event_system.subscribe(event_type, seen[event_type].append)
+    return seen
+
+
+def build_harvest(crew_size, rows, with_inventory=True):
+    """Crew queued to harvest a field of ripe corn and tomatoes"""
+    np.random.seed(23)  # Chunk soil quality is randomized on allocation
+    grid_manager = GridManager(EventSystem(), width=64, height=64)
+    manager = EmployeeManager(grid_manager.event_system, grid_manager, create_starting_employee=False)
+    inventory = None
+    if with_inventory:
+        inventory = InventoryManager(grid_manager.event_system)
+        inventory.storage_capacity = 100000
+        manager.set_inventory_manager(inventory)
+    field = []
+    for y in range(rows):
+        for x in range(20):
+            tile = grid_manager.get_tile(x, y)
+            tile.terrain_type = 'planted'
+            tile.current_crop = 'corn' if y % 2 == 0 else 'tomatoes'
+            tile.growth_stage = len(GROWTH_STAGES) - 1
+            field.append(tile)
+    crew = [manager.employees[manager.hire_employee(f"Worker {number}")] for number in range(crew_size)]
+    assert manager._distribute_tiles_among_employees(field, 'harvest', crew)
+    return grid_manager, manager, inventory, field
+
+
+def test_harvest_batching():
+    """Test bulk inventory ingestion and EmployeeManager harvest batching"""
+    print("=== Testing Batched Harvest Ingestion ===\n")
+    
+    # Test 1: A batch merges into same-day entries and emits one update
+    event_system = EventSystem()
+    inventory = InventoryManager(event_system)
+    seen = record(event_system, 'inventory_updated', 'storage_nearly_full')
+    inventory.add_crops_batch({('corn', 0.8, 2): 30, ('corn', 0.6, 2): 10, ('wheat', 0.8, 2): 5})
+    inventory.add_crops_batch({('corn', 0.8, 2): 20, ('corn', 0.8, 3): 4})
+    event_system.process_events()
+    entries = [(entry.quality, entry.harvest_day, entry.quantity) for entry in inventory.crops['corn']]
+    assert entries == [(0.8, 2, 50), (0.6, 2, 10), (0.8, 3, 4)] and inventory.current_storage == 69
+    assert len(seen['inventory_updated']) == 2 and seen['inventory_updated'][0]['crops_added'] == {'corn': 40, 'wheat': 5}
+    print(f"[OK] Test 1: Two batches stored {inventory.current_storage} units in {len(entries) + 1} entries")
+    
+    # Test 2: Overflow is stored partially and reported once per batch
+    inventory.storage_capacity = 80
+    stored = inventory.add_crops_batch({('corn', 0.8, 3): 6, ('tomatoes', 0.9, 3): 10})
+    event_system.process_events()
+    assert stored == {'corn': 6, 'tomatoes': 5} and inventory.current_storage == 80
+    assert len(seen['storage_nearly_full']) == 1 and seen['storage_nearly_full'][0]['overflow_by_crop'] == {'tomatoes': 5}
+    assert inventory.add_crops_batch({('corn', 0.8, 3): 1}) == {}
+    print(f"[OK] Test 2: Full storage kept {sum(stored.values())} units and reported 5 overflowing in one event")
+    
+    # Test 3: A crew harvesting a field updates the inventory once per tick
+    grid_manager, manager, inventory, field = build_harvest(48, 12)
+    seen = record(grid_manager.event_system, 'inventory_updated', 'harvest_completed')
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(3000):
+            manager.update(0.1)
+            grid_manager.event_system.process_events()
+            if all(tile.current_crop is None for tile in field):
+                break
+    assert all(tile.current_crop is None for tile in field)
+    harvested = sum(event['quantity'] for event in seen['harvest_completed'])
+    assert harvested == inventory.current_storage > 0 and sum(event['tiles'] for event in seen['harvest_completed']) == len(field)
+    assert len(seen['inventory_updated']) == len(seen['harvest_completed']) < len(field)
+    qualities = {entry.quality for entries in inventory.crops.values() for entry in entries}
+    assert all(abs(quality / HARVEST_QUALITY_BUCKET - round(quality / HARVEST_QUALITY_BUCKET)) < 1e-6 for quality in qualities)
+    entry_count = sum(len(entries) for entries in inventory.crops.values())
+    assert entry_count <= 2 * len(qualities)
+    print(f"[OK] Test 3: {len(field)} tiles harvested in {len(seen['harvest_completed'])} batches, stored in {entry_count} entries")
+    
+    # Test 4: Without an inventory, one crop_harvested event goes out per batch key
+    grid_manager, manager, _, field = build_harvest(20, 4, with_inventory=False)
+    seen = record(grid_manager.event_system, 'crop_harvested')
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(3000):
+            manager.update(0.1)
+            grid_manager.event_system.process_events()
+            if all(tile.current_crop is None for tile in field):
+                break
+    keys = [(event['crop_type'], event['quality'], event['day']) for event in seen['crop_harvested']]
+    assert all(tile.current_crop is None for tile in field) and len(keys) < len(field)
+    assert {crop_type for crop_type, _, _ in keys} == {'corn', 'tomatoes'}
+    print(f"[OK] Test 4: {len(keys)} crop_harvested events for {len(field)} tiles without an inventory manager")
+    
+    # Test 5: A crew finishing its tiles on the same tick commits them together
+    grid_manager, manager, inventory, field = build_harvest(6, 1)
+    seen = record(grid_manager.event_system, 'inventory_updated', 'harvest_completed')
+    crew = list(manager.employees.values())
+    finished = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        grid_manager.event_system.process_events()  # Deliver the task assignments
+        for employee in crew:
+            tile = employee.current_task.next_tile()
+            employee.x, employee.y = float(tile.x), float(tile.y)
+            employee._arrive()
+            employee.state_timer = 60.0  # Work on the tile is already done
+            finished.append(tile)
+        manager.update(0.1)
+        grid_manager.event_system.process_events()
+    assert all(tile.current_crop is None for tile in finished)
+    assert sum(tile.current_crop is not None for tile in field) == len(field) - len(crew)
+    assert len(seen['inventory_updated']) == len(seen['harvest_completed']) == 1
+    completed = seen['harvest_completed'][0]
+    assert completed['tiles'] == 6 and sorted(completed['employee_ids']) == sorted(employee.id for employee in crew)
+    assert completed['quantity'] == inventory.current_storage and completed['crops'] == {'corn': completed['quantity']}
+    print(f"[OK] Test 5: {len(crew)} employees finishing on one tick stored {completed['quantity']} corn in one commit")
+    
+    print("\n[SUCCESS] All harvest batching tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_harvest_batching()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared job board and work stealing
+
+Verifies that the board hands out the nearest job of the highest priority, that
+idle employees steal the back half of an overloaded queue, that work queued while
+the crew is busy (or left by a fired employee) waits on the board, and that a
+crew finishes a field dumped on one worker much sooner than that worker alone.
+"""
+
+import sys
+import os
+import random
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.employee.employee_manager import EmployeeManager
+from scripts.employee.job_board import JobBoard
+
+
+def build_farm(crew_size):
+    """Employee manager with a crew standing at the farm centre"""
+    grid_manager = GridManager(EventSystem())
+    manager = EmployeeManager(grid_manager.event_system, grid_manager, create_starting_employee=False)
+    crew = [manager.employees[manager.hire_employee(f"Worker {number}")] for number in range(crew_size)]
+    return grid_manager, manager, crew
+
+
+def till_time(crew_size, tiles_wanted=24):
+    """Game seconds until a field queued on the first employee alone is fully tilled"""
+    grid_manager, manager, crew = build_farm(crew_size)
+    field = [grid_manager.get_tile(x, y) for y in range(4, 12) for x in range(4, 12)][:tiles_wanted]
+    for tile in field:
+        tile.task_assignment, tile.task_assigned_to = 'till', crew[0].id
+    manager.assign_task_to_employee(crew[0].id, 'till', field)
+    elapsed = 0.0
+    while any(tile.terrain_type != 'tilled' for tile in field):
+        manager.update(0.1)
+        grid_manager.event_system.process_events()
+        elapsed += 0.1
+        assert elapsed < 1000
+    return elapsed
+
+
+def test_job_board():
+    """Test board ordering, work stealing and EmployeeManager integration"""
+    print("=== Testing Job Board ===\n")
+    rng = random.Random(11)
+    grid_manager = GridManager(EventSystem(), width=64, height=64)
+    
+    # Test 1: Nearest jobs are found exactly, and priority beats distance
+    board = JobBoard()
+    tiles = list({(rng.randrange(64), rng.randrange(64)) for _ in range(300)})
+    board.post([grid_manager.get_tile(x, y) for x, y in tiles], 'till')
+    for _ in range(50):
+        x, y = rng.randrange(64), rng.randrange(64)
+        nearest = min(abs(tx - x) + abs(ty - y) for tx, ty in tiles)
+        task_type, (tile,), params = board.claim(x, y, 1)
+        assert abs(tile.x - x) + abs(tile.y - y) == nearest and (task_type, params) == ('till', {})
+        board.post([tile], 'till')
+    far = grid_manager.get_tile(63, 63)
+    board.post([far], 'harvest')
+    assert board.claim(0, 0, 5) == ('harvest', [far], {})
+    print(f"[OK] Test 1: 50 claims found the nearest of {len(board)} jobs; harvest outranked closer tilling")
+    
+    # Test 2: Claims chain same-kind jobs in walking order and keep task parameters
+    board = JobBoard()
+    row = [grid_manager.get_tile(x, 20) for x in range(10, 30)]
+    board.post(row[::2], 'plant', crop_type='tomatoes')
+    board.post(row[1::2], 'plant', crop_type='corn')
+    task_type, claimed, params = board.claim(9, 20, 4)
+    assert params == {'crop_type': 'tomatoes'} and [tile.x for tile in claimed] == [10, 12, 14, 16]
+    assert board.withdraw(row) == 16 and not board and board.get_stats()['claimed'] == 4
+    print(f"[OK] Test 2: Claimed {[(tile.x, tile.y) for tile in claimed]} for {params['crop_type']}")
+    
+    # Test 3: An idle employee steals the back half of an overloaded queue
+    grid_manager, manager, (busy, idle) = build_farm(2)
+    field = [grid_manager.get_tile(x, 3) for x in range(2, 14)]
+    for tile in field:
+        tile.task_assignment, tile.task_assigned_to = 'till', busy.id
+    manager.assign_task_to_employee(busy.id, 'till', field)
+    assert manager._run_job_board() == 1
+    stolen = idle.current_task.tiles
+    kept = busy.current_task.tiles
+    assert len(stolen) == (len(field) - 1) // 2  # Half of what remains behind the tile being walked to
+    assert kept == field[:len(field) - len(stolen)] and sorted(stolen, key=lambda tile: tile.x) == field[len(kept):]
+    assert all(tile.task_assigned_to == idle.id for tile in stolen) and not manager.job_board
+    print(f"[OK] Test 3: {idle.name} took {len(stolen)} of {len(field)} tiles queued on {busy.name}")
+    
+    # Test 4: Busy crews leave selections on the board; cancel and firing keep it consistent
+    for employee in (busy, idle):
+        while len(employee.assigned_tasks) < 3:
+            manager.assign_task_to_employee(employee.id, 'till', [grid_manager.get_tile(0, len(employee.assigned_tasks))])
+    grid_manager.selected_tiles.set_rect(10, 10, 14, 13)
+    assert not manager.get_available_employees() and manager.assign_task_to_selection('till')
+    assert len(manager.job_board) == 12 and all(tile.task_assignment == 'till' for tile in manager.job_board.jobs)
+    grid_manager.selected_tiles.set_rect(10, 10, 14, 11)
+    assert manager.cancel_tasks_on_selection() and len(manager.job_board) == 8
+    manager.fire_employee(busy.id)
+    assert len(manager.job_board) == 8 + len(kept) and all(tile in manager.job_board for tile in kept)
+    print(f"[OK] Test 4: {len(manager.job_board)} jobs wait on the board after cancelling and firing")
+    
+    # Test 5: A crew finishes a field dumped on one worker much sooner than the worker alone
+    alone = till_time(1)
+    crew = till_time(4)
+    assert crew < alone * 0.5
+    print(f"[OK] Test 5: 24 tiles tilled in {crew:.1f}s by a crew of 4 instead of {alone:.1f}s")
+    
+    print("\n[SUCCESS] All job board tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_job_board()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Test script for employee pathfinding
+
+Verifies that GridManager keeps the passability bitmap in sync with buildings,
+that the Pathfinder routes around blocked tiles, and that employees follow the
+returned waypoints instead of walking through buildings.
+"""
+
+import sys
+import os
+import random
+from collections import deque
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.employee.employee import Employee, EmployeeState
+from scripts.employee.pathfinding import Pathfinder
+
+
+def build_wall(grid_manager, x, y0, y1):
+    """Place a vertical wall of silos at column x covering rows y0..y1-1"""
+    for y in range(y0, y1):
+        assert grid_manager.place_building_at(x, y, 'storage_silo', object())
+
+
+def bfs_distance(passability, start, goal):
+    """Reference shortest 4-directional distance (None if unreachable)"""
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == goal:
+            return distances[goal]
+        for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)):
+            if (nx, ny) not in distances and not passability.is_blocked(nx, ny):
+                distances[(nx, ny)] = distances[(x, y)] + 1
+                queue.append((nx, ny))
+    return None
+
+
+def walk_length(passability, waypoints):
+    """Length of a row/column waypoint path, asserting every tile on it is open"""
+    length = 0
+    for (x, y), (end_x, end_y) in zip(waypoints, waypoints[1:]):
+        assert x == end_x or y == end_y, "Waypoints must share a row or column"
+        while (x, y) != (end_x, end_y):
+            x += (end_x > x) - (end_x < x)
+            y += (end_y > y) - (end_y < y)
+            assert not passability.is_blocked(x, y)
+            length += 1
+    return length
+
+
+def test_pathfinding():
+    """Test the passability bitmap and waypoint following"""
+    print("=== Testing Pathfinding ===\n")
+    
+    grid_manager = GridManager(EventSystem(), width=64, height=64)
+    passability = grid_manager.passability
+    pathfinder = Pathfinder(grid_manager)
+    
+    # Test 1: Buildings update the bitmap
+    version = passability.version
+    build_wall(grid_manager, 10, 0, 12)
+    assert passability.blocked[:12, 10].all() and not passability.blocked[12, 10]
+    assert passability.version > version
+    print(f"[OK] Test 1: Wall of {int(passability.blocked.sum())} buildings marked blocked")
+    
+    # Test 2: Paths go around the wall and never through a blocked tile
+    path = pathfinder.find_path((5, 5), (15, 5))
+    assert path is not None and path[0] == (5, 5) and path[-1] == (15, 5)
+    assert any(y >= 12 for _, y in path)  # Must pass below the wall
+    assert pathfinder.find_path((5, 5), (10, 5)) is None  # Goal inside a building
+    print(f"[OK] Test 2: Path around the wall uses {len(path)} waypoints")
+    
+    # Test 3: Employees walk the waypoints without entering the wall
+    employee = Employee("emp_1", "Walker", 5.0, 5.0)
+    employee.pathfinder = pathfinder
+    employee._move_to_tile(15, 5)
+    assert employee.state == EmployeeState.MOVING and employee.path
+    visited = set()
+    for _ in range(400):
+        employee._update_movement(0.1)
+        visited.add((int(round(employee.x)), int(round(employee.y))))
+        if employee.state != EmployeeState.MOVING:
+            break
+    assert (employee.x, employee.y) == (15, 5) and employee.state == EmployeeState.WORKING
+    assert not any(passability.is_blocked(x, y) for x, y in visited)
+    print(f"[OK] Test 3: Employee reached (15, 5) through {len(visited)} open tiles")
+    
+    # Test 4: Removing a building reopens the tile and refreshes cached paths
+    grid_manager.remove_building_at(10, 5)
+    assert not passability.blocked[5, 10]
+    assert pathfinder.find_path((5, 5), (15, 5)) == [(x, 5) for x in range(5, 16)]
+    print("[OK] Test 4: Removed building reopened a straight path")
+    
+    # Test 5: Flat-index A* finds shortest routes and reuses its search arrays
+    rng = random.Random(11)
+    for _ in range(400):
+        x, y = rng.randrange(64), rng.randrange(64)
+        if (x, y) != (5, 5):
+            grid_manager.place_building_at(x, y, 'storage_silo', object())
+    pathfinder.find_path((0, 0), (1, 0))  # Picks up the new bitmap
+    g_costs = pathfinder._g_costs
+    for _ in range(60):
+        start = (rng.randrange(64), rng.randrange(64))
+        goal = (rng.randrange(64), rng.randrange(64))
+        if passability.is_blocked(*start):
+            continue
+        raw = pathfinder._astar_search(start, goal) if not passability.is_blocked(*goal) else None
+        expected = bfs_distance(passability, start, goal)
+        if expected is None:
+            assert raw is None
+        else:
+            assert raw[0] == start and raw[-1] == goal and len(raw) - 1 == expected
+            assert all(abs(ax - bx) + abs(ay - by) == 1 for (ax, ay), (bx, by) in zip(raw, raw[1:]))
+            assert not any(passability.is_blocked(x, y) for x, y in raw)
+    assert pathfinder._g_costs is g_costs and len(g_costs) == 64 * 64
+    print(f"[OK] Test 5: Flat A* matched BFS distances over {pathfinder._generation} searches")
+    
+    # Test 6: JPS is exact and hierarchical routes are walkable and near-optimal on a larger farm
+    large = GridManager(EventSystem(), width=160, height=160)
+    for _ in range(2500):
+        large.place_building_at(rng.randrange(160), rng.randrange(160), 'storage_silo', object())
+    jps = Pathfinder(large, mode='jps')
+    hierarchical = Pathfinder(large, mode='hierarchical')
+    checked = 0
+    while checked < 25:
+        start = (rng.randrange(160), rng.randrange(160))
+        goal = (rng.randrange(160), rng.randrange(160))
+        if large.passability.is_blocked(*start) or large.passability.is_blocked(*goal):
+            continue
+        expected = bfs_distance(large.passability, start, goal)
+        jps_path = jps.find_path(start, goal)
+        cross_cluster = hierarchical._use_cluster_graph(start, goal)
+        hierarchical_path = hierarchical.find_path(start, goal)
+        if expected is None:
+            assert jps_path is None and hierarchical_path is None
+            continue
+        assert walk_length(large.passability, jps_path) == expected
+        if cross_cluster:
+            assert expected <= walk_length(large.passability, hierarchical_path) <= expected * 1.5 + 4
+        checked += 1
+    try:
+        jps.set_mode('dijkstra')
+        assert False, "Unknown modes must be rejected"
+    except ValueError:
+        pass
+    
+    # Narrow and ragged farms: one column of clusters, and partial clusters on the far edges
+    for width, height in ((20, 70), (40, 70)):
+        farm = GridManager(EventSystem(), width=width, height=height)
+        for _ in range(width * height // 10):
+            farm.place_building_at(rng.randrange(width), rng.randrange(height), 'storage_silo', object())
+        hierarchical_farm = Pathfinder(farm, mode='hierarchical')
+        routes = 0
+        while routes < 25:
+            start = (rng.randrange(width), rng.randrange(height))
+            goal = (rng.randrange(width), rng.randrange(height))
+            if farm.passability.is_blocked(*start) or farm.passability.is_blocked(*goal):
+                continue
+            expected = bfs_distance(farm.passability, start, goal)
+            cross_cluster = hierarchical_farm._use_cluster_graph(start, goal)
+            farm_path = hierarchical_farm.find_path(start, goal)
+            if expected is None:
+                assert farm_path is None
+                continue
+            assert farm_path is not None and farm_path[0] == start and farm_path[-1] == goal
+            if cross_cluster:
+                # Crossing mid-way along a long open border detours to one of its end transitions
+                assert expected <= walk_length(farm.passability, farm_path) <= expected * 1.5 + 2 * CHUNK_SIZE
+            routes += 1
+        checked += routes
+    print(f"[OK] Test 6: JPS and hierarchical modes agree with BFS on {checked} routes (incl. 20x70 and 40x70 farms)")
+    
+    # Test 7: New buildings only rebuild the clusters around them and are routed around
+    graph = hierarchical.cluster_graph
+    far_fields = graph._cluster_fields(graph.cluster_of(150, 150))
+    wall_fields = graph._cluster_fields(graph.cluster_of(50, 20))
+    for y in range(150):
+        large.place_building_at(50, y, 'storage_silo', object())  # Wall with a gap at the bottom
+    for y in range(150, 160):
+        large.remove_building_at(50, y)
+    start, goal = (20, 20), (90, 20)
+    for x, y in (start, goal):
+        large.remove_building_at(x, y)
+    path = hierarchical.find_path(start, goal)
+    assert graph.fields.get(graph.cluster_of(150, 150)) is far_fields
+    assert graph.fields.get(graph.cluster_of(50, 20)) is not wall_fields
+    expected = bfs_distance(large.passability, start, goal)
+    if expected is None:
+        assert path is None
+    else:
+        assert walk_length(large.passability, path) >= expected and any(y >= 150 for _, y in path)
+    print(f"[OK] Test 7: Cluster graph refreshed only the changed chunks ({len(path or [])} waypoints around the wall)")
+    
+    # Test 8: LRU path cache counts hits and only drops routes through changed chunks
+    farm = GridManager(EventSystem(), width=128, height=128)
+    cached = Pathfinder(farm, cache_capacity=2)
+    build_wall(farm, 10, 0, 12)
+    route = cached.find_path((5, 5), (15, 5))  # Stays in chunk (0, 0)
+    assert cached.find_path((5, 5), (15, 5)) == route
+    cached.find_path((0, 40), (0, 50))
+    cached.find_path((5, 5), (15, 5))  # Refreshes the route's recency
+    cached.find_path((40, 100), (41, 100))  # Evicts the least recently used (0, 40) route
+    assert ((0, 40), (0, 50)) not in cached.path_cache.entries and len(cached.path_cache) == 2
+    farm.place_building_at(100, 100, 'storage_silo', object())  # Far from the cached route
+    assert cached.find_path((5, 5), (15, 5)) == route
+    farm.place_building_at(20, 20, 'storage_silo', object())  # Same chunk as the route
+    assert cached.find_path((5, 5), (15, 5)) == route
+    stats = cached.get_cache_stats()
+    assert stats['hits'] == 3 and stats['invalidations'] == 1 and stats['misses'] == 4
+    print(f"[OK] Test 8: Path cache hit rate {stats['hit_rate']:.0%} with {stats['invalidations']} scoped invalidation")
+    
+    # Test 9: Amenity flow fields give every tile its next step toward the nearest cooler
+    coolers = [(30, 30), (100, 90)]
+    for x, y in coolers:
+        farm.place_building_at(x, y, 'water_cooler', object())
+    field = farm.get_amenity_field('water_cooler')
+    assert farm.get_amenity_field('employee_housing') is None
+    for x, y in ((0, 0), (64, 64), (127, 127), (29, 31)):
+        nearest = min(bfs_distance(farm.passability, (x, y), tile)
+                      for cx, cy in coolers for tile in farm.get_building_interaction_tiles(cx, cy))
+        assert field.distance_at(x, y) == nearest
+        step = field.next_step(x, y)
+        assert step is None or field.distance_at(*step) == nearest - 1
+        waypoints, building = field.route_from(x, y)
+        assert building in coolers and walk_length(farm.passability, waypoints) == nearest
+    rebuilds = farm.amenity_fields.rebuilds
+    farm.get_tile(60, 60).till()
+    assert farm.get_amenity_field('water_cooler') is field and farm.amenity_fields.rebuilds == rebuilds
+    
+    thirsty = Employee("emp_2", "Thirsty", 64.0, 64.0)
+    thirsty.thirst = 10
+    thirsty.state = EmployeeState.SEEKING_AMENITY
+    thirsty._update_seeking_amenity(0.1, farm)
+    assert thirsty.state == EmployeeState.MOVING and field.distance_at(int(thirsty.target_x), int(thirsty.target_y)) == 0
+    farm.place_building_at(40, 40, 'water_cooler', object())
+    assert farm.get_amenity_field('water_cooler') is not field  # Rebuilt for the new cooler
+    print(f"[OK] Test 9: Flow field routes employees to {len(coolers)} coolers with {farm.amenity_fields.rebuilds} rebuilds")
+    
+    # Test 10: Cooperative mode lets a crew cross paths without sharing tiles
+    corridor = GridManager(EventSystem(), width=32, height=32)
+    for x in range(22):
+        for y in (4, 6):
+            if (x, y) != (16, 4):  # One side pocket to step aside into
+                corridor.place_building_at(x, y, 'storage_silo', object())
+    coop = Pathfinder(corridor, mode='cooperative')
+    coop.add_temporary_obstacle(10, 20)
+    crew = [Employee("emp_a", "East", 3.0, 5.0), Employee("emp_b", "West", 18.0, 5.0)]
+    trips = [((3, 5), (18, 5)), ((18, 5), (3, 5))]
+    for number in range(12):  # Two columns of six crossing the obstacle's row
+        crew.append(Employee(f"emp_{number:02d}", "Crosser", 2.0 + number % 6, 16.0 + number // 6))
+        trips.append((None, (17 - number % 6, 24 - number // 6)))
+    for employee, (_, goal) in zip(crew, trips):
+        employee.pathfinder = coop
+        employee._move_to_tile(*goal)
+    planner = coop.cooperative_planner
+    for _ in range(60 * 30):
+        planner.update(1 / 30, crew)
+        assert all((int(round(employee.x)), int(round(employee.y))) != (10, 20) for employee in crew)
+        if all(employee.state == EmployeeState.WORKING for employee in crew):
+            break
+    assert all((employee.x, employee.y) == goal for employee, (_, goal) in zip(crew, trips))
+    stats = planner.get_stats()
+    assert stats['conflicts'] == 0 and stats['ghost_plans'] == 0
+    coop.set_mode('astar')
+    assert coop.cooperative_planner is None and not any(employee.steered for employee in crew)
+    print(f"[OK] Test 10: {len(crew)} employees arrived in {stats['step']} steps with {stats['replans']} plans and no shared tiles")
+    
+    # Test 11: Batches are planned on worker processes and revalidated when claimed
+    batched = Pathfinder(large, mode='jps', workers=2)
+    queries = []
+    while len(queries) < 40:
+        start = (rng.randrange(160), rng.randrange(160))
+        goal = (rng.randrange(160), rng.randrange(160))
+        if not large.passability.is_blocked(*start) and not large.passability.is_blocked(*goal):
+            queries.append((start, goal))
+    futures = batched.find_paths_batch(queries)
+    assert batched.worker_pool is not None and batched.worker_pool.queries > 0
+    for future, (start, goal) in zip(futures, queries[:-1]):
+        future.result(timeout=60)
+        path = batched.claim_path(future, start, goal)
+        expected = bfs_distance(large.passability, start, goal)
+        assert (path is None) if expected is None else walk_length(large.passability, path) == expected
+    
+    start, goal = queries[-1]
+    futures[-1].result(timeout=60)
+    stale = batched.find_path(start, goal)  # Same route the worker planned
+    if stale is not None and len(stale) > 2:
+        blocker = stale[1] if stale[1] != goal else stale[-2]
+        large.place_building_at(blocker[0], blocker[1], 'storage_silo', object())
+        path = batched.claim_path(futures[-1], start, goal)
+        assert path is None or blocker not in path
+    
+    walkers = [Employee(f"emp_w{number}", "Batched", float(goal[0]), float(goal[1]))
+               for number, (_, goal) in enumerate(queries[:10])]  # Return trips miss the cache
+    batched.begin_batch()
+    for employee, (start, _) in zip(walkers, queries):
+        employee.pathfinder = batched
+        employee._move_to_tile(*start)
+    assert all(employee.pending_path is not None and not employee.path for employee in walkers)
+    batched.submit_batch()
+    for employee in walkers:
+        employee._update_movement(0.1)  # Waits in place until the tick boundary, however fast the workers are
+    assert all(employee.pending_path is not None for employee in walkers)
+    batched.settle_batch()
+    assert all(batched.route_ready(employee.pending_path) for employee in walkers)
+    for _ in range(3000):
+        for employee in walkers:
+            if employee.state == EmployeeState.MOVING:
+                employee._update_movement(0.1)
+        if all(employee.state == EmployeeState.WORKING for employee in walkers):
+            break
+    assert all((employee.x, employee.y) == start for employee, (start, _) in zip(walkers, queries))
+    batches = batched.worker_pool.batches
+    batched.close()
+    print(f"[OK] Test 11: {len(queries)} batched routes planned in {batches} worker batches")
+    
+    print("\n[SUCCESS] All pathfinding tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_pathfinding()
+    if not success:
+        sys.exit(1)
@@ -9,6 +9,7 @@ import os
 # Add the scripts directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
 
+from scripts.core.config import GRID_WIDTH, GRID_HEIGHT
 from scripts.core.event_system import EventSystem
 from scripts.core.grid_manager import GridManager
 from scripts.core.inventory_manager import InventoryManager
@@ -141,6 +142,35 @@ def test_spatial_benefits():
         distance = abs(building.x - 8) + abs(building.y - 8)
         print(f"     * {building.building_type.name} at ({building.x}, {building.y}), distance {distance}")
     
+    print("\n7. Testing Influence Maps Match Building Scan:")
+    mismatches = 0
+    for y in range(GRID_HEIGHT):
+        for x in range(GRID_WIDTH):
+            raster = building_manager.get_spatial_benefits_at(x, y)
+            scanned = building_manager._scan_spatial_benefits_at(x, y)
+            if any(abs(raster[key] - scanned[key]) > 1e-9 for key in scanned):
+                mismatches += 1
+    print(f"   - Tiles where influence maps differ from the building scan: {mismatches}")
+    assert mismatches == 0
+    
+    print("\n8. Testing Batch Harvest Matches Per-Tile Harvest:")
+    # Rows 6 and 10 mirror each other around the silo at (8, 8)
+    rows = {6: [], 10: []}
+    for y, row in rows.items():
+        for x in range(4, 13):
+            tile = grid_manager.get_tile(x, y)
+            tile.soil_quality = 8
+            tile.water_level = 90
+            tile.soil_nutrients = {'nitrogen': 90, 'phosphorus': 90, 'potassium': 90}
+            tile.till()
+            tile.plant('wheat')
+            row.append(tile)
+    grid_manager._handle_day_passed({'days': 5})
+    single_total = sum(tile.harvest(grid_manager)[1] for tile in rows[6])
+    batch_total = grid_manager.harvest_tiles(rows[10])['wheat']['quantity']
+    print(f"   - Per-tile harvest: {single_total} wheat, batch harvest: {batch_total} wheat")
+    assert single_total == batch_total
+    
     print("\n=== Spatial Building Benefits Test Complete ===")
     print(f"Final economy balance: ${economy_manager.get_current_balance()}")
 
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script for the travel-minimizing task assignment engine
+
+Verifies that selections are cut into balanced compact clusters, that clusters go
+to employees at minimum total entry cost, that tours are valid and shorter than
+list order, and that EmployeeManager queues tiles in the planned walking order.
+"""
+
+import sys
+import os
+import random
+from itertools import permutations
+
+import numpy as np
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.employee.employee_manager import EmployeeManager
+from scripts.employee.task_assignment import TaskAssignmentEngine, hungarian, sweep_clusters, order_tour
+
+
+def walk_length(start, tiles):
+    """Manhattan length of walking from start through tiles in order"""
+    length = 0
+    x, y = start
+    for tile in tiles:
+        length += abs(tile.x - x) + abs(tile.y - y)
+        x, y = tile.x, tile.y
+    return length
+
+
+def test_task_assignment():
+    """Test clustering, matching, tour ordering and EmployeeManager integration"""
+    print("=== Testing Task Assignment Engine ===\n")
+    rng = random.Random(3)
+    
+    # Test 1: Hungarian assignment matches brute force
+    for _ in range(40):
+        rows, columns = rng.randrange(1, 6), rng.randrange(1, 6)
+        rows = min(rows, columns)
+        cost = np.array([[rng.randrange(50) for _ in range(columns)] for _ in range(rows)])
+        assignment = hungarian(cost)
+        best = min(sum(cost[row, column] for row, column in enumerate(choice))
+                   for choice in permutations(range(columns), rows))
+        assert len(set(assignment)) == rows and sum(cost[row, column] for row, column in enumerate(assignment)) == best
+    print("[OK] Test 1: Hungarian assignment matched brute force on 40 cost matrices")
+    
+    # Test 2: Sweep clusters cover every tile once with near-equal sizes
+    coords = np.array([(rng.randrange(100), rng.randrange(100)) for _ in range(997)])
+    clusters = sweep_clusters(coords, 7)
+    sizes = sorted(len(cluster) for cluster in clusters)
+    assert sorted(np.concatenate(clusters).tolist()) == list(range(997)) and sizes[-1] - sizes[0] <= 3
+    print(f"[OK] Test 2: 997 tiles split into clusters of {sizes[0]}-{sizes[-1]}")
+    
+    # Test 3: Tours visit every point once and report their walking length
+    points = np.array([(rng.randrange(30), rng.randrange(30)) for _ in range(80)])
+    order, length = order_tour(np.array([0, 0]), points)
+    assert sorted(order.tolist()) == list(range(80))
+    steps = np.vstack(([0, 0], points[order]))
+    assert length == int(np.abs(np.diff(steps, axis=0)).sum())
+    print(f"[OK] Test 3: Tour through 80 tiles walks {length} tiles")
+    
+    # Test 4: Planned shares walk less than row-major slices
+    grid_manager = GridManager(EventSystem(), width=64, height=64)
+    tiles = [grid_manager.get_tile(x, y) for y in range(10, 50) for x in range(5, 45)]
+    starts = [(0.0, 0.0), (63.0, 0.0), (0.0, 63.0), (63.0, 63.0), (30.0, 30.0), (40.0, 5.0)]
+    engine = TaskAssignmentEngine()
+    shares = engine.plan(list(tiles), starts)
+    assert sorted((tile.x, tile.y) for share in shares for tile in share) == sorted((t.x, t.y) for t in tiles)
+    assert max(map(len, shares)) - min(map(len, shares)) <= 3
+    assert engine.last_travel == sum(walk_length(start, share) for start, share in zip(starts, shares))
+    per_employee = len(tiles) // len(starts)
+    slices = [tiles[number * per_employee:(number + 1) * per_employee] for number in range(len(starts))]
+    baseline = sum(walk_length(start, share) for start, share in zip(starts, slices))
+    assert engine.last_travel < baseline
+    print(f"[OK] Test 4: Crew walks {engine.last_travel} tiles instead of {baseline:.0f} with row-major slices")
+    
+    # Test 5: EmployeeManager queues each employee's share in walking order
+    grid_manager = GridManager(EventSystem())
+    manager = EmployeeManager(grid_manager.event_system, grid_manager, create_starting_employee=False)
+    crew = [manager.employees[manager.hire_employee(f"Worker {number}")] for number in range(3)]
+    for employee, (x, y) in zip(crew, ((0.0, 0.0), (15.0, 0.0), (8.0, 15.0))):
+        employee.x, employee.y = x, y
+    field = [grid_manager.get_tile(x, y) for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH)]
+    assert manager._distribute_tiles_among_employees(field, 'till', crew)
+    grid_manager.event_system.process_events()
+    queued = [employee.assigned_tasks[0].tiles for employee in crew]
+    assert sum(map(len, queued)) == len(field)
+    assert all(tile.task_assigned_to == employee.id for employee, share in zip(crew, queued) for tile in share)
+    assert all(abs(share[0].x - employee.x) + abs(share[0].y - employee.y) <= 3 for employee, share in zip(crew, queued))
+    print(f"[OK] Test 5: {len(field)} tiles queued for {len(crew)} employees, each starting beside them")
+    
+    print("\n[SUCCESS] All task assignment tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_task_assignment()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for indexed employee task queues
+
+Verifies that tasks hand out, complete, drop and give away tiles in O(1) while
+keeping the crew-wide tile -> (employee, task) index in step, that employees work
+their queues through the new task objects, that cancelling a selection only
+touches the cancelled tiles, and that queues survive a save round trip.
+"""
+
+import sys
+import os
+import json
+import time
+from types import SimpleNamespace
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.core.save_manager import SaveManager
+from scripts.employee.employee import EmployeeState
+from scripts.employee.employee_manager import EmployeeManager
+from scripts.employee.task_queue import Task, TaskIndex
+
+
+def test_task_queue():
+    """Test task operations, the reverse index and EmployeeManager integration"""
+    print("=== Testing Indexed Task Queues ===\n")
+    grid_manager = GridManager(EventSystem(), width=128, height=128)
+    
+    # Test 1: Next, complete, discard and pop_tail keep the index in step
+    index = TaskIndex()
+    row = [grid_manager.get_tile(x, 0) for x in range(10)]
+    task = Task('plant', row, 'worker', index, crop_type='corn')
+    assert task.next_tile() == row[0] and task.complete(row[0]) and not task.complete(row[0])
+    assert task.discard(row[4]) and task.pop_tail(3) == row[7:] and task.last_tile() == row[6]
+    assert task.tiles == [row[0]] + row[1:4] + row[5:7] and set(index.tasks) == set(row[1:4] + row[5:7])
+    assert index.lookup(row[5]) == ('worker', task) and index.lookup(row[4]) is None
+    restored = Task.from_dict(task.to_dict(), 'worker', TaskIndex())
+    assert (restored.tiles, restored.completed_tiles, restored.params) == (task.tiles, [row[0]], {'crop_type': 'corn'})
+    print(f"[OK] Test 1: {task.remaining} tiles left after completing, discarding and giving away {len(row) - task.remaining}")
+    
+    # Test 2: An employee works its queue through the task objects
+    manager = EmployeeManager(grid_manager.event_system, grid_manager, create_starting_employee=False)
+    worker = manager.employees[manager.hire_employee("Worker")]
+    field = [grid_manager.get_tile(x, 8) for x in range(8, 12)]
+    for tile in field:
+        tile.task_assignment, tile.task_assigned_to = 'till', worker.id
+    manager.assign_task_to_employee(worker.id, 'till', field)
+    for _ in range(400):
+        manager.update(0.1)
+    assert all(tile.terrain_type == 'tilled' and tile.task_assigned_to is None for tile in field)
+    assert not worker.assigned_tasks and worker.state == EmployeeState.IDLE and not manager.task_index
+    print(f"[OK] Test 2: {worker.name} tilled {len(field)} tiles and emptied the queue and index")
+    
+    # Test 3: Cancelling a selection only touches the cancelled tiles
+    crew = [worker] + [manager.employees[manager.hire_employee(f"Worker {number}")] for number in range(3)]
+    tiles = [grid_manager.get_tile(x, y) for y in range(20, 100) for x in range(20, 70)]
+    assert manager._distribute_tiles_among_employees(tiles, 'till', crew)
+    grid_manager.event_system.process_events()
+    for number, employee in enumerate(crew):  # Plus a long queue of single-tile tasks
+        for x in range(100, 120):
+            tile = grid_manager.get_tile(x, number)
+            tile.task_assignment, tile.task_assigned_to = 'till', employee.id
+            employee.assign_task('till', [tile])
+    assert len(manager.task_index) == len(tiles) + 80
+    grid_manager.selected_tiles.set_rect(20, 20, 70, 60)
+    started = time.perf_counter()
+    assert manager.cancel_tasks_on_selection()
+    cancel_time = time.perf_counter() - started
+    grid_manager.selected_tiles.set_rect(100, 0, 110, 4)
+    assert manager.cancel_tasks_on_selection()
+    queued = {tile: employee for employee in crew for task in employee.assigned_tasks for tile in task.pending}
+    assert len(queued) == len(manager.task_index) == len(tiles) // 2 + 40
+    assert all(manager.task_index.lookup(tile)[0] is employee for tile, employee in queued.items())
+    assert all(tile.task_assigned_to == employee.id for tile, employee in queued.items())
+    print(f"[OK] Test 3: Cancelled {len(tiles) // 2 + 40} of {len(tiles) + 80} queued tiles ({cancel_time * 1000:.1f} ms)")
+    
+    # Test 4: Queues survive a save round trip with the index rebuilt
+    save_manager = SaveManager.__new__(SaveManager)
+    save_manager.game_manager = SimpleNamespace(grid_manager=grid_manager, employee_manager=manager)
+    state = json.loads(json.dumps(save_manager._get_employee_manager_state()))
+    before = {employee.id: [(task.type, task.status, task.tiles) for task in employee.assigned_tasks]
+              for employee in crew}
+    save_manager._apply_employee_manager_state(state)
+    after = {employee.id: [(task.type, task.status, task.tiles) for task in employee.assigned_tasks]
+             for employee in manager.employees.values()}
+    assert after == before and len(manager.task_index) == len(queued)
+    assert all(employee.current_task is None or employee.current_task in employee.assigned_tasks
+               for employee in manager.employees.values())
+    print(f"[OK] Test 4: {sum(map(len, after.values()))} tasks restored with {len(manager.task_index)} indexed tiles")
+    
+    print("\n[SUCCESS] All task queue tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_task_queue()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test script for the columnar tile store behind GridManager
+
+Verifies that Tile views read and write through to the TileStore column buffers
+and that existing tile APIs (till, plant, harvest, grid[y][x]) keep working.
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the scripts directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager, Tile
+from scripts.core.tile_store import CROP_TABLE, NO_ID
+
+
+def test_tile_store():
+    """Test that tile views and the column store stay in sync"""
+    print("=== Testing Columnar Tile Store ===\n")
+    
+    event_system = EventSystem()
+    grid_manager = GridManager(event_system)
+    store = grid_manager.tile_store
+    
+    # Test 1: Store covers the whole grid
+    assert store.size == GRID_WIDTH * GRID_HEIGHT
+    assert len(grid_manager.grid) == GRID_HEIGHT and len(grid_manager.grid[0]) == GRID_WIDTH
+    print(f"[OK] Test 1: Store holds {store.size} tiles in {store.nbytes()} bytes")
+    
+    # Test 2: Tile views write through to the columns
+    tile = grid_manager.get_tile(3, 4)
+    index = store.index_of(3, 4)
+    assert tile.till()
+    assert tile.plant('wheat')
+    assert store.crop_id[index] == CROP_TABLE.id_for('wheat')
+    assert store.nutrients[0, index] == 100 - CROP_SOIL_EFFECTS['wheat']['depletes']['nitrogen']
+    assert grid_manager.grid[4][3].current_crop == 'wheat'
+    print("[OK] Test 2: Tile writes land in the store")
+    
+    # Test 3: Views of the same slot compare equal
+    assert grid_manager.get_tile(3, 4) == tile
+    assert len({tile, grid_manager.get_tile(3, 4), grid_manager.get_tile(4, 3)}) == 2
+    print("[OK] Test 3: Tile views compare and hash by storage slot")
+    
+    # Test 4: Growth and harvest through the view
+    grid_manager._handle_day_passed({'days': 1})
+    assert tile.can_harvest()
+    crop_type, yield_amount = tile.harvest(grid_manager)
+    assert crop_type == 'wheat' and yield_amount > 0
+    assert store.crop_id[index] == NO_ID and tile.terrain_type == 'tilled'
+    print(f"[OK] Test 4: Harvested {yield_amount} {crop_type} through tile view")
+    
+    # Test 5: Standalone tiles still work
+    standalone = Tile(5, 5)
+    standalone.soil_nutrients = {'nitrogen': 75, 'phosphorus': 60, 'potassium': 85}
+    standalone.crop_history = ['corn', 'wheat']
+    assert standalone.soil_nutrients['phosphorus'] == 60
+    assert standalone.get_soil_health_level() == 'good'
+    print("[OK] Test 5: Standalone tile keeps its own store")
+    
+    # Test 6: Batched growth kernel matches the per-tile growth rules
+    reference = Tile(0, 0)
+    for x in range(4):
+        grid_tile = grid_manager.get_tile(x, 10)
+        grid_tile.till()
+        grid_tile.plant('corn')
+    grid_manager.get_tile(0, 10).has_irrigation = True
+    reference.till()
+    reference.plant('corn')
+    changed = store.advance_growth(0.05, 0.7, irrigated_growth_modifier=1.0)
+    reference.update_growth(0.05, 0.7)
+    assert changed.size == 4
+    assert grid_manager.get_tile(1, 10).growth_stage == reference.growth_stage
+    assert grid_manager.get_tile(0, 10).days_growing > grid_manager.get_tile(1, 10).days_growing
+    print(f"[OK] Test 6: Growth kernel advanced {changed.size} tiles in one pass")
+    
+    # Test 7: Scheduled maturation only touches tiles whose deadline passed
+    scheduler = grid_manager.maturation_scheduler
+    scheduled = grid_manager.get_tile(6, 12)
+    scheduled.till()
+    scheduled.plant('wheat')
+    days_per_stage = CROP_TYPES['wheat']['growth_time'] / len(GROWTH_STAGES)
+    scheduler.advance(days_per_stage * 0.5)
+    assert scheduled.growth_stage == 0
+    assert abs(scheduled.days_growing - days_per_stage * 0.5) < 1e-9  # Materialized lazily
+    changed = scheduler.advance(days_per_stage * 0.6)
+    assert scheduled.growth_stage == 1
+    assert any(store.index_of(6, 12) in changed_indices for store, changed_indices in changed)
+    
+    # Weather change re-keys the deadline at the new rate
+    scheduler.set_growth_modifiers(0.5)
+    scheduler.advance(days_per_stage * 1.0)
+    assert scheduled.growth_stage == 1  # Needs 0.9 stage-days at half speed
+    scheduler.advance(days_per_stage * 0.9)
+    assert scheduled.growth_stage == 2
+    print(f"[OK] Test 7: Scheduler advanced tile to stage {scheduled.growth_stage} with weather re-key")
+    
+    # Test 8: Index sets follow till/plant/harvest/task/building changes
+    planted_before = len(grid_manager.get_planted_tiles())
+    indexed = grid_manager.get_tile(12, 2)
+    indexed.till()
+    indexed.plant('corn')
+    indexed.task_assignment = 'harvest'
+    assert len(grid_manager.get_planted_tiles()) == planted_before + 1
+    assert indexed in grid_manager.get_tasked_tiles('harvest')
+    grid_manager._handle_day_passed({'days': 3})
+    assert indexed in grid_manager.get_harvestable_tiles()
+    indexed.harvest(grid_manager)
+    indexed.task_assignment = None
+    assert indexed not in grid_manager.get_harvestable_tiles()
+    assert indexed not in grid_manager.get_tasked_tiles()
+    grid_manager.place_building_at(14, 14, 'water_cooler')
+    assert [(tile.x, tile.y) for tile in grid_manager.get_building_tiles('water_cooler')] == [(14, 14)]
+    print(f"[OK] Test 8: Index sets track tiles {grid_manager.get_tile_counts()}")
+    
+    # Test 9: Batch harvest gives the same yields as harvesting tile by tile, scaled by the weather
+    farms = []
+    for _ in range(3):
+        farm = GridManager(EventSystem())
+        farm.game_manager = SimpleNamespace(specialization_manager=SimpleNamespace(
+            get_bonus_multiplier=lambda bonus_type, default=1.0: {'wheat_yield_multiplier': 1.25,
+                                                                  'rotation_bonus_multiplier': 1.5}.get(bonus_type, default)))
+        farm.place_building_at(2, 2, 'storage_silo')
+        for x in range(GRID_WIDTH):
+            farm_tile = farm.get_tile(x, 6)
+            farm_tile.soil_quality = 3 + x % 8
+            farm_tile.water_level = 40 + x * 3
+            farm_tile.crop_history = ['corn'] if x % 3 == 0 else []
+            farm_tile.soil_nutrients = {'nitrogen': 10 + x * 5, 'phosphorus': 50, 'potassium': 90}
+            farm_tile.till()
+            farm_tile.plant(('wheat', 'corn', 'tomatoes')[x % 3])
+        farm._handle_day_passed({'days': 5})
+        farms.append(farm)
+    
+    expected = {}
+    for x in range(GRID_WIDTH):
+        crop_type, amount = farms[0].get_tile(x, 6).harvest(farms[0])
+        if crop_type is not None:  # Some plantings fail on depleted soil
+            expected[crop_type] = expected.get(crop_type, 0) + amount
+    ripe = len(farms[1].get_harvestable_tiles())
+    totals = farms[1].harvest_tiles([farms[1].get_tile(x, 6) for x in range(GRID_WIDTH)])
+    assert {crop: total['quantity'] for crop, total in totals.items()} == expected
+    assert sum(total['tiles'] for total in totals.values()) == ripe
+    assert not farms[1].get_harvestable_tiles() and farms[1].get_tile(0, 6).terrain_type == 'tilled'
+    assert farms[1].harvest_tiles() == {}
+    farms[2].event_system.emit('weather_updated', {'weather_event': 'storm', 'growth_modifier': 1.0, 'yield_modifier': 0.5})
+    farms[2].event_system.process_events()
+    stormy = farms[2].harvest_tiles()
+    assert all(stormy[crop]['tiles'] == total['tiles'] and stormy[crop]['quantity'] < total['quantity']
+               for crop, total in totals.items())
+    print(f"[OK] Test 9: Batch harvest matched per-tile yields {expected} ({stormy['wheat']['quantity']} wheat in a storm)")
+    
+    print("\n[SUCCESS] All tile store tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_tile_store()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,176 @@
+"""
+Crowd Movement Benchmark for Farming Simulation Game
+
+Simulates crews of employees walking between random tiles of a farm, once with
+every employee following its own path (employees walk through each other) and
+once in cooperative mode (reservation table, employees give way), so the cost
+of collision-free movement can be checked against the frame budget.
+
+Usage:
+    python tools/crowd_benchmark.py
+    python tools/crowd_benchmark.py --agents=10,100,500 --size=192 --seconds=60
+    python tools/crowd_benchmark.py --help
+
+Features:
+- Continuous traffic: each employee picks a new random goal on arrival
+- Frame time (mean and worst) for movement plus planning per mode and crew size
+- Trips completed, collisions (employees sharing a tile at a step) and, for the
+  cooperative planner, replans, search expansions and deadlock-breaking windows
+- Optional JSON output for comparing runs
+"""
+
+import sys
+import os
+import io
+import argparse
+import json
+import random
+import time
+from contextlib import redirect_stdout
+from typing import Dict, List
+
+# Add the parent directory to sys.path to import game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import game configuration and systems
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.employee.employee import Employee, EmployeeState
+from scripts.employee.pathfinding import Pathfinder
+
+
+DEFAULT_AGENTS = '10,100,500'  # Crew sizes to simulate
+DEFAULT_SIZE = 128  # Farm side length (tiles)
+DEFAULT_BUILDINGS = 1500  # Randomly placed single-tile buildings
+DEFAULT_SECONDS = 30  # Simulated seconds per run
+FPS = 30  # Simulation frames per second
+MODES = ('jps', 'cooperative')  # Independent paths vs reservation table
+
+
+def build_farm(size: int, buildings: int, seed: int) -> GridManager:
+    """Create a size x size farm with randomly placed buildings"""
+    rng = random.Random(seed)
+    with redirect_stdout(io.StringIO()):
+        grid_manager = GridManager(EventSystem(), width=size, height=size)
+        for _ in range(buildings):
+            grid_manager.place_building_at(rng.randrange(size), rng.randrange(size), 'storage_silo', object())
+    return grid_manager
+
+
+def count_collisions(employees: List[Employee]) -> int:
+    """Employees standing on a tile that another employee also stands on"""
+    tiles: Dict = {}
+    for employee in employees:
+        tile = (int(round(employee.x)), int(round(employee.y)))
+        tiles[tile] = tiles.get(tile, 0) + 1
+    return sum(count for count in tiles.values() if count > 1)
+
+
+def run_crowd(grid_manager: GridManager, mode: str, agents: int, seconds: int, seed: int) -> Dict:
+    """Simulate one crew in one pathfinding mode"""
+    rng = random.Random(seed)
+    free = [(x, y) for y in range(grid_manager.height) for x in range(grid_manager.width)
+            if not grid_manager.passability.is_blocked(x, y)]
+    pathfinder = Pathfinder(grid_manager, mode=mode)
+    planner = pathfinder.cooperative_planner
+    dt = 1.0 / FPS
+    step_frames = max(1, int(round(FPS / EMPLOYEE_SPEED)))  # Frames per tile walked
+    
+    frame_times = []
+    trips = 0
+    collisions = 0
+    with redirect_stdout(io.StringIO()):
+        employees = []
+        for number, (x, y) in enumerate(rng.sample(free, agents)):
+            employee = Employee(f"emp_{number:03d}", f"Worker {number}", float(x), float(y))
+            employee.pathfinder = pathfinder
+            employees.append(employee)
+        
+        for frame in range(seconds * FPS):
+            started = time.perf_counter()
+            for employee in employees:
+                if employee.state != EmployeeState.MOVING:
+                    if frame:
+                        trips += 1
+                    employee._move_to_tile(*rng.choice(free))
+                else:
+                    employee._update_movement(dt)
+            if planner is not None:
+                planner.update(dt, employees)
+            frame_times.append(time.perf_counter() - started)
+            if frame % step_frames == 0:
+                collisions += count_collisions(employees)
+    
+    result = {
+        'mode': mode,
+        'agents': agents,
+        'seconds': seconds,
+        'frame_ms': sum(frame_times) / len(frame_times) * 1000,
+        'worst_frame_ms': max(frame_times) * 1000,
+        'trips': trips,
+        'collisions': collisions
+    }
+    if planner is not None:
+        stats = planner.get_stats()
+        result.update({
+            'replans': stats['replans'],
+            'expansions_per_replan': stats['expansions'] / max(1, stats['replans']),
+            'conflicts': stats['conflicts'],
+            'ghost_plans': stats['ghost_plans']
+        })
+    return result
+
+
+def run_benchmark(crews: List[int], size: int, buildings: int, seconds: int, seed: int) -> List[Dict]:
+    """Simulate every crew size in both modes on the same farm"""
+    grid_manager = build_farm(size, buildings, seed)
+    results = []
+    for agents in crews:
+        for mode in MODES:
+            results.append(run_crowd(grid_manager, mode, agents, seconds, seed + agents))
+            results[-1].update({'farm_size': size, 'buildings': buildings})
+    return results
+
+
+def print_report(results: List[Dict]):
+    """Print a table of per-crew movement costs"""
+    print("=== Crowd Movement Benchmark ===\n")
+    first = results[0]
+    print(f"Farm {first['farm_size']}x{first['farm_size']}, {first['buildings']} buildings, "
+          f"{first['seconds']} simulated seconds at {FPS} fps\n")
+    header = (f"{'Agents':>7} {'Mode':>12} {'Frame ms':>9} {'Worst ms':>9} {'Trips':>6} {'Collisions':>11} "
+              f"{'Replans':>8} {'Exp/plan':>9} {'Ghost':>6}")
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        line = (f"{row['agents']:>7} {row['mode']:>12} {row['frame_ms']:>9.2f} {row['worst_frame_ms']:>9.2f} "
+                f"{row['trips']:>6} {row['collisions']:>11}")
+        if 'replans' in row:
+            line += f" {row['replans']:>8} {row['expansions_per_replan']:>9.1f} {row['ghost_plans']:>6}"
+        print(line)
+
+
+def main():
+    """Parse arguments and run the benchmark"""
+    parser = argparse.ArgumentParser(description="Time crews of employees walking with and without cooperative planning")
+    parser.add_argument('--agents', type=str, default=DEFAULT_AGENTS, help="Comma-separated crew sizes")
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE, help="Farm side length (max %d)" % MAX_GRID_SIZE)
+    parser.add_argument('--buildings', type=int, default=DEFAULT_BUILDINGS, help="Randomly placed buildings")
+    parser.add_argument('--seconds', type=int, default=DEFAULT_SECONDS, help="Simulated seconds per run")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for buildings and goals")
+    parser.add_argument('--json', type=str, default=None, help="Optional path to write results as JSON")
+    args = parser.parse_args()
+    
+    crews = [int(count) for count in args.agents.split(',')]
+    results = run_benchmark(crews, args.size, args.buildings, args.seconds, args.seed)
+    print_report(results)
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Memory Benchmark for Farming Simulation Game
+
+Measures how many bytes the core per-object state costs as the farm grows, so that
+changes to the tile store, Employee or CropEntry layouts can be checked against the
+footprint of running many balance simulations in one process.
+
+Usage:
+    python tools/memory_benchmark.py
+    python tools/memory_benchmark.py --sizes=64,256,1024 --employees-per-chunk=2
+    python tools/memory_benchmark.py --help
+
+Features:
+- Bytes per tile for fully allocated chunked farms of increasing size
+- Bytes per employee and per inventory entry, scaled with the farm
+- Allocation totals measured with tracemalloc (includes lists, dicts and arrays
+  owned by each object, not just the object header)
+- Optional JSON output for comparing runs
+"""
+
+import sys
+import os
+import io
+import gc
+import argparse
+import json
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List, Tuple, Any
+
+# Add the parent directory to sys.path to import game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import game configuration and systems
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.core.inventory_manager import InventoryManager, CropEntry
+from scripts.employee.employee import Employee
+from scripts.employee.employee_store import EmployeeStore
+
+
+DEFAULT_SIZES = [32, 128, 512, 1024]  # Farm side lengths (tiles)
+DEFAULT_EMPLOYEES_PER_CHUNK = 1  # Employees hired per fully allocated 32x32 chunk
+DEFAULT_ENTRIES_PER_EMPLOYEE = 20  # Inventory entries produced per employee
+
+
+def measure_allocation(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """
+    Run build() under tracemalloc and return (result, bytes still allocated)
+    
+    The result is returned so it stays alive until the measurement is taken.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    
+    # Game objects log on creation; keep the report readable
+    with redirect_stdout(io.StringIO()):
+        result = build()
+    
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, after - before
+
+
+def build_farm(size: int) -> GridManager:
+    """Create a size x size farm with every chunk allocated"""
+    grid_manager = GridManager(EventSystem(), width=size, height=size)
+    chunk_size = grid_manager.chunk_size
+    for chunk_y in range(0, size, chunk_size):
+        for chunk_x in range(0, size, chunk_size):
+            grid_manager.get_tile(chunk_x, chunk_y)  # Touching one tile allocates the chunk
+    return grid_manager
+
+
+def build_employees(count: int, size: int) -> List[Employee]:
+    """Create employees spread across the farm, each with a trait, sharing one store like EmployeeManager's"""
+    store = EmployeeStore()
+    employees = []
+    for i in range(count):
+        employee = Employee(f"emp_{i}", f"Worker {i}", float(i % size), float((i // size) % size), store=store)
+        employee.add_trait('hard_worker')
+        employees.append(employee)
+    return employees
+
+
+def build_inventory(count: int) -> InventoryManager:
+    """Create an inventory holding count crop entries (bypassing capacity checks)"""
+    inventory = InventoryManager(EventSystem())
+    crop_types = list(inventory.crops.keys())
+    for i in range(count):
+        crop_type = crop_types[i % len(crop_types)]
+        inventory.crops[crop_type].append(CropEntry(crop_type, 1 + i % 50, 0.5 + (i % 50) / 100.0, 1 + i % 30))
+    return inventory
+
+
+def run_benchmark(sizes: List[int], employees_per_chunk: int, entries_per_employee: int) -> List[Dict]:
+    """Measure per-object memory for each farm size"""
+    results = []
+    for size in sizes:
+        tiles = size * size
+        chunks = max(1, tiles // (CHUNK_SIZE * CHUNK_SIZE))
+        employee_count = max(1, chunks * employees_per_chunk)
+        entry_count = employee_count * entries_per_employee
+        
+        farm, farm_bytes = measure_allocation(lambda: build_farm(size))
+        store_bytes = farm.chunked_grid.nbytes()
+        del farm
+        
+        employees, employee_bytes = measure_allocation(lambda: build_employees(employee_count, size))
+        del employees
+        
+        inventory, inventory_bytes = measure_allocation(lambda: build_inventory(entry_count))
+        del inventory
+        
+        results.append({
+            'farm_size': size,
+            'tiles': tiles,
+            'employees': employee_count,
+            'inventory_entries': entry_count,
+            'bytes_per_tile': farm_bytes / tiles,
+            'store_bytes_per_tile': store_bytes / tiles,
+            'bytes_per_employee': employee_bytes / employee_count,
+            'bytes_per_inventory_entry': inventory_bytes / entry_count,
+            'total_mb': (farm_bytes + employee_bytes + inventory_bytes) / (1024 * 1024)
+        })
+    return results
+
+
+def print_report(results: List[Dict]):
+    """Print a table of per-object memory costs"""
+    print("=== Memory Benchmark ===\n")
+    header = f"{'Farm':>10} {'Tiles':>9} {'B/tile':>8} {'(store)':>8} {'Emps':>6} {'B/emp':>8} {'Entries':>8} {'B/entry':>8} {'Total MB':>9}"
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        farm = f"{row['farm_size']}x{row['farm_size']}"
+        print(f"{farm:>10} {row['tiles']:>9} {row['bytes_per_tile']:>8.1f} {row['store_bytes_per_tile']:>8.1f} "
+              f"{row['employees']:>6} {row['bytes_per_employee']:>8.1f} {row['inventory_entries']:>8} "
+              f"{row['bytes_per_inventory_entry']:>8.1f} {row['total_mb']:>9.2f}")
+
+
+def main():
+    """Parse arguments and run the benchmark"""
+    parser = argparse.ArgumentParser(description="Measure per-object memory use for growing farms")
+    parser.add_argument('--sizes', type=str, default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="Comma-separated farm side lengths (max %d)" % MAX_GRID_SIZE)
+    parser.add_argument('--employees-per-chunk', type=int, default=DEFAULT_EMPLOYEES_PER_CHUNK,
+                        help="Employees created per 32x32 chunk of farm")
+    parser.add_argument('--entries-per-employee', type=int, default=DEFAULT_ENTRIES_PER_EMPLOYEE,
+                        help="Inventory entries created per employee")
+    parser.add_argument('--json', type=str, default=None, help="Optional path to write results as JSON")
+    args = parser.parse_args()
+    
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results = run_benchmark(sizes, args.employees_per_chunk, args.entries_per_employee)
+    print_report(results)
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Pathfinding Benchmark for Farming Simulation Game
+
+Times cross-map path requests for each Pathfinder mode on a large farm scattered
+with buildings, so changes to the search code can be checked against the budget of
+answering many employee path requests per frame.
+
+Usage:
+    python tools/pathfinding_benchmark.py
+    python tools/pathfinding_benchmark.py --size=1024 --buildings=20000 --queries=50
+    python tools/pathfinding_benchmark.py --help
+
+Features:
+- Corner-to-corner queries on a size x size farm with randomly placed buildings
+- Cold time (first query, including graph construction) and warm time per mode
+- Average waypoint count and route length per mode
+- Optional JSON output for comparing runs
+"""
+
+import sys
+import os
+import io
+import argparse
+import json
+import random
+import time
+from contextlib import redirect_stdout
+from typing import Dict, List, Tuple
+
+# Add the parent directory to sys.path to import game modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import game configuration and systems
+from scripts.core.config import *
+from scripts.core.event_system import EventSystem
+from scripts.core.grid_manager import GridManager
+from scripts.employee.pathfinding import Pathfinder, PATHFINDING_MODES
+
+
+DEFAULT_SIZE = 512  # Farm side length (tiles)
+DEFAULT_BUILDINGS = 3000  # Randomly placed single-tile buildings
+DEFAULT_QUERIES = 30  # Corner-to-corner path requests per mode
+CORNER = 40  # Queries start and end within this many tiles of opposite corners
+
+
+def build_farm(size: int, buildings: int, seed: int) -> GridManager:
+    """Create a size x size farm with randomly placed buildings"""
+    rng = random.Random(seed)
+    with redirect_stdout(io.StringIO()):
+        grid_manager = GridManager(EventSystem(), width=size, height=size)
+        for _ in range(buildings):
+            grid_manager.place_building_at(rng.randrange(size), rng.randrange(size), 'storage_silo', object())
+    return grid_manager
+
+
+def make_queries(grid_manager: GridManager, count: int, seed: int) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """Random walkable start/goal pairs near opposite corners of the farm"""
+    rng = random.Random(seed)
+    size = grid_manager.width
+    queries = []
+    while len(queries) < count:
+        start = (rng.randrange(CORNER), rng.randrange(CORNER))
+        goal = (rng.randrange(size - CORNER, size), rng.randrange(size - CORNER, size))
+        if not grid_manager.passability.is_blocked(*start) and not grid_manager.passability.is_blocked(*goal):
+            queries.append((start, goal))
+    return queries
+
+
+def route_length(path: List[Tuple[int, int]]) -> int:
+    """Manhattan length of a waypoint path"""
+    return sum(abs(a[0] - b[0]) + abs(a[1] - b[1]) for a, b in zip(path, path[1:]))
+
+
+def run_benchmark(size: int, buildings: int, queries: int, seed: int) -> List[Dict]:
+    """Time every pathfinding mode on the same farm and queries"""
+    grid_manager = build_farm(size, buildings, seed)
+    requests = make_queries(grid_manager, queries, seed + 1)
+    results = []
+    for mode in PATHFINDING_MODES:
+        # Cold: construction plus the first request (builds any lazy structures)
+        started = time.perf_counter()
+        pathfinder = Pathfinder(grid_manager, mode=mode)
+        pathfinder.find_path(*requests[0])
+        cold = time.perf_counter() - started
+        
+        # Warm-up pass, then timed pass with the path cache cleared before every request
+        for start, goal in requests:
+            pathfinder.clear_cache()
+            pathfinder.find_path(start, goal)
+        paths = []
+        elapsed = 0.0
+        for start, goal in requests:
+            pathfinder.clear_cache()
+            started = time.perf_counter()
+            paths.append(pathfinder.find_path(start, goal))
+            elapsed += time.perf_counter() - started
+        
+        found = [path for path in paths if path]
+        results.append({
+            'mode': mode,
+            'farm_size': size,
+            'buildings': buildings,
+            'queries': len(requests),
+            'found': len(found),
+            'cold_ms': cold * 1000,
+            'warm_ms': elapsed / len(requests) * 1000,
+            'waypoints': sum(len(path) for path in found) / max(1, len(found)),
+            'route_length': sum(route_length(path) for path in found) / max(1, len(found))
+        })
+    return results
+
+
+def print_report(results: List[Dict]):
+    """Print a table of per-mode path timings"""
+    print("=== Pathfinding Benchmark ===\n")
+    first = results[0]
+    print(f"Farm {first['farm_size']}x{first['farm_size']}, {first['buildings']} buildings, {first['queries']} corner-to-corner queries\n")
+    header = f"{'Mode':>14} {'Found':>6} {'Cold ms':>9} {'Warm ms':>9} {'Waypoints':>10} {'Length':>8}"
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(f"{row['mode']:>14} {row['found']:>6} {row['cold_ms']:>9.2f} {row['warm_ms']:>9.3f} "
+              f"{row['waypoints']:>10.1f} {row['route_length']:>8.1f}")
+
+
+def main():
+    """Parse arguments and run the benchmark"""
+    parser = argparse.ArgumentParser(description="Time cross-map path requests for each pathfinding mode")
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE, help="Farm side length (max %d)" % MAX_GRID_SIZE)
+    parser.add_argument('--buildings', type=int, default=DEFAULT_BUILDINGS, help="Randomly placed buildings")
+    parser.add_argument('--queries', type=int, default=DEFAULT_QUERIES, help="Path requests per mode")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for buildings and queries")
+    parser.add_argument('--json', type=str, default=None, help="Optional path to write results as JSON")
+    args = parser.parse_args()
+    
+    results = run_benchmark(args.size, args.buildings, args.queries, args.seed)
+    print_report(results)
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()